@@ -0,0 +1,170 @@
+"""인메모리 캐시 유틸리티
+
+TTL 만료와 LRU 축출을 함께 지원하는 프로세스 로컬 캐시입니다.
+항목 수(max_entries)와 선택적으로 가중치 합(max_weight, 예: 바이트 수)으로
+크기를 제한하고, 적중/미스/축출 통계를 제공합니다.
+
+Example::
+
+    from app.core.cache import TTLCache
+
+    cache: TTLCache[str, list[int]] = TTLCache(
+        max_entries=1000, ttl_seconds=300
+    )
+    cache.set("key", [1, 2, 3])
+    cache.get("key")  # [1, 2, 3]
+    cache.stats.hits  # 1
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # 크기 제한으로 축출된 항목 수
+    expirations: int = 0  # TTL 만료로 제거된 항목 수
+
+    @property
+    def hit_ratio(self) -> float:
+        """적중률 (조회가 없으면 0.0)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """통계 딕셔너리 (API 응답/로그용)"""
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+class TTLCache(Generic[K, V]):
+    """TTL + LRU 인메모리 캐시
+
+    asyncio 단일 스레드에서 사용하는 것을 전제로 하며 락을 사용하지 않습니다.
+
+    Args:
+        max_entries: 최대 항목 수
+        ttl_seconds: 항목 유효 시간 (초, None이면 만료 없음)
+        max_weight: 가중치 합 상한 (None이면 제한 없음)
+        weigher: 항목 가중치 함수 (max_weight 사용 시, 예: 바이트 수)
+        clock: 시간 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: Optional[float] = None,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[V], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.clock = clock
+        self.stats = CacheStats()
+        self.weight = 0
+        # key -> (만료 시각, 가중치, 값), 뒤쪽이 최근 사용
+        self._data: OrderedDict[K, tuple[float, int, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, record=False) is not None
+
+    def get(self, key: K, record: bool = True) -> Optional[V]:
+        """값 조회 (적중 시 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+            record: 적중/미스 통계 기록 여부
+
+        Returns:
+            캐시된 값 또는 None (없거나 만료)
+        """
+        entry = self._data.get(key)
+        if entry is not None and entry[0] < self.clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            entry = None
+
+        if entry is None:
+            if record:
+                self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        if record:
+            self.stats.hits += 1
+        return entry[2]
+
+    def set(self, key: K, value: V) -> None:
+        """값 저장 (크기 제한 초과 시 오래된 항목부터 축출)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if key in self._data:
+            self._remove(key)
+
+        weight = self.weigher(value) if self.weigher else 0
+        if self.max_weight is not None and weight > self.max_weight:
+            # 단일 항목이 상한보다 크면 저장하지 않음
+            return
+
+        expires_at = (
+            self.clock() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else float("inf")
+        )
+        self._data[key] = (expires_at, weight, value)
+        self.weight += weight
+
+        while len(self._data) > self.max_entries or (
+            self.max_weight is not None and self.weight > self.max_weight
+        ):
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def delete(self, key: K) -> bool:
+        """항목 삭제
+
+        Returns:
+            삭제 여부
+        """
+        if key not in self._data:
+            return False
+        self._remove(key)
+        return True
+
+    def delete_where(self, predicate: Callable[[K], bool]) -> int:
+        """조건에 맞는 키 일괄 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """전체 삭제 (통계는 유지)"""
+        self._data.clear()
+        self.weight = 0
+
+    def _remove(self, key: K) -> None:
+        _, weight, _ = self._data.pop(key)
+        self.weight -= weight
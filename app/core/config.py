@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    web_concurrency: int = 1  # 워커 프로세스 수 (uvicorn/gunicorn WEB_CONCURRENCY)
 
     # Database
     database_url: str = (
@@ -53,6 +54,93 @@ class Settings(BaseSettings):
     google_api_key: str = "AIza-your-google-key-here"
     perplexity_api_key: str = "pplx-your-perplexity-key-here"
 
+    # Summarization (요약 LLM 파이프라인)
+    summary_combined_call: bool = False  # 요약+태그+카테고리를 JSON 단일 호출로 생성
+    summary_map_reduce_threshold_tokens: int = 12_000  # 초과 시 구간 분할 요약
+    summary_map_section_tokens: int = 4_000  # 구간 최소 크기 (토큰)
+    summary_map_concurrency: int = 4  # 동시에 요약할 구간 수 (fan-out)
+    summary_reduce_max_depth: int = 2  # 구간 요약 재병합 최대 단계
+
+    # Parser Pool (HTML/PDF 파싱 프로세스 풀)
+    parser_pool_enabled: bool = True  # False면 모든 파싱을 스레드에서 실행
+    parser_pool_workers: int = 2  # 워커 프로세스 수
+    parser_process_min_bytes: int = 256 * 1024  # 미만 입력은 스레드에서 파싱
+    parser_timeout_seconds: float = 30.0  # 작업별 제한 시간
+    parser_memory_limit_mb: int = 1024  # 워커 주소 공간 한도 (0이면 제한 없음)
+    pdf_page_range_size: int = 16  # PDF 구간 추출 작업당 페이지 수
+    # 요약 프롬프트에 넣을 PDF 토큰 예산 (0이면 전체, 캐시/임베딩은 항상 전체)
+    pdf_summary_token_budget: int = 0
+
+    # YouTube Transcript (자막 조회 / 자막 캐시)
+    youtube_transcript_timeout_seconds: float = 15.0  # 자막 조회 제한 시간
+    youtube_transcript_cache_ttl_days: int = 30  # 자막 캐시 유효 기간
+
+    # Embedding Batch (임베딩 배치 요청 패킹)
+    embedding_batch_max_items: int = 256  # 요청당 최대 입력 수 (OpenAI 한도 2048)
+    embedding_batch_max_tokens: int = 100_000  # 요청당 최대 토큰 (한도 300k)
+    embedding_batch_concurrency: int = 4  # 동시에 실행할 배치 요청 수
+
+    # Embedding Cache (쿼리/태그 임베딩 LRU 캐시)
+    embedding_cache_enabled: bool = True
+    embedding_cache_max_entries: int = 4096  # 최대 항목 수
+    embedding_cache_ttl_seconds: int = 3600  # 항목 유효 시간
+    embedding_cache_max_bytes: int = 128 * 1024 * 1024  # 벡터 총 메모리 상한
+
+    # Personalization Profile Cache (사용자 태그/카테고리 프로필 캐시)
+    personalization_profile_cache_enabled: bool = True
+    personalization_profile_cache_max_entries: int = 10_000  # 최대 사용자 수
+    personalization_profile_cache_ttl_seconds: int = 600  # 프로필 유효 시간
+
+    # Personalization Popularity (전역 인기도 상위 K 스냅샷, 백그라운드 갱신)
+    personalization_popularity_top_k: int = 1000  # 보관할 상위 태그/카테고리 수
+    personalization_popularity_refresh_seconds: int = 300  # 갱신 주기
+
+    # Personalization Write-behind (사용 통계 증가분 지연 일괄 반영)
+    personalization_write_behind_enabled: bool = False
+    personalization_write_behind_max_pending: int = 1000  # 즉시 flush 임계 키 수
+    personalization_write_behind_flush_seconds: float = 5.0  # flush 주기
+    # 연속 flush 실패 시 증가분을 버리기 전 최대 시도 횟수 (FK 위반 등)
+    personalization_write_behind_max_attempts: int = 5
+
+    # Personalization Embedding Backfill (태그/카테고리 마스터 임베딩 백그라운드 생성)
+    personalization_backfill_enabled: bool = True
+    personalization_backfill_batch_size: int = 100  # 종류별 배치당 행 수
+    personalization_backfill_interval_seconds: int = 60  # 실행 주기
+
+    # Personalization Tag Index (전체 태그 임베딩 인메모리 행렬)
+    personalization_tag_index_enabled: bool = True
+    personalization_tag_index_refresh_seconds: int = 600  # 전체 재적재 주기
+
+    # Embedding Pipeline (콘텐츠 청크 임베딩 파이프라인)
+    embedding_pipeline_concurrency: int = 4  # 임베딩 워커 수
+    embedding_pipeline_batch_size: int = 32  # 워커 요청당 청크 수
+    embedding_pipeline_queue_size: int = 8  # 청크 배치 큐 크기 (backpressure)
+    embedding_pipeline_flush_size: int = 64  # DB flush 단위 (청크 수)
+
+    # Vector Search (pgvector ANN 검색)
+    vector_index_mode: str = "halfvec"  # halfvec (HNSW 인덱스) | exact (전수 비교)
+    vector_ef_search: int = 100  # HNSW 탐색 후보 수 (클수록 정확, 최대 1000)
+    vector_candidate_limit: int = 200  # ANN 단계에서 가져올 최근접 청크 수
+    vector_iterative_scan: str = "relaxed_order"  # off | relaxed_order (0.8+)
+    vector_max_scan_tuples: int = 20_000  # 반복 스캔 최대 방문 튜플 수
+    search_matched_chunks: int = 3  # include_chunks 시 콘텐츠별 반환 청크 수
+
+    # Hybrid Search (벡터 + 키워드 결합)
+    hybrid_search_strategy: str = "sql"  # sql (단일 쿼리) | concurrent (레그 병렬)
+    hybrid_fusion: str = "weighted"  # weighted (alpha 가중합) | rrf
+    hybrid_rrf_k: int = 60  # RRF 상수 k
+    hybrid_candidate_limit: int = 100  # 레그별 최대 후보 콘텐츠 수
+
+    # Search Snapshot (하이브리드 검색 랭킹 스냅샷 캐시)
+    search_snapshot_enabled: bool = True
+    search_snapshot_backend: str = "auto"  # auto | memory | redis (redis_url)
+    search_snapshot_ttl_seconds: int = 300  # 스냅샷 유효 시간
+    search_snapshot_max_entries: int = 1000  # memory 백엔드 최대 스냅샷 수
+    search_snapshot_size: int = 500  # 스냅샷당 최대 결과 수 (이후 페이지는 직접 조회)
+
+    # Pagination (커서 페이지네이션 / 전체 개수)
+    pagination_total_cap: int = 1000  # capped 모드 최대 개수 ("1000+")
+
     # LangFuse Observability
     langfuse_secret_key: str = "sk-lf-your-secret-key-here"
     langfuse_public_key: str = "pk-lf-your-public-key-here"
@@ -83,6 +171,24 @@ class Settings(BaseSettings):
                 return [origin.strip() for origin in v.split(",")]
         return v
 
+    @model_validator(mode="after")
+    def validate_search_snapshot_backend(self) -> "Settings":
+        """여러 워커에서 프로세스 로컬 스냅샷 백엔드 사용 금지
+
+        memory 백엔드는 워커별로 따로 저장되어 다른 워커의 무효화가
+        반영되지 않으므로, 삭제/변경된 콘텐츠가 검색 결과에 남습니다.
+        """
+        if (
+            self.search_snapshot_enabled
+            and self.search_snapshot_backend == "memory"
+            and self.web_concurrency > 1
+        ):
+            raise ValueError(
+                "SEARCH_SNAPSHOT_BACKEND=memory is process-local and cannot "
+                "be used with WEB_CONCURRENCY > 1. Use 'redis' or 'auto'."
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_production_settings(self) -> "Settings":
         """프로덕션 환경에서 보안 설정 검증"""
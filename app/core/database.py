@@ -1,6 +1,8 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Callable
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -8,6 +10,25 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
+from app.core.vector import register_vector_codecs
+
+
+def enable_vector_codecs(async_engine: AsyncEngine) -> None:
+    """엔진의 새 연결마다 pgvector 바이너리 코덱 등록
+
+    벡터 값을 텍스트 리터럴 대신 바이너리 바인드 파라미터로 전송합니다.
+    asyncpg 드라이버가 아니면 아무것도 하지 않습니다.
+
+    Args:
+        async_engine: 비동기 엔진
+    """
+    if async_engine.dialect.driver != "asyncpg":
+        return
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _register_vector_codecs(dbapi_connection, connection_record):
+        dbapi_connection.run_async(register_vector_codecs)
+
 
 # 비동기 엔진 생성
 engine = create_async_engine(
@@ -17,6 +38,7 @@ engine = create_async_engine(
     pool_size=10,
     max_overflow=20,
 )
+enable_vector_codecs(engine)
 
 # 비동기 세션 팩토리
 async_session_maker = async_sessionmaker(
@@ -34,6 +56,40 @@ class Base(DeclarativeBase):
     pass
 
 
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+_AFTER_COMMIT_LISTENING_KEY = "after_commit_listening"
+
+
+def run_after_commit(
+    session: AsyncSession, callback: Callable[[], Any]
+) -> None:
+    """세션이 커밋된 뒤 실행할 콜백 등록 (롤백되면 폐기)
+
+    프로세스 전역 캐시/인덱스처럼 DB에 반영된 뒤에만 바뀌어야 하는 상태를
+    갱신할 때 사용합니다. 콜백은 동기 함수이며 등록 순서대로 한 번만
+    실행됩니다.
+
+    Args:
+        session: 변경을 반영할 DB 세션
+        callback: 커밋 후 실행할 콜백
+    """
+    if not session.info.get(_AFTER_COMMIT_LISTENING_KEY):
+        session.info[_AFTER_COMMIT_LISTENING_KEY] = True
+        sync_session = session.sync_session
+
+        def on_commit(_session: Any) -> None:
+            for pending in sync_session.info.pop(_AFTER_COMMIT_KEY, []):
+                pending()
+
+        def on_rollback(_session: Any) -> None:
+            sync_session.info.pop(_AFTER_COMMIT_KEY, None)
+
+        event.listen(sync_session, "after_commit", on_commit)
+        event.listen(sync_session, "after_rollback", on_rollback)
+
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """데이터베이스 세션 의존성"""
     async with async_session_maker() as session:
@@ -16,6 +16,7 @@ class ErrorCode(str, Enum):
     FORBIDDEN = "FORBIDDEN"
     BAD_REQUEST = "BAD_REQUEST"
     CONFLICT = "CONFLICT"
+    INVALID_CURSOR = "INVALID_CURSOR"
 
     # 인증 관련
     INVALID_TOKEN = "INVALID_TOKEN"
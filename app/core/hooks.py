@@ -0,0 +1,50 @@
+"""도메인 간 변경 알림 훅
+
+도메인이 다른 도메인을 직접 import하지 않고 변경을 알릴 수 있도록
+콜백을 등록해 두는 레지스트리입니다.
+
+- 콘텐츠 변경: contents 도메인이 콘텐츠를 동기화/삭제하면
+  notify_content_changed를 호출하고, ai 도메인은 검색 스냅샷 무효화 훅을
+  등록합니다.
+
+Example::
+
+    from app.core.hooks import register_content_change_hook
+
+    def invalidate(session: AsyncSession, user_id: int) -> None:
+        ...
+
+    register_content_change_hook(invalidate)
+"""
+
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ContentChangeHook = Callable[[AsyncSession, int], None]
+
+_content_change_hooks: list[ContentChangeHook] = []
+
+
+def register_content_change_hook(hook: ContentChangeHook) -> None:
+    """콘텐츠 변경 훅 등록 (같은 훅은 한 번만 등록)
+
+    Args:
+        hook: (요청 세션, 사용자 ID)를 받는 콜백
+    """
+    if hook not in _content_change_hooks:
+        _content_change_hooks.append(hook)
+
+
+def notify_content_changed(session: AsyncSession, user_id: int) -> None:
+    """사용자 콘텐츠 변경 알림
+
+    훅은 변경을 담은 요청 세션과 함께 호출되며, 커밋 후 반영 등 실행
+    시점은 훅이 결정합니다.
+
+    Args:
+        session: 변경을 반영할 DB 세션
+        user_id: 콘텐츠 소유 사용자 ID
+    """
+    for hook in list(_content_change_hooks):
+        hook(session, user_id)
@@ -3,9 +3,15 @@
 이 모듈은 Topics/AI 도메인에서 사용할 공개 인터페이스만 노출합니다.
 """
 
+from app.core.llm.embedding_cache import (
+    EmbeddingCache,
+    embedding_cache_model,
+    get_embedding_cache,
+)
 from app.core.llm.fallback import (
     call_with_fallback,
     create_embedding,
+    create_embeddings,
     stream_with_fallback,
 )
 from app.core.llm.observability import get_observe_decorator
@@ -20,6 +26,11 @@ __all__ = [
     "call_with_fallback",
     "stream_with_fallback",
     "create_embedding",
+    "create_embeddings",
+    # Cache
+    "EmbeddingCache",
+    "embedding_cache_model",
+    "get_embedding_cache",
     # Decorators
     "get_observe_decorator",
 ]
@@ -0,0 +1,81 @@
+"""임베딩 배치 패킹 유틸리티
+
+여러 텍스트를 프로바이더 요청 한도(토큰 수, 입력 개수)에 맞게
+배치로 묶습니다.
+"""
+
+from functools import lru_cache
+from typing import Sequence
+
+import tiktoken
+
+
+@lru_cache
+def get_token_encoding() -> tiktoken.Encoding:
+    """임베딩 토큰 계산용 인코딩 반환 (캐싱됨)
+
+    text-embedding-3 계열은 cl100k_base 인코딩을 사용합니다.
+    """
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(texts: Sequence[str]) -> list[int]:
+    """텍스트별 토큰 수 계산
+
+    Args:
+        texts: 토큰 수를 계산할 텍스트 리스트
+
+    Returns:
+        list[int]: 입력 순서와 동일한 토큰 수 리스트
+    """
+    encoding = get_token_encoding()
+    return [
+        len(tokens) for tokens in encoding.encode_ordinary_batch(list(texts))
+    ]
+
+
+def pack_by_token_budget(
+    token_counts: Sequence[int],
+    max_tokens: int,
+    max_items: int,
+) -> list[list[int]]:
+    """토큰 예산과 개수 한도에 맞춰 입력 인덱스를 배치로 묶기
+
+    입력 순서를 유지한 채 앞에서부터 채워 넣습니다 (greedy).
+    단일 입력이 max_tokens를 넘으면 해당 입력만 단독 배치로 구성합니다.
+
+    Args:
+        token_counts: 입력별 토큰 수
+        max_tokens: 배치당 최대 토큰 수
+        max_items: 배치당 최대 입력 수
+
+    Returns:
+        list[list[int]]: 배치별 입력 인덱스 리스트
+
+    Example::
+
+        pack_by_token_budget([300, 300, 300], max_tokens=600, max_items=10)
+        # [[0, 1], [2]]
+    """
+    if max_tokens <= 0 or max_items <= 0:
+        raise ValueError("max_tokens and max_items must be positive")
+
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for index, tokens in enumerate(token_counts):
+        if current and (
+            current_tokens + tokens > max_tokens or len(current) >= max_items
+        ):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
@@ -0,0 +1,306 @@
+"""임베딩 캐시 (LRU + TTL + 메모리 상한 + single-flight)
+
+검색 쿼리, 태그/카테고리 이름처럼 같은 텍스트가 반복해서 임베딩되는 경로에서
+프로바이더 호출을 줄이기 위한 프로세스 로컬 캐시입니다.
+
+- 키: (임베딩 모델, 정규화된 텍스트)
+  (차원을 축소한 임베딩은 embedding_cache_model(dimensions)로 분리)
+- 저장: float32 ndarray (list[float] 대비 약 1/8 메모리). 프로바이더
+  임베딩은 float32 정밀도이므로 첫 요청부터 float32로 반올림한 값을
+  반환해 캐시 적중 여부와 관계없이 같은 벡터를 돌려줍니다.
+- single-flight: 같은 키의 동시 요청은 하나의 프로바이더 호출 결과를 공유
+
+Example::
+
+    from app.core.llm import create_embedding, get_embedding_cache
+
+    vector = await get_embedding_cache().get_or_create(
+        query, create_embedding
+    )
+"""
+
+import asyncio
+import unicodedata
+from typing import Any, Awaitable, Callable, Optional, cast
+
+import numpy as np
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.llm.fallback import FALLBACK_ORDER
+from app.core.llm.types import LLMProviderError
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+EmbeddingLoader = Callable[[str], Awaitable[list[float]]]
+BatchEmbeddingLoader = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+def normalize_embedding_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC + 공백 정리)
+
+    대소문자는 임베딩 결과에 영향을 주므로 유지합니다.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def embedding_cache_model(dimensions: Optional[int] = None) -> str:
+    """캐시 키용 모델 이름
+
+    같은 텍스트라도 출력 차원이 다르면 다른 벡터이므로 키를 분리합니다.
+
+    Args:
+        dimensions: 출력 차원 (None이면 모델 기본 차원)
+
+    Returns:
+        "text-embedding-3-large" 또는 "text-embedding-3-large@256"
+    """
+    model = FALLBACK_ORDER["embedding"][0]
+    return model if dimensions is None else f"{model}@{dimensions}"
+
+
+class EmbeddingCache:
+    """임베딩 LRU 캐시
+
+    Args:
+        max_entries: 최대 항목 수
+        ttl_seconds: 항목 유효 시간 (초)
+        max_bytes: 저장 벡터 총 바이트 상한
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, max_bytes: int):
+        self.cache: TTLCache[tuple[str, str], np.ndarray] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_weight=max_bytes,
+            weigher=lambda vector: int(vector.nbytes),
+        )
+        self.coalesced = 0  # single-flight로 공유된 요청 수
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+    async def get_or_create(
+        self,
+        text: str,
+        loader: EmbeddingLoader,
+        model: Optional[str] = None,
+    ) -> list[float]:
+        """캐시 조회, 없으면 loader로 생성 후 저장
+
+        Args:
+            text: 임베딩할 텍스트
+            loader: 임베딩 생성 함수 (예: create_embedding)
+            model: 임베딩 모델 (None이면 기본 임베딩 모델)
+
+        Returns:
+            list[float]: 임베딩 벡터
+
+        Raises:
+            LLMProviderError: loader 실패 시 (대기 중인 요청도 같은 예외)
+        """
+        key = self._key(text, model)
+
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cast(list[float], cached.tolist())
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+
+            self.coalesced += 1
+            try:
+                return list(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                # 선행 요청이 취소된 경우에만 다시 시도
+                if inflight.cancelled():
+                    continue
+                raise
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # 대기자가 없을 때 예외 미조회 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+
+        try:
+            vector = await loader(text)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        stored = np.asarray(vector, dtype=np.float32)
+        self.cache.set(key, stored)
+        vector = cast(list[float], stored.tolist())
+        future.set_result(vector)
+        return vector
+
+    async def get_or_create_many(
+        self,
+        texts: list[str],
+        loader: BatchEmbeddingLoader,
+        model: Optional[str] = None,
+    ) -> list[list[float]]:
+        """여러 텍스트 일괄 조회, 미스만 모아 loader 한 번으로 생성
+
+        같은 키가 다른 요청에서 생성 중이면 그 결과를 기다립니다.
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            loader: 일괄 임베딩 생성 함수 (예: create_embeddings)
+            model: 임베딩 모델 (None이면 기본 임베딩 모델)
+
+        Returns:
+            list[list[float]]: texts와 같은 순서의 임베딩 벡터
+
+        Raises:
+            LLMProviderError: loader 실패 또는 결과 수가 입력 수와 다를 때
+        """
+        keys = [self._key(text, model) for text in texts]
+        vectors: dict[tuple[str, str], list[float]] = {}
+        waiting: dict[tuple[str, str], asyncio.Future] = {}
+        missing: dict[tuple[str, str], str] = {}
+
+        for key, text in zip(keys, texts):
+            if key in vectors or key in waiting or key in missing:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                vectors[key] = cast(list[float], cached.tolist())
+            elif key in self._inflight:
+                waiting[key] = self._inflight[key]
+            else:
+                missing[key] = text
+
+        if missing:
+            futures = {}
+            for key in missing:
+                future = asyncio.get_running_loop().create_future()
+                future.add_done_callback(
+                    lambda f: f.cancelled() or f.exception()
+                )
+                futures[key] = self._inflight[key] = future
+
+            try:
+                loaded = await loader(list(missing.values()))
+                # 위치로 키와 매핑하므로 개수가 다르면 대기 중인 요청까지 실패
+                if len(loaded) != len(missing):
+                    raise LLMProviderError(
+                        provider=model or embedding_cache_model(),
+                        original_error=(
+                            f"embedding loader returned {len(loaded)} "
+                            f"vectors for {len(missing)} inputs"
+                        ),
+                    )
+            except asyncio.CancelledError:
+                for future in futures.values():
+                    future.cancel()
+                raise
+            except Exception as e:
+                for future in futures.values():
+                    future.set_exception(e)
+                raise
+            finally:
+                for key in futures:
+                    self._inflight.pop(key, None)
+
+            for key, vector in zip(missing, loaded):
+                stored = np.asarray(vector, dtype=np.float32)
+                self.cache.set(key, stored)
+                vector = cast(list[float], stored.tolist())
+                futures[key].set_result(vector)
+                vectors[key] = vector
+
+        for key, future in waiting.items():
+            self.coalesced += 1
+            try:
+                vectors[key] = list(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # 선행 요청이 취소된 경우 단건으로 다시 시도
+                vectors[key] = await self.get_or_create(
+                    key[1], lambda t: _first(loader, t), model
+                )
+
+        return [vectors[key] for key in keys]
+
+    def _key(self, text: str, model: Optional[str]) -> tuple[str, str]:
+        return (
+            model or embedding_cache_model(),
+            normalize_embedding_text(text),
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계 (hits, misses, evictions, expirations, coalesced 등)"""
+        return {
+            **self.cache.stats.to_dict(),
+            "coalesced": self.coalesced,
+            "size": len(self.cache),
+            "bytes": self.cache.weight,
+        }
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self.cache.clear()
+
+
+class _PassthroughEmbeddingCache(EmbeddingCache):
+    """캐시 비활성화 시 (embedding_cache_enabled=False) loader 직접 호출"""
+
+    async def get_or_create(
+        self,
+        text: str,
+        loader: EmbeddingLoader,
+        model: Optional[str] = None,
+    ) -> list[float]:
+        self.cache.stats.misses += 1
+        return await loader(text)
+
+    async def get_or_create_many(
+        self,
+        texts: list[str],
+        loader: BatchEmbeddingLoader,
+        model: Optional[str] = None,
+    ) -> list[list[float]]:
+        self.cache.stats.misses += len(texts)
+        return await loader(texts) if texts else []
+
+
+async def _first(loader: BatchEmbeddingLoader, text: str) -> list[float]:
+    return (await loader([text]))[0]
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """임베딩 캐시 싱글톤
+
+    Returns:
+        EmbeddingCache (설정값 기반)
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        cache_class = (
+            EmbeddingCache
+            if settings.embedding_cache_enabled
+            else _PassthroughEmbeddingCache
+        )
+        _embedding_cache = cache_class(
+            max_entries=settings.embedding_cache_max_entries,
+            ttl_seconds=settings.embedding_cache_ttl_seconds,
+            max_bytes=settings.embedding_cache_max_bytes,
+        )
+    return _embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """싱글톤 초기화 (테스트 / 설정 변경 시)"""
+    global _embedding_cache
+    _embedding_cache = None
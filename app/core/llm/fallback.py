@@ -3,10 +3,14 @@
 에이전트는 모델이 아닌 티어만 지정하면 자동으로 fallback이 처리됩니다.
 """
 
-from typing import AsyncGenerator, Optional
+import asyncio
+from typing import AsyncGenerator, Optional, cast
 
+from app.core.config import settings
+from app.core.llm.batching import count_tokens, pack_by_token_budget
 from app.core.llm.provider import (
     acompletion_raw,
+    aembedding_batch_raw,
     aembedding_raw,
     astream_completion_raw,
 )
@@ -195,7 +199,9 @@ async def stream_with_fallback(
     raise AllProvidersFailedError(tier=tier.value, attempts=attempted_models)
 
 
-async def create_embedding(input_text: str) -> list[float]:
+async def create_embedding(
+    input_text: str, dimensions: Optional[int] = None
+) -> list[float]:
     """임베딩 생성 (fallback 없음)
 
     임베딩은 모델마다 벡터 공간이 다르므로 fallback을 지원하지 않습니다.
@@ -203,6 +209,8 @@ async def create_embedding(input_text: str) -> list[float]:
 
     Args:
         input_text: 임베딩할 텍스트
+        dimensions: 출력 차원 (None이면 모델 기본 차원,
+            예: Vector(256) 컬럼에 저장할 태그 임베딩은 256)
 
     Returns:
         list[float]: 임베딩 벡터 (text-embedding-3-large: 3072 차원)
@@ -218,4 +226,85 @@ async def create_embedding(input_text: str) -> list[float]:
     """
     model = FALLBACK_ORDER["embedding"][0]
     logger.info(f"Creating embedding with model={model}")
-    return await aembedding_raw(model=model, input_text=input_text)
+    # 기존 호출/모킹과 호환되도록 지정 시에만 전달
+    extra = {} if dimensions is None else {"dimensions": dimensions}
+    return await aembedding_raw(model=model, input_text=input_text, **extra)
+
+
+async def create_embeddings(
+    texts: list[str], dimensions: Optional[int] = None
+) -> list[list[float]]:
+    """여러 텍스트의 임베딩 일괄 생성 (fallback 없음)
+
+    텍스트를 토큰 예산/입력 개수 한도에 맞춰 배치로 묶고,
+    배치 요청을 제한된 동시성으로 실행합니다.
+    결과는 입력 순서와 동일하게 반환됩니다.
+
+    배치 관련 한도는 설정으로 조정합니다:
+    - embedding_batch_max_tokens: 배치당 최대 토큰 수
+    - embedding_batch_max_items: 배치당 최대 입력 수
+    - embedding_batch_concurrency: 동시 배치 요청 수
+
+    Args:
+        texts: 임베딩할 텍스트 리스트
+        dimensions: 출력 차원 (None이면 모델 기본 차원)
+
+    Returns:
+        list[list[float]]: 입력 순서와 동일한 임베딩 벡터 리스트
+
+    Raises:
+        LLMProviderError: 하나 이상의 배치 요청 실패 또는 배치 응답의
+            벡터 수가 입력 수와 다를 때 (위치 기반 매핑 보호)
+
+    Example:
+        from app.core.llm import create_embeddings
+
+        vectors = await create_embeddings(["chunk 1", "chunk 2"])
+        print(len(vectors))  # 2
+    """
+    if not texts:
+        return []
+
+    model = FALLBACK_ORDER["embedding"][0]
+    batches = pack_by_token_budget(
+        count_tokens(texts),
+        max_tokens=settings.embedding_batch_max_tokens,
+        max_items=settings.embedding_batch_max_items,
+    )
+    logger.info(
+        f"Creating embeddings with model={model}: "
+        f"{len(texts)} inputs in {len(batches)} batches"
+    )
+
+    semaphore = asyncio.Semaphore(max(settings.embedding_batch_concurrency, 1))
+    extra = {} if dimensions is None else {"dimensions": dimensions}
+    vectors: list[Optional[list[float]]] = [None] * len(texts)
+
+    async def run_batch(indices: list[int]) -> None:
+        async with semaphore:
+            batch_vectors = await aembedding_batch_raw(
+                model=model, inputs=[texts[i] for i in indices], **extra
+            )
+        # 호출자는 입력 위치로 결과를 매핑하므로 누락된 벡터는 오류로 처리
+        if len(batch_vectors) != len(indices):
+            raise LLMProviderError(
+                provider=model,
+                original_error=(
+                    f"embedding batch returned {len(batch_vectors)} "
+                    f"vectors for {len(indices)} inputs"
+                ),
+            )
+        for index, vector in zip(indices, batch_vectors):
+            vectors[index] = vector
+
+    tasks = [asyncio.create_task(run_batch(batch)) for batch in batches]
+    try:
+        await asyncio.gather(*tasks)
+    except Exception:
+        # 하나라도 실패하면 남은 배치 요청은 취소 (불필요한 과금 방지)
+        for task in tasks:
+            task.cancel()
+        raise
+
+    # 모든 배치가 길이 검증을 통과했으므로 None 없음
+    return cast(list[list[float]], vectors)
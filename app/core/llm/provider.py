@@ -5,7 +5,7 @@
 """
 
 import os
-from typing import AsyncGenerator, Optional, cast
+from typing import Any, AsyncGenerator, Optional, cast
 
 from litellm import acompletion, aembedding
 
@@ -43,6 +43,7 @@ async def acompletion_raw(
         temperature: 샘플링 온도 (0.0 ~ 1.0)
         max_tokens: 최대 출력 토큰 수
         **kwargs: LiteLLM에 전달할 추가 파라미터
+            (response_format은 지원하지 않는 모델이면 제외)
 
     Returns:
         LLMResult: 생성된 텍스트 및 사용량 정보
@@ -57,6 +58,12 @@ async def acompletion_raw(
         ]
         result = await acompletion_raw("claude-4.5-haiku", messages)
     """
+    if "response_format" in kwargs and not _supports_param(
+        model, "response_format"
+    ):
+        # JSON 모드 미지원 모델은 프롬프트 지시만으로 JSON 출력
+        kwargs.pop("response_format")
+
     try:
         response = await acompletion(
             model=model,
@@ -128,12 +135,15 @@ async def astream_completion_raw(
         raise LLMProviderError(provider=model, original_error=str(e))
 
 
-async def aembedding_raw(model: str, input_text: str) -> list[float]:
+async def aembedding_raw(
+    model: str, input_text: str, dimensions: Optional[int] = None
+) -> list[float]:
     """LiteLLM embedding 생성 (비동기)
 
     Args:
         model: 임베딩 모델 alias (예: "text-embedding-3-large")
         input_text: 임베딩할 텍스트
+        dimensions: 출력 차원 축소 (None이면 모델 기본 차원)
 
     Returns:
         list[float]: 임베딩 벡터
@@ -149,9 +159,74 @@ async def aembedding_raw(model: str, input_text: str) -> list[float]:
         # vector: list[float] with 3072 dimensions
     """
     try:
-        response = await aembedding(model=model, input=[input_text])
+        response = await aembedding(
+            model=model, input=[input_text], **_dimensions_kwargs(dimensions)
+        )
         return cast(list[float], response.data[0]["embedding"])
 
     except Exception as e:
         logger.error(f"LiteLLM embedding failed for model {model}: {e}")
         raise LLMProviderError(provider=model, original_error=str(e))
+
+
+async def aembedding_batch_raw(
+    model: str, inputs: list[str], dimensions: Optional[int] = None
+) -> list[list[float]]:
+    """LiteLLM embedding 배치 생성 (비동기)
+
+    여러 텍스트를 한 번의 프로바이더 요청으로 임베딩합니다.
+
+    Args:
+        model: 임베딩 모델 alias (예: "text-embedding-3-large")
+        inputs: 임베딩할 텍스트 리스트
+        dimensions: 출력 차원 축소 (None이면 모델 기본 차원)
+
+    Returns:
+        list[list[float]]: 입력 순서와 동일한 임베딩 벡터 리스트
+
+    Raises:
+        LLMProviderError: 프로바이더 호출 실패 또는 응답 개수 불일치 시
+
+    Example:
+        vectors = await aembedding_batch_raw(
+            "text-embedding-3-large",
+            ["first chunk", "second chunk"],
+        )
+        # len(vectors) == 2
+    """
+    try:
+        response = await aembedding(
+            model=model, input=inputs, **_dimensions_kwargs(dimensions)
+        )
+
+        # 프로바이더가 index 순서를 보장하지 않으므로 index 기준 정렬
+        data = sorted(response.data, key=lambda item: item["index"])
+        if len(data) != len(inputs):
+            raise ValueError(
+                f"expected {len(inputs)} embeddings, got {len(data)}"
+            )
+        return [cast(list[float], item["embedding"]) for item in data]
+
+    except Exception as e:
+        logger.error(
+            f"LiteLLM batch embedding failed for model {model} "
+            f"(inputs={len(inputs)}): {e}"
+        )
+        raise LLMProviderError(provider=model, original_error=str(e))
+
+
+def _dimensions_kwargs(dimensions: Optional[int]) -> dict[str, Any]:
+    """dimensions 지정 시에만 전달 (미지원 모델 호환)"""
+    return {} if dimensions is None else {"dimensions": dimensions}
+
+
+def _supports_param(model: str, param: str) -> bool:
+    """모델이 OpenAI 호환 파라미터를 지원하는지 여부 (알 수 없으면 False)"""
+    # litellm.utils 지연 로드 (import 시 부수 효과 방지)
+    from litellm import get_supported_openai_params
+
+    try:
+        params = get_supported_openai_params(model=model)
+    except Exception:
+        return False
+    return param in (params or [])
@@ -24,6 +24,8 @@ from typing import Any, Generic, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.utils.pagination import TotalMode, resolve_total
+
 DataT = TypeVar("DataT")
 
 
@@ -66,12 +68,24 @@ class APIResponse(BaseModel, Generic[DataT]):
 class PageMeta(BaseModel):
     """페이지네이션 메타 정보"""
 
-    total: int = Field(..., description="전체 아이템 수")
+    total: Optional[int] = Field(
+        ..., description="전체 아이템 수 (total_mode=none이면 null)"
+    )
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
-    total_pages: int = Field(..., description="전체 페이지 수")
+    total_pages: Optional[int] = Field(..., description="전체 페이지 수")
     has_next: bool = Field(..., description="다음 페이지 존재 여부")
     has_prev: bool = Field(..., description="이전 페이지 존재 여부")
+    total_mode: TotalMode = Field(
+        TotalMode.EXACT,
+        description=(
+            "total의 의미 (exact: 정확, capped: total 이상(예: 1000+), "
+            "estimated: 추정치, none: 미계산)"
+        ),
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 커서 (없으면 마지막 페이지)"
+    )
 
 
 class ListAPIResponse(BaseModel, Generic[DataT]):
@@ -116,24 +130,47 @@ def create_response(
 
 def create_list_response(
     data: list[DataT],
-    total: int,
+    total: Optional[int],
     page: int,
     size: int,
     message: str = "요청이 성공적으로 처리되었습니다.",
+    next_cursor: Optional[str] = None,
+    total_mode: TotalMode = TotalMode.EXACT,
+    cursor: Optional[str] = None,
 ) -> ListAPIResponse[DataT]:
     """목록 API 응답 생성 팩토리 함수
 
     Args:
         data: 목록 데이터
-        total: 전체 아이템 수
+        total: 전체 아이템 수 (count_total 결과)
         page: 현재 페이지
         size: 페이지 크기
         message: 응답 메시지
+        next_cursor: 다음 페이지 커서
+        total_mode: 요청한 전체 개수 계산 방식
+        cursor: 현재 요청 커서 (커서 페이지네이션 여부 판단)
 
     Returns:
         ListAPIResponse 인스턴스
+
+    Note:
+        커서 페이지네이션(next_cursor / cursor 사용)에서는 has_next /
+        has_prev를 커서 기준으로 판단합니다.
     """
-    total_pages = math.ceil(total / size) if size > 0 else 0
+    total, total_mode = resolve_total(total, total_mode)
+    total_pages = (
+        (math.ceil(total / size) if size > 0 else 0)
+        if total is not None
+        else None
+    )
+
+    if next_cursor is not None or cursor is not None:
+        has_next = next_cursor is not None
+        has_prev = cursor is not None or page > 1
+    else:
+        has_next = total_pages is not None and page < total_pages
+        has_prev = page > 1
+
     return ListAPIResponse(
         success=True,
         message=message,
@@ -143,8 +180,10 @@ def create_list_response(
             page=page,
             size=size,
             total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1,
+            has_next=has_next,
+            has_prev=has_prev,
+            total_mode=total_mode,
+            next_cursor=next_cursor,
         ),
     )
 
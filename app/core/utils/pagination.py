@@ -1,6 +1,49 @@
-"""페이지네이션 유틸리티"""
+"""페이지네이션 유틸리티
+
+- PageParams: page/size 기반 오프셋 페이지네이션 파라미터
+- CursorParams: 커서(keyset) 페이지네이션 및 전체 개수 계산 방식 파라미터
+- encode_cursor / decode_cursor: 마지막 행의 정렬 키를 담는 불투명 커서
+- count_total: exact / capped / estimated / none 방식의 전체 개수 계산
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 from fastapi import Query
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException, ErrorCode
+
+T = TypeVar("T")
+
+
+class TotalMode(str, Enum):
+    """전체 개수 계산 방식"""
+
+    EXACT = "exact"  # COUNT(*) 정확한 개수
+    CAPPED = "capped"  # 상한까지만 계산 (예: "1000+")
+    # 추정치 (EXPLAIN 플래너 추정 / 하이브리드 검색 후보 기준 하한)
+    ESTIMATED = "estimated"
+    NONE = "none"  # 계산하지 않음
 
 
 class PageParams:
@@ -42,3 +85,227 @@ class PageParams:
     def limit(self) -> int:
         """리미트 (size와 동일)"""
         return self.size
+
+
+class CursorParams:
+    """커서 페이지네이션 파라미터 의존성
+
+    cursor가 주어지면 page 대신 커서 이후부터 조회합니다 (OFFSET 없음).
+    첫 페이지는 cursor 없이 요청하고, 이후에는 응답의
+    meta.next_cursor를 그대로 전달합니다.
+
+    Example::
+
+        @router.get("", response_model=ListAPIResponse[ItemResponse])
+        async def get_items(
+            page_params: PageParams = Depends(),
+            cursor_params: CursorParams = Depends(),
+        ):
+            ...
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(
+            None, description="다음 페이지 커서 (이전 응답의 meta.next_cursor)"
+        ),
+        total_mode: TotalMode = Query(
+            TotalMode.EXACT,
+            description="전체 개수 계산 방식 (exact, capped, estimated, none)",
+        ),
+    ):
+        self.cursor = cursor
+        self.total_mode = total_mode
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """커서 페이지 조회 결과"""
+
+    items: list[T]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+CursorKeyType = Union[type, tuple[type, ...]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    raise TypeError(f"Unsupported cursor value: {type(value).__name__}")
+
+
+def _json_object_hook(obj: dict) -> Any:
+    if set(obj) == {"$dt"}:
+        return datetime.fromisoformat(obj["$dt"])
+    return obj
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """정렬 키를 불투명 커서 문자열로 인코딩
+
+    Args:
+        values: 마지막 행의 정렬 키 (예: {"created_at": ..., "id": 10})
+
+    Returns:
+        URL-safe base64 문자열
+    """
+    payload = json.dumps(
+        values, default=_json_default, separators=(",", ":")
+    ).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    cursor: str,
+    keys: Union[Sequence[str], Mapping[str, CursorKeyType]] = (),
+) -> dict[str, Any]:
+    """커서 문자열 디코딩
+
+    Args:
+        cursor: encode_cursor로 만든 커서
+        keys: 반드시 포함되어야 하는 키 목록, 또는 키별 허용 타입
+            (예: {"created_at": datetime, "id": int})
+
+    Returns:
+        정렬 키 딕셔너리
+
+    Raises:
+        BadRequestException: 커서 형식이 잘못되었거나 키가 누락되었거나
+            값의 타입이 다른 경우
+    """
+    invalid = BadRequestException(
+        message="잘못된 커서입니다.",
+        error_code=ErrorCode.INVALID_CURSOR,
+    )
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(
+            base64.urlsafe_b64decode(padded.encode()),
+            object_hook=_json_object_hook,
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise invalid from e
+
+    if not isinstance(values, dict) or any(k not in values for k in keys):
+        raise invalid
+
+    if isinstance(keys, Mapping):
+        for key, expected in keys.items():
+            value = values[key]
+            # bool은 int의 하위 타입이므로 별도로 거부
+            if isinstance(value, bool) or not isinstance(value, expected):
+                raise invalid
+
+    return values
+
+
+def next_cursor(
+    items: Sequence[T],
+    size: int,
+    key: Callable[[T], dict[str, Any]],
+) -> Optional[str]:
+    """마지막 아이템 기준 다음 페이지 커서 생성
+
+    페이지가 가득 찬 경우에만 커서를 만듭니다 (짧은 페이지 = 마지막 페이지).
+
+    Args:
+        items: 현재 페이지 아이템
+        size: 페이지 크기
+        key: 아이템에서 정렬 키를 꺼내는 함수
+
+    Returns:
+        다음 페이지 커서 또는 None
+    """
+    if not items or len(items) < size:
+        return None
+    return encode_cursor(key(items[-1]))
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON)
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_total(
+    session: AsyncSession,
+    statement: Select,
+    mode: TotalMode = TotalMode.EXACT,
+    cap: Optional[int] = None,
+) -> Optional[int]:
+    """전체 개수 계산
+
+    Args:
+        session: DB 세션
+        statement: 개수를 셀 SELECT (정렬/페이지네이션 제외)
+        mode: 계산 방식
+        cap: capped 모드 상한 (None이면 settings.pagination_total_cap)
+
+    Returns:
+        - exact: 정확한 개수
+        - capped: 최대 cap + 1 (cap 초과 여부는 resolve_total로 판단)
+        - estimated: 플래너 추정 행 수 (통계 기반, ANALYZE 의존,
+          플랜이 비어 있으면 None)
+        - none: None (쿼리 실행 안 함)
+    """
+    if mode == TotalMode.NONE:
+        return None
+
+    statement = statement.order_by(None)
+
+    if mode == TotalMode.ESTIMATED:
+        result = await session.execute(_ExplainJSON(statement))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        if not plan:
+            return None
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    if mode == TotalMode.CAPPED:
+        cap = cap if cap is not None else settings.pagination_total_cap
+        statement = statement.limit(cap + 1)
+
+    result = await session.execute(
+        select(func.count()).select_from(statement.subquery())
+    )
+    return int(result.scalar() or 0)
+
+
+def resolve_total(
+    total: Optional[int],
+    mode: TotalMode = TotalMode.EXACT,
+    cap: Optional[int] = None,
+) -> tuple[Optional[int], TotalMode]:
+    """응답에 표시할 전체 개수와 그 의미 결정
+
+    Args:
+        total: count_total 결과
+        mode: 요청한 계산 방식
+        cap: capped 모드 상한 (None이면 settings.pagination_total_cap)
+
+    Returns:
+        (표시할 개수, 실제 의미) 튜플
+        - capped 모드에서 상한 이하이면 정확한 개수이므로 exact
+        - 상한 초과이면 (cap, capped) → "cap+"로 표시
+    """
+    if total is None or mode == TotalMode.NONE:
+        return None, TotalMode.NONE
+
+    if mode == TotalMode.CAPPED:
+        cap = cap if cap is not None else settings.pagination_total_cap
+        if total > cap:
+            return cap, TotalMode.CAPPED
+        return total, TotalMode.EXACT
+
+    return total, mode
@@ -0,0 +1,24 @@
+"""Server-Sent Events 유틸리티"""
+
+import json
+from typing import Any, Protocol
+
+
+class SSEEvent(Protocol):
+    """SSE로 전송할 이벤트 (이벤트 이름 + JSON 직렬화 가능한 데이터)"""
+
+    event: str
+    data: Any
+
+
+def format_sse(event: SSEEvent) -> bytes:
+    """이벤트를 SSE 메시지로 인코딩
+
+    Args:
+        event: event / data 속성을 가진 이벤트
+
+    Returns:
+        bytes: "event: <이름>\\ndata: <JSON>\\n\\n" (UTF-8, 한글 그대로)
+    """
+    payload = json.dumps(event.data, ensure_ascii=False)
+    return f"event: {event.event}\ndata: {payload}\n\n".encode("utf-8")
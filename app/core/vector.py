@@ -0,0 +1,174 @@
+"""pgvector 보조 타입 및 asyncpg 바이너리 코덱
+
+- HalfVector: pgvector-python(0.2.x)에 없는 halfvec 타입. 2바이트 부동소수점
+  벡터로, 3072 차원처럼 vector 타입으로는 HNSW 인덱스를 만들 수 없는
+  (최대 2000 차원) 임베딩에 표현식 인덱스(`embedding_vector::halfvec(3072)`)
+  형태로 ANN 인덱스를 적용할 때 사용합니다.
+- Vector: asyncpg 바이너리 코덱이 등록된 연결에서는 값을 텍스트로 직렬화하지
+  않고 그대로 드라이버에 넘기는 vector 타입.
+- register_vector_codecs: 연결마다 vector/halfvec 바이너리 코덱 등록.
+
+바이너리 코덱을 사용하면 3072 차원 벡터를 ~60KB 10진 텍스트 대신
+12KB(vector) / 6KB(halfvec) 바이너리로 전송하고, 벡터 값을 바인드 파라미터로
+넘겨 SQL 문자열이 쿼리마다 달라지지 않으므로 prepared statement 캐시가
+재사용됩니다.
+"""
+
+import struct
+from typing import Any, Optional
+
+import numpy as np
+from pgvector.asyncpg import register_vector
+from pgvector.sqlalchemy import Vector as _PgVector
+from pgvector.utils import from_db, to_db
+from sqlalchemy.dialects.postgresql.base import ischema_names
+from sqlalchemy.types import Float, String, UserDefinedType
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["HalfVector", "Vector", "register_vector_codecs"]
+
+
+def _check_dim(value: Any, dim: Optional[int]) -> Any:
+    """벡터 차원 검증 (바이너리 코덱 경로용)"""
+    if value is not None and dim is not None and len(value) != dim:
+        raise ValueError(f"expected {dim} dimensions, not {len(value)}")
+    return value
+
+
+class Vector(_PgVector):
+    """pgvector vector 타입 (asyncpg 바이너리 코덱 지원)
+
+    asyncpg 드라이버에서는 register_vector_codecs로 등록한 바이너리 코덱이
+    list/ndarray를 직접 인코딩하므로 텍스트 변환을 건너뜁니다.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        if dialect.driver != "asyncpg":
+            return super().bind_processor(dialect)
+
+        def process(value):
+            return _check_dim(value, self.dim)
+
+        return process
+
+
+class HalfVector(UserDefinedType):
+    """pgvector halfvec 타입 (최대 4000 차원까지 HNSW 인덱스 지원)
+
+    Example::
+
+        from sqlalchemy import cast
+
+        column = ContentEmbeddingMetadata.embedding_vector
+        expr = cast(column, HalfVector(3072))
+        distance = expr.cosine_distance(
+            bindparam("query", query, type_=HalfVector(3072))
+        )
+    """
+
+    cache_ok = True
+    _string = String()
+
+    def __init__(self, dim: Optional[int] = None):
+        super(UserDefinedType, self).__init__()
+        self.dim = dim
+
+    def get_col_spec(self, **kw) -> str:
+        if self.dim is None:
+            return "HALFVEC"
+        return f"HALFVEC({self.dim})"
+
+    def bind_processor(self, dialect):
+        if dialect.driver == "asyncpg":
+
+            def process_binary(value):
+                return _check_dim(value, self.dim)
+
+            return process_binary
+
+        def process(value):
+            return to_db(value, self.dim)
+
+        return process
+
+    def literal_processor(self, dialect):
+        string_literal_processor = self._string._cached_literal_processor(
+            dialect
+        )
+
+        def process(value):
+            return string_literal_processor(to_db(value, self.dim))
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            return from_db(value)
+
+        return process
+
+    class comparator_factory(UserDefinedType.Comparator):
+        def l2_distance(self, other):
+            return self.op("<->", return_type=Float)(other)
+
+        def max_inner_product(self, other):
+            return self.op("<#>", return_type=Float)(other)
+
+        def cosine_distance(self, other):
+            return self.op("<=>", return_type=Float)(other)
+
+
+# reflection(alembic autogenerate) 지원
+ischema_names["halfvec"] = HalfVector
+
+
+def halfvec_to_db_binary(value: Any) -> bytes:
+    """halfvec 바이너리 인코딩 (dim uint16, unused uint16, float16[dim])"""
+    array = np.asarray(value, dtype=">f2")
+    if array.ndim != 1:
+        raise ValueError("expected ndim to be 1")
+    return struct.pack(">HH", array.shape[0], 0) + array.tobytes()
+
+
+def halfvec_from_db_binary(data: bytes) -> np.ndarray:
+    """halfvec 바이너리 디코딩 (float32 ndarray로 반환)"""
+    dim, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f2", count=dim, offset=4).astype(
+        np.float32
+    )
+
+
+async def register_vector_codecs(conn: Any) -> None:
+    """asyncpg 연결에 vector/halfvec 바이너리 코덱 등록
+
+    pgvector 확장이 아직 설치되지 않은 DB(최초 마이그레이션 전)나
+    halfvec이 없는 pgvector(< 0.7.0)에서는 해당 코덱을 건너뜁니다.
+
+    Args:
+        conn: asyncpg Connection
+    """
+    try:
+        await register_vector(conn)
+    except ValueError:
+        logger.warning(
+            "pgvector extension not found; vector binary codec not registered"
+        )
+        return
+
+    try:
+        await conn.set_type_codec(
+            "halfvec",
+            encoder=halfvec_to_db_binary,
+            decoder=halfvec_from_db_binary,
+            format="binary",
+        )
+    except ValueError:
+        logger.warning(
+            "halfvec type not found (pgvector < 0.7.0); "
+            "halfvec binary codec not registered"
+        )
@@ -3,25 +3,47 @@
 콘텐츠를 청크로 분할하고 각 청크의 임베딩을 생성하여 저장합니다.
 """
 
-from typing import Optional, cast
+import asyncio
+from typing import Any, Callable, Iterator, Optional, Union, cast
 
 import tiktoken
-from sqlalchemy import delete, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.core.llm import create_embedding
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from app.core.config import settings
+from app.core.llm import create_embedding, create_embeddings
 from app.core.logging import get_logger
+from app.domains.ai.embedding.types import EmbeddingProgress, ProgressCallback
 from app.domains.ai.exceptions import EmbeddingFailedException
 from app.domains.ai.models import ChunkStrategy, ContentEmbeddingMetadata
+from app.domains.ai.search.snapshot import get_search_snapshot_cache
+from app.domains.contents.models import Content, EmbeddingStatus
 
 logger = get_logger(__name__)
 
+# (청크 인덱스, 청크 텍스트, 시작 위치, 종료 위치)
+IndexedChunk = tuple[int, str, int, int]
+# 워커 결과: (청크 배치, 임베딩 벡터 또는 실패 예외)
+BatchResult = tuple[list[IndexedChunk], Union[list[list[float]], Exception]]
+
 
 class EmbeddingService:
     """임베딩 생성 및 관리 서비스"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        progress_session_factory: Optional[Callable[[], Any]] = None,
+    ):
         self.session = session
+        # 진행 상태를 바로 커밋할 별도 세션 팩토리
+        # (None이면 요청 세션과 같은 엔진으로 생성)
+        self.progress_session_factory = progress_session_factory
         self.default_encoding = tiktoken.get_encoding("cl100k_base")
 
     def chunk_text(
@@ -42,6 +64,31 @@ class EmbeddingService:
 
         TODO : 전략에 따른 분할 적용
         """
+        chunks = list(self.iter_chunks(text, strategy))
+
+        logger.info(
+            f"Text chunked into {len(chunks)} chunks "
+            f"(strategy={strategy.name}, size={strategy.chunk_size}, "
+            f"overlap={strategy.chunk_overlap})"
+        )
+
+        return chunks
+
+    def iter_chunks(
+        self, text: str, strategy: ChunkStrategy
+    ) -> Iterator[tuple[str, int, int]]:
+        """텍스트를 청크 단위로 순차 생성
+
+        chunk_text와 동일한 분할 규칙을 사용하되, 청크를 하나씩 yield하여
+        파이프라인이 분할 완료를 기다리지 않고 임베딩을 시작할 수 있게 합니다.
+
+        Args:
+            text: 분할할 텍스트
+            strategy: 청크 분할 전략
+
+        Yields:
+            tuple[str, int, int]: (청크 텍스트, 시작 위치, 종료 위치)
+        """
         if strategy.split_method != "token":
             logger.warning(
                 f"Unsupported split method: {strategy.split_method}. "
@@ -50,7 +97,6 @@ class EmbeddingService:
 
         # 텍스트를 토큰으로 변환
         tokens = self.default_encoding.encode(text)
-        chunks: list[tuple[str, int, int]] = []
 
         chunk_size = strategy.chunk_size
         chunk_overlap = strategy.chunk_overlap
@@ -70,7 +116,7 @@ class EmbeddingService:
             start_pos = start_idx
             end_pos = end_idx
 
-            chunks.append((chunk_text, start_pos, end_pos))
+            yield chunk_text, start_pos, end_pos
 
             # 다음 청크로 이동 (오버랩 고려)
             start_idx += chunk_size - chunk_overlap
@@ -79,14 +125,6 @@ class EmbeddingService:
             if end_idx >= len(tokens):
                 break
 
-        logger.info(
-            f"Text chunked into {len(chunks)} chunks "
-            f"(strategy={strategy.name}, size={chunk_size}, "
-            f"overlap={chunk_overlap})"
-        )
-
-        return chunks
-
     async def create_embedding_vector(self, text: str) -> list[float]:
         """텍스트의 임베딩 벡터 생성
 
@@ -111,22 +149,37 @@ class EmbeddingService:
         content_id: int,
         text: str,
         strategy_id: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> list[ContentEmbeddingMetadata]:
-        """콘텐츠의 임베딩 생성 및 저장
+        """콘텐츠의 임베딩 생성 및 저장 (파이프라인)
 
         콘텐츠를 청크로 분할하고 각 청크의 임베딩을 생성하여 DB에 저장합니다.
         기존 임베딩이 있으면 삭제 후 재생성합니다.
 
+        파이프라인 구성:
+        1. 청크 분할 → 제한된 크기의 비동기 큐로 배치 단위 전달
+        2. 워커 풀(동시성 제한)이 배치별로 임베딩 생성
+        3. 완료된 청크는 다른 청크가 처리되는 동안 그룹 단위로 DB flush
+
+        진행 상태는 콘텐츠의 embedding_status / embedding_progress에
+        기록됩니다 (processing → completed / partial / failed). processing과
+        failed는 별도 트랜잭션으로 바로 커밋되고, completed / partial은
+        청크와 함께 호출자 트랜잭션으로 커밋됩니다 (_save_progress 참고).
+        일부 청크만 실패한 경우 성공한 청크는 저장하고 상태를 partial로 남겨
+        재시도 대상이 되게 합니다.
+
         Args:
             content_id: 콘텐츠 ID
             text: 임베딩할 텍스트
             strategy_id: 청크 분할 전략 ID (None이면 기본 전략 사용)
+            on_progress: 청크 그룹 flush 시마다 호출되는 진행 상태 콜백
 
         Returns:
             list[ContentEmbeddingMetadata]: 생성된 임베딩 메타데이터 리스트
+                (chunk_index 순)
 
         Raises:
-            EmbeddingFailedException: 임베딩 생성 실패 시
+            EmbeddingFailedException: 모든 청크의 임베딩 생성 실패 시
         """
         logger.info(
             f"Creating embeddings for content_id={content_id}, "
@@ -156,39 +209,256 @@ class EmbeddingService:
         await self.session.flush()
         logger.info(f"Deleted existing embeddings for content_id={content_id}")
 
-        # 텍스트를 청크로 분할
-        chunks = self.chunk_text(text, strategy)
+        progress = EmbeddingProgress(content_id=content_id)
+        await self._save_progress(progress)
 
-        # 각 청크의 임베딩 생성 및 저장
-        embeddings: list[ContentEmbeddingMetadata] = []
+        async def report(progress: EmbeddingProgress) -> None:
+            await self._save_progress(progress)
+            if on_progress is not None:
+                await on_progress(progress)
 
-        for idx, (chunk_text, start_pos, end_pos) in enumerate(chunks):
-            # 임베딩 벡터 생성
-            embedding_vector = await self.create_embedding_vector(chunk_text)
-
-            # DB 객체 생성
-            embedding_metadata = ContentEmbeddingMetadata(
-                content_id=content_id,
-                strategy_id=strategy.id,
-                chunk_index=idx,
-                chunk_content=chunk_text,
-                start_position=start_pos,
-                end_position=end_pos,
-                embedding_vector=embedding_vector,
-                embedding_model="text-embedding-3-large",
+        embeddings = await self._run_embedding_pipeline(
+            content_id=content_id,
+            text=text,
+            strategy=strategy,
+            progress=progress,
+            on_progress=report,
+        )
+
+        if progress.status == "failed":
+            raise EmbeddingFailedException(
+                detail_msg=(
+                    f"임베딩 생성 실패: {progress.failed_chunks}개 청크 모두 실패 "
+                    f"({progress.errors[0] if progress.errors else 'unknown'})"
+                )
             )
 
-            self.session.add(embedding_metadata)
-            embeddings.append(embedding_metadata)
+        if progress.status == "partial":
+            logger.warning(
+                f"Partial embedding failure for content_id={content_id}: "
+                f"{progress.failed_chunks}/{progress.total_chunks} chunks "
+                f"failed (indices={progress.failed_indices})"
+            )
 
-        # DB에 저장
-        await self.session.flush()
         logger.info(
             f"Created {len(embeddings)} embeddings for content_id={content_id}"
         )
 
         return embeddings
 
+    async def _save_progress(self, progress: EmbeddingProgress) -> None:
+        """진행 상태를 콘텐츠 embedding_status / embedding_progress에 기록
+
+        - processing / failed: 별도의 짧은 트랜잭션으로 바로 커밋하므로
+          다른 요청/프로세스에서 진행률을 조회할 수 있고, 모든 청크가 실패해
+          호출자가 롤백해도 failed 상태가 남습니다.
+        - completed / partial: 저장된 청크와 함께 보이도록 호출자
+          트랜잭션에 기록하고, 커밋 후 사용자의 검색 스냅샷을 다시
+          무효화합니다 (동기화 시점의 무효화 이후 임베딩 완료 전까지 만들어진
+          스냅샷에는 이 콘텐츠가 빠져 있음).
+
+        콘텐츠 행이 호출자 트랜잭션에서 생성/수정되어 아직 커밋되지
+        않았다면 (다른 트랜잭션에서 보이지 않거나 잠겨 있음) 호출자
+        트랜잭션에 기록하며, 이 경우 진행 상태는 커밋 후에만 보입니다.
+        콘텐츠가 없으면 무시합니다.
+        """
+        status = EmbeddingStatus(progress.status)
+        if status in (
+            EmbeddingStatus.PROCESSING,
+            EmbeddingStatus.FAILED,
+        ) and await self._commit_progress(progress):
+            return
+
+        content = await self.session.get(Content, progress.content_id)
+        if content is None:
+            return
+        content.embedding_status = status
+        content.embedding_progress = progress.to_dict()
+        await self.session.flush()
+
+        if status in (EmbeddingStatus.COMPLETED, EmbeddingStatus.PARTIAL):
+            get_search_snapshot_cache().invalidate_user_on_commit(
+                self.session, content.user_id
+            )
+
+    async def _commit_progress(self, progress: EmbeddingProgress) -> bool:
+        """별도 트랜잭션으로 진행 상태 커밋
+
+        호출자 트랜잭션이 잠근 행은 기다리지 않고 건너뜁니다 (SKIP LOCKED).
+
+        Returns:
+            콘텐츠 행을 갱신해 커밋했는지 여부
+        """
+        session_factory = self._get_progress_session_factory()
+        if session_factory is None:
+            return False
+
+        target = (
+            select(Content.id)
+            .where(Content.id == progress.content_id)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        try:
+            async with session_factory() as session:
+                result = await session.execute(
+                    update(Content)
+                    .where(Content.id == target)
+                    .values(
+                        embedding_status=EmbeddingStatus(progress.status),
+                        embedding_progress=progress.to_dict(),
+                    )
+                    .returning(Content.id)
+                )
+                updated = result.scalar_one_or_none() is not None
+                await session.commit()
+                return updated
+        except Exception as e:
+            logger.warning(
+                f"Embedding progress commit failed for "
+                f"content_id={progress.content_id}: {e}"
+            )
+            return False
+
+    def _get_progress_session_factory(self) -> Optional[Callable[[], Any]]:
+        if self.progress_session_factory is not None:
+            return self.progress_session_factory
+        bind = self.session.bind
+        if isinstance(bind, AsyncConnection):
+            bind = bind.engine
+        if not isinstance(bind, AsyncEngine):
+            return None
+        return async_sessionmaker(bind, expire_on_commit=False)
+
+    async def _run_embedding_pipeline(
+        self,
+        content_id: int,
+        text: str,
+        strategy: ChunkStrategy,
+        progress: EmbeddingProgress,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[ContentEmbeddingMetadata]:
+        """청크 분할 → 임베딩 워커 풀 → 그룹 flush 파이프라인 실행
+
+        세션은 동시 사용이 불가능하므로 DB 쓰기는 이 코루틴에서만 수행하고,
+        워커는 임베딩 생성만 담당합니다.
+        """
+        worker_count = max(settings.embedding_pipeline_concurrency, 1)
+        batch_size = max(settings.embedding_pipeline_batch_size, 1)
+        flush_size = max(settings.embedding_pipeline_flush_size, 1)
+
+        chunk_queue: asyncio.Queue[
+            Optional[list[IndexedChunk]]
+        ] = asyncio.Queue(
+            maxsize=max(settings.embedding_pipeline_queue_size, 1)
+        )
+        result_queue: asyncio.Queue[Optional[BatchResult]] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                batch: list[IndexedChunk] = []
+                for idx, (chunk, start_pos, end_pos) in enumerate(
+                    self.iter_chunks(text, strategy)
+                ):
+                    progress.total_chunks += 1
+                    batch.append((idx, chunk, start_pos, end_pos))
+                    if len(batch) >= batch_size:
+                        # 큐가 가득 차면 워커가 따라올 때까지 분할을 멈춤
+                        await chunk_queue.put(batch)
+                        batch = []
+                if batch:
+                    await chunk_queue.put(batch)
+                progress.chunking_done = True
+            finally:
+                # 분할 실패 시에도 워커가 종료되도록 종료 신호 전송
+                for _ in range(worker_count):
+                    await chunk_queue.put(None)
+
+        async def work() -> None:
+            try:
+                while True:
+                    batch = await chunk_queue.get()
+                    if batch is None:
+                        return
+                    try:
+                        vectors = await create_embeddings(
+                            [chunk for _, chunk, _, _ in batch]
+                        )
+                        await result_queue.put((batch, vectors))
+                    except Exception as e:
+                        logger.error(
+                            f"Embedding batch failed for "
+                            f"content_id={content_id}: {e}"
+                        )
+                        await result_queue.put((batch, e))
+            finally:
+                await result_queue.put(None)
+
+        tasks = [asyncio.create_task(produce())] + [
+            asyncio.create_task(work()) for _ in range(worker_count)
+        ]
+
+        embeddings: list[ContentEmbeddingMetadata] = []
+        pending = 0
+        finished_workers = 0
+
+        try:
+            while finished_workers < worker_count:
+                item = await result_queue.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+
+                batch, outcome = item
+                if isinstance(outcome, Exception):
+                    progress.failed_chunks += len(batch)
+                    progress.failed_indices.extend(idx for idx, *_ in batch)
+                    progress.errors.append(str(outcome))
+                    continue
+
+                for (idx, chunk, start_pos, end_pos), vector in zip(
+                    batch, outcome
+                ):
+                    embedding_metadata = ContentEmbeddingMetadata(
+                        content_id=content_id,
+                        strategy_id=strategy.id,
+                        chunk_index=idx,
+                        chunk_content=chunk,
+                        start_position=start_pos,
+                        end_position=end_pos,
+                        embedding_vector=vector,
+                        embedding_model="text-embedding-3-large",
+                    )
+                    self.session.add(embedding_metadata)
+                    embeddings.append(embedding_metadata)
+                pending += len(batch)
+
+                # 완료된 청크를 그룹 단위로 flush (나머지 청크는 계속 임베딩 중)
+                if pending >= flush_size:
+                    await self.session.flush()
+                    progress.embedded_chunks += pending
+                    pending = 0
+                    if on_progress is not None:
+                        await on_progress(progress)
+
+            # 생산자 예외(분할 실패 등)를 전파
+            await tasks[0]
+
+            if pending:
+                await self.session.flush()
+                progress.embedded_chunks += pending
+            if on_progress is not None:
+                await on_progress(progress)
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        progress.failed_indices.sort()
+        embeddings.sort(key=lambda e: e.chunk_index)
+        return embeddings
+
     async def get_chunk_strategy(
         self,
         content_type: Optional[str] = None,
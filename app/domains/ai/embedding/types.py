@@ -0,0 +1,77 @@
+"""임베딩 도메인 타입 정의"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class EmbeddingProgress:
+    """콘텐츠 임베딩 진행 상태
+
+    파이프라인 임베딩 중 청크 단위 진행률과 부분 실패 정보를 담습니다.
+
+    Attributes:
+        content_id: 콘텐츠 ID
+        total_chunks: 현재까지 분할된 전체 청크 수
+        embedded_chunks: 임베딩/저장이 완료된 청크 수
+        failed_chunks: 임베딩에 실패한 청크 수
+        failed_indices: 실패한 청크 인덱스 목록
+        errors: 실패 원인 메시지 목록
+        chunking_done: 청크 분할 완료 여부
+
+    Example::
+
+        progress = EmbeddingProgress(content_id=1)
+        progress.total_chunks = 10
+        progress.embedded_chunks = 7
+        progress.failed_chunks = 3
+
+        progress.status  # "partial" (분할 완료 후)
+        progress.ratio  # 1.0
+    """
+
+    content_id: int
+    total_chunks: int = 0
+    embedded_chunks: int = 0
+    failed_chunks: int = 0
+    failed_indices: list[int] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    chunking_done: bool = False
+
+    @property
+    def processed_chunks(self) -> int:
+        """처리(성공 + 실패)된 청크 수"""
+        return self.embedded_chunks + self.failed_chunks
+
+    @property
+    def ratio(self) -> float:
+        """진행률 (0.0~1.0)"""
+        if self.total_chunks == 0:
+            return 1.0 if self.chunking_done else 0.0
+        return self.processed_chunks / self.total_chunks
+
+    @property
+    def status(self) -> str:
+        """진행 상태 (processing, completed, partial, failed)"""
+        if not self.chunking_done or self.processed_chunks < self.total_chunks:
+            return "processing"
+        if self.failed_chunks == 0:
+            return "completed"
+        if self.embedded_chunks == 0:
+            return "failed"
+        return "partial"
+
+    def to_dict(self) -> dict[str, Any]:
+        """콘텐츠 embedding_progress 컬럼 저장용 (오류는 최근 5개만)"""
+        return {
+            "total_chunks": self.total_chunks,
+            "embedded_chunks": self.embedded_chunks,
+            "failed_chunks": self.failed_chunks,
+            "failed_indices": sorted(self.failed_indices),
+            "errors": self.errors[-5:],
+            "ratio": round(self.ratio, 4),
+        }
+
+
+# 진행 상태 콜백 (청크 그룹이 DB에 flush될 때마다 호출)
+ProgressCallback = Callable[[EmbeddingProgress], Awaitable[None]]
@@ -4,6 +4,7 @@
 - ContentEmbeddingMetadata: 콘텐츠 임베딩 메타데이터
 - ChunkStrategy: 청크 분할 전략
 - SummaryCache: 요약 캐시
+- YoutubeTranscriptCache: YouTube 자막 캐시
 - Tag: 태그 마스터 (개인화 추천용)
 - UserTagUsage: 사용자 태그 사용 통계
 - Category: 카테고리 마스터 (개인화 추천용)
@@ -16,22 +17,30 @@
 from datetime import datetime
 from typing import Optional
 
-from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
     ARRAY,
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    cast,
     func,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
+from app.core.vector import HalfVector, Vector
+
+# 청크 임베딩 차원 (text-embedding-3-large)
+CONTENT_EMBEDDING_DIM = 3072
+# 태그/카테고리 임베딩 차원 (text-embedding-3-large, dimensions=256)
+# 짧은 문자열이므로 축소 차원으로 저장/비교 (메모리 1/12, 행렬 곱 12배 빠름)
+TAG_EMBEDDING_DIM = 256
 
 
 class ContentEmbeddingMetadata(Base):
@@ -72,8 +81,12 @@ class ContentEmbeddingMetadata(Base):
         Integer, nullable=True, comment="원본 텍스트에서의 종료 위치"
     )
     # pgvector 타입: text-embedding-3-large (3072 차원)
+    # vector 타입은 2000 차원까지만 인덱싱 가능하므로
+    # halfvec 표현식 HNSW 인덱스(모듈 하단)로 ANN 검색을 지원
     embedding_vector = mapped_column(
-        Vector(3072), nullable=True, comment="임베딩 벡터 (3072 차원)"
+        Vector(CONTENT_EMBEDDING_DIM),
+        nullable=True,
+        comment="임베딩 벡터 (3072 차원)",
     )
     embedding_model: Mapped[str] = mapped_column(
         String(100),
@@ -96,6 +109,21 @@ class ContentEmbeddingMetadata(Base):
         )
 
 
+# 청크 임베딩 ANN 인덱스 (HNSW, halfvec 코사인 거리)
+# 검색 쿼리는 동일한 표현식(embedding_vector::halfvec(3072) <=> ...)으로
+# ORDER BY distance LIMIT k 형태를 사용해야 인덱스를 탑니다.
+Index(
+    "ix_content_embedding_metadatas_embedding_hnsw",
+    cast(
+        ContentEmbeddingMetadata.embedding_vector,
+        HalfVector(CONTENT_EMBEDDING_DIM),
+    ).label("embedding_halfvec"),
+    postgresql_using="hnsw",
+    postgresql_with={"m": 16, "ef_construction": 64},
+    postgresql_ops={"embedding_halfvec": "halfvec_cosine_ops"},
+)
+
+
 class ChunkStrategy(Base):
     """청크 분할 전략
 
@@ -169,6 +197,7 @@ class SummaryCache(Base):
     - cache_key: URL 또는 파일의 SHA-256 해시
     - TTL: 30일
     - content_hash로 변경 감지
+    - source_fingerprint가 같으면 본문 추출(파싱) 없이 캐시 반환
     """
 
     __tablename__ = "summary_cache"
@@ -191,6 +220,11 @@ class SummaryCache(Base):
     content_hash: Mapped[Optional[str]] = mapped_column(
         String(64), nullable=True, comment="콘텐츠 해시 (변경 감지용)"
     )
+    source_fingerprint: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="원본 지문 (원본 HTML 해시 / YouTube 영상 ID, 파싱 생략용)",
+    )
     extracted_text: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True, comment="추출된 텍스트"
     )
@@ -238,6 +272,56 @@ class SummaryCache(Base):
         )
 
 
+class YoutubeTranscriptCache(Base):
+    """YouTube 자막 캐시
+
+    (video_id, language) 단위로 가져온 자막을 저장합니다. 요약 캐시와
+    별도이므로 refresh 요청이나 다른 사용자의 같은 영상 저장도 자막 API
+    호출 없이 처리합니다.
+
+    캐시 정책:
+    - language: 실제로 가져온 자막의 언어 코드
+    - TTL: youtube_transcript_cache_ttl_days (기본 30일)
+    """
+
+    __tablename__ = "youtube_transcript_cache"
+
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True
+    )
+    video_id: Mapped[str] = mapped_column(
+        String(20), nullable=False, comment="YouTube 영상 ID"
+    )
+    language: Mapped[str] = mapped_column(
+        String(20), nullable=False, comment="자막 언어 코드 (ko, en 등)"
+    )
+    transcript: Mapped[str] = mapped_column(
+        Text, nullable=False, comment="자막 텍스트"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="생성일시",
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, comment="만료일시"
+    )
+
+    # video_id 단독 조회도 이 제약의 인덱스 사용
+    __table_args__ = (
+        UniqueConstraint(
+            "video_id", "language", name="uq_youtube_transcript_video_language"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<YoutubeTranscriptCache(id={self.id}, "
+            f"video_id={self.video_id}, language={self.language})>"
+        )
+
+
 class Tag(Base):
     """태그 마스터
 
@@ -258,11 +342,11 @@ class Tag(Base):
     tag_name: Mapped[str] = mapped_column(
         String(100), unique=True, nullable=False, comment="태그 이름"
     )
-    # 태그용 소형 임베딩 (1536 차원)
+    # 태그용 소형 임베딩 (256 차원)
     embedding_vector = mapped_column(
-        Vector(1536),
+        Vector(TAG_EMBEDDING_DIM),
         nullable=True,
-        comment="태그 임베딩 벡터 (1536 차원)",
+        comment="태그 임베딩 벡터 (256 차원)",
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -342,11 +426,11 @@ class Category(Base):
         nullable=False,
         comment="카테고리 이름",
     )
-    # 카테고리용 소형 임베딩 (1536 차원)
+    # 카테고리용 소형 임베딩 (256 차원)
     embedding_vector = mapped_column(
-        Vector(1536),
+        Vector(TAG_EMBEDDING_DIM),
         nullable=True,
-        comment="카테고리 임베딩 벡터 (1536 차원)",
+        comment="카테고리 임베딩 벡터 (256 차원)",
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
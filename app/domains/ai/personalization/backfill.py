@@ -0,0 +1,140 @@
+"""태그/카테고리 마스터 임베딩 backfill 작업
+
+콘텐츠 동기화는 새 태그/카테고리를 임베딩 없이(NULL) 생성하므로,
+요청 경로가 임베딩 프로바이더를 기다리지 않습니다. 이 작업이 NULL 행을
+FOR UPDATE SKIP LOCKED로 잠가 배치로 임베딩하고 일괄 저장합니다.
+
+- 실행: 앱 lifespan 백그라운드 작업 (run_forever) 또는
+  `python -m scripts.backfill_tag_embeddings` (run_until_done)
+- 여러 인스턴스가 동시에 실행되어도 SKIP LOCKED로 행이 나뉩니다.
+- 배치 임베딩이 실패하면 배치를 나눠 다시 시도하고, 단독으로도 실패하는
+  행은 이번 실행의 이후 배치에서 제외합니다 (다음 주기에 다시 시도).
+  배치 전체가 실패하면 프로바이더 장애로 보고 롤백 후 다음 주기에 다시
+  시도합니다.
+
+Example::
+
+    worker = EmbeddingBackfillWorker(async_session_maker, batch_size=100)
+    filled = await worker.run_until_done()
+"""
+
+import asyncio
+from typing import Any, Callable, Collection, Mapping, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.domains.ai.personalization.service import PersonalizationService
+from app.domains.ai.personalization.types import BackfillResult
+
+logger = get_logger(__name__)
+
+
+class EmbeddingBackfillWorker:
+    """NULL 임베딩 마스터 행 backfill 작업
+
+    Args:
+        session_factory: AsyncSession 컨텍스트 매니저 팩토리
+            (예: async_session_maker)
+        batch_size: 종류(태그/카테고리)별 배치당 최대 행 수
+        interval_seconds: run_forever 실행 주기 (초)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        batch_size: int,
+        interval_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.filled = 0  # 임베딩을 채운 행 수 (누적)
+        self.skipped = 0  # 임베딩에 실패해 건너뛴 행 수 (누적)
+
+    async def run_once(
+        self, exclude_ids: Optional[Mapping[str, Collection[int]]] = None
+    ) -> BackfillResult:
+        """한 배치 처리 (한 트랜잭션, 커밋 시 잠금 해제)
+
+        Args:
+            exclude_ids: 종류("tag" / "category")별 제외할 행 ID
+
+        Returns:
+            BackfillResult (채운 행 수, 종류별 실패 행 ID)
+
+        Raises:
+            LLMProviderError: 배치 전체 임베딩 실패 시 (배치 롤백)
+        """
+        async with self.session_factory() as session:
+            service = PersonalizationService(session)
+            result = await service.backfill_embeddings(
+                batch_size=self.batch_size, exclude_ids=exclude_ids
+            )
+            await session.commit()
+
+        self.filled += result.filled
+        self.skipped += sum(len(ids) for ids in result.failed.values())
+        return result
+
+    async def run_until_done(self, max_batches: Optional[int] = None) -> int:
+        """NULL 행이 없을 때까지 배치 반복
+
+        임베딩에 실패한 행은 이후 배치에서 제외하므로, 항상 실패하는 행이
+        있어도 뒤의 행이 계속 처리됩니다.
+
+        Args:
+            max_batches: 최대 배치 수 (None이면 제한 없음)
+
+        Returns:
+            임베딩을 채운 행 수
+        """
+        total = 0
+        batches = 0
+        failed: dict[str, set[int]] = {}
+        while max_batches is None or batches < max_batches:
+            result = await self.run_once(exclude_ids=failed)
+            for kind, ids in result.failed.items():
+                failed.setdefault(kind, set()).update(ids)
+            total += result.filled
+            batches += 1
+            if result.filled == 0:
+                break
+        return total
+
+    async def run_forever(self) -> None:
+        """주기적 backfill 루프 (앱 lifespan 백그라운드 작업)
+
+        오류는 로그만 남기고 다음 주기에 다시 시도합니다.
+        """
+        while True:
+            try:
+                await self.run_until_done()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Embedding backfill failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        """작업 상태 (누적 처리 / 건너뛴 행 수)"""
+        return {"filled": self.filled, "skipped": self.skipped}
+
+
+def create_backfill_worker(
+    session_factory: Callable[[], Any],
+    batch_size: Optional[int] = None,
+) -> EmbeddingBackfillWorker:
+    """설정값 기반 backfill 작업 생성
+
+    Args:
+        session_factory: AsyncSession 컨텍스트 매니저 팩토리
+        batch_size: 배치당 행 수 (None이면 설정값)
+
+    Returns:
+        EmbeddingBackfillWorker
+    """
+    return EmbeddingBackfillWorker(
+        session_factory=session_factory,
+        batch_size=batch_size or settings.personalization_backfill_batch_size,
+        interval_seconds=settings.personalization_backfill_interval_seconds,
+    )
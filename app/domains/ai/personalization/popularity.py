@@ -0,0 +1,179 @@
+"""전역 태그/카테고리 인기도 스토어
+
+전역 인기도(`SUM(use_count) GROUP BY`)는 전체 사용량 테이블을 집계하므로
+요청 경로에서 계산하지 않고, 상위 K개 스냅샷을 프로세스에 보관해 두고
+백그라운드 작업으로 주기적으로 다시 계산합니다.
+
+- 조회: 이름(대소문자 무시) → 정규화 점수 (최다 사용 = 1.0), O(1)
+- 갱신: 앱 lifespan에서 run_forever 실행
+  (실행 중이면 요청은 만료된 스냅샷을 그대로 사용하고, 실행 중이 아니면
+  요청 시 ensure_fresh가 만료된 스냅샷을 다시 계산)
+
+인기도는 천천히 변하므로 갱신 주기 동안의 지연은 허용합니다.
+
+Example::
+
+    store = get_popularity_store()
+    await store.ensure_fresh(session)
+    store.tag_score("Python")  # 0.0~1.0
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.domains.ai.personalization.repository import PersonalizationRepository
+from app.domains.ai.personalization.scoring import build_popularity
+
+logger = get_logger(__name__)
+
+
+class PopularityStore:
+    """상위 K개 전역 인기도 스냅샷
+
+    Args:
+        top_k: 보관할 상위 태그/카테고리 수 (순위 밖은 0점)
+        refresh_seconds: 갱신 주기 (초)
+        clock: 시간 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        top_k: int,
+        refresh_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.top_k = top_k
+        self.refresh_seconds = refresh_seconds
+        self.clock = clock
+        self.tags: dict[str, float] = {}
+        self.categories: dict[str, float] = {}
+        self.refreshed_at: Optional[float] = None
+        self._refresher_running = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        """스냅샷이 없거나 갱신 주기가 지났는지 여부"""
+        return (
+            self.refreshed_at is None
+            or self.clock() - self.refreshed_at >= self.refresh_seconds
+        )
+
+    def tag_score(self, tag_name: str) -> float:
+        """태그 인기도 (0.0~1.0, 상위 K개 밖이면 0.0)"""
+        return self.tags.get(tag_name.lower(), 0.0)
+
+    def category_score(self, category_name: str) -> float:
+        """카테고리 인기도 (0.0~1.0, 상위 K개 밖이면 0.0)"""
+        return self.categories.get(category_name.lower(), 0.0)
+
+    async def refresh(self, session: AsyncSession) -> None:
+        """전역 사용 통계를 다시 집계해 스냅샷 교체
+
+        Args:
+            session: DB 세션
+        """
+        repository = PersonalizationRepository(session)
+        tag_stats = await repository.get_global_tag_stats(limit=self.top_k)
+        category_stats = await repository.get_global_category_stats(
+            limit=self.top_k
+        )
+
+        # 딕셔너리 교체는 원자적이므로 조회 중인 요청에 영향 없음
+        self.tags = build_popularity(tag_stats)
+        self.categories = build_popularity(
+            category_stats, name_key="category_name"
+        )
+        self.refreshed_at = self.clock()
+
+        logger.info(
+            f"Popularity snapshot refreshed: {len(self.tags)} tags, "
+            f"{len(self.categories)} categories"
+        )
+
+    def _needs_refresh(self) -> bool:
+        # 백그라운드 갱신 중에는 첫 스냅샷만 요청 경로에서 계산
+        if self._refresher_running:
+            return self.refreshed_at is None
+        return self.is_stale
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """스냅샷이 필요한 경우에만 갱신 (동시 요청은 한 번만 집계)
+
+        백그라운드 갱신(run_forever)이 실행 중이면 만료된 스냅샷을 그대로
+        사용하고 (다음 주기에 교체), 스냅샷이 아직 없을 때만 집계합니다.
+
+        Args:
+            session: DB 세션
+        """
+        if not self._needs_refresh():
+            return
+        async with self._lock:
+            if self._needs_refresh():
+                await self.refresh(session)
+
+    async def run_forever(self, session_factory: Callable[[], Any]) -> None:
+        """주기적 갱신 루프 (앱 lifespan 백그라운드 작업)
+
+        오류는 로그만 남기고 다음 주기에 다시 시도합니다.
+
+        Args:
+            session_factory: AsyncSession 컨텍스트 매니저 팩토리
+                (예: async_session_maker)
+        """
+        self._refresher_running = True
+        try:
+            while True:
+                try:
+                    async with session_factory() as session:
+                        async with self._lock:
+                            await self.refresh(session)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Popularity snapshot refresh failed: {e}")
+                await asyncio.sleep(self.refresh_seconds)
+        finally:
+            self._refresher_running = False
+
+    def stats(self) -> dict[str, Any]:
+        """스냅샷 상태 (항목 수, 경과 시간)"""
+        return {
+            "tags": len(self.tags),
+            "categories": len(self.categories),
+            "age_seconds": (
+                None
+                if self.refreshed_at is None
+                else round(self.clock() - self.refreshed_at, 1)
+            ),
+        }
+
+
+_popularity_store: Optional[PopularityStore] = None
+
+
+def get_popularity_store() -> PopularityStore:
+    """전역 인기도 스토어 싱글톤
+
+    Returns:
+        PopularityStore (설정값 기반)
+    """
+    global _popularity_store
+    if _popularity_store is None:
+        refresh_seconds = settings.personalization_popularity_refresh_seconds
+        _popularity_store = PopularityStore(
+            top_k=settings.personalization_popularity_top_k,
+            refresh_seconds=refresh_seconds,
+        )
+    return _popularity_store
+
+
+def reset_popularity_store() -> None:
+    """싱글톤 초기화 (테스트 / 설정 변경 시)"""
+    global _popularity_store
+    _popularity_store = None
@@ -0,0 +1,213 @@
+"""사용자 개인화 프로필 캐시
+
+요약 요청마다(요약 캐시 히트 포함) 사용자 태그/카테고리 통계와 임베딩을
+다시 조회하지 않도록, 활성 사용자의 프로필(이름, 사용 횟수, 마지막 사용
+시각, 정규화된 float32 임베딩 행렬)을 프로세스 로컬로 보관합니다.
+
+- 축출: LRU (max_entries) + TTL
+- 갱신: update_tag_usage / update_category_usage가 UPSERT 결과로 캐시된
+  프로필을 제자리 갱신 (write-through, 재조회 없음). 세션 커밋 후에만
+  반영하므로 롤백된 사용은 캐시에 남지 않습니다.
+
+Example::
+
+    cache = get_user_profile_cache()
+    profile = cache.get(user_id)
+    if profile is None:
+        profile = await load_profile(user_id)
+        cache.set(user_id, profile)
+"""
+
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.domains.ai.personalization.scoring import add_use, record_use
+from app.domains.ai.personalization.types import UserProfile
+
+# 프로필 행 수 상한 (get_user_tag_stats / get_user_category_stats 기본 limit)
+TAG_PROFILE_LIMIT = 50
+CATEGORY_PROFILE_LIMIT = 20
+
+
+class UserProfileCache:
+    """사용자 프로필 LRU + TTL 캐시
+
+    Args:
+        max_entries: 최대 사용자 수
+        ttl_seconds: 프로필 유효 시간 (초)
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+    ):
+        self.cache: TTLCache[int, UserProfile] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    def get(self, user_id: int) -> Optional[UserProfile]:
+        """프로필 조회 (없거나 만료되면 None)"""
+        return self.cache.get(user_id)
+
+    def set(self, user_id: int, profile: UserProfile) -> None:
+        """프로필 저장"""
+        self.cache.set(user_id, profile)
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자 프로필 삭제 (다음 조회 시 DB에서 다시 로드)"""
+        self.cache.delete(user_id)
+
+    def record_tag_use(
+        self,
+        user_id: int,
+        tag_name: str,
+        use_count: int,
+        last_used_at: Optional[datetime],
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """캐시된 프로필에 태그 사용 반영 (캐시에 없으면 무시)
+
+        Args:
+            user_id: 사용자 ID
+            tag_name: 태그 이름
+            use_count: UPSERT 후 사용 횟수
+            last_used_at: UPSERT 후 마지막 사용 시각
+            embedding: 태그 임베딩 (새 태그인 경우 사용)
+        """
+        profile = self.cache.get(user_id, record=False)
+        if profile is not None:
+            record_use(
+                profile.tags,
+                tag_name,
+                use_count,
+                last_used_at,
+                embedding,
+                limit=TAG_PROFILE_LIMIT,
+            )
+
+    def record_category_use(
+        self,
+        user_id: int,
+        category_name: str,
+        use_count: int,
+        last_used_at: Optional[datetime],
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """캐시된 프로필에 카테고리 사용 반영 (캐시에 없으면 무시)
+
+        Args:
+            user_id: 사용자 ID
+            category_name: 카테고리 이름
+            use_count: UPSERT 후 사용 횟수
+            last_used_at: UPSERT 후 마지막 사용 시각
+            embedding: 카테고리 임베딩 (새 카테고리인 경우 사용)
+        """
+        profile = self.cache.get(user_id, record=False)
+        if profile is not None:
+            record_use(
+                profile.categories,
+                category_name,
+                use_count,
+                last_used_at,
+                embedding,
+                limit=CATEGORY_PROFILE_LIMIT,
+            )
+
+    def add_use(
+        self,
+        user_id: int,
+        kind: str,
+        name: str,
+        count: int,
+        last_used_at: Optional[datetime],
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """캐시된 프로필에 사용 횟수 증가분 반영 (write-behind 모드)
+
+        Args:
+            user_id: 사용자 ID
+            kind: "tag" 또는 "category"
+            name: 태그/카테고리 이름
+            count: 증가량
+            last_used_at: 마지막 사용 시각
+            embedding: 임베딩 (새 항목인 경우 사용)
+        """
+        profile = self.cache.get(user_id, record=False)
+        if profile is not None:
+            apply_pending(profile, kind, name, count, last_used_at, embedding)
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계 (hits, misses, evictions, expirations, size 등)"""
+        return {**self.cache.stats.to_dict(), "size": len(self.cache)}
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self.cache.clear()
+
+
+class _DisabledUserProfileCache(UserProfileCache):
+    """캐시 비활성화 시 (personalization_profile_cache_enabled=False)"""
+
+    def get(self, user_id: int) -> Optional[UserProfile]:
+        self.cache.stats.misses += 1
+        return None
+
+    def set(self, user_id: int, profile: UserProfile) -> None:
+        return None
+
+
+def apply_pending(
+    profile: UserProfile,
+    kind: str,
+    name: str,
+    count: int,
+    last_used_at: Optional[datetime],
+    embedding: Optional[Sequence[float]] = None,
+) -> None:
+    """프로필에 DB 반영 전 증가분 더하기
+
+    Args:
+        profile: 사용자 프로필
+        kind: "tag" 또는 "category"
+        name: 태그/카테고리 이름
+        count: 증가량
+        last_used_at: 마지막 사용 시각
+        embedding: 임베딩 (새 항목인 경우 사용)
+    """
+    if kind == "tag":
+        usage_profile, limit = profile.tags, TAG_PROFILE_LIMIT
+    else:
+        usage_profile, limit = profile.categories, CATEGORY_PROFILE_LIMIT
+    add_use(usage_profile, name, count, last_used_at, embedding, limit=limit)
+
+
+_profile_cache: Optional[UserProfileCache] = None
+
+
+def get_user_profile_cache() -> UserProfileCache:
+    """사용자 프로필 캐시 싱글톤
+
+    Returns:
+        UserProfileCache (설정값 기반)
+    """
+    global _profile_cache
+    if _profile_cache is None:
+        cache_class = (
+            UserProfileCache
+            if settings.personalization_profile_cache_enabled
+            else _DisabledUserProfileCache
+        )
+        _profile_cache = cache_class(
+            max_entries=settings.personalization_profile_cache_max_entries,
+            ttl_seconds=settings.personalization_profile_cache_ttl_seconds,
+        )
+    return _profile_cache
+
+
+def reset_user_profile_cache() -> None:
+    """싱글톤 초기화 (테스트 / 설정 변경 시)"""
+    global _profile_cache
+    _profile_cache = None
@@ -2,13 +2,13 @@
 
 사용자의 태그/카테고리 사용 통계를 조회하고 관리합니다.
 """
-from typing import Optional, cast
+from datetime import datetime
+from typing import Any, Collection, Mapping, Optional, Sequence, Union, cast
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.llm import create_embedding
 from app.core.logging import get_logger
 from app.core.utils.datetime import now_utc
 from app.domains.ai.models import (
@@ -20,6 +20,9 @@ from app.domains.ai.models import (
 
 logger = get_logger(__name__)
 
+# 단일 시각 또는 (user_id, 참조 ID)별 시각
+LastUsedAt = Union[datetime, Mapping[tuple[int, int], datetime], None]
+
 
 class PersonalizationRepository:
     """개인화 레포지토리"""
@@ -201,9 +204,12 @@ class PersonalizationRepository:
     ) -> Tag:
         """태그 마스터에서 태그 조회 또는 생성
 
+        임베딩이 주어지지 않은 새 태그는 NULL로 저장하고,
+        백그라운드 backfill 작업이 채웁니다 (요청 경로에서 임베딩하지 않음).
+
         Args:
             tag_name: 태그 이름
-            embedding_vector: 태그 임베딩 벡터 (1536 차원)
+            embedding_vector: 태그 임베딩 벡터 (TAG_EMBEDDING_DIM 차원)
 
         Returns:
             Tag 객체
@@ -218,13 +224,6 @@ class PersonalizationRepository:
             return existing_tag
 
         # 새 태그 생성
-        if embedding_vector is None:
-            try:
-                embedding_vector = await create_embedding(tag_name)
-            except Exception:
-                # 임베딩 실패 시 None으로 저장 (나중에 재계산)
-                embedding_vector = None
-
         new_tag = Tag(
             tag_name=tag_name,
             embedding_vector=embedding_vector,
@@ -243,9 +242,12 @@ class PersonalizationRepository:
     ) -> Category:
         """카테고리 마스터에서 카테고리 조회 또는 생성
 
+        임베딩이 주어지지 않은 새 카테고리는 NULL로 저장하고,
+        백그라운드 backfill 작업이 채웁니다.
+
         Args:
             category_name: 카테고리 이름
-            embedding_vector: 카테고리 임베딩 벡터 (1536 차원)
+            embedding_vector: 카테고리 임베딩 벡터 (TAG_EMBEDDING_DIM 차원)
 
         Returns:
             Category 객체
@@ -260,12 +262,6 @@ class PersonalizationRepository:
             return existing_category
 
         # 새 카테고리 생성
-        if embedding_vector is None:
-            try:
-                embedding_vector = await create_embedding(category_name)
-            except Exception:
-                embedding_vector = None
-
         new_category = Category(
             category_name=category_name,
             embedding_vector=embedding_vector,
@@ -375,3 +371,246 @@ class PersonalizationRepository:
         )
 
         return usage
+
+    async def _bulk_get_or_create(
+        self, model: Any, name_column: Any, names: Sequence[str]
+    ) -> dict[str, dict]:
+        """이름 목록을 마스터 테이블에서 일괄 조회 또는 생성
+
+        1) INSERT ... ON CONFLICT DO NOTHING RETURNING (새 행)
+        2) 이미 있던 이름만 SELECT (없으면 생략)
+
+        새 행의 임베딩은 NULL로 두고 backfill_*_embeddings로 채웁니다.
+        """
+        # 이름 정렬: 동시 INSERT 간 고유 인덱스 잠금 순서를 고정해 교착 방지
+        unique_names = sorted(set(names))
+        if not unique_names:
+            return {}
+
+        key = name_column.key
+        columns = (model.id, name_column, model.embedding_vector)
+        created_at = now_utc()
+        stmt = (
+            insert(model)
+            .values([{key: n, "created_at": created_at} for n in unique_names])
+            .on_conflict_do_nothing(index_elements=[key])
+            .returning(*columns)
+        )
+        result = await self.session.execute(stmt)
+        rows = {
+            row[1]: {
+                "id": row[0],
+                key: row[1],
+                "embedding_vector": row[2],
+                "created": True,
+            }
+            for row in result.all()
+        }
+
+        existing = [n for n in unique_names if n not in rows]
+        if existing:
+            result = await self.session.execute(
+                select(*columns).where(name_column.in_(existing))
+            )
+            for row in result.all():
+                rows[row[1]] = {
+                    "id": row[0],
+                    key: row[1],
+                    "embedding_vector": row[2],
+                    "created": False,
+                }
+
+        if any(row["created"] for row in rows.values()):
+            logger.info(
+                f"Created {model.__tablename__}: "
+                f"{[n for n, row in rows.items() if row['created']]}"
+            )
+        return rows
+
+    async def bulk_get_or_create_tags(
+        self, tag_names: Sequence[str]
+    ) -> dict[str, dict]:
+        """태그 일괄 조회 또는 생성 (최대 2개 쿼리, 임베딩 생성 없음)
+
+        Args:
+            tag_names: 태그 이름 리스트 (중복 허용)
+
+        Returns:
+            태그 이름 → {id, tag_name, embedding_vector, created}
+        """
+        return await self._bulk_get_or_create(Tag, Tag.tag_name, tag_names)
+
+    async def bulk_get_or_create_categories(
+        self, category_names: Sequence[str]
+    ) -> dict[str, dict]:
+        """카테고리 일괄 조회 또는 생성 (최대 2개 쿼리, 임베딩 생성 없음)
+
+        Args:
+            category_names: 카테고리 이름 리스트 (중복 허용)
+
+        Returns:
+            카테고리 이름 → {id, category_name, embedding_vector, created}
+        """
+        return await self._bulk_get_or_create(
+            Category, Category.category_name, category_names
+        )
+
+    async def _bulk_upsert_usage(
+        self,
+        model: Any,
+        ref_column: Any,
+        increments: Mapping[tuple[int, int], int],
+        last_used_at: LastUsedAt = None,
+    ) -> list[dict]:
+        """(user_id, 참조 ID)별 사용 횟수를 한 번의 다중 행 UPSERT로 증가"""
+        if not increments:
+            return []
+
+        key = ref_column.key
+        now = now_utc()
+
+        def used_at(usage_key: tuple[int, int]) -> datetime:
+            if isinstance(last_used_at, Mapping):
+                return last_used_at.get(usage_key) or now
+            return last_used_at or now
+
+        # 키 정렬: 동시 UPSERT 간 행 잠금 순서를 고정해 교착 방지
+        values = [
+            {
+                "user_id": usage_key[0],
+                key: usage_key[1],
+                "use_count": count,
+                "last_used_at": used_at(usage_key),
+            }
+            for usage_key, count in sorted(increments.items())
+        ]
+        insert_stmt = insert(model).values(values)
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["user_id", key],
+            set_={
+                "use_count": model.use_count + insert_stmt.excluded.use_count,
+                # 지연 반영(write-behind) 시 더 최근 값을 덮어쓰지 않음
+                "last_used_at": func.greatest(
+                    model.last_used_at, insert_stmt.excluded.last_used_at
+                ),
+            },
+        ).returning(
+            model.user_id, ref_column, model.use_count, model.last_used_at
+        )
+
+        result = await self.session.execute(upsert_stmt)
+        return [
+            {
+                "user_id": row[0],
+                key: row[1],
+                "use_count": row[2],
+                "last_used_at": row[3],
+            }
+            for row in result.all()
+        ]
+
+    async def bulk_upsert_user_tag_usage(
+        self,
+        increments: Mapping[tuple[int, int], int],
+        last_used_at: LastUsedAt = None,
+    ) -> list[dict]:
+        """사용자 태그 사용 카운트 일괄 증가 (단일 쿼리)
+
+        Args:
+            increments: (user_id, tag_id) → 증가량
+            last_used_at: 마지막 사용 시각 (기본 현재 시각, 키별 지정 가능)
+
+        Returns:
+            갱신 후 사용 통계 리스트 (user_id, tag_id, use_count, last_used_at)
+        """
+        return await self._bulk_upsert_usage(
+            UserTagUsage, UserTagUsage.tag_id, increments, last_used_at
+        )
+
+    async def bulk_upsert_user_category_usage(
+        self,
+        increments: Mapping[tuple[int, int], int],
+        last_used_at: LastUsedAt = None,
+    ) -> list[dict]:
+        """사용자 카테고리 사용 카운트 일괄 증가 (단일 쿼리)
+
+        Args:
+            increments: (user_id, category_id) → 증가량
+            last_used_at: 마지막 사용 시각 (기본 현재 시각, 키별 지정 가능)
+
+        Returns:
+            갱신 후 사용 통계 리스트
+            (user_id, category_id, use_count, last_used_at)
+        """
+        return await self._bulk_upsert_usage(
+            UserCategoryUsage,
+            UserCategoryUsage.category_id,
+            increments,
+            last_used_at,
+        )
+
+    async def get_tag_embeddings(self) -> list[tuple[str, Any]]:
+        """임베딩이 있는 전체 태그 조회 (태그 인덱스 적재용)
+
+        Returns:
+            (태그 이름, 임베딩) 리스트 (id 순)
+        """
+        result = await self.session.execute(
+            select(Tag.tag_name, Tag.embedding_vector)
+            .where(Tag.embedding_vector.is_not(None))
+            .order_by(Tag.id)
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def get_missing_embeddings(
+        self,
+        model: Any,
+        name_column: Any,
+        limit: int,
+        exclude_ids: Collection[int] = (),
+    ) -> list[tuple[int, str]]:
+        """임베딩이 없는 마스터 행 조회 및 잠금
+
+        FOR UPDATE SKIP LOCKED로 잠그므로 여러 backfill 작업이 동시에
+        실행되어도 같은 행을 중복 임베딩하지 않습니다. 잠금은 트랜잭션
+        종료(commit/rollback)까지 유지됩니다.
+
+        Args:
+            model: Tag 또는 Category
+            name_column: 이름 컬럼
+            limit: 최대 행 수
+            exclude_ids: 제외할 행 ID (이번 실행에서 임베딩에 실패한 행)
+
+        Returns:
+            (id, 이름) 리스트
+        """
+        query = select(model.id, name_column).where(
+            model.embedding_vector.is_(None)
+        )
+        if exclude_ids:
+            query = query.where(model.id.notin_(exclude_ids))
+        result = await self.session.execute(
+            query.order_by(model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def update_embeddings(
+        self, model: Any, vectors: Mapping[int, list[float]]
+    ) -> None:
+        """마스터 행 임베딩 일괄 저장 (executemany UPDATE 한 번)
+
+        Args:
+            model: Tag 또는 Category
+            vectors: id → 임베딩 벡터
+        """
+        if not vectors:
+            return
+        await self.session.execute(
+            update(model),
+            [
+                {"id": row_id, "embedding_vector": vector}
+                for row_id, vector in vectors.items()
+            ],
+        )
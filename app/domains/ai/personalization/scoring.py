@@ -0,0 +1,369 @@
+"""개인화 점수 계산 엔진
+
+후보 태그/카테고리 전체를 한 번에 점수화합니다.
+사용자 프로필(사용 통계 + 임베딩 행렬)과 전역 인기도는 요청당 한 번만
+로드하고, 유사도는 후보 × 사용자 태그 행렬 곱으로 계산합니다.
+
+Example::
+
+    profile = build_profile(await repository.get_user_tag_stats(user_id))
+    scorer = PersonalizationScorer(personalization_weight=0.5)
+    scored = scorer.score(
+        candidates,
+        profile,
+        candidate_embeddings=np.array(await create_embeddings(candidates)),
+        popularity=build_popularity(global_stats),
+    )
+"""
+
+import math
+from datetime import datetime
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.core.logging import get_logger
+from app.core.utils.datetime import UTC, now_utc
+from app.domains.ai.personalization.types import ScoredTag, UsageProfile
+
+logger = get_logger(__name__)
+
+# 개인화 점수 정규화 기준 (유사도 × log(빈도 + 1) / 0.25, 최대 1.0)
+PERSONALIZATION_SCALE = 0.25
+# 최근성 감쇠 기준 일수 (오늘 = 1.0, 30일 전 ≈ 0.37)
+RECENCY_DECAY_DAYS = 30.0
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (float32, 영벡터는 그대로 0)
+
+    Args:
+        matrix: (n, d) 행렬
+
+    Returns:
+        정규화된 (n, d) float32 행렬
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.asarray(matrix / norms, dtype=np.float32)
+
+
+def build_profile(
+    stats: Sequence[dict], name_key: str = "tag_name"
+) -> UsageProfile:
+    """사용 통계로 사용자 프로필 생성
+
+    Args:
+        stats: get_user_tag_stats / get_user_category_stats 결과
+            (use_count 내림차순)
+        name_key: 이름 필드 (tag_name 또는 category_name)
+
+    Returns:
+        UsageProfile (임베딩이 없는 행은 유사도 계산에서 제외)
+    """
+    names = [row[name_key] for row in stats]
+    use_counts = np.array(
+        [row["use_count"] for row in stats], dtype=np.float32
+    )
+    last_used_at = [row["last_used_at"] for row in stats]
+
+    rows = [
+        (i, row["embedding_vector"])
+        for i, row in enumerate(stats)
+        if row["embedding_vector"] is not None
+    ]
+    # 차원이 다른 임베딩(모델 변경 전 데이터)은 가장 많은 차원에 맞춰 제외
+    if rows:
+        dims = [len(vector) for _, vector in rows]
+        dim = max(set(dims), key=dims.count)
+        rows = [(i, vector) for i, vector in rows if len(vector) == dim]
+
+    if rows:
+        indices = np.array([i for i, _ in rows], dtype=np.intp)
+        embeddings = normalize_rows(np.array([v for _, v in rows]))
+    else:
+        indices = np.empty(0, dtype=np.intp)
+        embeddings = np.empty((0, 0), dtype=np.float32)
+
+    return UsageProfile(
+        names=names,
+        use_counts=use_counts,
+        last_used_at=last_used_at,
+        embeddings=embeddings,
+        embedding_rows=indices,
+    )
+
+
+def record_use(
+    profile: UsageProfile,
+    name: str,
+    use_count: int,
+    last_used_at: Optional[datetime],
+    embedding: Optional[Sequence[float]] = None,
+    limit: Optional[int] = None,
+) -> None:
+    """프로필에 사용 기록 반영 (DB 재조회 없이 제자리 갱신)
+
+    Args:
+        profile: 갱신할 프로필
+        name: 태그/카테고리 이름
+        use_count: 갱신 후 사용 횟수 (UPSERT 결과)
+        last_used_at: 갱신 후 마지막 사용 시각
+        embedding: 새 항목의 임베딩 (없으면 유사도 계산에서 제외)
+        limit: 프로필 최대 행 수 (조회 시 limit과 동일하게 유지)
+    """
+    if name in profile.names:
+        i = profile.names.index(name)
+        profile.use_counts[i] = use_count
+        profile.last_used_at[i] = last_used_at
+        return
+
+    # 조회는 use_count 상위 limit개이므로, 가득 찬 경우 더 적은 횟수의 새
+    # 항목은 조회 결과에도 포함되지 않음
+    if limit is not None and len(profile.names) >= limit:
+        if use_count <= float(profile.use_counts.min()):
+            return
+
+    profile.names.append(name)
+    profile.use_counts = np.append(profile.use_counts, np.float32(use_count))
+    profile.last_used_at.append(last_used_at)
+
+    if embedding is not None:
+        row = normalize_rows(np.asarray(embedding)[np.newaxis, :])
+        appended = True
+        if not profile.has_embeddings:
+            profile.embeddings = row
+        elif row.shape[1] == profile.embeddings.shape[1]:
+            profile.embeddings = np.vstack([profile.embeddings, row])
+        else:
+            # 차원이 다른 임베딩은 유사도 계산에서 제외
+            appended = False
+        if appended:
+            profile.embedding_rows = np.append(
+                profile.embedding_rows, len(profile.names) - 1
+            )
+
+    if limit is not None and len(profile.names) > limit:
+        _drop_row(profile, int(np.argmin(profile.use_counts)))
+
+
+def add_use(
+    profile: UsageProfile,
+    name: str,
+    count: int,
+    last_used_at: Optional[datetime],
+    embedding: Optional[Sequence[float]] = None,
+    limit: Optional[int] = None,
+) -> None:
+    """프로필에 사용 횟수 증가분 반영 (DB 반영 전 증가분용)
+
+    Args:
+        profile: 갱신할 프로필
+        name: 태그/카테고리 이름
+        count: 증가량
+        last_used_at: 마지막 사용 시각
+        embedding: 새 항목의 임베딩
+        limit: 프로필 최대 행 수
+    """
+    current = 0
+    if name in profile.names:
+        i = profile.names.index(name)
+        current = int(profile.use_counts[i])
+        previous = profile.last_used_at[i]
+        if previous is not None and last_used_at is not None:
+            last_used_at = max(previous, last_used_at)
+    record_use(
+        profile, name, current + count, last_used_at, embedding, limit=limit
+    )
+
+
+def _drop_row(profile: UsageProfile, index: int) -> None:
+    """프로필에서 한 행 제거 (임베딩 행 인덱스 재매핑)"""
+    del profile.names[index]
+    del profile.last_used_at[index]
+    profile.use_counts = np.delete(profile.use_counts, index)
+
+    keep = profile.embedding_rows != index
+    profile.embeddings = profile.embeddings[keep]
+    rows = profile.embedding_rows[keep]
+    profile.embedding_rows = np.where(rows > index, rows - 1, rows)
+
+
+def build_popularity(
+    global_stats: Sequence[dict], name_key: str = "tag_name"
+) -> dict[str, float]:
+    """전역 사용 통계로 인기도 점수표 생성
+
+    Args:
+        global_stats: get_global_tag_stats 결과 (total_use_count 내림차순)
+        name_key: 이름 필드
+
+    Returns:
+        소문자 이름 → 인기도 (최다 사용 = 1.0)
+    """
+    if not global_stats:
+        return {}
+
+    max_count = max(float(global_stats[0]["total_use_count"]), 1.0)
+    popularity: dict[str, float] = {}
+    for row in global_stats:
+        popularity.setdefault(
+            row[name_key].lower(), float(row["total_use_count"]) / max_count
+        )
+    return popularity
+
+
+def base_scores(total: int) -> np.ndarray:
+    """LLM 제안 순서 기반 점수 (첫 번째 = 1.0, 마지막 = 0.1)"""
+    return 1.0 - 0.9 * np.arange(total) / max(total - 1, 1)
+
+
+def personalization_scores(
+    candidate_embeddings: np.ndarray, profile: UsageProfile
+) -> np.ndarray:
+    """개인화 점수 (사용자 태그와의 최대 유사도 × log(빈도 + 1))
+
+    Args:
+        candidate_embeddings: (k, d) 후보 임베딩
+        profile: 사용자 프로필
+
+    Returns:
+        (k,) 점수 (0.0~1.0)
+    """
+    total = len(candidate_embeddings)
+    if not profile.has_embeddings:
+        return np.zeros(total)
+
+    candidates = normalize_rows(candidate_embeddings)
+    if candidates.shape[1] != profile.embeddings.shape[1]:
+        logger.warning(
+            "Candidate embedding dimension mismatch: "
+            f"{candidates.shape[1]} != {profile.embeddings.shape[1]}"
+        )
+        return np.zeros(total)
+
+    # (k, m) 코사인 유사도 × (m,) 빈도 가중치
+    weights = np.log(profile.use_counts[profile.embedding_rows] + 1)
+    scores = (candidates @ profile.embeddings.T) * weights
+    best = np.maximum(scores.max(axis=1), 0.0)
+    return np.asarray(
+        np.minimum(best / PERSONALIZATION_SCALE, 1.0), dtype=np.float64
+    )
+
+
+def recency_scores(
+    candidates: Sequence[str],
+    profile: UsageProfile,
+    now: Optional[datetime] = None,
+) -> np.ndarray:
+    """최근성 점수 (같은 이름을 최근에 사용했을수록 높음)
+
+    Args:
+        candidates: 후보 이름
+        profile: 사용자 프로필
+        now: 기준 시각 (기본 현재 UTC)
+
+    Returns:
+        (k,) 점수 (0.0~1.0, 사용 이력 없으면 0)
+    """
+    now = now or now_utc()
+    index = profile.name_index
+    scores = np.zeros(len(candidates))
+
+    for i, candidate in enumerate(candidates):
+        row = index.get(candidate.lower())
+        last_used_at = None if row is None else profile.last_used_at[row]
+        if last_used_at is None:
+            continue
+        if last_used_at.tzinfo is None:
+            last_used_at = last_used_at.replace(tzinfo=UTC)
+        days_ago = (now - last_used_at).days
+        scores[i] = math.exp(-days_ago / RECENCY_DECAY_DAYS)
+
+    return scores
+
+
+class PersonalizationScorer:
+    """후보 일괄 점수 계산기
+
+    final_score =
+        base_score + w1*personalization + w2*recency + w3*popularity
+
+    Args:
+        personalization_weight: 개인화 점수 가중치
+        recency_weight: 최근성 점수 가중치
+        popularity_weight: 인기도 점수 가중치
+    """
+
+    def __init__(
+        self,
+        personalization_weight: float = 0.5,
+        recency_weight: float = 0.2,
+        popularity_weight: float = 0.1,
+    ):
+        self.w1 = personalization_weight
+        self.w2 = recency_weight
+        self.w3 = popularity_weight
+
+    def score(
+        self,
+        candidates: Sequence[str],
+        profile: UsageProfile,
+        candidate_embeddings: Optional[np.ndarray] = None,
+        popularity: Optional[dict[str, float]] = None,
+        now: Optional[datetime] = None,
+    ) -> list[ScoredTag]:
+        """후보 점수 계산 및 정렬
+
+        Args:
+            candidates: 후보 이름 (LLM 제안 순서)
+            profile: 사용자 프로필
+            candidate_embeddings: (k, d) 후보 임베딩
+                (None이면 개인화 점수 0)
+            popularity: build_popularity 결과 (None이면 인기도 0)
+            now: 최근성 기준 시각
+
+        Returns:
+            final_score 내림차순 정렬된 점수 목록
+            (동점이면 LLM 제안 순서 유지)
+        """
+        total = len(candidates)
+        if total == 0:
+            return []
+
+        base = base_scores(total)
+        personalization = (
+            personalization_scores(candidate_embeddings, profile)
+            if candidate_embeddings is not None
+            else np.zeros(total)
+        )
+        recency = (
+            recency_scores(candidates, profile, now)
+            if self.w2
+            else np.zeros(total)
+        )
+        popular = np.array(
+            [(popularity or {}).get(c.lower(), 0.0) for c in candidates]
+        )
+
+        final = (
+            base
+            + self.w1 * personalization
+            + self.w2 * recency
+            + self.w3 * popular
+        )
+
+        scored: list[ScoredTag] = [
+            {
+                "tag": candidate,
+                "final_score": float(final[i]),
+                "base_score": float(base[i]),
+                "personalization_score": float(personalization[i]),
+                "recency_score": float(recency[i]),
+                "popularity_score": float(popular[i]),
+            }
+            for i, candidate in enumerate(candidates)
+        ]
+        scored.sort(key=lambda x: x["final_score"], reverse=True)
+        return scored
@@ -2,20 +2,80 @@
 
 태그/카테고리 추천을 사용자별로 개인화합니다.
 """
-import math
-from datetime import datetime
+from collections import Counter
+from functools import partial
+from typing import Any, Collection, Mapping, Optional, Union
 
 import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.llm import create_embedding
+from app.core.database import run_after_commit
+from app.core.llm import (
+    create_embeddings,
+    embedding_cache_model,
+    get_embedding_cache,
+)
 from app.core.logging import get_logger
+from app.domains.ai.models import TAG_EMBEDDING_DIM, Category, Tag
+from app.domains.ai.personalization.popularity import get_popularity_store
+from app.domains.ai.personalization.profile_cache import (
+    CATEGORY_PROFILE_LIMIT,
+    TAG_PROFILE_LIMIT,
+    UserProfileCache,
+    apply_pending,
+    get_user_profile_cache,
+)
 from app.domains.ai.personalization.repository import PersonalizationRepository
-from app.domains.ai.personalization.types import ScoredCategory, ScoredTag
+from app.domains.ai.personalization.scoring import (
+    PersonalizationScorer,
+    build_profile,
+)
+from app.domains.ai.personalization.tag_index import (
+    TagVectorIndex,
+    get_tag_index,
+)
+from app.domains.ai.personalization.types import (
+    BackfillResult,
+    PendingUsage,
+    ScoredCategory,
+    ScoredTag,
+    SimilarTag,
+    UserProfile,
+)
+from app.domains.ai.personalization.usage_buffer import (
+    UsageBuffer,
+    get_usage_buffer,
+)
 
 logger = get_logger(__name__)
 
 
+async def embed_names(names: list[str]) -> list[list[float]]:
+    """태그/카테고리 이름 일괄 임베딩 (캐시 미스만 배치 호출)
+
+    Tag/Category.embedding_vector 컬럼에 맞춰 TAG_EMBEDDING_DIM(256) 차원으로
+    요청하므로, 후보 임베딩과 사용자 프로필 임베딩이 같은 벡터 공간에
+    있습니다.
+
+    Args:
+        names: 태그/카테고리 이름 리스트
+
+    Returns:
+        names와 같은 순서의 임베딩 벡터
+
+    Raises:
+        LLMProviderError: 임베딩 생성 실패 시
+    """
+    dimensions = TAG_EMBEDDING_DIM
+
+    async def loader(texts: list[str]) -> list[list[float]]:
+        return await create_embeddings(texts, dimensions=dimensions)
+
+    return await get_embedding_cache().get_or_create_many(
+        names, loader, model=embedding_cache_model(dimensions)
+    )
+
+
 class PersonalizationService:
     """개인화 서비스
 
@@ -36,6 +96,8 @@ class PersonalizationService:
         personalization_weight: float = 0.5,
         recency_weight: float = 0.2,
         popularity_weight: float = 0.1,
+        profile_cache: Optional[UserProfileCache] = None,
+        usage_buffer: Optional[UsageBuffer] = None,
     ):
         """
         Args:
@@ -43,181 +105,153 @@ class PersonalizationService:
             personalization_weight: 개인화 점수 가중치 (기본 0.5)
             recency_weight: 최근성 점수 가중치 (기본 0.2)
             popularity_weight: 인기도 점수 가중치 (기본 0.1)
+            profile_cache: 사용자 프로필 캐시 (기본 싱글톤)
+            usage_buffer: 사용 통계 write-behind 버퍼
+                (기본 싱글톤, write-behind 비활성화 시 None → 즉시 반영)
         """
         self.session = session
         self.repository = PersonalizationRepository(session)
+        self.profile_cache = profile_cache or get_user_profile_cache()
+        self.usage_buffer = (
+            usage_buffer if usage_buffer is not None else get_usage_buffer()
+        )
         self.w1 = personalization_weight
         self.w2 = recency_weight
         self.w3 = popularity_weight
+        self.scorer = PersonalizationScorer(
+            personalization_weight=personalization_weight,
+            recency_weight=recency_weight,
+            popularity_weight=popularity_weight,
+        )
 
-    def _cosine_similarity(
-        self, vec1: list[float], vec2: list[float]
-    ) -> float:
-        """코사인 유사도 계산
-
-        Args:
-            vec1: 벡터 1
-            vec2: 벡터 2
-
-        Returns:
-            코사인 유사도 (0.0~1.0)
-        """
-        vec1_arr = np.array(vec1)
-        vec2_arr = np.array(vec2)
-
-        dot_product = np.dot(vec1_arr, vec2_arr)
-        norm1 = np.linalg.norm(vec1_arr)
-        norm2 = np.linalg.norm(vec2_arr)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return float(dot_product / (norm1 * norm2))
-
-    def _calculate_base_score(self, index: int, total: int) -> float:
-        """LLM 제안 순서 기반 점수 계산
+    async def _load_profile(self, user_id: int) -> UserProfile:
+        """사용자 프로필 조회 (캐시 미스 시에만 DB 조회)"""
+        profile = self.profile_cache.get(user_id)
+        if profile is not None:
+            return profile
+
+        profile = UserProfile(
+            tags=build_profile(
+                await self.repository.get_user_tag_stats(
+                    user_id, limit=TAG_PROFILE_LIMIT
+                )
+            ),
+            categories=build_profile(
+                await self.repository.get_user_category_stats(
+                    user_id, limit=CATEGORY_PROFILE_LIMIT
+                ),
+                name_key="category_name",
+            ),
+        )
 
-        Args:
-            index: 후보 태그의 순서 (0부터 시작)
-            total: 전체 후보 태그 수
+        # write-behind 모드: 아직 DB에 반영되지 않은 증가분 더하기
+        if self.usage_buffer is not None:
+            for usage in self.usage_buffer.pending_for_user(user_id):
+                apply_pending(
+                    profile,
+                    usage.kind,
+                    usage.name,
+                    usage.count,
+                    usage.last_used_at,
+                    usage.embedding,
+                )
+
+        self.profile_cache.set(user_id, profile)
+        return profile
+
+    async def _load_popularity(self) -> dict[str, float]:
+        """전역 태그 인기도 (백그라운드 갱신 스냅샷, 만료 시에만 DB 조회)"""
+        store = get_popularity_store()
+        await store.ensure_fresh(self.session)
+        return store.tags
+
+    async def _load_tag_index(self) -> Optional[TagVectorIndex]:
+        """전체 태그 임베딩 행렬 (만료 시에만 DB 재적재)
 
         Returns:
-            base_score (0.0~1.0, 첫 번째일수록 높음)
+            TagVectorIndex, 비활성화 또는 적재 실패 시 None
         """
-        # 선형 감소: 첫 번째 = 1.0, 마지막 = 0.1
-        return 1.0 - (0.9 * index / max(total - 1, 1))
-
-    async def _calculate_personalization_score(
-        self, candidate_tag: str, user_id: int
-    ) -> float:
-        """개인화 점수 계산
+        index = get_tag_index()
+        if index is None:
+            return None
+        try:
+            await index.ensure_fresh(self.session)
+        except Exception as e:
+            logger.warning(f"Failed to load tag index: {e}")
+            return None
+        return index
 
-        사용자의 과거 태그와 후보 태그의 유사도 및 빈도를 기반으로 점수 계산
+    async def _embed_candidates(
+        self,
+        candidates: list[str],
+        tag_index: Optional[TagVectorIndex] = None,
+    ) -> Optional[np.ndarray]:
+        """후보 임베딩 일괄 생성 (캐시 미스만 한 번의 배치 호출)
 
         Args:
-            candidate_tag: 후보 태그
-            user_id: 사용자 ID
+            candidates: 후보 이름
+            tag_index: 태그 인덱스 (있으면 마스터에 있는 태그는 행렬에서
+                가져오고 나머지만 임베딩)
 
         Returns:
-            personalization_score (0.0~1.0)
+            (k, d) 임베딩 행렬, 실패 시 None (개인화 점수 0으로 처리)
         """
-        # 사용자 태그 사용 통계 조회
-        user_tags = await self.repository.get_user_tag_stats(user_id)
-
-        if not user_tags:
-            # 콜드 스타트: 사용자 태그 없음 → 점수 0
-            return 0.0
-
-        # 후보 태그 임베딩 생성
+        known: dict[str, Any] = {}
+        if tag_index is not None:
+            for name in candidates:
+                vector = tag_index.vector(name)
+                if vector is not None:
+                    known[name] = vector
+
+        missing = list(dict.fromkeys(c for c in candidates if c not in known))
         try:
-            candidate_embedding = await create_embedding(candidate_tag)
+            vectors = await embed_names(missing) if missing else []
         except Exception as e:
             logger.warning(
-                f"Failed to create embedding for tag '{candidate_tag}': {e}"
+                f"Failed to create embeddings for candidates {missing}: {e}"
             )
-            return 0.0
-
-        # 각 사용자 태그와의 유사도 계산
-        max_score = 0.0
-        for user_tag in user_tags:
-            if user_tag["embedding_vector"] is None:
-                continue
-
-            similarity = self._cosine_similarity(
-                candidate_embedding, user_tag["embedding_vector"]
-            )
-
-            # 점수 = 유사도 × log(빈도 + 1)
-            score = similarity * math.log(user_tag["use_count"] + 1)
-            max_score = max(max_score, score)
-
-        # 정규화 (최대값이 1.0이 되도록)
-        # log(50 + 1) ≈ 3.93이므로, 최대 점수는 약 1.0 × 3.93 = 3.93
-        # 0.25로 나누면 대략 0.0~1.0 범위
-        normalized_score = min(max_score / 0.25, 1.0)
+            return None
 
-        return normalized_score
+        known.update(zip(missing, vectors))
+        return np.array([known[c] for c in candidates], dtype=np.float32)
 
-    async def _calculate_recency_score(
-        self, candidate_tag: str, user_id: int
-    ) -> float:
-        """최근성 점수 계산
+    async def score_tags(
+        self, candidate_tags: list[str], user_id: int
+    ) -> list[ScoredTag]:
+        """후보 태그 점수 계산
 
-        사용자가 최근에 사용한 태그일수록 높은 점수
+        사용자 프로필은 캐시, 전역 인기도는 상위 K 스냅샷에서 가져오고,
+        후보 임베딩은 한 번의 배치로 생성합니다.
 
         Args:
-            candidate_tag: 후보 태그
+            candidate_tags: LLM이 제안한 후보 태그 리스트
             user_id: 사용자 ID
 
         Returns:
-            recency_score (0.0~1.0)
+            final_score 내림차순 정렬된 점수 목록 (구성 요소별 점수 포함)
         """
-        user_tags = await self.repository.get_user_tag_stats(user_id)
+        if not candidate_tags:
+            return []
 
-        if not user_tags:
-            return 0.0
+        profile = (await self._load_profile(user_id)).tags
+        popularity = await self._load_popularity()
 
-        # 후보 태그와 동일한 태그를 사용자가 사용한 적이 있는지 확인
-        matching_tag = next(
-            (
-                t
-                for t in user_tags
-                if t["tag_name"].lower() == candidate_tag.lower()
-            ),
-            None,
+        # 콜드 스타트(임베딩 있는 사용자 태그 없음)면 임베딩 생략
+        embeddings = (
+            await self._embed_candidates(
+                candidate_tags, await self._load_tag_index()
+            )
+            if profile.has_embeddings
+            else None
         )
 
-        if not matching_tag or matching_tag["last_used_at"] is None:
-            return 0.0
-
-        # 마지막 사용 시점으로부터 경과 일수
-        days_ago = (datetime.now() - matching_tag["last_used_at"]).days
-
-        # 지수 감쇠: 오늘 = 1.0, 30일 전 = ~0.5, 90일 전 = ~0.25
-        recency_score = math.exp(-days_ago / 30.0)
-
-        return recency_score
-
-    async def _calculate_popularity_score(self, candidate_tag: str) -> float:
-        """전역 인기도 점수 계산
-
-        전체 사용자들이 많이 사용한 태그일수록 높은 점수
-
-        Args:
-            candidate_tag: 후보 태그
-
-        Returns:
-            popularity_score (0.0~1.0)
-        """
-        global_stats = await self.repository.get_global_tag_stats(limit=100)
-
-        if not global_stats:
-            return 0.0
-
-        # 후보 태그의 전역 사용 횟수 확인
-        matching_stat = next(
-            (
-                s
-                for s in global_stats
-                if s["tag_name"].lower() == candidate_tag.lower()
-            ),
-            None,
+        return self.scorer.score(
+            candidate_tags,
+            profile,
+            candidate_embeddings=embeddings,
+            popularity=popularity,
         )
 
-        if not matching_stat:
-            return 0.0
-
-        # 상위 태그의 최대 사용 횟수
-        max_use_count = global_stats[0]["total_use_count"]
-
-        # 정규화: 최다 사용 태그 = 1.0
-        max_use_count_value = float(max_use_count)
-        total_use_count = float(matching_stat["total_use_count"])
-
-        popularity_score = total_use_count / max(max_use_count_value, 1.0)
-
-        return popularity_score
-
     async def personalize_tags(
         self,
         candidate_tags: list[str],
@@ -244,59 +278,90 @@ class PersonalizationService:
             f"{len(candidate_tags)} candidates → {count} results"
         )
 
-        scored_tags: list[ScoredTag] = []
+        scored_tags = await self.score_tags(candidate_tags, user_id)
 
-        for index, tag in enumerate(candidate_tags):
-            # 1. Base score (LLM 제안 순서)
-            base_score = self._calculate_base_score(index, len(candidate_tags))
-
-            # 2. Personalization score (유사도 × 빈도)
-            personalization_score = (
-                await self._calculate_personalization_score(tag, user_id)
+        for item in scored_tags:
+            logger.debug(
+                f"Tag '{item['tag']}': final={item['final_score']:.3f} "
+                f"(base={item['base_score']:.3f}, "
+                f"pers={item['personalization_score']:.3f}, "
+                f"rec={item['recency_score']:.3f}, "
+                f"pop={item['popularity_score']:.3f})"
             )
 
-            # 3. Recency score (최근성)
-            recency_score = await self._calculate_recency_score(tag, user_id)
+        # 상위 N개 반환
+        result = [item["tag"] for item in scored_tags[:count]]
 
-            # 4. Popularity score (전역 인기도)
-            popularity_score = await self._calculate_popularity_score(tag)
+        logger.info(f"Personalized tags: {result}")
 
-            # 최종 점수 계산
-            final_score = (
-                base_score
-                + self.w1 * personalization_score
-                + self.w2 * recency_score
-                + self.w3 * popularity_score
-            )
+        return result
 
-            scored_tags.append(
-                {
-                    "tag": tag,
-                    "final_score": final_score,
-                    "base_score": base_score,
-                    "personalization_score": personalization_score,
-                    "recency_score": recency_score,
-                    "popularity_score": popularity_score,
-                }
-            )
+    async def similar_tags(self, tag: str, k: int = 10) -> list[SimilarTag]:
+        """전체 태그 중 주어진 태그와 가장 가까운 태그 k개
 
-            logger.debug(
-                f"Tag '{tag}': final={final_score:.3f} "
-                f"(base={base_score:.3f}, "
-                f"pers={personalization_score:.3f}, "
-                f"rec={recency_score:.3f}, "
-                f"pop={popularity_score:.3f})"
-            )
+        태그 인덱스(인메모리 행렬)에서 검색하며, 마스터에 없는 태그만
+        임베딩을 생성합니다.
 
-        # 최종 점수로 정렬
-        scored_tags.sort(key=lambda x: x["final_score"], reverse=True)
+        Args:
+            tag: 기준 태그 (마스터에 없어도 됨)
+            k: 반환할 태그 수
 
-        # 상위 N개 반환
-        result = [item["tag"] for item in scored_tags[:count]]
+        Returns:
+            코사인 유사도 내림차순 유사 태그 목록
+            (인덱스 비활성화 또는 임베딩 실패 시 빈 리스트)
+        """
+        index = await self._load_tag_index()
+        if index is None:
+            return []
 
-        logger.info(f"Personalized tags: {result}")
+        embeddings = await self._embed_candidates([tag], index)
+        if embeddings is None:
+            return []
+        return index.top_k(embeddings[0], k=k, exclude=tag)
 
-        return result
+    async def score_categories(
+        self, candidate_categories: list[str], user_id: int
+    ) -> list[ScoredCategory]:
+        """후보 카테고리 점수 계산
+
+        태그와 같은 엔진을 사용하며, 개인화 점수만 반영합니다
+        (사용자 카테고리 프로필과의 유사도 × 빈도).
+
+        Args:
+            candidate_categories: LLM이 제안한 후보 카테고리 리스트
+            user_id: 사용자 ID
+
+        Returns:
+            final_score 내림차순 정렬된 점수 목록
+        """
+        if not candidate_categories:
+            return []
+
+        profile = (await self._load_profile(user_id)).categories
+        embeddings = (
+            await self._embed_candidates(candidate_categories)
+            if profile.has_embeddings
+            else None
+        )
+
+        scorer = PersonalizationScorer(
+            personalization_weight=self.w1,
+            recency_weight=0.0,
+            popularity_weight=0.0,
+        )
+        scored = scorer.score(
+            candidate_categories, profile, candidate_embeddings=embeddings
+        )
+
+        return [
+            {
+                "category": item["tag"],
+                "final_score": item["final_score"],
+                "base_score": item["base_score"],
+                "personalization_score": item["personalization_score"],
+            }
+            for item in scored
+        ]
 
     async def personalize_category(
         self,
@@ -322,32 +387,9 @@ class PersonalizationService:
             f"{len(candidate_categories)} candidates"
         )
 
-        # 카테고리도 태그와 동일한 로직 적용
-        # (카테고리용 별도 메서드를 만들 수도 있지만, 현재는 태그 메서드 재사용)
-        scored_categories: list[ScoredCategory] = []
-
-        for index, category in enumerate(candidate_categories):
-            base_score = self._calculate_base_score(
-                index, len(candidate_categories)
-            )
-
-            # 카테고리용 개인화 점수 (향후 별도 구현 가능)
-            # 현재는 태그와 동일한 로직 사용
-            personalization_score = (
-                await self._calculate_personalization_score(category, user_id)
-            )
-
-            final_score = base_score + self.w1 * personalization_score
-
-            scored_categories.append(
-                {
-                    "category": category,
-                    "final_score": final_score,
-                }
-            )
-
-        # 최종 점수로 정렬
-        scored_categories.sort(key=lambda x: x["final_score"], reverse=True)
+        scored_categories = await self.score_categories(
+            candidate_categories, user_id
+        )
 
         result = scored_categories[0]["category"]
 
@@ -360,6 +402,8 @@ class PersonalizationService:
 
         사용자가 선택한 태그들을 마스터 테이블에 추가하고,
         사용자별 태그 사용 통계를 업데이트합니다.
+        태그 수와 관계없이 2~3개의 쿼리로 처리하며, 새 태그의 임베딩은
+        요청 경로에서 만들지 않고 backfill_embeddings로 채웁니다.
 
         Args:
             user_id: 사용자 ID
@@ -370,15 +414,41 @@ class PersonalizationService:
 
         logger.info(f"Updating tag usage for user {user_id}: {len(tags)} tags")
 
-        for tag_name in tags:
-            # 1. 태그 마스터에 추가 (없으면 생성)
-            # 임베딩은 나중에 배치로 생성하거나, 개인화 시 생성
-            tag = await self.repository.get_or_create_tag(tag_name)
+        # 1. 태그 마스터에 일괄 추가 (없으면 생성, 임베딩은 NULL)
+        tag_rows = await self.repository.bulk_get_or_create_tags(tags)
+
+        # write-behind 모드: 커밋 후 버퍼와 캐시된 프로필에 반영
+        if self.usage_buffer is not None:
+            for name, count in Counter(tags).items():
+                self._stage_usage(
+                    self.usage_buffer,
+                    "tag",
+                    user_id,
+                    tag_rows[name],
+                    name,
+                    count,
+                )
+            logger.info(f"Tag usage buffered for user {user_id}: {tags}")
+            return
 
-            # 2. 사용자 태그 사용 통계 업데이트
-            await self.repository.upsert_user_tag_usage(
-                user_id=user_id,
-                tag_id=tag.id,
+        # 2. 사용자 태그 사용 통계 일괄 업데이트 (중복 태그는 횟수 합산)
+        increments = Counter((user_id, tag_rows[name]["id"]) for name in tags)
+        usages = await self.repository.bulk_upsert_user_tag_usage(increments)
+
+        # 3. 커밋 후 캐시된 프로필 제자리 갱신 (재조회 없음, 롤백 시 생략)
+        rows_by_id = {row["id"]: row for row in tag_rows.values()}
+        for usage in usages:
+            tag = rows_by_id[usage["tag_id"]]
+            run_after_commit(
+                self.session,
+                partial(
+                    self.profile_cache.record_tag_use,
+                    user_id,
+                    tag["tag_name"],
+                    usage["use_count"],
+                    usage["last_used_at"],
+                    tag["embedding_vector"],
+                ),
             )
 
         logger.info(f"Tag usage updated for user {user_id}: {tags}")
@@ -388,6 +458,7 @@ class PersonalizationService:
 
         사용자가 선택한 카테고리를 마스터 테이블에 추가하고,
         사용자별 카테고리 사용 통계를 업데이트합니다.
+        새 카테고리의 임베딩은 backfill_embeddings로 채웁니다.
 
         Args:
             user_id: 사용자 ID
@@ -400,14 +471,227 @@ class PersonalizationService:
             f"Updating category usage for user {user_id}: '{category}'"
         )
 
-        # 1. 카테고리 마스터에 추가 (없으면 생성)
-        # 임베딩은 나중에 배치로 생성하거나, 개인화 시 생성
-        category_obj = await self.repository.get_or_create_category(category)
+        # 1. 카테고리 마스터에 추가 (없으면 생성, 임베딩은 NULL)
+        category_rows = await self.repository.bulk_get_or_create_categories(
+            [category]
+        )
+        category_row = category_rows[category]
+
+        # write-behind 모드: 커밋 후 버퍼와 캐시된 프로필에 반영
+        if self.usage_buffer is not None:
+            self._stage_usage(
+                self.usage_buffer,
+                "category",
+                user_id,
+                category_row,
+                category,
+                1,
+            )
+            logger.info(
+                f"Category usage buffered for user {user_id}: '{category}'"
+            )
+            return
 
         # 2. 사용자 카테고리 사용 통계 업데이트
-        await self.repository.upsert_user_category_usage(
-            user_id=user_id,
-            category_id=category_obj.id,
+        usages = await self.repository.bulk_upsert_user_category_usage(
+            {(user_id, category_row["id"]): 1}
         )
 
+        # 3. 커밋 후 캐시된 프로필 제자리 갱신 (재조회 없음, 롤백 시 생략)
+        for usage in usages:
+            run_after_commit(
+                self.session,
+                partial(
+                    self.profile_cache.record_category_use,
+                    user_id,
+                    category,
+                    usage["use_count"],
+                    usage["last_used_at"],
+                    category_row["embedding_vector"],
+                ),
+            )
+
         logger.info(f"Category usage updated for user {user_id}: '{category}'")
+
+    def _stage_usage(
+        self,
+        buffer: UsageBuffer,
+        kind: str,
+        user_id: int,
+        row: dict,
+        name: str,
+        count: int,
+    ) -> None:
+        """write-behind 버퍼에 증가분 등록 (커밋 후 캐시된 프로필 반영)
+
+        프로필도 버퍼 합산과 같은 after_commit 시점에 갱신하므로, 롤백된
+        사용이 캐시된 프로필에 남지 않습니다.
+        """
+
+        def apply_to_profile(usage: PendingUsage) -> None:
+            self.profile_cache.add_use(
+                usage.user_id,
+                usage.kind,
+                usage.name,
+                usage.count,
+                usage.last_used_at,
+                usage.embedding,
+            )
+
+        buffer.stage(
+            self.session,
+            kind,
+            user_id,
+            row["id"],
+            name,
+            count=count,
+            embedding=row["embedding_vector"],
+            on_commit=apply_to_profile,
+        )
+
+    async def backfill_embeddings(
+        self,
+        batch_size: int = 100,
+        exclude_ids: Optional[Mapping[str, Collection[int]]] = None,
+    ) -> BackfillResult:
+        """임베딩이 없는 태그/카테고리 마스터 행 일괄 임베딩
+
+        대상 행은 FOR UPDATE SKIP LOCKED로 잠기므로 호출자가 커밋해야
+        잠금이 풀리고 결과가 반영됩니다 (EmbeddingBackfillWorker 참고).
+
+        배치 임베딩이 실패하면 배치를 반으로 나눠 다시 시도해, 항상 실패하는
+        행만 골라내고 나머지 행은 저장합니다. 골라낸 행 ID는 결과의
+        failed로 반환하므로 호출자가 다음 배치에서 제외할 수 있습니다.
+        첫 분할의 두 절반과 단일 행 확인까지 실패하면 더 나누지 않고
+        프로바이더 장애로 보고 바로 예외를 발생시킵니다.
+
+        새로 임베딩된 태그는 커밋 후 태그 인덱스에 추가합니다 (롤백 시 생략).
+
+        Args:
+            batch_size: 종류별 한 번에 처리할 최대 행 수
+            exclude_ids: 종류("tag" / "category")별 제외할 행 ID
+
+        Returns:
+            BackfillResult (채운 행 수, 종류별 실패 행 ID)
+
+        Raises:
+            LLMProviderError: 2개 이상인 배치의 모든 행이 실패한 경우
+                (프로바이더 장애로 보고 다음 주기에 다시 시도)
+        """
+        exclude_ids = exclude_ids or {}
+        result = BackfillResult()
+        for kind, model, name_column in (
+            ("tag", Tag, Tag.tag_name),
+            ("category", Category, Category.category_name),
+        ):
+            rows = await self.repository.get_missing_embeddings(
+                model,
+                name_column,
+                limit=batch_size,
+                exclude_ids=exclude_ids.get(kind, ()),
+            )
+            if not rows:
+                continue
+
+            embedded, failed = await self._embed_isolating_failures(rows)
+            if not embedded and len(rows) > 1:
+                # 모든 행이 실패하면 행 문제가 아닌 프로바이더 장애로 판단
+                raise failed[-1][2]
+            if failed:
+                result.failed[kind] = [row_id for row_id, _, _ in failed]
+                logger.warning(
+                    f"Embedding backfill skipped {kind} rows: "
+                    f"{result.failed[kind]} ({failed[-1][2]})"
+                )
+            if not embedded:
+                continue
+
+            await self.repository.update_embeddings(
+                model, {row_id: vector for row_id, _, vector in embedded}
+            )
+            # 새로 임베딩된 태그는 커밋 후 태그 인덱스에 추가 (증분)
+            tag_index = get_tag_index() if model is Tag else None
+            if tag_index is not None:
+                names = [name for _, name, _ in embedded]
+                vectors = [vector for _, _, vector in embedded]
+                run_after_commit(
+                    self.session, partial(tag_index.add_many, names, vectors)
+                )
+            result.filled += len(embedded)
+
+        if result.filled:
+            logger.info(f"Backfilled embeddings for {result.filled} rows")
+        return result
+
+    async def _embed_isolating_failures(
+        self, rows: list[tuple[int, str]], detect_outage: bool = True
+    ) -> tuple[
+        list[tuple[int, str, list[float]]], list[tuple[int, str, Exception]]
+    ]:
+        """행 임베딩, 실패 시 반으로 나눠 재시도해 실패 행만 분리
+
+        Args:
+            rows: (id, 이름) 리스트
+            detect_outage: 첫 분할에서 프로바이더 장애 여부를 확인할지 여부
+
+        Returns:
+            ([(id, 이름, 벡터)], [단독으로도 실패한 (id, 이름, 오류)])
+
+        Raises:
+            Exception: 두 절반과 단일 행 확인이 모두 실패한 경우
+                (프로바이더 장애, 행마다 나눠 재시도하지 않음)
+        """
+        attempt = await self._try_embed(rows)
+        if not isinstance(attempt, Exception):
+            return self._pair_vectors(rows, attempt), []
+        if len(rows) == 1:
+            return [], [(rows[0][0], rows[0][1], attempt)]
+
+        middle = len(rows) // 2
+        halves = (rows[:middle], rows[middle:])
+        attempts = [await self._try_embed(half) for half in halves]
+
+        if detect_outage and all(isinstance(a, Exception) for a in attempts):
+            # 두 절반이 모두 실패하면 한 행만 다시 확인해, 그것도
+            # 실패하면 장애로 보고 2N-1번 나눠 호출하지 않음
+            probe = next((half[:1] for half in halves if len(half) > 1), [])
+            probe_attempt = await self._try_embed(probe) if probe else attempt
+            if isinstance(probe_attempt, Exception):
+                raise probe_attempt
+
+        embedded: list[tuple[int, str, list[float]]] = []
+        failed: list[tuple[int, str, Exception]] = []
+        for half, half_attempt in zip(halves, attempts):
+            if not isinstance(half_attempt, Exception):
+                embedded.extend(self._pair_vectors(half, half_attempt))
+            elif len(half) == 1:
+                failed.append((half[0][0], half[0][1], half_attempt))
+            else:
+                (
+                    half_embedded,
+                    half_failed,
+                ) = await self._embed_isolating_failures(
+                    half, detect_outage=False
+                )
+                embedded.extend(half_embedded)
+                failed.extend(half_failed)
+        return embedded, failed
+
+    @staticmethod
+    async def _try_embed(
+        rows: list[tuple[int, str]]
+    ) -> Union[list[list[float]], Exception]:
+        """행 임베딩 시도 (실패 시 예외를 발생시키지 않고 반환)"""
+        try:
+            return await embed_names([name for _, name in rows])
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _pair_vectors(
+        rows: list[tuple[int, str]], vectors: list[list[float]]
+    ) -> list[tuple[int, str, list[float]]]:
+        return [
+            (row_id, name, vector)
+            for (row_id, name), vector in zip(rows, vectors)
+        ]
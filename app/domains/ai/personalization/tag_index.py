@@ -0,0 +1,233 @@
+"""전체 태그 임베딩 인메모리 행렬
+
+태그 마스터의 임베딩(TAG_EMBEDDING_DIM 차원)을 하나의 연속된 float32
+행렬로 프로세스에 보관합니다.
+
+- 조회: 이름 → 행 (O(1)), 후보 태그가 이미 마스터에 있으면 임베딩 호출 생략
+- 최근접 검색: 행렬 × 쿼리 벡터 + argpartition (수천 개 태그 기준 수십 µs)
+- 갱신: backfill이 임베딩을 채운 태그는 즉시 행 추가 (증분),
+  다른 프로세스의 변경은 refresh_seconds마다 전체 재적재로 반영
+
+Example::
+
+    index = get_tag_index()
+    await index.ensure_fresh(session)
+    index.top_k(index.vector("Python"), k=5, exclude="Python")
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.domains.ai.models import TAG_EMBEDDING_DIM
+from app.domains.ai.personalization.repository import PersonalizationRepository
+from app.domains.ai.personalization.scoring import normalize_rows
+from app.domains.ai.personalization.types import SimilarTag
+
+logger = get_logger(__name__)
+
+# 행렬 초기 용량 (행 수, 이후 2배씩 증가)
+INITIAL_CAPACITY = 64
+
+
+class TagVectorIndex:
+    """태그 이름 → L2 정규화된 임베딩 행렬
+
+    Args:
+        dim: 임베딩 차원
+        refresh_seconds: 전체 재적재 주기 (초)
+        clock: 시간 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        refresh_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.dim = dim
+        self.refresh_seconds = refresh_seconds
+        self.clock = clock
+        self.names: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.refreshed_at: Optional[float] = None
+        self._buffer = np.empty((0, dim), dtype=np.float32)
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.rows
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """(n, dim) 정규화된 임베딩 행렬 (연속 메모리 뷰)"""
+        return self._buffer[: len(self.names)]
+
+    @property
+    def is_stale(self) -> bool:
+        """적재 전이거나 재적재 주기가 지났는지 여부"""
+        return (
+            self.refreshed_at is None
+            or self.clock() - self.refreshed_at >= self.refresh_seconds
+        )
+
+    def vector(self, name: str) -> Optional[np.ndarray]:
+        """태그 임베딩 (정규화됨, 없으면 None)"""
+        row = self.rows.get(name)
+        return None if row is None else self._buffer[row].copy()
+
+    def add_many(
+        self, names: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> int:
+        """태그 임베딩 추가 (이미 있는 이름은 행 교체)
+
+        차원이 다른 벡터(모델/차원 변경 전 데이터)는 건너뜁니다.
+
+        Args:
+            names: 태그 이름
+            vectors: 임베딩 벡터 (names와 같은 순서)
+
+        Returns:
+            추가/교체한 행 수
+        """
+        pairs = [
+            (name, vector)
+            for name, vector in zip(names, vectors)
+            if vector is not None and len(vector) == self.dim
+        ]
+        if not pairs:
+            return 0
+
+        normalized = normalize_rows(np.array([v for _, v in pairs]))
+        new_names = [name for name, _ in pairs if name not in self.rows]
+        self._reserve(len(self.names) + len(new_names))
+
+        for (name, _), vector in zip(pairs, normalized):
+            row = self.rows.get(name)
+            if row is None:
+                row = self.rows[name] = len(self.names)
+                self.names.append(name)
+            self._buffer[row] = vector
+        return len(pairs)
+
+    def replace(
+        self, names: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        """전체 교체 (재적재)"""
+        self.names = []
+        self.rows = {}
+        self._buffer = np.empty((0, self.dim), dtype=np.float32)
+        self.add_many(names, vectors)
+
+    def top_k(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        exclude: Optional[str] = None,
+    ) -> list[SimilarTag]:
+        """쿼리 벡터와 가장 가까운 태그 k개
+
+        Args:
+            query: 쿼리 임베딩 (dim 차원, 정규화 불필요)
+            k: 반환할 태그 수
+            exclude: 결과에서 제외할 태그 이름 (예: 쿼리 태그 자신)
+
+        Returns:
+            코사인 유사도 내림차순 유사 태그 목록
+        """
+        query_row = np.asarray(query, dtype=np.float32)
+        if len(self.names) == 0 or k <= 0 or len(query_row) != self.dim:
+            return []
+
+        scores = self.matrix @ normalize_rows(query_row[np.newaxis, :])[0]
+        excluded = self.rows.get(exclude) if exclude is not None else None
+        if excluded is not None:
+            scores[excluded] = -np.inf
+
+        k = min(k, len(scores) - (excluded is not None))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {"tag": self.names[i], "similarity": float(scores[i])} for i in top
+        ]
+
+    async def refresh(self, session: AsyncSession) -> None:
+        """DB에서 전체 태그 임베딩 재적재
+
+        Args:
+            session: DB 세션
+        """
+        rows = await PersonalizationRepository(session).get_tag_embeddings()
+        self.replace([name for name, _ in rows], [v for _, v in rows])
+        self.refreshed_at = self.clock()
+        logger.info(f"Tag index loaded: {len(self.names)} tags")
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """적재 전이거나 만료된 경우에만 재적재 (동시 요청은 한 번만)
+
+        Args:
+            session: DB 세션
+        """
+        if not self.is_stale:
+            return
+        async with self._lock:
+            if self.is_stale:
+                await self.refresh(session)
+
+    def stats(self) -> dict[str, Any]:
+        """인덱스 상태 (태그 수, 차원, 행렬 바이트, 경과 시간)"""
+        return {
+            "tags": len(self.names),
+            "dim": self.dim,
+            "bytes": int(self.matrix.nbytes),
+            "age_seconds": (
+                None
+                if self.refreshed_at is None
+                else round(self.clock() - self.refreshed_at, 1)
+            ),
+        }
+
+    def _reserve(self, size: int) -> None:
+        """행렬 용량 확보 (부족하면 2배로 늘려 복사, 증분 추가 분할 상환)"""
+        capacity = len(self._buffer)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, INITIAL_CAPACITY)
+        buffer = np.empty((capacity, self.dim), dtype=np.float32)
+        buffer[: len(self.names)] = self.matrix
+        self._buffer = buffer
+
+
+_tag_index: Optional[TagVectorIndex] = None
+
+
+def get_tag_index() -> Optional[TagVectorIndex]:
+    """태그 인덱스 싱글톤
+
+    Returns:
+        TagVectorIndex (personalization_tag_index_enabled=False이면 None)
+    """
+    global _tag_index
+    if not settings.personalization_tag_index_enabled:
+        return None
+    if _tag_index is None:
+        refresh_seconds = settings.personalization_tag_index_refresh_seconds
+        _tag_index = TagVectorIndex(
+            dim=TAG_EMBEDDING_DIM, refresh_seconds=refresh_seconds
+        )
+    return _tag_index
+
+
+def reset_tag_index() -> None:
+    """싱글톤 초기화 (테스트 / 설정 변경 시)"""
+    global _tag_index
+    _tag_index = None
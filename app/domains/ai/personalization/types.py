@@ -1,6 +1,10 @@
 """개인화 관련 타입 정의"""
 
-from typing import TypedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional, TypedDict
+
+import numpy as np
 
 
 class ScoredTag(TypedDict):
@@ -29,7 +33,116 @@ class ScoredCategory(TypedDict):
     Attributes:
         category: 카테고리 이름
         final_score: 최종 점수
+        base_score: LLM 제안 순서 기반 점수
+        personalization_score: 개인화 점수 (유사도 × 빈도)
     """
 
     category: str
     final_score: float
+    base_score: float
+    personalization_score: float
+
+
+class SimilarTag(TypedDict):
+    """유사 태그 (태그 인덱스 최근접 검색 결과)
+
+    Attributes:
+        tag: 태그 이름
+        similarity: 코사인 유사도
+    """
+
+    tag: str
+    similarity: float
+
+
+@dataclass
+class UsageProfile:
+    """사용자 태그/카테고리 사용 프로필 (점수 계산용)
+
+    Attributes:
+        names: 이름 (use_count 내림차순)
+        use_counts: (m,) 사용 횟수
+        last_used_at: 마지막 사용 시각
+        embeddings: (e, d) L2 정규화된 float32 임베딩 행렬
+            (임베딩이 있는 행만)
+        embedding_rows: (e,) embeddings 각 행의 names 인덱스
+    """
+
+    names: list[str]
+    use_counts: np.ndarray
+    last_used_at: list[Optional[datetime]]
+    embeddings: np.ndarray
+    embedding_rows: np.ndarray
+
+    @property
+    def is_empty(self) -> bool:
+        """사용 이력 없음 (콜드 스타트)"""
+        return not self.names
+
+    @property
+    def has_embeddings(self) -> bool:
+        """유사도 계산에 쓸 임베딩 존재 여부"""
+        return len(self.embedding_rows) > 0
+
+    @property
+    def name_index(self) -> dict[str, int]:
+        """소문자 이름 → 사용 횟수가 가장 많은 행 인덱스"""
+        index: dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            key = name.lower()
+            if key not in index or (
+                self.use_counts[i] > self.use_counts[index[key]]
+            ):
+                index[key] = i
+        return index
+
+
+@dataclass
+class UserProfile:
+    """사용자 개인화 프로필 (UserProfileCache 항목)
+
+    Attributes:
+        tags: 태그 사용 프로필
+        categories: 카테고리 사용 프로필
+    """
+
+    tags: UsageProfile
+    categories: UsageProfile
+
+
+@dataclass
+class PendingUsage:
+    """DB 반영 전 사용 횟수 증가분 (write-behind 버퍼 항목)
+
+    Attributes:
+        kind: "tag" 또는 "category"
+        user_id: 사용자 ID
+        ref_id: 태그/카테고리 ID
+        name: 태그/카테고리 이름 (프로필 반영용)
+        count: 누적 증가량
+        last_used_at: 마지막 사용 시각
+        embedding: 태그/카테고리 임베딩 (프로필 반영용)
+        attempts: 실패한 flush 시도 횟수
+    """
+
+    kind: str
+    user_id: int
+    ref_id: int
+    name: str
+    count: int
+    last_used_at: datetime
+    embedding: Optional[Any] = None
+    attempts: int = 0
+
+
+@dataclass
+class BackfillResult:
+    """마스터 임베딩 backfill 배치 결과
+
+    Attributes:
+        filled: 임베딩을 채운 행 수
+        failed: 종류("tag" / "category")별 단독으로도 임베딩에 실패한 행 ID
+    """
+
+    filled: int = 0
+    failed: dict[str, list[int]] = field(default_factory=dict)
@@ -0,0 +1,300 @@
+"""개인화 사용 통계 write-behind 버퍼
+
+콘텐츠 동기화마다 user_tag_usage / user_category_usage 행을 바로 갱신하면
+인기 태그나 활발한 사용자의 행에 잠금 경합이 생깁니다. write-behind
+모드(personalization_write_behind_enabled)에서는 증가분을
+(종류, user_id, 태그/카테고리 ID)별로 프로세스 메모리에 합산해 두고,
+주기적으로 또는 크기 임계값에 도달하면 종류별 다중 행 UPSERT 한 번으로
+반영합니다.
+
+- 증가분은 요청 세션이 커밋된 뒤에만 버퍼에 들어갑니다 (롤백 시 폐기).
+- 앱 종료 시 lifespan에서 남은 증가분을 flush합니다.
+- 반영 전 증가분은 pending_for_user로 조회해 개인화 프로필에 더합니다.
+- flush에 max_attempts번 연속 실패한 증가분(예: 삭제된 태그의 FK 위반)은
+  오류 로그를 남기고 버립니다.
+- 프로세스가 비정상 종료되면 마지막 flush 이후 증가분은 유실됩니다.
+
+Example::
+
+    buffer = get_usage_buffer()
+    buffer.stage(session, "tag", user_id, tag_id, "Python")
+    await session.commit()  # 커밋 후 버퍼에 합산
+    await buffer.flush()
+"""
+
+import asyncio
+from dataclasses import replace
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.logging import get_logger
+from app.core.utils.datetime import now_utc
+from app.domains.ai.personalization.repository import PersonalizationRepository
+from app.domains.ai.personalization.types import PendingUsage
+
+logger = get_logger(__name__)
+
+UsageKey = tuple[str, int, int]  # (kind, user_id, ref_id)
+
+_STAGED_KEY = "personalization_usage_staged"
+_LISTENING_KEY = "personalization_usage_listening"
+
+
+class UsageBuffer:
+    """사용 횟수 증가분 합산 버퍼
+
+    Args:
+        session_factory: flush용 AsyncSession 컨텍스트 매니저 팩토리
+        max_pending: 이 수 이상의 키가 쌓이면 즉시 flush 예약
+        flush_interval_seconds: 주기적 flush 간격 (초)
+        max_attempts: 증가분을 버리기 전 최대 flush 시도 횟수
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        max_pending: int,
+        flush_interval_seconds: float,
+        max_attempts: int = 5,
+    ):
+        self.session_factory = session_factory
+        self.max_pending = max_pending
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_attempts = max_attempts
+        self.pending: dict[UsageKey, PendingUsage] = {}
+        # flush 중인 항목 (커밋 전까지 프로필 조회에 포함)
+        self.inflight: dict[UsageKey, PendingUsage] = {}
+        self.flushed = 0  # DB에 반영된 키 수 (누적)
+        self.dropped = 0  # 반복 실패로 버린 키 수 (누적)
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(self, usage: PendingUsage) -> None:
+        """증가분 합산 (커밋된 사용만 호출)
+
+        Args:
+            usage: 증가분
+        """
+        key = (usage.kind, usage.user_id, usage.ref_id)
+        _merge(self.pending, key, usage)
+
+        if len(self.pending) >= self.max_pending:
+            self._schedule_flush()
+
+    def stage(
+        self,
+        session: AsyncSession,
+        kind: str,
+        user_id: int,
+        ref_id: int,
+        name: str,
+        count: int = 1,
+        embedding: Optional[Any] = None,
+        on_commit: Optional[Callable[[PendingUsage], None]] = None,
+    ) -> PendingUsage:
+        """세션 커밋 시 버퍼에 합산할 증가분 등록
+
+        마스터 행 생성과 같은 트랜잭션이 롤백되면 증가분도 폐기되므로,
+        존재하지 않는 ID가 flush되지 않습니다.
+
+        Args:
+            session: 요청 DB 세션
+            kind: "tag" 또는 "category"
+            user_id: 사용자 ID
+            ref_id: 태그/카테고리 ID
+            name: 태그/카테고리 이름
+            count: 증가량
+            embedding: 임베딩 (프로필 반영용)
+            on_commit: 커밋 후 버퍼에 합산한 뒤 호출할 콜백
+                (예: 캐시된 프로필 반영, 롤백 시 호출되지 않음)
+
+        Returns:
+            등록된 증가분
+        """
+        usage = PendingUsage(
+            kind=kind,
+            user_id=user_id,
+            ref_id=ref_id,
+            name=name,
+            count=count,
+            last_used_at=now_utc(),
+            embedding=embedding,
+        )
+
+        if not session.info.get(_LISTENING_KEY):
+            session.info[_LISTENING_KEY] = True
+            sync_session = session.sync_session
+
+            def on_session_commit(_session: Any) -> None:
+                for item, callback in sync_session.info.pop(_STAGED_KEY, []):
+                    self.add(item)
+                    if callback is not None:
+                        callback(item)
+
+            def on_rollback(_session: Any) -> None:
+                sync_session.info.pop(_STAGED_KEY, None)
+
+            event.listen(sync_session, "after_commit", on_session_commit)
+            event.listen(sync_session, "after_rollback", on_rollback)
+
+        session.info.setdefault(_STAGED_KEY, []).append((usage, on_commit))
+        return usage
+
+    def pending_for_user(self, user_id: int) -> list[PendingUsage]:
+        """사용자의 반영 전 증가분 (flush 중인 항목 포함)"""
+        merged: dict[UsageKey, PendingUsage] = {}
+        for source in (self.inflight, self.pending):
+            for key, usage in source.items():
+                if usage.user_id == user_id:
+                    _merge(merged, key, usage)
+        return list(merged.values())
+
+    async def flush(self) -> int:
+        """반영 전 증가분을 종류별 다중 행 UPSERT로 반영
+
+        실패하면 증가분을 버퍼에 되돌리고 다음 flush에서 다시 시도합니다.
+        max_attempts번 실패한 증가분은 버립니다.
+
+        Returns:
+            반영한 키 수
+        """
+        async with self._lock:
+            if not self.pending:
+                return 0
+
+            self.inflight, self.pending = self.pending, {}
+            batch = self.inflight
+            committed = False
+            try:
+                async with self.session_factory() as session:
+                    repository = PersonalizationRepository(session)
+                    upserts = {
+                        "tag": repository.bulk_upsert_user_tag_usage,
+                        "category": repository.bulk_upsert_user_category_usage,
+                    }
+                    for kind, upsert in upserts.items():
+                        usages = {
+                            (u.user_id, u.ref_id): u
+                            for u in batch.values()
+                            if u.kind == kind
+                        }
+                        if not usages:
+                            continue
+                        await upsert(
+                            {k: u.count for k, u in usages.items()},
+                            {k: u.last_used_at for k, u in usages.items()},
+                        )
+                    await session.commit()
+                    committed = True
+                    # 커밋된 증가분은 DB 조회에 포함되므로 세션 종료를
+                    # 기다리지 않고 바로 제외 (프로필 이중 합산 방지)
+                    self.inflight = {}
+            except Exception as e:
+                if not committed:
+                    logger.warning(
+                        f"Usage buffer flush failed ({len(batch)} keys): {e}"
+                    )
+                    self._requeue(batch)
+                    return 0
+                logger.warning(f"Usage buffer session close failed: {e}")
+            finally:
+                self.inflight = {}
+
+            self.flushed += len(batch)
+            logger.debug(f"Usage buffer flushed: {len(batch)} keys")
+            return len(batch)
+
+    async def run_forever(self) -> None:
+        """주기적 flush 루프 (앱 lifespan 백그라운드 작업)
+
+        루프가 취소되어도 진행 중인 flush는 끝까지 실행됩니다
+        (종료 시 마지막 flush는 같은 락을 기다림).
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await asyncio.shield(self.flush())
+
+    def stats(self) -> dict[str, Any]:
+        """버퍼 상태 (반영 대기 키 수, 누적 반영 키 수)"""
+        return {
+            "pending": len(self.pending),
+            "inflight": len(self.inflight),
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+        }
+
+    def _requeue(self, batch: dict[UsageKey, PendingUsage]) -> None:
+        """실패한 증가분을 버퍼에 되돌림 (max_attempts 도달 시 버림)"""
+        for key, usage in batch.items():
+            usage.attempts += 1
+            if usage.attempts >= self.max_attempts:
+                self.dropped += 1
+                logger.error(
+                    f"Usage buffer dropped increment after {usage.attempts} "
+                    f"failed flushes: kind={usage.kind}, "
+                    f"user_id={usage.user_id}, ref_id={usage.ref_id}, "
+                    f"count={usage.count}"
+                )
+                continue
+            _merge(self.pending, key, usage)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self.flush())
+
+
+def _merge(
+    target: dict[UsageKey, PendingUsage], key: UsageKey, usage: PendingUsage
+) -> None:
+    """증가분 합산 (횟수 더하기, 마지막 사용 시각은 최신 값)"""
+    current = target.get(key)
+    if current is None:
+        target[key] = replace(usage)
+        return
+    current.count += usage.count
+    current.last_used_at = max(current.last_used_at, usage.last_used_at)
+    current.attempts = max(current.attempts, usage.attempts)
+    if current.embedding is None:
+        current.embedding = usage.embedding
+
+
+_usage_buffer: Optional[UsageBuffer] = None
+
+
+def get_usage_buffer() -> Optional[UsageBuffer]:
+    """write-behind 버퍼 싱글톤
+
+    Returns:
+        UsageBuffer (personalization_write_behind_enabled=False이면 None)
+    """
+    global _usage_buffer
+    if not settings.personalization_write_behind_enabled:
+        return None
+    if _usage_buffer is None:
+        _usage_buffer = UsageBuffer(
+            session_factory=async_session_maker,
+            max_pending=settings.personalization_write_behind_max_pending,
+            flush_interval_seconds=(
+                settings.personalization_write_behind_flush_seconds
+            ),
+            max_attempts=settings.personalization_write_behind_max_attempts,
+        )
+    return _usage_buffer
+
+
+def reset_usage_buffer() -> None:
+    """싱글톤 초기화 (테스트 / 설정 변경 시)"""
+    global _usage_buffer
+    _usage_buffer = None
@@ -1,13 +1,15 @@
 """AI 도메인 리포지토리
 """
 
+from datetime import timedelta
 from typing import Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.utils.datetime import now_utc
-from app.domains.ai.models import SummaryCache
+from app.domains.ai.models import SummaryCache, YoutubeTranscriptCache
 
 
 class AIRepository:
@@ -34,3 +36,61 @@ class AIRepository:
         result = await self.session.execute(query)
         cache: Optional[SummaryCache] = result.scalar_one_or_none()
         return cache
+
+    async def get_youtube_transcript(
+        self, video_id: str, languages: list[str]
+    ) -> Optional[YoutubeTranscriptCache]:
+        """유효한 YouTube 자막 캐시 조회
+
+        선호 언어 순서대로 고르고, 선호 언어 자막이 없으면 다른 언어
+        자막을 반환합니다 (자막 조회 시에도 같은 순서로 대체 언어 선택).
+
+        Args:
+            video_id: YouTube 영상 ID
+            languages: 선호 언어 목록
+
+        Returns:
+            YoutubeTranscriptCache 객체 또는 None
+        """
+        query = select(YoutubeTranscriptCache).where(
+            YoutubeTranscriptCache.video_id == video_id,
+            YoutubeTranscriptCache.expires_at > now_utc(),
+        )
+        result = await self.session.execute(query)
+        cached = list(result.scalars().all())
+        if not cached:
+            return None
+
+        by_language = {row.language: row for row in cached}
+        for language in languages:
+            if language in by_language:
+                return by_language[language]
+        return cached[0]
+
+    async def save_youtube_transcript(
+        self, video_id: str, language: str, transcript: str, ttl_days: int
+    ) -> None:
+        """YouTube 자막 캐시 저장 (같은 영상/언어는 교체)
+
+        Args:
+            video_id: YouTube 영상 ID
+            language: 자막 언어 코드
+            transcript: 자막 텍스트
+            ttl_days: 유효 기간 (일)
+        """
+        expires_at = now_utc() + timedelta(days=ttl_days)
+        stmt = insert(YoutubeTranscriptCache).values(
+            video_id=video_id,
+            language=language,
+            transcript=transcript,
+            expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["video_id", "language"],
+            set_={
+                "transcript": transcript,
+                "created_at": now_utc(),
+                "expires_at": expires_at,
+            },
+        )
+        await self.session.execute(stmt)
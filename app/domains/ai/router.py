@@ -3,25 +3,41 @@
 AI 도메인 관련 API 엔드포인트입니다.
 """
 
+import asyncio
+from typing import AsyncGenerator, Awaitable, Callable
+
 from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import async_session_maker, get_db
 from app.core.dependencies import verify_internal_api_key
+from app.core.llm import get_embedding_cache
 from app.core.schemas import (
     APIResponse,
     ListAPIResponse,
     create_list_response,
     create_response,
 )
+from app.core.utils.sse import format_sse
+from app.domains.ai.personalization.popularity import get_popularity_store
+from app.domains.ai.personalization.profile_cache import get_user_profile_cache
+from app.domains.ai.personalization.tag_index import get_tag_index
+from app.domains.ai.personalization.usage_buffer import get_usage_buffer
 from app.domains.ai.schemas import (
+    CacheStatsResponse,
     SearchRequest,
     SearchResultResponse,
     SummarizeResponse,
     YoutubeSummarizeRequest,
 )
 from app.domains.ai.search.service import AISearchService
+from app.domains.ai.search.snapshot import get_search_snapshot_cache
 from app.domains.ai.summarization.service import SummarizationService
+from app.domains.ai.summarization.types import (
+    SummaryEvent,
+    SummaryEventCallback,
+)
 
 router = APIRouter()
 
@@ -126,6 +142,74 @@ async def summarize_pdf(
     )
 
 
+@router.post(
+    "/summarize/webpage/stream",
+    dependencies=[Depends(verify_internal_api_key)],
+)
+async def summarize_webpage_stream(
+    url: str = Form(...),
+    user_id: int = Form(...),
+    html_file: UploadFile = File(...),
+    tag_count: int = Form(5),
+    refresh: bool = Form(False),
+):
+    """웹페이지 요약 생성 (SSE 스트리밍)"""
+    html_content = await html_file.read()
+    html_str = html_content.decode("utf-8")
+
+    return _create_summary_streaming_response(
+        lambda service, event_callback: service.summarize_webpage(
+            url=url,
+            html_content=html_str,
+            user_id=user_id,
+            tag_count=tag_count,
+            refresh=refresh,
+            event_callback=event_callback,
+        )
+    )
+
+
+@router.post(
+    "/summarize/youtube/stream",
+    dependencies=[Depends(verify_internal_api_key)],
+)
+async def summarize_youtube_stream(request: YoutubeSummarizeRequest):
+    """유튜브 요약 생성 (SSE 스트리밍)"""
+    return _create_summary_streaming_response(
+        lambda service, event_callback: service.summarize_youtube(
+            url=request.url,
+            user_id=request.user_id,
+            tag_count=request.tag_count,
+            refresh=request.refresh,
+            event_callback=event_callback,
+        )
+    )
+
+
+@router.post(
+    "/summarize/pdf/stream",
+    dependencies=[Depends(verify_internal_api_key)],
+)
+async def summarize_pdf_stream(
+    user_id: int = Form(...),
+    pdf_file: UploadFile = File(...),
+    tag_count: int = Form(5),
+    refresh: bool = Form(False),
+):
+    """PDF 요약 생성 (SSE 스트리밍)"""
+    pdf_content = await pdf_file.read()
+
+    return _create_summary_streaming_response(
+        lambda service, event_callback: service.summarize_pdf(
+            pdf_content=pdf_content,
+            user_id=user_id,
+            tag_count=tag_count,
+            refresh=refresh,
+            event_callback=event_callback,
+        )
+    )
+
+
 @router.post(
     "/search",
     response_model=ListAPIResponse[SearchResultResponse],
@@ -136,7 +220,7 @@ async def search_contents(
     service: AISearchService = Depends(get_search_service),
 ):
     """콘텐츠 검색"""
-    results, total = await service.search(
+    results, total, total_mode = await service.search(
         query=request.query,
         user_id=request.user_id,
         mode=request.search_mode,
@@ -145,6 +229,8 @@ async def search_contents(
         size=request.size,
         threshold=request.threshold,
         include_chunks=request.include_chunks,
+        cursor=request.cursor,
+        total_mode=request.total_mode,
     )
 
     # dict → SearchResultResponse 변환
@@ -155,4 +241,91 @@ async def search_contents(
         total=total,
         page=request.page,
         size=request.size,
+        next_cursor=service.next_cursor(
+            results,
+            mode=request.search_mode,
+            size=request.size,
+            page=request.page,
+            cursor=request.cursor,
+        ),
+        total_mode=total_mode,
+        cursor=request.cursor,
+    )
+
+
+@router.get(
+    "/cache/stats",
+    response_model=APIResponse[CacheStatsResponse],
+    dependencies=[Depends(verify_internal_api_key)],
+)
+async def get_cache_stats():
+    """AI 캐시 통계 (프로세스 단위)"""
+    usage_buffer = get_usage_buffer()
+    tag_index = get_tag_index()
+    return create_response(
+        data=CacheStatsResponse(
+            embedding=get_embedding_cache().stats(),
+            search_snapshot=get_search_snapshot_cache().stats(),
+            personalization_profile=get_user_profile_cache().stats(),
+            popularity=get_popularity_store().stats(),
+            usage_buffer=(
+                usage_buffer.stats() if usage_buffer is not None else None
+            ),
+            tag_index=tag_index.stats() if tag_index is not None else None,
+        ),
+        message="캐시 통계를 조회했습니다.",
+    )
+
+
+def _create_summary_streaming_response(
+    run: Callable[
+        [SummarizationService, SummaryEventCallback], Awaitable[dict]
+    ],
+) -> StreamingResponse:
+    """요약 서비스 이벤트를 SSE로 중계
+
+    이벤트: summary_delta → summary → tags → category → done (실패 시 error)
+
+    응답 스트림보다 오래 걸릴 수 있는 작업이므로 요청 의존성(get_db)
+    대신 작업 전용 세션을 열고, 완료 후 커밋합니다. done 이벤트는 캐시
+    저장 결과를 담으므로 커밋이 성공한 뒤 마지막으로 전송합니다.
+    """
+    queue: asyncio.Queue[SummaryEvent | None] = asyncio.Queue()
+
+    async def runner() -> None:
+        try:
+            async with async_session_maker() as session:
+                service = SummarizationService(session)
+                await run(service, queue.put)
+                await session.commit()
+            if service.done_payload is not None:
+                await queue.put(
+                    SummaryEvent(event="done", data=service.done_payload)
+                )
+        except Exception as exc:  # noqa: BLE001
+            await queue.put(
+                SummaryEvent(
+                    event="error",
+                    data={
+                        "message": "요약 생성 중 오류가 발생했습니다.",
+                        "detail": str(exc),
+                    },
+                )
+            )
+        finally:
+            await queue.put(None)
+
+    task = asyncio.create_task(runner())
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        while True:
+            event = await queue.get()
+            if event is None:
+                break
+            yield format_sse(event)
+        await task
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
     )
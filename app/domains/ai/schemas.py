@@ -5,6 +5,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from app.core.utils.pagination import TotalMode
 from app.domains.ai.search.types import SearchFilters
 
 
@@ -62,6 +63,21 @@ class SearchRequest(BaseModel):
     size: int = Field(20, ge=1, le=100, description="페이지 크기")
     threshold: float = Field(0.5, ge=0.0, le=1.0, description="벡터 검색 유사도 임계값")
     include_chunks: bool = Field(False, description="매칭된 청크 정보 포함 여부")
+    cursor: Optional[str] = Field(
+        None, description="다음 페이지 커서 (이전 응답의 meta.next_cursor, page 대신 사용)"
+    )
+    total_mode: TotalMode = Field(
+        TotalMode.EXACT,
+        description="전체 개수 계산 방식 (exact, capped, estimated, none)",
+    )
+
+
+class MatchedChunkResponse(BaseModel):
+    """매칭된 청크 정보"""
+
+    chunk_index: int = Field(..., description="청크 인덱스")
+    chunk_content: str = Field(..., description="청크 내용")
+    similarity: float = Field(..., description="청크 벡터 유사도 (0.0~1.0)")
 
 
 class SearchResultResponse(BaseModel):
@@ -93,3 +109,31 @@ class SearchResultResponse(BaseModel):
     # vector 모드 전용 (include_chunks=true일 때)
     chunk_content: Optional[str] = Field(None, description="매칭된 청크 내용")
     chunk_index: Optional[int] = Field(None, description="청크 인덱스")
+    matched_chunks: Optional[list[MatchedChunkResponse]] = Field(
+        None, description="유사도 상위 청크 목록 (vector 모드, include_chunks=true)"
+    )
+
+
+class CacheStatsResponse(BaseModel):
+    """AI 캐시 통계 응답"""
+
+    embedding: dict = Field(
+        ...,
+        description=(
+            "임베딩 캐시 통계 (hits, misses, evictions, expirations, "
+            "hit_ratio, coalesced, size, bytes)"
+        ),
+    )
+    search_snapshot: Optional[dict] = Field(
+        None, description="하이브리드 검색 스냅샷 캐시 통계 (memory 백엔드)"
+    )
+    personalization_profile: dict = Field(..., description="사용자 개인화 프로필 캐시 통계")
+    popularity: dict = Field(
+        ..., description="전역 인기도 스냅샷 상태 (tags, categories, age_seconds)"
+    )
+    usage_buffer: Optional[dict] = Field(
+        None, description="사용 통계 write-behind 버퍼 상태 (활성화 시)"
+    )
+    tag_index: Optional[dict] = Field(
+        None, description="태그 임베딩 행렬 상태 (tags, dim, bytes, age_seconds)"
+    )
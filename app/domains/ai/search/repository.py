@@ -3,18 +3,42 @@
 벡터 검색, 키워드 검색, 하이브리드 검색 쿼리를 담당합니다.
 """
 
+import asyncio
 from typing import Any, Optional
 
-from sqlalchemy import Float, and_, cast, func, select, text
+from sqlalchemy import (
+    Float,
+    Select,
+    Subquery,
+    and_,
+    bindparam,
+    cast,
+    func,
+    or_,
+    select,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.database import async_session_maker
 from app.core.logging import get_logger
-from app.domains.ai.models import ContentEmbeddingMetadata
+from app.core.utils.pagination import TotalMode, count_total
+from app.core.vector import HalfVector, Vector
+from app.domains.ai.models import (
+    CONTENT_EMBEDDING_DIM,
+    ContentEmbeddingMetadata,
+)
 from app.domains.ai.search.types import SearchFilters
-from app.domains.contents.models import Content
+from app.domains.contents.models import Content, EmbeddingStatus
 
 logger = get_logger(__name__)
 
+SEARCHABLE_EMBEDDING_STATUSES = (
+    EmbeddingStatus.COMPLETED,
+    EmbeddingStatus.PARTIAL,
+)
+
 
 class AISearchRepository:
     """검색 전용 리포지토리
@@ -70,11 +94,15 @@ class AISearchRepository:
         page: int = 1,
         size: int = 20,
         threshold: float = 0.5,
+        chunks_per_content: int = 1,
+        after: Optional[tuple[float, int]] = None,
+        seen: int = 0,
     ) -> tuple[list[dict], int]:
-        """벡터 유사도 검색
+        """벡터 유사도 검색 (콘텐츠 단위)
 
         pgvector의 코사인 거리 연산자 (<=>)를 사용하여
-        임베딩 벡터 간 유사도를 계산합니다.
+        임베딩 벡터 간 유사도를 계산하고, 콘텐츠마다 가장 유사한 청크
+        하나를 기준으로 순위를 매깁니다.
 
         Args:
             query_embedding: 쿼리 임베딩 벡터 (3072 차원)
@@ -83,95 +111,358 @@ class AISearchRepository:
             page: 페이지 번호 (1부터 시작)
             size: 페이지 크기
             threshold: 최소 유사도 임계값 (0.0~1.0)
+            chunks_per_content: 콘텐츠별로 반환할 상위 청크 수
+                (2 이상이면 matched_chunks 포함)
+            after: 커서 (마지막으로 본 similarity, content_id).
+                주어지면 page 대신 그 이후 콘텐츠부터 조회
+            seen: 커서 이전까지 반환한 콘텐츠 수 (ANN 후보 수 k 산정용)
 
         Returns:
-            tuple[list[dict], int]: (검색 결과, 전체 개수)
+            tuple[list[dict], int]: (검색 결과, 전체 콘텐츠 개수)
                 검색 결과:
                 - content_id: int
                 - title: str
                 - summary: str
                 - content_type: str
                 - source_url: str
-                - similarity: float (0.0~1.0)
-                - chunk_content: str (매칭된 청크)
+                - similarity: float (0.0~1.0, 최고 유사 청크 기준)
+                - chunk_content: str (최고 유사 청크)
                 - chunk_index: int
+                - matched_chunks: list[dict] (chunks_per_content > 1일 때,
+                  chunk_index / chunk_content / similarity)
 
         Note:
             pgvector <=> 연산자는 코사인 거리를 반환 (0에 가까울수록 유사)
             similarity = 1 - cosine_distance
+
+            HNSW 인덱스를 사용하기 위해 먼저 `ORDER BY distance LIMIT k`로
+            최근접 청크 후보(k = max(vector_candidate_limit,
+            offset + seen + size))를
+            가져온 뒤, 윈도우 함수로 콘텐츠별 청크 순위와 콘텐츠 순위를 매기고
+            페이지네이션과 전체 개수까지 한 쿼리에서 처리합니다.
+            따라서 전체 개수는 후보 집합 기준의 근사값입니다.
         """
-        # 벡터를 PostgreSQL array literal로 변환
-        vector_literal = f"[{','.join(map(str, query_embedding))}]"
+        # 페이지네이션 계산
+        offset = (page - 1) * size
+        candidate_limit = max(
+            settings.vector_candidate_limit, offset + seen + size
+        )
+        chunks_per_content = max(chunks_per_content, 1)
+
+        await self._set_ef_search(candidate_limit)
+
+        # 1단계: ANN 후보 (ORDER BY distance LIMIT k → HNSW 인덱스 스캔)
+        candidates = self._vector_candidates(
+            query_embedding=query_embedding,
+            user_id=user_id,
+            filters=filters,
+            limit=candidate_limit,
+        )
+
+        # 2단계: threshold 필터 후 콘텐츠별 청크 순위 / 최고 거리
+        chunk_rank = (
+            func.row_number()
+            .over(
+                partition_by=candidates.c.content_id,
+                order_by=(candidates.c.distance, candidates.c.chunk_index),
+            )
+            .label("chunk_rank")
+        )
+        best_distance = (
+            func.min(candidates.c.distance)
+            .over(partition_by=candidates.c.content_id)
+            .label("best_distance")
+        )
+        ranked = (
+            select(candidates, chunk_rank, best_distance)
+            .where(candidates.c.distance < 1 - threshold)
+            .subquery("ranked")
+        )
+
+        # 3단계: 전체 콘텐츠 수 (커서 조건 적용 전)
+        total_count = (
+            func.count()
+            .filter(ranked.c.chunk_rank == 1)
+            .over()
+            .label("total_count")
+        )
+        counted = select(
+            ranked,
+            (1 - ranked.c.best_distance).label("best_similarity"),
+            total_count,
+        ).subquery("counted")
+
+        # 4단계: 콘텐츠 순위 (페이지네이션 기준, 커서 이후만)
+        content_rank = (
+            func.dense_rank()
+            .over(order_by=(counted.c.best_distance, counted.c.content_id))
+            .label("content_rank")
+        )
+        ordered_query = select(counted, content_rank)
+        if after is not None:
+            ordered_query = ordered_query.where(
+                self._keyset_after(
+                    counted.c.best_similarity, counted.c.content_id, after
+                )
+            )
+        ordered = ordered_query.subquery("ordered")
+
+        query = (
+            select(
+                ordered.c.content_id,
+                ordered.c.title,
+                ordered.c.summary,
+                ordered.c.content_type,
+                ordered.c.source_url,
+                (1 - ordered.c.distance).label("similarity"),
+                ordered.c.chunk_content,
+                ordered.c.chunk_index,
+                ordered.c.total_count,
+            )
+            .where(ordered.c.chunk_rank <= chunks_per_content)
+            .where(ordered.c.content_rank > offset)
+            .where(ordered.c.content_rank <= offset + size)
+            .order_by(ordered.c.content_rank, ordered.c.chunk_rank)
+        )
+
+        result = await self.session.execute(query)
+        rows = result.mappings().all()
+
+        if rows:
+            total = rows[0]["total_count"]
+        elif offset > 0 or after is not None:
+            # 마지막 페이지 이후 요청 시에만 개수 별도 조회
+            count_result = await self.session.execute(
+                select(func.count(func.distinct(ranked.c.content_id)))
+            )
+            total = count_result.scalar() or 0
+        else:
+            total = 0
+
+        # 콘텐츠별로 묶기 (첫 행 = 최고 유사 청크)
+        results: dict[int, dict] = {}
+        for row in rows:
+            chunk = {
+                "chunk_index": row["chunk_index"],
+                "chunk_content": row["chunk_content"],
+                "similarity": row["similarity"],
+            }
+            if row["content_id"] not in results:
+                data = dict(row)
+                data.pop("total_count")
+                if chunks_per_content > 1:
+                    data["matched_chunks"] = []
+                results[row["content_id"]] = data
+            if chunks_per_content > 1:
+                results[row["content_id"]]["matched_chunks"].append(chunk)
 
+        logger.info(
+            f"Vector search: query_dim={len(query_embedding)}, "
+            f"user_id={user_id}, page={page}, size={size}, "
+            f"mode={settings.vector_index_mode}, k={candidate_limit}, "
+            f"found={len(results)}/{total} results"
+        )
+
+        return list(results.values()), total
+
+    def _vector_candidates(
+        self,
+        query_embedding: list[float],
+        user_id: int,
+        filters: Optional[SearchFilters],
+        limit: int,
+    ) -> Subquery:
+        """쿼리 벡터와 가장 가까운 청크 후보 서브쿼리 생성
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            user_id: 사용자 ID
+            filters: 검색 필터
+            limit: 후보 청크 수 (k)
+
+        Returns:
+            Subquery: content_id, title, summary, content_type, source_url,
+                distance, chunk_content, chunk_index 컬럼을 가진 서브쿼리
+        """
         # 기본 필터 조건
         filter_conditions = [
             Content.user_id == user_id,
             Content.deleted_at.is_(None),
-            Content.embedding_status == "completed",
+            # partial은 저장된 청크만으로 검색 (재임베딩 전까지)
+            Content.embedding_status.in_(SEARCHABLE_EMBEDDING_STATUSES),
         ]
 
         # 추가 필터 적용
         filter_conditions.extend(self._build_filters(filters))
 
-        # 유사도 조건 (threshold)
-        similarity_expr = 1 - cast(
-            ContentEmbeddingMetadata.embedding_vector.op("<=>")(
-                text(f"'{vector_literal}'::vector")
-            ),
-            Float(),
-        )
+        # 코사인 거리 (halfvec 모드는 인덱스 표현식과 동일해야 함)
+        distance_expr = self._cosine_distance_expr(query_embedding)
 
-        # 전체 개수 조회 (페이지네이션용)
-        count_query = (
-            select(func.count(func.distinct(Content.id)))
-            .select_from(Content)
+        return (
+            select(
+                Content.id.label("content_id"),
+                Content.title,
+                Content.summary,
+                Content.content_type,
+                Content.source_url,
+                distance_expr.label("distance"),
+                ContentEmbeddingMetadata.chunk_content,
+                ContentEmbeddingMetadata.chunk_index,
+            )
             .join(
                 ContentEmbeddingMetadata,
                 ContentEmbeddingMetadata.content_id == Content.id,
             )
             .where(and_(*filter_conditions))
-            .where(similarity_expr > threshold)
+            .order_by(distance_expr)
+            .limit(limit)
+            .subquery("candidates")
         )
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
 
-        # 페이지네이션 계산
-        offset = (page - 1) * size
+    def _cosine_distance_expr(self, query_embedding: list[float]) -> Any:
+        """쿼리 벡터와 청크 임베딩 간 코사인 거리 표현식 생성
 
-        # pgvector 유사도 검색 쿼리
-        # 1 - (vector <=> query) = similarity score
-        query = (
+        쿼리 벡터는 바인드 파라미터로 전달되어 (asyncpg 바이너리 코덱)
+        SQL 문자열이 쿼리마다 달라지지 않습니다.
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+
+        Returns:
+            Any: 코사인 거리 SQL 표현식
+
+        Note:
+            halfvec 모드는 HNSW 표현식 인덱스와 동일한
+            `embedding_vector::halfvec(3072) <=> $1(halfvec)`를 사용하고,
+            exact 모드는 원본 vector 정밀도로 전수 비교합니다.
+        """
+        if settings.vector_index_mode == "exact":
+            return ContentEmbeddingMetadata.embedding_vector.op(
+                "<=>", return_type=Float
+            )(
+                bindparam(
+                    "query_embedding",
+                    query_embedding,
+                    type_=Vector(CONTENT_EMBEDDING_DIM),
+                    unique=True,
+                )
+            )
+
+        if settings.vector_index_mode != "halfvec":
+            logger.warning(
+                "Unsupported vector index mode: "
+                f"{settings.vector_index_mode}. Falling back to halfvec."
+            )
+
+        # 바깥에 CAST 등을 씌우면 ORDER BY가 인덱스 표현식과 달라져 인덱스 미사용
+        return cast(
+            ContentEmbeddingMetadata.embedding_vector,
+            HalfVector(CONTENT_EMBEDDING_DIM),
+        ).op("<=>", return_type=Float)(
+            bindparam(
+                "query_embedding",
+                query_embedding,
+                type_=HalfVector(CONTENT_EMBEDDING_DIM),
+                unique=True,
+            )
+        )
+
+    async def get_contents_by_ids(
+        self, content_ids: list[int], user_id: int
+    ) -> list[dict]:
+        """ID 목록으로 검색 결과용 콘텐츠 정보 조회 (순서 유지)
+
+        랭킹 스냅샷의 페이지 슬라이스를 채우는 데 사용합니다.
+        삭제되었거나 다른 사용자의 콘텐츠는 제외됩니다.
+
+        Args:
+            content_ids: 콘텐츠 ID 목록 (결과 순서)
+            user_id: 사용자 ID
+
+        Returns:
+            list[dict]: content_id, title, summary, content_type, source_url
+        """
+        if not content_ids:
+            return []
+
+        result = await self.session.execute(
             select(
                 Content.id.label("content_id"),
                 Content.title,
                 Content.summary,
                 Content.content_type,
                 Content.source_url,
-                similarity_expr.label("similarity"),
-                ContentEmbeddingMetadata.chunk_content,
-                ContentEmbeddingMetadata.chunk_index,
-            )
-            .join(
-                ContentEmbeddingMetadata,
-                ContentEmbeddingMetadata.content_id == Content.id,
+            ).where(
+                Content.id.in_(content_ids),
+                Content.user_id == user_id,
+                Content.deleted_at.is_(None),
             )
-            .where(and_(*filter_conditions))
-            .where(similarity_expr > threshold)
-            .order_by(text("similarity DESC"))
-            .offset(offset)
-            .limit(size)
         )
+        rows = {row["content_id"]: dict(row) for row in result.mappings()}
 
-        result = await self.session.execute(query)
-        rows = result.mappings().all()
+        return [rows[cid] for cid in content_ids if cid in rows]
 
-        logger.info(
-            f"Vector search: query_dim={len(query_embedding)}, "
-            f"user_id={user_id}, page={page}, size={size}, "
-            f"found={len(rows)}/{total} results"
+    @staticmethod
+    def _keyset_after(
+        score: Any, content_id: Any, after: tuple[float, int]
+    ) -> Any:
+        """커서 이후 조건 (score DESC, content_id ASC 정렬 기준)
+
+        Args:
+            score: 점수 표현식
+            content_id: 콘텐츠 ID 표현식
+            after: 커서 (마지막으로 본 score, content_id)
+
+        Returns:
+            SQLAlchemy 조건식
+        """
+        last_score, last_id = after
+        return or_(
+            score < last_score,
+            and_(score == last_score, content_id > last_id),
         )
 
-        return [dict(row) for row in rows], total
+    async def _set_ef_search(self, candidate_limit: int) -> None:
+        """현재 트랜잭션의 HNSW 탐색 설정 (ef_search / 반복 스캔)
+
+        ef_search는 후보 수(k) 이상이어야 k개를 모두 반환할 수 있으므로
+        설정값과 k 중 큰 값을 사용합니다 (pgvector 최대 1000).
+
+        HNSW 스캔은 사용자 필터를 인덱스 탐색 후에 적용하므로, 전체 청크 중
+        일부만 가진 사용자는 ef_search개 후보 대부분이 걸러져 결과가
+        부족해집니다. vector_iterative_scan이 off가 아니면
+        (pgvector 0.8 이상) 같은 트랜잭션에서 hnsw.iterative_scan과
+        hnsw.max_scan_tuples를 함께 설정해, 필터를 통과한 후보가 k개가 될
+        때까지 (또는 max_scan_tuples까지) 인덱스 탐색을 이어갑니다.
+        relaxed_order는 후보 순서가 약간 어긋날 수 있지만 이후 단계에서
+        거리로 다시 정렬하므로 결과 순서에는 영향이 없습니다.
+
+        Args:
+            candidate_limit: ANN 단계 후보 수
+        """
+        if settings.vector_index_mode == "exact":
+            return
+
+        ef_search = min(max(settings.vector_ef_search, candidate_limit), 1000)
+        if settings.vector_iterative_scan == "off":
+            await self.session.execute(
+                text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                {"ef_search": str(ef_search)},
+            )
+            return
+
+        await self.session.execute(
+            text(
+                "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+                "set_config('hnsw.iterative_scan', :iterative_scan, true), "
+                "set_config('hnsw.max_scan_tuples', :max_scan_tuples, true)"
+            ),
+            {
+                "ef_search": str(ef_search),
+                "iterative_scan": settings.vector_iterative_scan,
+                "max_scan_tuples": str(settings.vector_max_scan_tuples),
+            },
+        )
 
     async def keyword_search(
         self,
@@ -180,11 +471,14 @@ class AISearchRepository:
         filters: Optional[SearchFilters] = None,
         page: int = 1,
         size: int = 20,
-    ) -> tuple[list[dict], int]:
+        after: Optional[tuple[float, int]] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[list[dict], Optional[int]]:
         """키워드 검색 (PostgreSQL Full-Text Search)
 
         title, summary, memo, content_type, source_url, category, tags 를
-        하나의 텍스트로 합쳐서 전문 검색을 수행합니다.
+        가중치를 두어 저장한 contents.search_vector 컬럼(GIN 인덱스)으로
+        전문 검색을 수행합니다.
 
         Args:
             query: 검색 쿼리 문자열
@@ -192,9 +486,12 @@ class AISearchRepository:
             filters: 검색 필터
             page: 페이지 번호 (1부터 시작)
             size: 페이지 크기
+            after: 커서 (마지막으로 본 rank, content_id).
+                주어지면 OFFSET 없이 그 이후 결과부터 조회 (keyset)
+            total_mode: 전체 개수 계산 방식 (exact, capped, estimated, none)
 
         Returns:
-            tuple[list[dict], int]: (검색 결과, 전체 개수)
+            tuple[list[dict], Optional[int]]: (검색 결과, 전체 개수)
                 검색 결과:
                 - content_id: int
                 - title: str
@@ -204,14 +501,15 @@ class AISearchRepository:
                 - rank: float (relevance score)
 
         Note:
-            - to_tsvector: 텍스트를 검색 가능한 tsvector로 변환
+            - search_vector: 트리거가 INSERT/UPDATE 시 갱신하는 tsvector
+              (가중치 A: title, tags / B: category, summary / C: memo /
+              D: content_type, source_url)
             - plainto_tsquery: 쿼리를 tsquery로 변환 (평문)
-            - ts_rank: 관련도 점수 계산
+            - ts_rank: 관련도 점수 계산 (가중치 반영)
             - 'simple' 언어 설정으로 한/영 혼용 텍스트 처리
 
         TODO:
             - 다국어 지원 시 언어별 tsvector 처리 고려
-            - 매칭 키워드 많은 경우 더 높은 점수 (title, tags 등 가중치 부여)
             - raw content 필드도 포함 고려 (대용량 주의)
         """
         # 기본 필터 조건
@@ -223,43 +521,23 @@ class AISearchRepository:
         # 추가 필터 적용
         filter_conditions.extend(self._build_filters(filters))
 
-        # Full-Text Search 쿼리
-        # COALESCE로 NULL 처리 (summary가 NULL일 수 있음)
-        # TODO : 다국어 지원 시 언어별 tsvector 처리 고려 (한글, 영어 혼용)
-        # → 현재는 'simple' 설정으로 한/영 혼용 텍스트를 단순 토큰화하여 처리
-        tsvector_expr = func.to_tsvector(
-            "simple",
-            func.coalesce(Content.title, "")
-            + " "
-            + func.coalesce(Content.summary, "")
-            + " "
-            + func.coalesce(Content.content_type, "")
-            + " "
-            + func.coalesce(Content.source_url, "")
-            + " "
-            + func.coalesce(Content.memo, "")
-            + " "
-            + func.coalesce(Content.category, "")
-            + " "
-            + func.coalesce(func.array_to_string(Content.tags, " "), ""),
-        )
-        tsquery_expr = func.plainto_tsquery("simple", query)
+        tsvector_expr, tsquery_expr = self._keyword_match_exprs(query)
 
         # FTS 매칭 조건
         fts_condition = tsvector_expr.op("@@")(tsquery_expr)
 
         # 전체 개수 조회 (페이지네이션용)
-        count_query = (
-            select(func.count(Content.id))
-            .select_from(Content)
+        total = await count_total(
+            self.session,
+            select(Content.id)
             .where(and_(*filter_conditions))
-            .where(fts_condition)
+            .where(fts_condition),
+            mode=total_mode,
         )
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
 
         # 페이지네이션 계산
         offset = (page - 1) * size
+        rank_expr = func.ts_rank(tsvector_expr, tsquery_expr)
 
         query_stmt = (
             select(
@@ -268,11 +546,17 @@ class AISearchRepository:
                 Content.summary,
                 Content.content_type,
                 Content.source_url,
-                func.ts_rank(tsvector_expr, tsquery_expr).label("rank"),
+                rank_expr.label("rank"),
             )
             .where(and_(*filter_conditions))
             .where(fts_condition)
-            .order_by(text("rank DESC"))
+        )
+        if after is not None:
+            query_stmt = query_stmt.where(
+                self._keyset_after(rank_expr, Content.id, after)
+            )
+        query_stmt = (
+            query_stmt.order_by(text("rank DESC"), Content.id)
             .offset(offset)
             .limit(size)
         )
@@ -288,6 +572,23 @@ class AISearchRepository:
 
         return [dict(row) for row in rows], total
 
+    def _keyword_match_exprs(self, query: str) -> tuple[Any, Any]:
+        """키워드 검색용 tsvector / tsquery 표현식 생성
+
+        Args:
+            query: 검색 쿼리 문자열
+
+        Returns:
+            tuple[Any, Any]: (tsvector 표현식, tsquery 표현식)
+        """
+        # 저장된 가중치 tsvector 컬럼 사용 (GIN 인덱스, 트리거로 갱신)
+        # TODO : 다국어 지원 시 언어별 tsvector 처리 고려 (한글, 영어 혼용)
+        # → 현재는 'simple' 설정으로 한/영 혼용 텍스트를 단순 토큰화하여 처리
+        tsvector_expr = Content.search_vector
+        tsquery_expr = func.plainto_tsquery("simple", query)
+
+        return tsvector_expr, tsquery_expr
+
     async def hybrid_search(
         self,
         query: str,
@@ -298,11 +599,21 @@ class AISearchRepository:
         size: int = 20,
         alpha: float = 0.7,
         threshold: float = 0.5,
-    ) -> tuple[list[dict], int]:
+        fusion: Optional[str] = None,
+        after: Optional[tuple[float, int]] = None,
+        seen: int = 0,
+    ) -> tuple[list[dict], int, TotalMode]:
         """하이브리드 검색 (벡터 + 키워드 결합)
 
         벡터 검색과 키워드 검색 결과를 결합하여 최종 스코어를 계산합니다.
 
+        실행 방식 (settings.hybrid_search_strategy):
+        - sql: 두 후보 집합을 CTE로 만들어 FULL OUTER JOIN으로 병합하고,
+          정렬/페이지네이션/병합 후보 개수(COUNT(*) OVER())까지 단일 쿼리로
+          처리
+        - concurrent: 두 레그를 별도 커넥션(세션)에서 동시에 실행한 뒤
+          애플리케이션에서 병합
+
         Args:
             query: 검색 쿼리 문자열
             query_embedding: 쿼리 임베딩 벡터
@@ -310,11 +621,18 @@ class AISearchRepository:
             filters: 검색 필터
             page: 페이지 번호 (1부터 시작)
             size: 페이지 크기
-            alpha: 벡터 검색 가중치 (0.0~1.0, 기본 0.7)
+            alpha: 벡터 검색 가중치 (0.0~1.0, 기본 0.7, weighted 전용)
             threshold: 벡터 검색 최소 유사도 임계값
+            fusion: 점수 결합 방식 (weighted, rrf / None이면 설정값 사용)
+            after: 커서 (마지막으로 본 final_score, content_id).
+                주어지면 page 대신 그 이후 결과부터 조회
+            seen: 커서 이전까지 반환한 콘텐츠 수 (레그별 후보 수 산정용)
 
         Returns:
-            tuple[list[dict], int]: (검색 결과, 전체 개수)
+            tuple[list[dict], int, TotalMode]: (검색 결과, 전체 개수, 의미)
+                전체 개수는 레그별 후보(fetch_limit개)를 병합한 수이므로,
+                fetch_limit 이상이면 잘린 레그가 있을 수 있는 하한값이며
+                estimated로 표시합니다 (그 외에는 exact).
                 검색 결과:
                 - content_id: int
                 - title: str
@@ -326,100 +644,406 @@ class AISearchRepository:
                 - keyword_score: float (키워드 관련도)
 
         Note:
-            final_score =
+            weighted: final_score =
                 (vector_score * alpha) + (keyword_score * (1 - alpha))
-            중복 콘텐츠는 content_id로 병합
+            rrf: final_score =
+                1 / (k + vector_rank) + 1 / (k + keyword_rank)
+            keyword_score는 후보 중 최대 rank로 나눈 0~1 정규화 값이며,
+            중복 콘텐츠는 content_id로 병합됩니다.
         """
-        # 벡터 검색과 키워드 검색을 충분히 가져옴 (병합을 위해)
-        # 최소 페이지 * 크기 * 2, 최대 100개
-        fetch_limit = min(page * size * 2, 100)
+        fusion = fusion or settings.hybrid_fusion
+        if fusion not in ("weighted", "rrf"):
+            raise ValueError(f"Invalid hybrid fusion: {fusion}")
 
-        # 벡터 검색 결과
-        vector_results, _ = await self.vector_search(
+        # 레그별 후보 콘텐츠 수 (요청 페이지까지는 항상 포함)
+        offset = (page - 1) * size
+        fetch_limit = max(
+            settings.hybrid_candidate_limit, offset + seen + size
+        )
+
+        if settings.hybrid_search_strategy == "concurrent":
+            final_results, total = await self._hybrid_search_concurrent(
+                query=query,
+                query_embedding=query_embedding,
+                user_id=user_id,
+                filters=filters,
+                offset=offset,
+                size=size,
+                fetch_limit=fetch_limit,
+                alpha=alpha,
+                threshold=threshold,
+                fusion=fusion,
+                after=after,
+            )
+        else:
+            final_results, total = await self._hybrid_search_sql(
+                query=query,
+                query_embedding=query_embedding,
+                user_id=user_id,
+                filters=filters,
+                offset=offset,
+                size=size,
+                fetch_limit=fetch_limit,
+                alpha=alpha,
+                threshold=threshold,
+                fusion=fusion,
+                after=after,
+            )
+
+        # 레그가 fetch_limit에서 잘렸다면 병합 개수도 fetch_limit 이상
+        total_mode = (
+            TotalMode.ESTIMATED if total >= fetch_limit else TotalMode.EXACT
+        )
+
+        logger.info(
+            f"Hybrid search: query='{query}', "
+            f"user_id={user_id}, page={page}, size={size}, "
+            f"strategy={settings.hybrid_search_strategy}, fusion={fusion}, "
+            f"merged_total={total} ({total_mode.value}), "
+            f"returned={len(final_results)} results"
+        )
+
+        return final_results, total, total_mode
+
+    async def _hybrid_search_sql(
+        self,
+        query: str,
+        query_embedding: list[float],
+        user_id: int,
+        filters: Optional[SearchFilters],
+        offset: int,
+        size: int,
+        fetch_limit: int,
+        alpha: float,
+        threshold: float,
+        fusion: str,
+        after: Optional[tuple[float, int]] = None,
+    ) -> tuple[list[dict], int]:
+        """하이브리드 검색 - 단일 쿼리 (CTE + FULL OUTER JOIN)"""
+        vector_limit = max(settings.vector_candidate_limit, fetch_limit)
+        await self._set_ef_search(vector_limit)
+
+        vector_leg = self._vector_leg_query(
             query_embedding=query_embedding,
             user_id=user_id,
             filters=filters,
-            page=1,
-            size=fetch_limit,
+            limit=fetch_limit,
             threshold=threshold,
+        ).cte("vector_leg")
+        keyword_leg = self._keyword_leg_query(
+            query=query,
+            user_id=user_id,
+            filters=filters,
+            limit=fetch_limit,
+        ).cte("keyword_leg")
+
+        vector_score = func.coalesce(vector_leg.c.vector_score, 0.0)
+        keyword_score = func.coalesce(keyword_leg.c.keyword_score, 0.0)
+
+        if fusion == "rrf":
+            rrf_k = settings.hybrid_rrf_k
+            final_score = func.coalesce(
+                1.0 / cast(rrf_k + vector_leg.c.vector_rank, Float), 0.0
+            ) + func.coalesce(
+                1.0 / cast(rrf_k + keyword_leg.c.keyword_rank, Float), 0.0
+            )
+        else:
+            final_score = vector_score * alpha + keyword_score * (1 - alpha)
+
+        fused = (
+            select(
+                func.coalesce(
+                    vector_leg.c.content_id, keyword_leg.c.content_id
+                ).label("content_id"),
+                func.coalesce(vector_leg.c.title, keyword_leg.c.title).label(
+                    "title"
+                ),
+                func.coalesce(
+                    vector_leg.c.summary, keyword_leg.c.summary
+                ).label("summary"),
+                func.coalesce(
+                    vector_leg.c.content_type, keyword_leg.c.content_type
+                ).label("content_type"),
+                func.coalesce(
+                    vector_leg.c.source_url, keyword_leg.c.source_url
+                ).label("source_url"),
+                final_score.label("final_score"),
+                vector_score.label("vector_score"),
+                keyword_score.label("keyword_score"),
+            )
+            .select_from(
+                vector_leg.join(
+                    keyword_leg,
+                    vector_leg.c.content_id == keyword_leg.c.content_id,
+                    full=True,
+                )
+            )
+            .subquery("fused")
         )
 
-        # 키워드 검색 결과
-        keyword_results, _ = await self.keyword_search(
-            query=query,
+        # 페이지 + 전체 개수를 한 번에 조회 (개수는 커서 조건 적용 전)
+        counted = select(
+            fused, func.count().over().label("total_count")
+        ).subquery("counted")
+        page_query = select(counted)
+        if after is not None:
+            page_query = page_query.where(
+                self._keyset_after(
+                    counted.c.final_score, counted.c.content_id, after
+                )
+            )
+        page_query = (
+            page_query.order_by(
+                counted.c.final_score.desc(), counted.c.content_id
+            )
+            .offset(offset)
+            .limit(size)
+        )
+        result = await self.session.execute(page_query)
+        rows = [dict(row) for row in result.mappings().all()]
+
+        if rows:
+            total = rows[0]["total_count"]
+        elif offset > 0 or after is not None:
+            # 마지막 페이지 이후 요청 시에만 개수 별도 조회
+            count_result = await self.session.execute(
+                select(func.count()).select_from(fused)
+            )
+            total = count_result.scalar() or 0
+        else:
+            total = 0
+
+        for row in rows:
+            row.pop("total_count", None)
+
+        return rows, total
+
+    async def _hybrid_search_concurrent(
+        self,
+        query: str,
+        query_embedding: list[float],
+        user_id: int,
+        filters: Optional[SearchFilters],
+        offset: int,
+        size: int,
+        fetch_limit: int,
+        alpha: float,
+        threshold: float,
+        fusion: str,
+        after: Optional[tuple[float, int]] = None,
+    ) -> tuple[list[dict], int]:
+        """하이브리드 검색 - 레그 병렬 실행 후 애플리케이션 병합
+
+        AsyncSession은 동시 사용이 불가능하므로 레그마다
+        커넥션 풀에서 별도 세션을 열어 실행합니다.
+        """
+
+        async def run_vector_leg() -> list[dict]:
+            async with async_session_maker() as leg_session:
+                leg_repository = AISearchRepository(leg_session)
+                await leg_repository._set_ef_search(
+                    max(settings.vector_candidate_limit, fetch_limit)
+                )
+                result = await leg_session.execute(
+                    leg_repository._vector_leg_query(
+                        query_embedding=query_embedding,
+                        user_id=user_id,
+                        filters=filters,
+                        limit=fetch_limit,
+                        threshold=threshold,
+                    )
+                )
+                return [dict(row) for row in result.mappings().all()]
+
+        async def run_keyword_leg() -> list[dict]:
+            async with async_session_maker() as leg_session:
+                leg_repository = AISearchRepository(leg_session)
+                result = await leg_session.execute(
+                    leg_repository._keyword_leg_query(
+                        query=query,
+                        user_id=user_id,
+                        filters=filters,
+                        limit=fetch_limit,
+                    )
+                )
+                return [dict(row) for row in result.mappings().all()]
+
+        vector_results, keyword_results = await asyncio.gather(
+            run_vector_leg(), run_keyword_leg()
+        )
+
+        sorted_results = self._fuse_results(
+            vector_results, keyword_results, alpha=alpha, fusion=fusion
+        )
+
+        total = len(sorted_results)
+        if after is not None:
+            last_score, last_id = after
+            sorted_results = [
+                r
+                for r in sorted_results
+                if r["final_score"] < last_score
+                or (
+                    r["final_score"] == last_score
+                    and r["content_id"] > last_id
+                )
+            ]
+
+        return sorted_results[offset : offset + size], total
+
+    def _vector_leg_query(
+        self,
+        query_embedding: list[float],
+        user_id: int,
+        filters: Optional[SearchFilters],
+        limit: int,
+        threshold: float,
+    ) -> Select:
+        """하이브리드 벡터 레그: 콘텐츠별 최고 유사도와 순위
+
+        Returns:
+            Select: content_id, title, summary, content_type, source_url,
+                vector_score, vector_rank
+        """
+        candidates = self._vector_candidates(
+            query_embedding=query_embedding,
             user_id=user_id,
             filters=filters,
-            page=1,
-            size=fetch_limit,
+            limit=max(settings.vector_candidate_limit, limit),
         )
+        best_distance = func.min(candidates.c.distance)
+
+        return (
+            select(
+                candidates.c.content_id,
+                candidates.c.title,
+                candidates.c.summary,
+                candidates.c.content_type,
+                candidates.c.source_url,
+                (1 - best_distance).label("vector_score"),
+                func.row_number()
+                .over(order_by=best_distance)
+                .label("vector_rank"),
+            )
+            .where(candidates.c.distance < 1 - threshold)
+            .group_by(
+                candidates.c.content_id,
+                candidates.c.title,
+                candidates.c.summary,
+                candidates.c.content_type,
+                candidates.c.source_url,
+            )
+            .order_by(best_distance)
+            .limit(limit)
+        )
+
+    def _keyword_leg_query(
+        self,
+        query: str,
+        user_id: int,
+        filters: Optional[SearchFilters],
+        limit: int,
+    ) -> Select:
+        """하이브리드 키워드 레그: 정규화된 관련도와 순위
+
+        Returns:
+            Select: content_id, title, summary, content_type, source_url,
+                keyword_score (최대 rank 대비 0~1), keyword_rank
+        """
+        filter_conditions = [
+            Content.user_id == user_id,
+            Content.deleted_at.is_(None),
+        ]
+        filter_conditions.extend(self._build_filters(filters))
+
+        tsvector_expr, tsquery_expr = self._keyword_match_exprs(query)
+        rank_expr = func.ts_rank(tsvector_expr, tsquery_expr, type_=Float)
 
-        # 결과 병합 (content_id를 키로 사용)
+        ranked = (
+            select(
+                Content.id.label("content_id"),
+                Content.title,
+                Content.summary,
+                Content.content_type,
+                Content.source_url,
+                rank_expr.label("rank"),
+            )
+            .where(and_(*filter_conditions))
+            .where(tsvector_expr.op("@@")(tsquery_expr))
+            .order_by(rank_expr.desc())
+            .limit(limit)
+            .subquery("ranked")
+        )
+        max_rank = func.nullif(func.max(ranked.c.rank).over(), 0, type_=Float)
+
+        return select(
+            ranked.c.content_id,
+            ranked.c.title,
+            ranked.c.summary,
+            ranked.c.content_type,
+            ranked.c.source_url,
+            (ranked.c.rank / max_rank).label("keyword_score"),
+            func.row_number()
+            .over(order_by=ranked.c.rank.desc())
+            .label("keyword_rank"),
+        )
+
+    @staticmethod
+    def _fuse_results(
+        vector_results: list[dict],
+        keyword_results: list[dict],
+        alpha: float,
+        fusion: str,
+    ) -> list[dict]:
+        """레그 결과를 content_id 기준으로 병합하고 final_score로 정렬
+
+        _hybrid_search_sql과 동일한 점수 계산식을 사용합니다.
+        """
         merged_results: dict[int, dict] = {}
 
-        # 벡터 검색 결과 추가
         for result in vector_results:
-            content_id = result["content_id"]
-            merged_results[content_id] = {
-                "content_id": content_id,
+            merged_results[result["content_id"]] = {
+                "content_id": result["content_id"],
                 "title": result["title"],
                 "summary": result["summary"],
                 "content_type": result["content_type"],
                 "source_url": result["source_url"],
-                "vector_score": result["similarity"],
+                "vector_score": result["vector_score"],
                 "keyword_score": 0.0,
+                "vector_rank": result["vector_rank"],
+                "keyword_rank": None,
             }
 
-        # 키워드 검색 결과 병합
-        # 정규화: rank를 0~1 범위로 변환
-        max_rank = (
-            max((r["rank"] for r in keyword_results), default=1.0) or 1.0
-        )
-
         for result in keyword_results:
-            content_id = result["content_id"]
-            normalized_rank = result["rank"] / max_rank
-
-            if content_id in merged_results:
-                # 기존 벡터 결과에 키워드 점수 추가
-                merged_results[content_id]["keyword_score"] = normalized_rank
-            else:
-                # 키워드만 매칭된 경우
-                merged_results[content_id] = {
-                    "content_id": content_id,
+            data = merged_results.setdefault(
+                result["content_id"],
+                {
+                    "content_id": result["content_id"],
                     "title": result["title"],
                     "summary": result["summary"],
                     "content_type": result["content_type"],
                     "source_url": result["source_url"],
                     "vector_score": 0.0,
-                    "keyword_score": normalized_rank,
-                }
+                    "vector_rank": None,
+                },
+            )
+            data["keyword_score"] = result["keyword_score"] or 0.0
+            data["keyword_rank"] = result["keyword_rank"]
 
-        # 하이브리드 스코어 계산
+        rrf_k = settings.hybrid_rrf_k
         for data in merged_results.values():
-            data["final_score"] = (data["vector_score"] * alpha) + (
-                data["keyword_score"] * (1 - alpha)
-            )
+            vector_rank = data.pop("vector_rank")
+            keyword_rank = data.pop("keyword_rank")
+            if fusion == "rrf":
+                data["final_score"] = (
+                    1.0 / (rrf_k + vector_rank) if vector_rank else 0.0
+                ) + (1.0 / (rrf_k + keyword_rank) if keyword_rank else 0.0)
+            else:
+                data["final_score"] = (data["vector_score"] * alpha) + (
+                    data["keyword_score"] * (1 - alpha)
+                )
 
-        # final_score로 정렬
-        sorted_results = sorted(
+        return sorted(
             merged_results.values(),
-            key=lambda x: x["final_score"],
-            reverse=True,
+            key=lambda x: (-x["final_score"], x["content_id"]),
         )
-
-        # 전체 개수
-        total = len(sorted_results)
-
-        # 페이지네이션 적용
-        offset = (page - 1) * size
-        final_results = sorted_results[offset : offset + size]
-
-        logger.info(
-            f"Hybrid search: query='{query}', "
-            f"user_id={user_id}, page={page}, size={size}, "
-            f"vector_count={len(vector_results)}, "
-            f"keyword_count={len(keyword_results)}, "
-            f"merged_total={total}, returned={len(final_results)} results"
-        )
-
-        return final_results, total
@@ -4,13 +4,28 @@ from typing import Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.llm import create_embedding
+from app.core.config import settings
+from app.core.exceptions import BadRequestException, ErrorCode
+from app.core.llm import create_embedding, get_embedding_cache
 from app.core.logging import get_logger
+from app.core.utils.pagination import TotalMode, decode_cursor, encode_cursor
 from app.domains.ai.search.repository import AISearchRepository
+from app.domains.ai.search.snapshot import (
+    SearchSnapshot,
+    get_search_snapshot_cache,
+    snapshot_key,
+)
 from app.domains.ai.search.types import SearchFilters
 
 logger = get_logger(__name__)
 
+# 검색 모드별 정렬 점수 필드 (점수 DESC, content_id ASC 정렬)
+SCORE_FIELDS = {
+    "vector": "similarity",
+    "keyword": "rank",
+    "hybrid": "final_score",
+}
+
 
 class AISearchService:
     """AI 검색 서비스"""
@@ -29,7 +44,9 @@ class AISearchService:
         size: int = 20,
         threshold: float = 0.5,
         include_chunks: bool = False,
-    ) -> tuple[list[dict], int]:
+        cursor: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[list[dict], Optional[int], TotalMode]:
         """통합 검색
 
         1. 검색 모드에 따라 실행:
@@ -45,17 +62,40 @@ class AISearchService:
             - Content 정보 포함
             - 스코어 포함 (similarity, rank, final_score)
             - include_chunks=true 시 매칭된 청크 포함
+              (vector 모드: 최고 유사 청크 + 상위 청크 목록 matched_chunks)
+
+        4. 페이지네이션:
+            - cursor가 없으면 page 기반 OFFSET
+            - cursor가 있으면 (점수, content_id) keyset으로 커서 이후 조회
+            - total_mode는 키워드 검색의 COUNT 쿼리에 적용
+              (vector/hybrid는 후보 집합 개수를 같은 쿼리에서 계산)
+            - hybrid는 레그 후보가 잘렸을 수 있으면 전체 개수가 하한이므로
+              total_mode를 estimated로 바꿔 반환
+            - hybrid는 랭킹 스냅샷(search_snapshot_*)을 사용해 이후 페이지를
+              슬라이스 + ID 조회로 처리
 
         Returns:
-            (검색 결과, 총 개수)
+            (검색 결과, 총 개수, 총 개수의 의미)
+
+        Raises:
+            BadRequestException: 커서가 잘못되었거나 다른 검색 모드의 커서인 경우
         """
         results: list[dict[str, Any]] = []
-        total = 0
+        total: Optional[int] = 0
+        hybrid_total_mode = TotalMode.EXACT
+
+        after = None
+        seen = 0
+        if cursor:
+            after, seen = self._parse_cursor(cursor, mode)
+            page = 1
 
         if mode == "vector":
             # 쿼리 임베딩 생성
             logger.info(f"Creating embedding for query: '{query}'")
-            query_embedding = await create_embedding(query)
+            query_embedding = await get_embedding_cache().get_or_create(
+                query, create_embedding
+            )
 
             results, total = await self.repository.vector_search(
                 query_embedding=query_embedding,
@@ -64,6 +104,11 @@ class AISearchService:
                 page=page,
                 size=size,
                 threshold=threshold,
+                chunks_per_content=(
+                    settings.search_matched_chunks if include_chunks else 1
+                ),
+                after=after,
+                seen=seen,
             )
 
             # include_chunks가 False이면 청크 정보 제거
@@ -79,14 +124,42 @@ class AISearchService:
                 filters=filters,
                 page=page,
                 size=size,
+                after=after,
+                total_mode=total_mode,
+            )
+
+        elif (
+            mode == "hybrid"
+            and settings.search_snapshot_enabled
+            and get_search_snapshot_cache().enabled
+        ):
+            (
+                results,
+                total,
+                hybrid_total_mode,
+            ) = await self._hybrid_search_snapshot(
+                query=query,
+                user_id=user_id,
+                filters=filters,
+                page=page,
+                size=size,
+                threshold=threshold,
+                after=after,
+                seen=seen,
             )
 
         elif mode == "hybrid":
             # 쿼리 임베딩 생성
             logger.info(f"Creating embedding for query: '{query}'")
-            query_embedding = await create_embedding(query)
+            query_embedding = await get_embedding_cache().get_or_create(
+                query, create_embedding
+            )
 
-            results, total = await self.repository.hybrid_search(
+            (
+                results,
+                total,
+                hybrid_total_mode,
+            ) = await self.repository.hybrid_search(
                 query=query,
                 query_embedding=query_embedding,
                 user_id=user_id,
@@ -94,6 +167,8 @@ class AISearchService:
                 page=page,
                 size=size,
                 threshold=threshold,
+                after=after,
+                seen=seen,
             )
 
         else:
@@ -104,4 +179,185 @@ class AISearchService:
             f"user_id={user_id}, found={len(results)}/{total} results"
         )
 
-        return results, total
+        if (
+            hybrid_total_mode == TotalMode.ESTIMATED
+            and total_mode != TotalMode.NONE
+        ):
+            total_mode = TotalMode.ESTIMATED
+
+        return results, total, total_mode
+
+    async def _hybrid_search_snapshot(
+        self,
+        query: str,
+        user_id: int,
+        filters: Optional[SearchFilters],
+        page: int,
+        size: int,
+        threshold: float,
+        after: Optional[tuple[float, int]] = None,
+        seen: int = 0,
+    ) -> tuple[list[dict], int, TotalMode]:
+        """하이브리드 검색 - 랭킹 스냅샷 사용
+
+        스냅샷이 없으면 search_snapshot_size개까지 랭킹을 계산해 저장하고,
+        있으면 임베딩 생성과 두 레그 실행 없이 슬라이스 + ID 조회만 합니다.
+        전체 결과가 스냅샷보다 많고 요청 페이지가 스냅샷 범위를 벗어나면
+        해당 페이지는 저장소에서 직접 조회합니다 (page 또는 커서 기준).
+
+        Returns:
+            (검색 결과, 저장소가 계산한 전체 개수, 그 의미)
+        """
+        snapshot_cache = get_search_snapshot_cache()
+        key = snapshot_key(
+            query,
+            mode="hybrid",
+            filters=filters,
+            threshold=threshold,
+            fusion=settings.hybrid_fusion,
+        )
+
+        rows: Optional[list[dict]] = None
+        snapshot = await snapshot_cache.get(user_id, key)
+        if snapshot is None:
+            logger.info(f"Creating embedding for query: '{query}'")
+            query_embedding = await get_embedding_cache().get_or_create(
+                query, create_embedding
+            )
+
+            rows, total, total_mode = await self.repository.hybrid_search(
+                query=query,
+                query_embedding=query_embedding,
+                user_id=user_id,
+                filters=filters,
+                page=1,
+                size=settings.search_snapshot_size,
+                threshold=threshold,
+            )
+            await snapshot_cache.set(user_id, key, rows, total, total_mode)
+            snapshot = SearchSnapshot(
+                ranked=rows, total=total, total_mode=total_mode
+            )
+        ranked = snapshot.ranked
+
+        # 페이지 시작 위치 (커서는 점수 DESC, content_id ASC 기준)
+        start = (page - 1) * size
+        if after is not None:
+            last_score, last_id = after
+            start = next(
+                (
+                    i
+                    for i, r in enumerate(ranked)
+                    if r["final_score"] < last_score
+                    or (
+                        r["final_score"] == last_score
+                        and r["content_id"] > last_id
+                    )
+                ),
+                len(ranked),
+            )
+
+        if snapshot.truncated and start + size > len(ranked):
+            # 스냅샷 범위 밖 (잘린 랭킹의 마지막 페이지 이후) → 직접 조회
+            logger.info(
+                f"Hybrid search beyond snapshot: user_id={user_id}, "
+                f"page={page}, size={size}, snapshot={len(ranked)}, "
+                f"total={snapshot.total}"
+            )
+            query_embedding = await get_embedding_cache().get_or_create(
+                query, create_embedding
+            )
+            return await self.repository.hybrid_search(
+                query=query,
+                query_embedding=query_embedding,
+                user_id=user_id,
+                filters=filters,
+                page=page,
+                size=size,
+                threshold=threshold,
+                after=after,
+                seen=seen,
+            )
+
+        page_entries = ranked[start : start + size]
+
+        if rows is not None:
+            # 방금 계산한 결과에는 콘텐츠 정보가 이미 포함됨
+            return (
+                [dict(r) for r in page_entries],
+                snapshot.total,
+                snapshot.total_mode,
+            )
+
+        contents = await self.repository.get_contents_by_ids(
+            [r["content_id"] for r in page_entries], user_id
+        )
+        scores = {r["content_id"]: r for r in page_entries}
+        results = [{**c, **scores[c["content_id"]]} for c in contents]
+
+        logger.info(
+            f"Hybrid search snapshot hit: user_id={user_id}, "
+            f"page={page}, size={size}, total={snapshot.total}"
+        )
+
+        return results, snapshot.total, snapshot.total_mode
+
+    def next_cursor(
+        self,
+        results: list[dict],
+        mode: str,
+        size: int,
+        page: int = 1,
+        cursor: Optional[str] = None,
+    ) -> Optional[str]:
+        """검색 결과의 다음 페이지 커서 생성
+
+        페이지가 가득 찬 경우에만 마지막 결과의 (점수, content_id)로
+        커서를 만듭니다.
+
+        Args:
+            results: search 결과
+            mode: 검색 모드
+            size: 페이지 크기
+            page: 요청 페이지 (cursor가 없을 때)
+            cursor: 요청 커서
+
+        Returns:
+            다음 페이지 커서 또는 None
+        """
+        if not results or len(results) < size:
+            return None
+
+        if cursor:
+            _, seen = self._parse_cursor(cursor, mode)
+        else:
+            seen = (page - 1) * size
+
+        last = results[-1]
+        return encode_cursor(
+            {
+                "mode": mode,
+                "score": last[SCORE_FIELDS[mode]],
+                "id": last["content_id"],
+                "seen": seen + len(results),
+            }
+        )
+
+    @staticmethod
+    def _parse_cursor(cursor: str, mode: str) -> tuple[tuple[float, int], int]:
+        """검색 커서 디코딩
+
+        Returns:
+            ((마지막 점수, 마지막 content_id), 지금까지 반환한 결과 수)
+        """
+        values = decode_cursor(
+            cursor,
+            keys={"mode": str, "score": (int, float), "id": int, "seen": int},
+        )
+        if values["mode"] != mode:
+            raise BadRequestException(
+                message="다른 검색 모드의 커서입니다.",
+                error_code=ErrorCode.INVALID_CURSOR,
+                detail={"cursor_mode": values["mode"], "search_mode": mode},
+            )
+        return (values["score"], values["id"]), values["seen"]
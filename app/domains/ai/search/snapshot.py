@@ -0,0 +1,366 @@
+"""하이브리드 검색 랭킹 스냅샷 캐시
+
+하이브리드 검색은 두 레그(벡터/키워드)를 실행하고 점수를 결합하는 비용이
+크므로, 첫 페이지 요청 시 결합된 랭킹(content_id + 점수) 목록 전체를
+짧은 시간 동안 저장해 두고 이후 페이지는 목록 슬라이스 + ID 기반 조회로
+처리합니다.
+
+- 키: (user_id, 정규화된 query, filters, mode, threshold 등) 해시
+- 값: 상위 search_snapshot_size개 랭킹 + 저장소가 계산한 전체 개수와 그 의미
+  (전체 개수가 랭킹보다 많으면 스냅샷 범위 밖 페이지는 다시 조회)
+- 무효화: 사용자별 세대(generation) 번호를 올려 기존 스냅샷을 모두 무효화
+  (콘텐츠 동기화/삭제 및 임베딩 완료 시 세션 커밋 후 실행)
+- 백엔드: auto (기본, 워커 1개면 memory / 여러 워커면 redis)
+  | memory (프로세스 로컬 LRU, 단일 워커 전용)
+  | redis (settings.redis_url, `redis` 패키지 필요 / 여러 워커 간 공유)
+  redis가 필요한데 `redis` 패키지가 없으면 경고를 남기고 스냅샷 캐시를
+  끕니다 (하이브리드 검색은 매 페이지 직접 조회).
+- contents 도메인은 app.core.hooks의 콘텐츠 변경 훅으로 무효화를 요청합니다.
+
+캐시는 최적화 용도이므로 백엔드 오류는 로그만 남기고 미스로 처리합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Protocol
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.hooks import register_content_change_hook
+from app.core.logging import get_logger
+from app.core.utils.pagination import TotalMode
+from app.domains.ai.search.types import SearchFilters
+
+logger = get_logger(__name__)
+
+# 스냅샷 항목 필드 (콘텐츠 정보는 조회 시 ID로 다시 가져옴)
+SNAPSHOT_FIELDS = (
+    "content_id",
+    "final_score",
+    "vector_score",
+    "keyword_score",
+)
+
+# session.info 키 (커밋 후 무효화할 사용자 ID)
+_STAGED_KEY = "search_snapshot_invalidations"
+_LISTENING_KEY = "search_snapshot_listening"
+
+
+@dataclass
+class SearchSnapshot:
+    """랭킹 스냅샷
+
+    Attributes:
+        ranked: 정렬된 랭킹 목록 (SNAPSHOT_FIELDS 딕셔너리)
+        total: 저장소가 계산한 전체 결과 수 (ranked보다 클 수 있음)
+        total_mode: total의 의미 (후보가 잘렸으면 estimated)
+    """
+
+    ranked: list[dict]
+    total: int
+    total_mode: TotalMode = TotalMode.EXACT
+
+    @property
+    def truncated(self) -> bool:
+        """스냅샷이 전체 결과 중 일부만 담고 있는지 여부"""
+        return self.total > len(self.ranked)
+
+
+def snapshot_key(
+    query: str,
+    mode: str,
+    filters: Optional[SearchFilters] = None,
+    **params: Any,
+) -> str:
+    """스냅샷 키 생성
+
+    Args:
+        query: 검색 쿼리 (공백/대소문자 정규화)
+        mode: 검색 모드
+        filters: 검색 필터
+        **params: 랭킹에 영향을 주는 기타 파라미터 (threshold, fusion 등)
+
+    Returns:
+        sha256 hex digest
+    """
+    payload = {
+        "query": " ".join(query.lower().split()),
+        "mode": mode,
+        "filters": asdict(filters) if filters else None,
+        "params": params,
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class SnapshotBackend(Protocol):
+    """스냅샷 저장소 백엔드"""
+
+    async def get(self, user_id: int, key: str) -> Optional[dict]:
+        ...
+
+    async def set(self, user_id: int, key: str, snapshot: dict) -> None:
+        ...
+
+    async def invalidate_user(self, user_id: int) -> None:
+        ...
+
+
+class MemorySnapshotBackend:
+    """프로세스 로컬 스냅샷 저장소 (TTL + LRU)"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.cache: TTLCache[tuple[int, int, str], dict] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        # 세대 번호도 크기/수명 제한 (축출되어 0으로 돌아가도 무효화 시
+        # 해당 사용자 스냅샷을 함께 삭제하므로 이전 스냅샷이 되살아나지 않음)
+        self._generations: TTLCache[int, int] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    def _generation(self, user_id: int) -> int:
+        return self._generations.get(user_id, record=False) or 0
+
+    async def get(self, user_id: int, key: str) -> Optional[dict]:
+        generation = self._generation(user_id)
+        return self.cache.get((user_id, generation, key))
+
+    async def set(self, user_id: int, key: str, snapshot: dict) -> None:
+        generation = self._generation(user_id)
+        self.cache.set((user_id, generation, key), snapshot)
+
+    async def invalidate_user(self, user_id: int) -> None:
+        self._generations.set(user_id, self._generation(user_id) + 1)
+        # 이전 세대 항목은 즉시 정리 (LRU 슬롯 확보)
+        self.cache.delete_where(lambda k: k[0] == user_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.cache.stats.to_dict(), "size": len(self.cache)}
+
+
+class RedisSnapshotBackend:
+    """Redis 스냅샷 저장소 (워커 간 공유)
+
+    사용자별 세대 키(INCR)를 스냅샷 키에 포함하므로, 무효화는 INCR 한 번이고
+    이전 세대 스냅샷은 TTL로 자연 만료됩니다.
+    """
+
+    prefix = "search:snapshot"
+
+    def __init__(self, url: str, ttl_seconds: int):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "search_snapshot_backend=redis requires the 'redis' package "
+                "(poetry install --extras redis)"
+            ) from e
+
+        self.client = redis_asyncio.from_url(url)
+        self.ttl_seconds = ttl_seconds
+
+    async def _generation(self, user_id: int) -> int:
+        value = await self.client.get(f"{self.prefix}:gen:{user_id}")
+        return int(value or 0)
+
+    async def get(self, user_id: int, key: str) -> Optional[dict]:
+        generation = await self._generation(user_id)
+        raw = await self.client.get(
+            f"{self.prefix}:{user_id}:{generation}:{key}"
+        )
+        return json.loads(raw) if raw else None
+
+    async def set(self, user_id: int, key: str, snapshot: dict) -> None:
+        generation = await self._generation(user_id)
+        await self.client.set(
+            f"{self.prefix}:{user_id}:{generation}:{key}",
+            json.dumps(snapshot),
+            ex=self.ttl_seconds,
+        )
+
+    async def invalidate_user(self, user_id: int) -> None:
+        await self.client.incr(f"{self.prefix}:gen:{user_id}")
+
+
+class SearchSnapshotCache:
+    """검색 랭킹 스냅샷 캐시 (백엔드 오류는 미스로 처리)
+
+    backend가 None이면 비활성 상태로, 조회는 항상 미스이고 저장/무효화는
+    아무것도 하지 않습니다.
+    """
+
+    def __init__(self, backend: Optional[SnapshotBackend]):
+        self.backend = backend
+        # 커밋 후 예약된 무효화 태스크 (GC 방지용 참조)
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """스냅샷 백엔드 사용 가능 여부"""
+        return self.backend is not None
+
+    async def get(self, user_id: int, key: str) -> Optional[SearchSnapshot]:
+        """스냅샷 조회
+
+        Returns:
+            SearchSnapshot 또는 None (이전 형식 항목도 미스로 처리)
+        """
+        if self.backend is None:
+            return None
+        try:
+            payload = await self.backend.get(user_id, key)
+        except Exception as e:
+            logger.warning(f"Search snapshot get failed: {e}")
+            return None
+        if not isinstance(payload, dict) or "total_mode" not in payload:
+            return None
+        return SearchSnapshot(
+            ranked=payload["ranked"],
+            total=payload["total"],
+            total_mode=TotalMode(payload["total_mode"]),
+        )
+
+    async def set(
+        self,
+        user_id: int,
+        key: str,
+        ranked: list[dict],
+        total: int,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> None:
+        """스냅샷 저장
+
+        Args:
+            user_id: 사용자 ID
+            key: snapshot_key 결과
+            ranked: 정렬된 랭킹 목록 (SNAPSHOT_FIELDS만 저장)
+            total: 저장소가 계산한 전체 결과 수
+            total_mode: total의 의미
+        """
+        if self.backend is None:
+            return
+        entries = [{f: row.get(f) for f in SNAPSHOT_FIELDS} for row in ranked]
+        try:
+            await self.backend.set(
+                user_id,
+                key,
+                {
+                    "ranked": entries,
+                    "total": total,
+                    "total_mode": total_mode.value,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Search snapshot set failed: {e}")
+
+    def stats(self) -> Optional[dict[str, Any]]:
+        """캐시 통계 (프로세스 로컬 백엔드만, 그 외 None)"""
+        stats = getattr(self.backend, "stats", None)
+        return stats() if stats else None
+
+    async def invalidate_user(self, user_id: int) -> None:
+        """사용자의 모든 스냅샷 무효화 (콘텐츠 변경 시)"""
+        if self.backend is None:
+            return
+        try:
+            await self.backend.invalidate_user(user_id)
+        except Exception as e:
+            logger.warning(
+                f"Search snapshot invalidation failed: user_id={user_id}, "
+                f"error={e}"
+            )
+
+    def invalidate_user_on_commit(
+        self, session: AsyncSession, user_id: int
+    ) -> None:
+        """세션 커밋 후 사용자의 모든 스냅샷 무효화 예약
+
+        커밋 전에 무효화하면 그 사이의 검색이 변경 전 결과로 스냅샷을
+        다시 만들 수 있으므로, 변경이 보이는 시점(after_commit)에
+        무효화합니다. 롤백되면 예약을 취소합니다.
+
+        Args:
+            session: 변경을 반영할 DB 세션
+            user_id: 사용자 ID
+        """
+        if self.backend is None:
+            return
+        if not session.info.get(_LISTENING_KEY):
+            session.info[_LISTENING_KEY] = True
+            sync_session = session.sync_session
+            loop = asyncio.get_running_loop()
+
+            def on_commit(_session: Any) -> None:
+                for staged_user_id in sync_session.info.pop(_STAGED_KEY, ()):
+                    task = loop.create_task(
+                        self.invalidate_user(staged_user_id)
+                    )
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+            def on_rollback(_session: Any) -> None:
+                sync_session.info.pop(_STAGED_KEY, None)
+
+            event.listen(sync_session, "after_commit", on_commit)
+            event.listen(sync_session, "after_rollback", on_rollback)
+
+        session.info.setdefault(_STAGED_KEY, set()).add(user_id)
+
+
+_snapshot_cache: Optional[SearchSnapshotCache] = None
+
+
+def get_search_snapshot_cache() -> SearchSnapshotCache:
+    """검색 스냅샷 캐시 싱글톤
+
+    Returns:
+        settings.search_snapshot_backend에 따른 SearchSnapshotCache
+        (auto는 settings.web_concurrency가 2 이상이면 redis, redis 패키지가
+        없으면 비활성 캐시)
+    """
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        backend: Optional[SnapshotBackend]
+        backend_name = settings.search_snapshot_backend
+        if backend_name == "auto":
+            backend_name = (
+                "redis" if settings.web_concurrency > 1 else "memory"
+            )
+        if backend_name == "redis":
+            try:
+                backend = RedisSnapshotBackend(
+                    settings.redis_url, settings.search_snapshot_ttl_seconds
+                )
+            except RuntimeError as e:
+                # 선택 의존성이므로 없으면 스냅샷 없이 직접 조회
+                logger.warning(f"Search snapshot cache disabled: {e}")
+                backend = None
+        else:
+            backend = MemorySnapshotBackend(
+                max_entries=settings.search_snapshot_max_entries,
+                ttl_seconds=settings.search_snapshot_ttl_seconds,
+            )
+        _snapshot_cache = SearchSnapshotCache(backend)
+    return _snapshot_cache
+
+
+def reset_search_snapshot_cache() -> None:
+    """싱글톤 초기화 (테스트 / 설정 변경 시)"""
+    global _snapshot_cache
+    _snapshot_cache = None
+
+
+def invalidate_snapshots_on_commit(
+    session: AsyncSession, user_id: int
+) -> None:
+    """콘텐츠 변경 훅 - 세션 커밋 후 사용자 스냅샷 무효화"""
+    get_search_snapshot_cache().invalidate_user_on_commit(session, user_id)
+
+
+register_content_change_hook(invalidate_snapshots_on_commit)
@@ -66,3 +66,37 @@ CATEGORY_PREDICTION_PROMPT = """다음 내용의 카테고리를 예측해주세
 반드시 JSON 배열만 출력하세요. 다른 텍스트는 포함하지 마세요.
 
 카테고리:"""
+
+COMBINED_OUTPUT_PROMPT = """출력 형식:
+다음 키를 가진 JSON 객체 하나만 출력하세요. 다른 텍스트는 포함하지 마세요.
+- "summary": 위 요구사항에 따른 요약 (문자열)
+- "tags": 요약의 핵심 키워드 10-15개, 중요도 순 (문자열 배열)
+- "categories": 내용의 카테고리 10-15개, 중요도 순 (문자열 배열)
+
+예시: {"summary": "...", "tags": ["태그1", "태그2"], "categories": ["카테고리1"]}
+
+JSON:"""
+
+SECTION_SUMMARY_PROMPT = """다음은 긴 문서를 나눈 구간 중 {index}/{total}번째입니다.
+
+내용:
+{content}
+
+요구사항:
+- 이 구간의 핵심 내용을 5-8문장으로 요약
+- 고유명사, 수치, 결론 등 중요한 정보 유지
+- 다른 구간과 합쳐질 수 있도록 서론/맺음말 없이 작성
+
+요약:"""
+
+SECTION_MERGE_PROMPT = """다음은 긴 문서를 순서대로 나눈 구간별 요약입니다.
+
+구간 요약:
+{content}
+
+요구사항:
+- 구간 순서를 유지하며 하나의 요약으로 통합
+- 중복된 내용은 합치고 핵심 정보는 유지
+- 5-8문장으로 작성
+
+요약:"""
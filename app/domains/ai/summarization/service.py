@@ -1,29 +1,64 @@
 """AI summarization 서비스
 AI 요약 생성 관련 비즈니스 로직 계층입니다.
 """
+import asyncio
 import json
+import time
 from datetime import timedelta
-from typing import Optional
+from typing import Awaitable, Optional, TypeVar
 
+from pydantic import ValidationError
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.llm import LLMMessage, LLMTier, call_with_fallback
+from app.core.config import settings
+from app.core.llm import (
+    LLMMessage,
+    LLMResult,
+    LLMTier,
+    call_with_fallback,
+    stream_with_fallback,
+)
+from app.core.llm.batching import count_tokens
 from app.core.logging import get_logger
 from app.core.middlewares.context import get_request_id
 from app.core.utils.datetime import now_utc
 from app.domains.ai.embedding.service import EmbeddingService
-from app.domains.ai.exceptions import SummarizationFailedException
-from app.domains.ai.models import SummaryCache
+from app.domains.ai.exceptions import (
+    SummarizationFailedException,
+    TranscriptNotAvailableException,
+)
+from app.domains.ai.models import ChunkStrategy, SummaryCache
 from app.domains.ai.personalization.service import PersonalizationService
 from app.domains.ai.repository import AIRepository
 from app.domains.ai.schemas import SummarizeResponse
 from app.domains.ai.summarization import prompts
-from app.domains.ai.summarization.types import SummaryPipelineResult
+from app.domains.ai.summarization.types import (
+    CombinedSummaryOutput,
+    SummaryEvent,
+    SummaryEventCallback,
+    SummaryPipelineResult,
+)
 from app.domains.ai.utils import parsers
+from app.domains.ai.utils.parser_executor import (
+    ParserExecutor,
+    get_parser_executor,
+)
+from app.domains.ai.utils.types import PDFPage
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+async def _timed(awaitable: Awaitable[T], timings: dict, step: str) -> T:
+    """단계 소요 시간(ms)을 timings[step]에 기록 (실패해도 기록)"""
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[step] = round((time.perf_counter() - started) * 1000, 1)
+
 
 class SummarizationService:
     """AI 요약 서비스"""
@@ -33,6 +68,7 @@ class SummarizationService:
         session: AsyncSession,
         embedding_service: Optional[EmbeddingService] = None,
         personalization_service: Optional[PersonalizationService] = None,
+        parser_executor: Optional[ParserExecutor] = None,
     ):
         self.session = session
         self.repository = AIRepository(session)
@@ -42,14 +78,18 @@ class SummarizationService:
         self.personalization_service = (
             personalization_service or PersonalizationService(session)
         )
+        # 스트리밍 완료(done) 이벤트 데이터 (커밋 성공 후 라우터가 전송)
+        self.done_payload: Optional[dict] = None
+        # HTML/PDF 파싱은 이벤트 루프 밖(프로세스 풀 / 스레드)에서 실행
+        self.parser_executor = parser_executor or get_parser_executor()
 
-    async def _get_cached_summary(
+    async def _find_cached_summary(
         self,
         cache_key: str,
         user_id: int,
         url: str,
-        tag_count: int = 5,
-    ) -> Optional[dict]:
+    ) -> Optional[SummaryCache]:
+        """유효한 요약 캐시 조회 (본문 비교는 호출자가 수행)"""
         cached = await self.repository.get_summary_cache(cache_key)
         if not cached:
             logger.info(
@@ -72,6 +112,17 @@ class SummarizationService:
                 "request_id": get_request_id(),
             },
         )
+        return cached
+
+    async def _return_cached(
+        self,
+        cached: SummaryCache,
+        cache_key: str,
+        user_id: int,
+        tag_count: int,
+        event_callback: Optional[SummaryEventCallback] = None,
+    ) -> dict:
+        """캐시된 요약에 개인화를 적용해 응답 (스트리밍 시 이벤트 전송)"""
         candidate_categories = cached.candidate_categories or []
         candidate_tags = cached.candidate_tags or []
 
@@ -91,7 +142,7 @@ class SummarizationService:
             )
         )
 
-        return {
+        cached_summary = {
             "content_hash": cached.content_hash or cache_key,
             "extracted_text": cached.extracted_text or "",
             "summary": cached.summary or "",
@@ -101,23 +152,67 @@ class SummarizationService:
             "candidate_categories": candidate_categories,
             "cached": True,
         }
+        await self._emit_cached(event_callback, cached_summary)
+        return self._to_schema_dict(cached_summary)
 
     async def _prepare_transcript_and_strategy(
         self,
         url: str,
-    ) -> tuple[str, Optional[object]]:
+    ) -> tuple[str, Optional[ChunkStrategy]]:
         youtube_id = parsers.extract_youtube_video_id(url)
-        youtube_transcript = parsers.get_youtube_transcript(youtube_id)
+        youtube_transcript = await self._get_youtube_transcript(youtube_id)
         chunk_strategy = await self.embedding_service.get_chunk_strategy(
             content_type="youtube"
         )
         return youtube_transcript, chunk_strategy
 
+    async def _get_youtube_transcript(self, video_id: str) -> str:
+        """자막 캐시 조회, 없으면 자막 API 조회 후 캐시 저장
+
+        refresh 요청이나 다른 사용자의 같은 영상 요약도 자막 캐시가
+        유효하면 네트워크 호출 없이 처리합니다.
+
+        Raises:
+            YoutubeVideoNotFoundException: 동영상을 찾을 수 없음
+            TranscriptNotAvailableException: 자막 없음 또는 조회 시간 초과
+        """
+        languages = list(parsers.YOUTUBE_TRANSCRIPT_LANGUAGES)
+        cached = await self.repository.get_youtube_transcript(
+            video_id, languages
+        )
+        if cached is not None:
+            logger.info(
+                "YouTube transcript cache hit",
+                extra={"video_id": video_id, "language": cached.language},
+            )
+            return cached.transcript
+
+        try:
+            # 자막 조회는 네트워크 I/O이므로 프로세스 풀 대신 스레드 사용
+            transcript = await self.parser_executor.run_in_thread(
+                parsers.fetch_youtube_transcript,
+                video_id,
+                languages,
+                timeout=settings.youtube_transcript_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            raise TranscriptNotAvailableException(
+                video_id=video_id, reason="자막 조회 시간이 초과되었습니다"
+            )
+
+        await self.repository.save_youtube_transcript(
+            video_id,
+            transcript.language,
+            transcript.text,
+            ttl_days=settings.youtube_transcript_cache_ttl_days,
+        )
+        return transcript.text
+
     async def _prepare_text_and_strategy(
         self,
         html_content: str,
-    ) -> tuple[str, Optional[object]]:
-        extracted_text = parsers.extract_text_from_html(html_content)
+    ) -> tuple[str, Optional[ChunkStrategy]]:
+        extracted_text = await self.parser_executor.extract_html(html_content)
         chunk_strategy = await self.embedding_service.get_chunk_strategy(
             content_type="webpage"
         )
@@ -133,88 +228,574 @@ class SummarizationService:
     async def _prepare_pdf_text_and_strategy(
         self,
         pdf_content: bytes,
-    ) -> tuple[str, Optional[object]]:
-        extracted_text = parsers.extract_text_from_pdf(pdf_content)
+    ) -> tuple[str, str, Optional[ChunkStrategy]]:
+        """PDF 전체 추출 후 (전체 텍스트, 요약용 텍스트, 청크 전략) 반환
+
+        캐시/임베딩에 쓰이는 extracted_text는 항상 전체 페이지이고,
+        pdf_summary_token_budget은 LLM에 전달하는 요약용 텍스트에만
+        적용합니다.
+        """
+        extraction = await self.parser_executor.extract_pdf(pdf_content)
+        extracted_text = extraction.text
+        summary_text = extracted_text
+        budget = settings.pdf_summary_token_budget
+        if budget > 0:
+            summary_text = self._pages_within_budget(extraction.pages, budget)
         chunk_strategy = await self.embedding_service.get_chunk_strategy(
             content_type="pdf"
         )
-        return extracted_text, chunk_strategy
+        return extracted_text, summary_text, chunk_strategy
+
+    @staticmethod
+    def _pages_within_budget(pages: list[PDFPage], token_budget: int) -> str:
+        """앞 페이지부터 누적 토큰이 예산에 도달할 때까지의 텍스트"""
+        pages = [page for page in pages if page.text.strip()]
+        kept: list[PDFPage] = []
+        tokens = 0
+        for page, page_tokens in zip(
+            pages, count_tokens([page.text for page in pages])
+        ):
+            kept.append(page)
+            tokens += page_tokens
+            if tokens >= token_budget:
+                break
+        return parsers.join_pdf_pages(kept)
 
     async def _run_llm_pipeline(
         self,
         extracted_text: str,
         summary_prompt: str = prompts.WEBPAGE_SUMMARY_PROMPT,
         max_summary_tokens: int = 400,
-        prompt_kwargs: Optional[dict] = None,
+        text_key: str = "content",
+        chunk_strategy: Optional[ChunkStrategy] = None,
+        combined: Optional[bool] = None,
+        event_callback: Optional[SummaryEventCallback] = None,
     ) -> SummaryPipelineResult:
         """LLM 파이프라인 실행 (요약 + 태그 + 카테고리)
 
+        본문이 summary_map_reduce_threshold_tokens를 넘으면 구간별 요약을
+        먼저 만들고(map-reduce), 이어붙인 구간 요약을 본문 대신 사용합니다.
+
+        - combined 모드: 요약/태그/카테고리를 JSON 객체 하나로 요청하는
+          단일 호출. 응답이 스키마에 맞지 않으면 pipeline 모드로 재시도
+        - pipeline 모드: 요약 → 태그 ∥ 카테고리 (3회 호출)
+
         Args:
             extracted_text: 추출된 텍스트
             summary_prompt: 요약 프롬프트 템플릿
             max_summary_tokens: 요약 최대 토큰 수
-            prompt_kwargs: 프롬프트 포맷 인자
+            text_key: 요약 프롬프트에서 본문 자리의 포맷 키
+            chunk_strategy: 긴 본문 구간 분할 전략 (None이면 토큰 기반)
+            combined: 단일 호출 여부 (None이면 settings.summary_combined_call)
+            event_callback: 스트리밍 이벤트 콜백 (pipeline 모드는 요약
+                토큰을 summary_delta로, 두 모드 모두 완성된 요약을
+                summary로 전송)
 
         Returns:
-            SummaryPipelineResult: 요약, 태그, 카테고리 결과
+            SummaryPipelineResult: 요약, 태그, 카테고리 결과 및 단계별 소요 시간
+
+        Raises:
+            SummarizationFailedException: 요약 생성 실패 시
         """
-        try:
-            prompt_data = prompt_kwargs or {"content": extracted_text}
-            summary_result = await call_with_fallback(
-                tier=LLMTier.LIGHT,
-                messages=[
-                    LLMMessage(
-                        role="user",
-                        content=summary_prompt.format(**prompt_data),
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+
+        text, sections = await self._condense_long_text(
+            extracted_text, chunk_strategy, max_summary_tokens, timings
+        )
+        summary_content = summary_prompt.format(**{text_key: text})
+
+        llm_result: Optional[LLMResult] = None
+        output: Optional[CombinedSummaryOutput] = None
+        if settings.summary_combined_call if combined is None else combined:
+            llm_result, output = await self._run_combined_call(
+                summary_content, max_summary_tokens, timings
+            )
+
+        if llm_result is not None and output is not None:
+            result = SummaryPipelineResult(
+                summary=llm_result,
+                summary_text=output.summary,
+                candidate_tags=output.tags,
+                candidate_categories=output.categories,
+                mode="combined",
+                timings_ms=timings,
+            )
+            await self._emit(
+                event_callback, "summary", {"summary": output.summary}
+            )
+        else:
+            result = await self._run_step_pipeline(
+                summary_content, max_summary_tokens, timings, event_callback
+            )
+            # 스키마 불일치로 버려진 단일 호출도 과금되므로 WTU에 포함
+            result.discarded = llm_result
+        result.sections = sections
+
+        timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(
+            "LLM summary pipeline completed",
+            extra={
+                "mode": result.mode,
+                "sections": len(sections),
+                "timings_ms": timings,
+                "failed_steps": list(result.errors),
+                "request_id": get_request_id(),
+            },
+        )
+        return result
+
+    async def _condense_long_text(
+        self,
+        text: str,
+        chunk_strategy: Optional[ChunkStrategy],
+        max_section_tokens: int,
+        timings: dict[str, float],
+    ) -> tuple[str, list[LLMResult]]:
+        """긴 본문을 구간별 요약으로 축약 (map-reduce)
+
+        1. map: 본문을 구간으로 나눠 최대 summary_map_concurrency개씩
+           동시에 요약
+        2. reduce: 이어붙인 구간 요약이 임계값을 넘으면 임계값 단위로
+           묶어 다시 요약 (최대 summary_reduce_max_depth단계)
+
+        Args:
+            text: 원본 본문
+            chunk_strategy: 구간 분할 전략
+            max_section_tokens: 구간 요약 최대 출력 토큰 수
+            timings: 단계별 소요 시간 기록 (map, reduce_N)
+
+        Returns:
+            (축약된 본문, 구간 요약/병합 호출 결과) - 임계값 이하면
+            (원본 본문, [])
+
+        Raises:
+            SummarizationFailedException: 구간 요약 실패 시
+        """
+        threshold = settings.summary_map_reduce_threshold_tokens
+        if count_tokens([text])[0] <= threshold:
+            return text, []
+
+        strategy = self._section_strategy(chunk_strategy)
+        sections = [
+            chunk
+            for chunk, _, _ in self.embedding_service.iter_chunks(
+                text, strategy
+            )
+        ]
+        semaphore = asyncio.Semaphore(settings.summary_map_concurrency)
+        results: list[LLMResult] = []
+
+        total = len(sections)
+        partials = await _timed(
+            self._summarize_sections(
+                [
+                    prompts.SECTION_SUMMARY_PROMPT.format(
+                        index=index, total=total, content=section
                     )
+                    for index, section in enumerate(sections, start=1)
                 ],
-                temperature=0.3,
-                max_tokens=max_summary_tokens,
+                max_section_tokens,
+                semaphore,
+                results,
+            ),
+            timings,
+            "map",
+        )
+
+        depth = 0
+        condensed = "\n\n".join(partials)
+        while (
+            depth < settings.summary_reduce_max_depth
+            and len(partials) > 1
+            and count_tokens([condensed])[0] > threshold
+        ):
+            depth += 1
+            partials = await _timed(
+                self._summarize_sections(
+                    [
+                        prompts.SECTION_MERGE_PROMPT.format(content=group)
+                        for group in self._group_by_tokens(partials, threshold)
+                    ],
+                    max_section_tokens,
+                    semaphore,
+                    results,
+                ),
+                timings,
+                f"reduce_{depth}",
+            )
+            condensed = "\n\n".join(partials)
+
+        logger.info(
+            "Long text condensed with map-reduce",
+            extra={
+                "sections": total,
+                "reduce_depth": depth,
+                "condensed_tokens": count_tokens([condensed])[0],
+                "request_id": get_request_id(),
+            },
+        )
+        return condensed, results
+
+    async def _summarize_sections(
+        self,
+        contents: list[str],
+        max_tokens: int,
+        semaphore: asyncio.Semaphore,
+        results: list[LLMResult],
+    ) -> list[str]:
+        """구간 프롬프트를 동시에 요약 (semaphore로 fan-out 제한, 순서 유지)
+
+        Raises:
+            SummarizationFailedException: 구간 하나라도 실패 시
+        """
+
+        async def summarize(content: str) -> str:
+            async with semaphore:
+                result = await call_with_fallback(
+                    tier=LLMTier.LIGHT,
+                    messages=[LLMMessage(role="user", content=content)],
+                    temperature=0.3,
+                    max_tokens=max_tokens,
+                )
+            results.append(result)
+            return result.content.strip()
+
+        try:
+            return list(
+                await asyncio.gather(*(summarize(c) for c in contents))
+            )
+        except Exception as e:
+            logger.error("LLM section summarization failed", exc_info=e)
+            raise SummarizationFailedException(
+                detail_msg=f"LLM 구간 요약 생성 실패: {str(e)}"
+            )
+
+    @staticmethod
+    def _group_by_tokens(partials: list[str], limit: int) -> list[str]:
+        """연속된 구간 요약을 limit 토큰 이하 묶음으로 결합 (최소 1개씩)"""
+        groups: list[str] = []
+        current: list[str] = []
+        current_tokens = 0
+        for partial, tokens in zip(partials, count_tokens(partials)):
+            if current and current_tokens + tokens > limit:
+                groups.append("\n\n".join(current))
+                current, current_tokens = [], 0
+            current.append(partial)
+            current_tokens += tokens
+        if current:
+            groups.append("\n\n".join(current))
+        return groups
+
+    @staticmethod
+    def _section_strategy(
+        chunk_strategy: Optional[ChunkStrategy],
+    ) -> ChunkStrategy:
+        """구간 분할 전략 (콘텐츠 청크 전략 기반, 최소 구간 크기 보장)
+
+        임베딩용 청크(수백 토큰)를 그대로 쓰면 호출 수가 과도해지므로
+        chunk_size를 summary_map_section_tokens 이상으로 확대합니다.
+        """
+        min_size = settings.summary_map_section_tokens
+        if chunk_strategy is None:
+            return ChunkStrategy(
+                name="summary-sections",
+                chunk_size=min_size,
+                chunk_overlap=0,
+                split_method="token",
+            )
+        return ChunkStrategy(
+            name=f"{chunk_strategy.name}-summary-sections",
+            chunk_size=max(chunk_strategy.chunk_size, min_size),
+            chunk_overlap=chunk_strategy.chunk_overlap,
+            split_method=chunk_strategy.split_method,
+        )
+
+    async def _run_combined_call(
+        self,
+        summary_content: str,
+        max_summary_tokens: int,
+        timings: dict[str, float],
+    ) -> tuple[LLMResult, Optional[CombinedSummaryOutput]]:
+        """요약 + 태그 + 카테고리 단일 JSON 호출
+
+        JSON 응답 형식(response_format)은 지원하는 프로바이더에만
+        전달됩니다.
+
+        Returns:
+            (LLM 호출 결과, 검증된 출력 - 스키마 불일치 시 None)
+
+        Raises:
+            SummarizationFailedException: 모든 프로바이더 호출 실패 시
+        """
+        # 요약 프롬프트의 마지막 "요약:" 대신 JSON 출력 형식 지시
+        content = (
+            summary_content.removesuffix("요약:").rstrip()
+            + "\n\n"
+            + prompts.COMBINED_OUTPUT_PROMPT
+        )
+        try:
+            llm_result = await _timed(
+                call_with_fallback(
+                    tier=LLMTier.LIGHT,
+                    messages=[LLMMessage(role="user", content=content)],
+                    temperature=0.3,
+                    # 요약 + 태그(200) + 카테고리(150) 출력 예산
+                    max_tokens=max_summary_tokens + 350,
+                    response_format={"type": "json_object"},
+                ),
+                timings,
+                "combined",
+            )
+        except Exception as e:
+            logger.error("LLM combined summarization failed", exc_info=e)
+            raise SummarizationFailedException(
+                detail_msg=f"LLM 요약 생성 실패: {str(e)}"
+            )
+
+        output = self._parse_combined_output(llm_result.content)
+        if output is None:
+            logger.warning(
+                "Combined summary output did not match schema, "
+                "falling back to step pipeline",
+                extra={"finish_reason": llm_result.finish_reason},
+            )
+        return llm_result, output
+
+    async def _run_step_pipeline(
+        self,
+        summary_content: str,
+        max_summary_tokens: int,
+        timings: dict[str, float],
+        event_callback: Optional[SummaryEventCallback] = None,
+    ) -> SummaryPipelineResult:
+        """요약 → 태그 ∥ 카테고리 (3회 호출)
+
+        태그 추출과 카테고리 예측은 요약에만 의존하므로 요약 이후
+        병렬로 실행합니다. 요약이 실패하면 예외를 발생시키고,
+        태그/카테고리 중 하나가 실패하면 해당 결과만 None으로 둡니다.
+        event_callback이 있으면 요약을 스트리밍으로 생성합니다.
+
+        Raises:
+            SummarizationFailedException: 요약 생성 실패 시
+        """
+        messages = [LLMMessage(role="user", content=summary_content)]
+        try:
+            summary_result = await _timed(
+                (
+                    call_with_fallback(
+                        tier=LLMTier.LIGHT,
+                        messages=messages,
+                        temperature=0.3,
+                        max_tokens=max_summary_tokens,
+                    )
+                    if event_callback is None
+                    else self._stream_summary(
+                        messages, max_summary_tokens, event_callback
+                    )
+                ),
+                timings,
+                "summary",
+            )
+        except Exception as e:
+            logger.error("LLM summarization failed", exc_info=e)
+            raise SummarizationFailedException(
+                detail_msg=f"LLM 요약 생성 실패: {str(e)}"
             )
 
-            tag_result = await call_with_fallback(
+        summary_text = summary_result.content.strip()
+        await self._emit(event_callback, "summary", {"summary": summary_text})
+
+        # 카테고리 후보 목록 조회
+        # TODO : 개인화 추천 로직 고민 필요
+        #   키워드를 뽑은 이후, 카테고리 후보를 추출할지
+        #   카테고리를 전달하여 후보를 뽑을지, 키워드 중심인 경우 태그와 병합 고려
+        steps = {
+            "tags": call_with_fallback(
                 tier=LLMTier.LIGHT,
                 messages=[
                     LLMMessage(
                         role="user",
                         content=prompts.TAG_EXTRACTION_PROMPT.format(
-                            summary=summary_result.content.strip()
+                            summary=summary_text
                         ),
                     )
                 ],
                 temperature=0.2,
                 max_tokens=200,
-            )
-
-            # 카테고리 후보 목록 조회
-            # TODO : 개인화 추천 로직 고민 필요
-            #   키워드를 뽑은 이후, 카테고리 후보를 추출할지
-            #   카테고리를 전달하여 후보를 뽑을지, 키워드 중심인 경우 태그와 병합 고려
-            category_result = await call_with_fallback(
+            ),
+            "category": call_with_fallback(
                 tier=LLMTier.LIGHT,
                 messages=[
                     LLMMessage(
                         role="user",
                         content=prompts.CATEGORY_PREDICTION_PROMPT.format(
-                            summary=summary_result.content.strip()
+                            summary=summary_text
                         ),
                     )
                 ],
                 temperature=0.2,
                 max_tokens=150,
-            )
+            ),
+        }
+        outcomes = await asyncio.gather(
+            *(_timed(call, timings, step) for step, call in steps.items()),
+            return_exceptions=True,
+        )
 
-            return SummaryPipelineResult(
-                summary=summary_result,
-                tags=tag_result,
-                category=category_result,
-            )
-        except Exception as e:
-            logger.error("LLM summarization failed", exc_info=e)
-            raise SummarizationFailedException(
-                detail_msg=f"LLM 요약 생성 실패: {str(e)}"
+        results: dict[str, Optional[LLMResult]] = {}
+        errors: dict[str, str] = {}
+        for step, outcome in zip(steps, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    f"LLM {step} step failed, continuing without it",
+                    exc_info=outcome,
+                )
+                results[step] = None
+                errors[step] = str(outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[step] = outcome
+
+        # 실패한 단계(None)는 후보 없음으로 처리
+        tag_result, category_result = results["tags"], results["category"]
+        return SummaryPipelineResult(
+            summary=summary_result,
+            summary_text=summary_text,
+            candidate_tags=(
+                self._parse_json_array(tag_result.content)
+                if tag_result is not None
+                else []
+            ),
+            candidate_categories=(
+                self._parse_json_array(category_result.content)
+                if category_result is not None
+                else []
+            ),
+            tags=tag_result,
+            category=category_result,
+            timings_ms=timings,
+            errors=errors,
+        )
+
+    async def _stream_summary(
+        self,
+        messages: list[LLMMessage],
+        max_tokens: int,
+        event_callback: SummaryEventCallback,
+    ) -> LLMResult:
+        """요약 스트리밍 생성 (청크마다 summary_delta 이벤트)
+
+        스트림은 텍스트만 전달하므로 사용량은 tiktoken으로 추정하고,
+        모델명 대신 티어명을 기록합니다.
+
+        Raises:
+            AllProvidersFailedError: 모든 모델이 스트리밍 시작 전 실패 시
+            LLMProviderError: 스트리밍 중 에러 발생 시
+        """
+        chunks: list[str] = []
+        async for chunk in stream_with_fallback(
+            tier=LLMTier.LIGHT,
+            messages=messages,
+            temperature=0.3,
+            max_tokens=max_tokens,
+        ):
+            chunks.append(chunk)
+            await event_callback(
+                SummaryEvent(event="summary_delta", data={"text": chunk})
             )
 
+        content = "".join(chunks)
+        input_tokens, output_tokens = count_tokens(
+            ["".join(m.content for m in messages), content]
+        )
+        return LLMResult(
+            content=content,
+            model=LLMTier.LIGHT.value,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+
+    @staticmethod
+    async def _emit(
+        event_callback: Optional[SummaryEventCallback],
+        event: str,
+        data: dict,
+    ) -> None:
+        """스트리밍 이벤트 전송 (event_callback이 없으면 무시)"""
+        if event_callback is not None:
+            await event_callback(SummaryEvent(event=event, data=data))
+
+    def _set_done_payload(
+        self,
+        summary_data: dict,
+        total_wtu: int,
+        cache_written: bool,
+        partial: bool = False,
+    ) -> None:
+        """완료(done) 이벤트 데이터 기록 (응답 데이터, WTU, 캐시 결과)
+
+        캐시 저장 결과는 커밋 이후에야 확정되므로 여기서 전송하지 않고,
+        호출자(SSE 라우터)가 커밋 성공 후 done_payload를 전송합니다.
+        """
+        self.done_payload = {
+            "data": self._to_schema_dict(summary_data),
+            "success": True,
+            "wtu": total_wtu,
+            "cache": {
+                "hit": summary_data["cached"],
+                "written": cache_written,
+            },
+            "partial": partial,
+        }
+
+    async def _emit_cached(
+        self,
+        event_callback: Optional[SummaryEventCallback],
+        cached_summary: dict,
+    ) -> None:
+        """캐시 히트 결과를 스트리밍 이벤트로 전송 (요약은 한 번에)"""
+        await self._emit(
+            event_callback,
+            "summary",
+            {"summary": cached_summary["summary"]},
+        )
+        await self._emit(
+            event_callback,
+            "tags",
+            {
+                "tags": cached_summary["tags"],
+                "candidate_tags": cached_summary["candidate_tags"],
+            },
+        )
+        await self._emit(
+            event_callback,
+            "category",
+            {
+                "category": cached_summary["category"],
+                "candidate_categories": cached_summary["candidate_categories"],
+            },
+        )
+        self._set_done_payload(
+            cached_summary, total_wtu=0, cache_written=False
+        )
+
+    @staticmethod
+    def _parse_combined_output(
+        raw: Optional[str],
+    ) -> Optional[CombinedSummaryOutput]:
+        """단일 호출 응답 검증 (코드 블록 허용, 실패 시 None)"""
+        cleaned = (raw or "").strip()
+        if cleaned.startswith("```"):
+            cleaned = cleaned.strip("` \n")
+            if cleaned.startswith("json"):
+                cleaned = cleaned[4:].strip()
+        try:
+            return CombinedSummaryOutput.model_validate_json(cleaned)
+        except ValidationError:
+            return None
+
     @staticmethod
     def _parse_json_array(raw: str) -> list[str]:
         cleaned = raw.strip()
@@ -237,6 +818,7 @@ class SummarizationService:
         pipeline_result: SummaryPipelineResult,
         user_id: int,
         tag_count: int,
+        event_callback: Optional[SummaryEventCallback] = None,
     ) -> tuple[dict, int]:
         """요약 데이터 구성
 
@@ -245,15 +827,15 @@ class SummarizationService:
             pipeline_result: LLM 파이프라인 실행 결과
             user_id: 사용자 ID (개인화용)
             tag_count: 반환할 태그 수
+            event_callback: 스트리밍 이벤트 콜백 (개인화가 끝나는 대로
+                tags, category 이벤트 전송)
 
         Returns:
             tuple[dict, int]: (요약 데이터, 총 WTU)
         """
-        summary_text = pipeline_result.summary.content.strip()
-        candidate_tags = self._parse_json_array(pipeline_result.tags.content)
-        candidate_categories = self._parse_json_array(
-            pipeline_result.category.content
-        )
+        summary_text = pipeline_result.summary_text
+        candidate_tags = pipeline_result.candidate_tags
+        candidate_categories = pipeline_result.candidate_categories
 
         # 개인화 추천 로직 적용
         personalized_tags = (
@@ -263,6 +845,11 @@ class SummarizationService:
                 count=tag_count,
             )
         )
+        await self._emit(
+            event_callback,
+            "tags",
+            {"tags": personalized_tags, "candidate_tags": candidate_tags},
+        )
 
         personalized_category = (
             await self.personalization_service.personalize_category(
@@ -270,6 +857,14 @@ class SummarizationService:
                 user_id=user_id,
             )
         )
+        await self._emit(
+            event_callback,
+            "category",
+            {
+                "category": personalized_category,
+                "candidate_categories": candidate_categories,
+            },
+        )
 
         # WTU 계산 (SummaryPipelineResult의 메서드 활용)
         total_wtu = pipeline_result.calculate_total_wtu()
@@ -293,7 +888,18 @@ class SummarizationService:
         summary_data: dict,
         total_tokens: int,
         cache_type: str = "webpage",
-    ) -> None:
+        partial: bool = False,
+        source_fingerprint: Optional[str] = None,
+    ) -> bool:
+        """요약 캐시 저장 (저장했으면 True)"""
+        # 태그/카테고리 단계가 실패한 결과는 캐시하지 않음 (다음 요청에서 재시도)
+        if partial:
+            logger.info(
+                "Skipping summary cache for partial pipeline result",
+                extra={"content_hashs": cache_key, "cache_type": cache_type},
+            )
+            return False
+
         # 기존 동일 cache_key/type 캐시가 있으면 교체 (UPSERT 대용)
         await self.session.execute(
             delete(SummaryCache).where(
@@ -306,6 +912,7 @@ class SummarizationService:
             cache_key=cache_key,
             cache_type=cache_type,
             content_hash=summary_data["content_hash"],
+            source_fingerprint=source_fingerprint,
             extracted_text=summary_data["extracted_text"],
             summary=summary_data["summary"],
             candidate_tags=summary_data["candidate_tags"],
@@ -315,6 +922,7 @@ class SummarizationService:
         )
         self.session.add(summary_cache)
         await self.session.flush()
+        return True
 
     @staticmethod
     def _to_schema_dict(data: dict) -> dict:
@@ -328,20 +936,26 @@ class SummarizationService:
         user_id: int,
         tag_count: int = 5,
         refresh: bool = False,
+        event_callback: Optional[SummaryEventCallback] = None,
     ) -> dict:
         """웹페이지 요약 생성
         캐싱 로직:
         1. content_hashs = SHA256(url)
         2. 캐시 조회 (expires_at > now_utc())
-        3. content_hash 비교
-        4. 캐시 미스 or 변경 시:
+        3. 원본 HTML 지문(source_fingerprint) 일치 시 파싱 없이 반환
+        4. HTML 파싱 후 content_hash 비교 (일치 시 지문 갱신 후 반환)
+        5. 캐시 미스 or 변경 시:
         - HTML 파싱
         - 텍스트 청크 분할
         - 청크별 임베딩 생성
         - LLM 요약 생성
         - 태그/카테고리 후보 추출
         - 캐시 저장 (TTL 30일)
-        5. 개인화 추천 적용
+        6. 개인화 추천 적용
+
+        event_callback이 주어지면 요약 토큰, 태그, 카테고리 이벤트를
+        순서대로 전송합니다 (SSE 스트리밍 엔드포인트). 완료(done) 이벤트
+        데이터는 done_payload에 기록되며 커밋 후 호출자가 전송합니다.
 
         Returns:
             {
@@ -360,10 +974,10 @@ class SummarizationService:
                 https://github.com/Glitch-Jar/LLM-EYES
         """
         cache_key = parsers.calculate_content_hash(url)
+        # 원본 HTML 지문이 같으면 본문 추출(파싱) 없이 캐시 반환
+        source_fingerprint = parsers.calculate_source_fingerprint(html_content)
 
-        extracted_text, _ = await self._prepare_text_and_strategy(html_content)
-        current_content_hash = parsers.calculate_content_hash(extracted_text)
-
+        cached: Optional[SummaryCache] = None
         if refresh:
             logger.info(
                 "Summary cache refresh requested",
@@ -375,44 +989,73 @@ class SummarizationService:
                 },
             )
         else:
-            cached_summary = await self._get_cached_summary(
-                cache_key=cache_key,
-                user_id=user_id,
-                url=url,
-                tag_count=tag_count,
-            )
+            cached = await self._find_cached_summary(cache_key, user_id, url)
             if (
-                cached_summary
-                and cached_summary["content_hash"] == current_content_hash
+                cached is not None
+                and cached.source_fingerprint == source_fingerprint
             ):
-                return self._to_schema_dict(cached_summary)
+                return await self._return_cached(
+                    cached, cache_key, user_id, tag_count, event_callback
+                )
 
-        pipeline_result = await self._run_llm_pipeline(extracted_text)
+        extracted_text, chunk_strategy = await self._prepare_text_and_strategy(
+            html_content
+        )
+        current_content_hash = parsers.calculate_content_hash(extracted_text)
+
+        if cached is not None and cached.content_hash == current_content_hash:
+            # 원본만 바뀌고(광고, 토큰 등) 본문이 같으면 지문 갱신 후 반환
+            cached.source_fingerprint = source_fingerprint
+            await self.session.flush()
+            return await self._return_cached(
+                cached, cache_key, user_id, tag_count, event_callback
+            )
+
+        pipeline_result = await self._run_llm_pipeline(
+            extracted_text,
+            chunk_strategy=chunk_strategy,
+            event_callback=event_callback,
+        )
         summary_data, total_wtu = await self._build_summary_data(
             extracted_text,
             pipeline_result,
             user_id,
             tag_count,
+            event_callback,
         )
-        await self._save_cache(
+        cache_written = await self._save_cache(
             cache_key=cache_key,
             summary_data=summary_data,
             total_tokens=total_wtu,
             cache_type="webpage",
+            partial=pipeline_result.is_partial,
+            source_fingerprint=source_fingerprint,
+        )
+        self._set_done_payload(
+            summary_data,
+            total_wtu,
+            cache_written,
+            partial=pipeline_result.is_partial,
         )
 
         return self._to_schema_dict(summary_data)
 
     async def summarize_youtube(
-        self, url: str, user_id: int, tag_count: int = 5, refresh: bool = False
+        self,
+        url: str,
+        user_id: int,
+        tag_count: int = 5,
+        refresh: bool = False,
+        event_callback: Optional[SummaryEventCallback] = None,
     ) -> dict:
         """유튜브 요약 생성
 
         캐싱 로직:
         1. content_hashs = SHA256(url)
         2. 캐시 조회 (expires_at > now_utc())
-        3. content_hash 비교
-        4. 캐시 미스 or 변경 시:
+        3. 영상 ID 지문(source_fingerprint) 일치 시 자막 조회 없이 반환
+        4. 자막 조회 후 content_hash 비교 (일치 시 지문 갱신 후 반환)
+        5. 캐시 미스 or 변경 시:
         - 자막 추출
         - 자막이 없으면 음성 -> 텍스트 변환
         - 텍스트 청크 분할
@@ -420,7 +1063,11 @@ class SummarizationService:
         - LLM 요약 생성
         - 태그/카테고리 후보 추출
         - 캐시 저장 (TTL 30일)
-        5. 개인화 추천 적용
+        6. 개인화 추천 적용
+
+        event_callback이 주어지면 요약 토큰, 태그, 카테고리 이벤트를
+        순서대로 전송합니다 (SSE 스트리밍 엔드포인트). 완료(done) 이벤트
+        데이터는 done_payload에 기록되며 커밋 후 호출자가 전송합니다.
 
         Returns:
             {
@@ -436,10 +1083,11 @@ class SummarizationService:
         """
 
         cache_key = parsers.calculate_content_hash(url)
+        # 영상 ID가 같으면 자막을 다시 가져오지 않음
+        # (자막 변경은 refresh 또는 캐시 만료 시 반영)
+        source_fingerprint = f"youtube:{parsers.extract_youtube_video_id(url)}"
 
-        extracted_text, _ = await self._prepare_transcript_and_strategy(url)
-        current_content_hash = parsers.calculate_content_hash(extracted_text)
-
+        cached: Optional[SummaryCache] = None
         if refresh:
             logger.info(
                 "Summary cache refresh requested",
@@ -451,36 +1099,55 @@ class SummarizationService:
                 },
             )
         else:
-            cached_summary = await self._get_cached_summary(
-                cache_key=cache_key,
-                user_id=user_id,
-                url=url,
-                tag_count=tag_count,
-            )
+            cached = await self._find_cached_summary(cache_key, user_id, url)
             if (
-                cached_summary
-                and cached_summary["content_hash"] == current_content_hash
+                cached is not None
+                and cached.source_fingerprint == source_fingerprint
             ):
-                return self._to_schema_dict(cached_summary)
+                return await self._return_cached(
+                    cached, cache_key, user_id, tag_count, event_callback
+                )
+
+        (
+            extracted_text,
+            chunk_strategy,
+        ) = await self._prepare_transcript_and_strategy(url)
+        current_content_hash = parsers.calculate_content_hash(extracted_text)
+
+        if cached is not None and cached.content_hash == current_content_hash:
+            cached.source_fingerprint = source_fingerprint
+            await self.session.flush()
+            return await self._return_cached(
+                cached, cache_key, user_id, tag_count, event_callback
+            )
 
         pipeline_result = await self._run_llm_pipeline(
             extracted_text,
             summary_prompt=prompts.YOUTUBE_SUMMARY_PROMPT,
-            prompt_kwargs={
-                "transcript": extracted_text,
-            },
+            text_key="transcript",
+            chunk_strategy=chunk_strategy,
+            event_callback=event_callback,
         )
         summary_data, total_wtu = await self._build_summary_data(
             extracted_text,
             pipeline_result,
             user_id,
             tag_count,
+            event_callback,
         )
-        await self._save_cache(
+        cache_written = await self._save_cache(
             cache_key=cache_key,
             summary_data=summary_data,
             total_tokens=total_wtu,
             cache_type="youtube",
+            partial=pipeline_result.is_partial,
+            source_fingerprint=source_fingerprint,
+        )
+        self._set_done_payload(
+            summary_data,
+            total_wtu,
+            cache_written,
+            partial=pipeline_result.is_partial,
         )
 
         return self._to_schema_dict(summary_data)
@@ -491,6 +1158,7 @@ class SummarizationService:
         user_id: int,
         tag_count: int = 5,
         refresh: bool = False,
+        event_callback: Optional[SummaryEventCallback] = None,
     ) -> dict:
         """PDF 요약 생성
         OCR 및 텍스트 추출 후 요약 생성
@@ -508,6 +1176,10 @@ class SummarizationService:
         - 캐시 저장 (TTL 30일)
         5. 개인화 추천 적용
 
+        event_callback이 주어지면 요약 토큰, 태그, 카테고리 이벤트를
+        순서대로 전송합니다 (SSE 스트리밍 엔드포인트). 완료(done) 이벤트
+        데이터는 done_payload에 기록되며 커밋 후 호출자가 전송합니다.
+
         Returns:
             {
                 "content_hash": str,
@@ -533,34 +1205,46 @@ class SummarizationService:
                 },
             )
         else:
-            cached_summary = await self._get_cached_summary(
-                cache_key=cache_key,
-                user_id=user_id,
-                url="pdf_content",
-                tag_count=tag_count,
+            # 캐시 키가 파일 해시이므로 키 일치 = 내용 일치
+            cached = await self._find_cached_summary(
+                cache_key, user_id, "pdf_content"
             )
-            if cached_summary:
-                return self._to_schema_dict(cached_summary)
+            if cached is not None:
+                return await self._return_cached(
+                    cached, cache_key, user_id, tag_count, event_callback
+                )
 
-        extracted_text, _ = await self._prepare_pdf_text_and_strategy(
-            pdf_content
-        )
-        pipeline_result = await self._run_llm_pipeline(
+        (
             extracted_text,
+            summary_text,
+            chunk_strategy,
+        ) = await self._prepare_pdf_text_and_strategy(pdf_content)
+        pipeline_result = await self._run_llm_pipeline(
+            summary_text,
             summary_prompt=prompts.PDF_SUMMARY_PROMPT,
             max_summary_tokens=500,
+            chunk_strategy=chunk_strategy,
+            event_callback=event_callback,
         )
         summary_data, total_wtu = await self._build_summary_data(
             extracted_text,
             pipeline_result,
             user_id,
             tag_count,
+            event_callback,
         )
-        await self._save_cache(
+        cache_written = await self._save_cache(
             cache_key=cache_key,
             summary_data=summary_data,
             total_tokens=total_wtu,
             cache_type="pdf",
+            partial=pipeline_result.is_partial,
+        )
+        self._set_done_payload(
+            summary_data,
+            total_wtu,
+            cache_written,
+            partial=pipeline_result.is_partial,
         )
 
         return self._to_schema_dict(summary_data)
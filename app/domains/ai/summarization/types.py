@@ -1,6 +1,9 @@
 """요약 도메인 타입 정의"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from pydantic import BaseModel, Field, field_validator
 
 from app.core.llm.types import LLMResult
 from app.core.llm.wtu import calculate_wtu_from_tokens
@@ -10,37 +13,64 @@ from app.core.llm.wtu import calculate_wtu_from_tokens
 class SummaryPipelineResult:
     """요약 파이프라인 실행 결과
 
-    요약, 태그 추출, 카테고리 예측의 LLM 호출 결과를 담습니다.
+    요약, 태그 추출, 카테고리 예측의 LLM 호출 결과와 파싱된 결과를
+    담습니다.
+
+    - pipeline 모드: 요약 이후 태그/카테고리를 병렬 호출합니다. 둘 중
+      하나가 실패해도 요약과 나머지 결과는 유지됩니다 (실패한 단계는 None).
+    - combined 모드: 한 번의 JSON 호출 결과가 summary에 담기고
+      tags/category는 None입니다.
+    - 긴 본문은 구간별 요약(map)과 병합(reduce)을 먼저 거치며, 해당 호출
+      결과는 sections에 담깁니다.
 
     Attributes:
-        summary: 요약 생성 결과
-        tags: 태그 추출 결과
-        category: 카테고리 예측 결과
+        summary: 요약 생성 결과 (combined 모드는 단일 호출 결과)
+        summary_text: 요약 본문
+        candidate_tags: 태그 후보 (중요도 순)
+        candidate_categories: 카테고리 후보 (중요도 순)
+        tags: 태그 추출 결과 (combined 모드 또는 실패 시 None)
+        category: 카테고리 예측 결과 (combined 모드 또는 실패 시 None)
+        mode: "pipeline" 또는 "combined"
+        discarded: 스키마 불일치로 버려진 combined 호출 결과 (WTU에 포함)
+        sections: map-reduce 구간 요약/병합 호출 결과 (WTU에 포함)
+        timings_ms: 단계별 소요 시간 (map, reduce_N, summary, tags,
+            category, total)
+        errors: 실패한 단계별 오류 메시지
 
     Example::
 
-        result = SummaryPipelineResult(
-            summary=summary_llm_result,
-            tags=tag_llm_result,
-            category=category_llm_result
-        )
+        result = await service._run_llm_pipeline(extracted_text)
 
         # WTU 계산
         total_wtu = result.calculate_total_wtu()
 
         # 개별 접근
-        summary_text = result.summary.content
-        tag_list = parse_json(result.tags.content)
+        summary_text = result.summary_text
+        tag_list = result.candidate_tags
     """
 
     summary: LLMResult
-    tags: LLMResult
-    category: LLMResult
+    summary_text: str
+    candidate_tags: list[str]
+    candidate_categories: list[str]
+    tags: Optional[LLMResult] = None
+    category: Optional[LLMResult] = None
+    mode: str = "pipeline"
+    discarded: Optional[LLMResult] = None
+    sections: list[LLMResult] = field(default_factory=list)
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_partial(self) -> bool:
+        """태그 또는 카테고리 단계가 실패했는지 여부"""
+        return bool(self.errors)
 
     def calculate_total_wtu(self) -> int:
         """전체 WTU 계산
 
-        3개 LLM 호출(요약, 태그, 카테고리)의 WTU를 합산합니다.
+        실행된 LLM 호출(구간 요약, 요약, 태그, 카테고리, 버려진 combined
+        호출)의 WTU를 합산합니다.
 
         Returns:
             int: 총 WTU (Weighted Token Unit)
@@ -50,6 +80,60 @@ class SummaryPipelineResult:
                 calculate_wtu_from_tokens(
                     result.input_tokens, result.output_tokens, result.model
                 )
-                for result in [self.summary, self.tags, self.category]
+                for result in [
+                    *self.sections,
+                    self.summary,
+                    self.tags,
+                    self.category,
+                    self.discarded,
+                ]
+                if result is not None
             ]
         )
+
+
+class CombinedSummaryOutput(BaseModel):
+    """단일 호출(combined 모드) 응답 스키마
+
+    Attributes:
+        summary: 요약 본문
+        tags: 태그 후보
+        categories: 카테고리 후보
+    """
+
+    summary: str = Field(..., min_length=1)
+    tags: list[str] = Field(default_factory=list)
+    categories: list[str] = Field(default_factory=list)
+
+    @field_validator("summary")
+    @classmethod
+    def strip_summary(cls, value: str) -> str:
+        value = value.strip()
+        if not value:
+            raise ValueError("summary must not be blank")
+        return value
+
+    @field_validator("tags", "categories")
+    @classmethod
+    def strip_items(cls, values: list[str]) -> list[str]:
+        return [v.strip() for v in values if v.strip()]
+
+
+class SummaryEvent(BaseModel):
+    """요약 스트리밍(SSE) 이벤트
+
+    이벤트 순서:
+        summary_delta (요약 토큰, 여러 번) → summary → tags → category → done
+        (캐시 히트 시 summary_delta 없이 summary부터, 실패 시 error)
+        done은 서비스가 done_payload에 기록하고, 커밋 성공 후 전송됩니다.
+
+    Attributes:
+        event: 이벤트 이름
+        data: 이벤트 데이터 (JSON 직렬화 가능)
+    """
+
+    event: str
+    data: dict[str, Any]
+
+
+SummaryEventCallback = Callable[[SummaryEvent], Awaitable[None]]
@@ -0,0 +1,424 @@
+"""HTML/PDF 파싱 실행 계층
+
+BeautifulSoup / pypdf 파싱은 CPU 작업이라 요청 핸들러에서 직접 실행하면
+큰 PDF 하나가 같은 uvicorn 워커의 모든 요청을 멈춥니다. 이 계층은 파서를
+이벤트 루프 밖에서 실행합니다.
+
+- 큰 입력 (parser_process_min_bytes 이상): 프로세스 풀
+  (입력 bytes/str → 텍스트, 워커별 주소 공간 한도 적용)
+- 작은 입력 또는 풀 비활성화: 스레드 (pickle / 프로세스 전환 비용 생략)
+- 작업별 제한 시간: 초과 시 프로세스 풀은 워커를 종료하고 재생성
+  (스레드는 강제 종료할 수 없어 결과만 버림)
+- PDF: pdf_page_range_size 페이지 단위 구간을 워커 수만큼 동시에 추출해
+  페이지 순서대로 스트리밍하고, 토큰 예산에 도달하면 남은 구간은 취소
+  (프로세스 풀은 PDF를 임시 파일로 한 번만 쓰고 경로만 전달, 워커는
+  PdfReader를 캐시해 구간마다 다시 파싱하지 않음)
+
+도메인 예외는 pickle할 수 없으므로 워커는 (성공 여부, 텍스트 또는 오류
+메시지)를 반환하고, 호출 프로세스에서 파서별 예외로 다시 발생시킵니다.
+
+Example::
+
+    executor = get_parser_executor()
+    result = await executor.extract_pdf(pdf_content, token_budget=12_000)
+    text = result.text
+"""
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import aclosing, suppress
+from typing import Any, AsyncGenerator, Callable, Optional, TypeVar, Union
+
+from app.core.config import settings
+from app.core.exceptions import BaseAPIException
+from app.core.logging import get_logger
+from app.domains.ai.exceptions import HTMLParseException, PDFParseException
+from app.domains.ai.utils import parsers
+from app.domains.ai.utils.types import PDFExtractionResult, PDFPage
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+ParserInput = Union[str, bytes]
+ParseError = type[Union[HTMLParseException, PDFParseException]]
+
+
+def _init_worker(memory_limit_bytes: int) -> None:
+    """워커 프로세스 초기화 (주소 공간 한도 설정, 0이면 제한 없음)"""
+    if memory_limit_bytes <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, hard))
+
+
+def _write_temp_pdf(pdf_content: bytes) -> str:
+    """워커 프로세스에 전달할 PDF 임시 파일 생성 (호출자가 삭제)"""
+    fd, path = tempfile.mkstemp(prefix="linkyboard-", suffix=".pdf")
+    with os.fdopen(fd, "wb") as file:
+        file.write(pdf_content)
+    return path
+
+
+def _parse_in_worker(
+    parser: Callable[..., T], content: ParserInput, *args: Any
+) -> tuple[bool, Union[T, str]]:
+    """워커 프로세스 진입점 (예외 대신 (성공 여부, 결과/오류) 반환)"""
+    try:
+        return True, parser(content, *args)
+    except MemoryError:
+        return False, "파싱 중 메모리 한도를 초과했습니다"
+    except BaseAPIException as e:
+        return False, str(e.detail_info.get("info", e.message))
+    except Exception as e:
+        return False, str(e)
+
+
+class ParserExecutor:
+    """파서 실행기 (프로세스 풀 + 스레드 fallback)
+
+    Args:
+        max_workers: 워커 프로세스 수 (0이면 프로세스 풀 미사용)
+        process_min_bytes: 프로세스 풀을 사용할 최소 입력 크기
+        timeout_seconds: 작업별 제한 시간 (초)
+        memory_limit_bytes: 워커 프로세스 주소 공간 한도 (0이면 제한 없음)
+        pdf_page_range_size: PDF 구간 추출 작업당 페이지 수
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        process_min_bytes: int,
+        timeout_seconds: float,
+        memory_limit_bytes: int,
+        pdf_page_range_size: int = 16,
+    ):
+        self.max_workers = max_workers
+        self.process_min_bytes = process_min_bytes
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_bytes = memory_limit_bytes
+        self.pdf_page_range_size = max(1, pdf_page_range_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.counts = {"process": 0, "thread": 0, "timeouts": 0}
+
+    async def extract_html(self, html_content: str) -> str:
+        """HTML 본문 추출 (parsers.extract_text_from_html)
+
+        Raises:
+            HTMLParseException: 파싱 실패, 시간 초과, 메모리 한도 초과 시
+        """
+        return await self._run(
+            parsers.extract_text_from_html, html_content, HTMLParseException
+        )
+
+    async def extract_pdf(
+        self, pdf_content: bytes, token_budget: Optional[int] = None
+    ) -> PDFExtractionResult:
+        """PDF 텍스트 추출 (페이지 구간 병렬, 페이지별 통계 포함)
+
+        Args:
+            pdf_content: PDF 바이너리 콘텐츠
+            token_budget: 요약용 토큰 예산. 앞 페이지부터 누적한 토큰이
+                예산에 도달하면 남은 페이지를 추출하지 않고 중단합니다
+                (summary 모드). None이면 전체 추출 (full 모드, 임베딩용)
+
+        Returns:
+            PDFExtractionResult: 추출 텍스트와 페이지별 소요 시간 / 실패
+
+        Raises:
+            PDFParseException: 파싱 실패, 시간 초과, 추출 텍스트 없음
+        """
+        started = time.perf_counter()
+        total_pages = await self.count_pdf_pages(pdf_content)
+        result = PDFExtractionResult(
+            text="",
+            total_pages=total_pages,
+            mode="full" if token_budget is None else "summary",
+        )
+
+        # 워커 프로세스가 이 모듈을 import할 때 litellm을 불러오지 않도록
+        # 토큰 계산 모듈은 호출 시점에 import
+        from app.core.llm.batching import count_tokens
+
+        tokens = 0
+        async with aclosing(
+            self.iter_pdf_pages(pdf_content, total_pages)
+        ) as pages:
+            async for page in pages:
+                result.pages.append(page)
+                if token_budget is None or not page.text.strip():
+                    continue
+                tokens += count_tokens([page.text])[0]
+                if tokens >= token_budget:
+                    break
+
+        result.truncated = len(result.pages) < total_pages
+        result.text = parsers.join_pdf_pages(result.pages)
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        if result.failed_pages:
+            logger.warning("PDF pages failed to extract", extra=result.stats())
+        if not result.text:
+            raise PDFParseException(detail_msg=parsers.PDF_NO_TEXT_MESSAGE)
+
+        logger.info(
+            f"Extracted {len(result.text)} characters from PDF "
+            f"({len(result.pages)}/{total_pages} pages)",
+            extra=result.stats(),
+        )
+        return result
+
+    async def count_pdf_pages(self, pdf_content: bytes) -> int:
+        """PDF 페이지 수 조회 (스레드, 상호 참조 테이블만 읽음)
+
+        Raises:
+            PDFParseException: PDF를 열 수 없거나 페이지가 없을 때
+        """
+        try:
+            return await self.run_in_thread(
+                parsers.count_pdf_pages, pdf_content
+            )
+        except asyncio.TimeoutError:
+            self.counts["timeouts"] += 1
+            raise PDFParseException(detail_msg=self._timeout_message())
+
+    async def iter_pdf_pages(
+        self, pdf_content: bytes, total_pages: Optional[int] = None
+    ) -> AsyncGenerator[PDFPage, None]:
+        """PDF 페이지를 순서대로 스트리밍 (구간 병렬 추출)
+
+        pdf_page_range_size 페이지 단위 구간을 워커 수만큼 미리 실행하고,
+        앞 구간이 끝나는 대로 페이지를 내보냅니다. 소비자가 중간에
+        멈추면 (aclose) 시작 전인 구간은 취소합니다. 이미 워커에서 실행
+        중인 구간은 끝까지 실행되며 결과만 버립니다.
+
+        프로세스 풀을 사용하는 크기면 PDF를 임시 파일로 한 번만 쓰고
+        구간 작업에는 경로만 전달합니다 (스트리밍이 끝나면 삭제).
+
+        Raises:
+            PDFParseException: 파싱 실패 또는 구간 시간 초과 시
+        """
+        if total_pages is None:
+            total_pages = await self.count_pdf_pages(pdf_content)
+
+        size = self.pdf_page_range_size
+        ranges = deque(
+            (start, min(start + size, total_pages))
+            for start in range(0, total_pages, size)
+        )
+        in_flight: deque[asyncio.Task[list[PDFPage]]] = deque()
+        path = (
+            await asyncio.to_thread(_write_temp_pdf, pdf_content)
+            if self._use_pool(pdf_content)
+            else None
+        )
+
+        def schedule() -> None:
+            start, end = ranges.popleft()
+            if path is None:
+                job = self._run(
+                    parsers.extract_pdf_page_range,
+                    pdf_content,
+                    PDFParseException,
+                    start,
+                    end,
+                )
+            else:
+                job = self._run_in_pool(
+                    parsers.extract_pdf_file_page_range,
+                    path,
+                    PDFParseException,
+                    start,
+                    end,
+                )
+            in_flight.append(asyncio.create_task(job))
+
+        try:
+            while ranges and len(in_flight) < max(1, self.max_workers):
+                schedule()
+            while in_flight:
+                pages = await in_flight.popleft()
+                if ranges:
+                    schedule()
+                for page in pages:
+                    yield page
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            if path is not None:
+                # 실행 중인 워커는 이미 파일을 읽었으므로 바로 삭제해도 됨
+                with suppress(FileNotFoundError):
+                    os.unlink(path)
+
+    async def run_in_thread(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> T:
+        """I/O 위주 작업을 스레드에서 실행 (제한 시간 적용)
+
+        Args:
+            func: 실행할 함수
+            *args: 함수 인자
+            timeout: 제한 시간 (None이면 timeout_seconds)
+
+        Raises:
+            asyncio.TimeoutError: 제한 시간 초과 시
+        """
+        return await asyncio.wait_for(
+            asyncio.to_thread(func, *args),
+            timeout=self.timeout_seconds if timeout is None else timeout,
+        )
+
+    def _use_pool(self, content: ParserInput) -> bool:
+        """입력을 프로세스 풀에서 파싱할지 여부"""
+        return self.max_workers > 0 and len(content) >= self.process_min_bytes
+
+    async def _run(
+        self,
+        parser: Callable[..., T],
+        content: ParserInput,
+        error: ParseError,
+        *args: Any,
+    ) -> T:
+        """입력 크기에 따라 프로세스 풀 또는 스레드에서 파서 실행
+
+        parser(content, *args)를 실행합니다. 프로세스 풀에서 실행하려면
+        parser와 인자, 반환값이 pickle 가능해야 합니다.
+        """
+        if not self._use_pool(content):
+            self.counts["thread"] += 1
+            try:
+                return await self.run_in_thread(parser, content, *args)
+            except asyncio.TimeoutError:
+                self.counts["timeouts"] += 1
+                raise error(detail_msg=self._timeout_message())
+
+        return await self._run_in_pool(parser, content, error, *args)
+
+    async def _run_in_pool(
+        self,
+        parser: Callable[..., T],
+        content: ParserInput,
+        error: ParseError,
+        *args: Any,
+    ) -> T:
+        """프로세스 풀에서 parser(content, *args) 실행 (입력 크기 무관)"""
+        self.counts["process"] += 1
+        try:
+            ok, value = await self._submit(parser, content, error, args)
+        except BrokenProcessPool:
+            # 다른 작업의 시간 초과로 풀이 재생성되었거나 워커가 비정상
+            # 종료된 경우 (메모리 한도 초과로 인한 kill 등) 한 번 재시도
+            try:
+                ok, value = await self._submit(parser, content, error, args)
+            except BrokenProcessPool:
+                raise error(detail_msg="파서 프로세스가 비정상 종료되었습니다")
+
+        if not ok:
+            raise error(detail_msg=str(value))
+        return value  # type: ignore[return-value]
+
+    async def _submit(
+        self,
+        parser: Callable[..., T],
+        content: ParserInput,
+        error: ParseError,
+        args: tuple[Any, ...],
+    ) -> tuple[bool, Union[T, str]]:
+        pool = self._get_pool()
+        future = asyncio.get_running_loop().run_in_executor(
+            pool, _parse_in_worker, parser, content, *args
+        )
+        try:
+            return await asyncio.wait_for(future, timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self.counts["timeouts"] += 1
+            self._restart_pool(pool)
+            raise error(detail_msg=self._timeout_message())
+        except BrokenProcessPool:
+            self._restart_pool(pool)
+            raise
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # fork는 이벤트 루프 / 스레드 상태를 복제하므로 spawn 사용
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.memory_limit_bytes,),
+            )
+        return self._pool
+
+    def _restart_pool(self, pool: ProcessPoolExecutor) -> None:
+        """멈춘 워커 종료 후 다음 작업에서 풀 재생성"""
+        if self._pool is not pool:
+            return  # 이미 다른 작업이 재생성함
+        self._pool = None
+        logger.warning("Restarting parser process pool")
+        # 실행 중인 작업은 취소할 수 없으므로 워커 프로세스를 직접 종료
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _timeout_message(self) -> str:
+        return f"파싱 제한 시간({self.timeout_seconds:g}초)을 초과했습니다"
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료 (앱 종료 시)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict[str, Any]:
+        """실행 통계 (프로세스 / 스레드 실행 수, 시간 초과 수)"""
+        return {
+            **self.counts,
+            "workers": self.max_workers,
+            "pool_started": self._pool is not None,
+        }
+
+
+_parser_executor: Optional[ParserExecutor] = None
+
+
+def get_parser_executor() -> ParserExecutor:
+    """파서 실행기 싱글톤
+
+    parser_pool_enabled=False이면 모든 파싱을 스레드에서 실행합니다.
+    """
+    global _parser_executor
+    if _parser_executor is None:
+        _parser_executor = ParserExecutor(
+            max_workers=(
+                settings.parser_pool_workers
+                if settings.parser_pool_enabled
+                else 0
+            ),
+            process_min_bytes=settings.parser_process_min_bytes,
+            timeout_seconds=settings.parser_timeout_seconds,
+            memory_limit_bytes=settings.parser_memory_limit_mb * 1024 * 1024,
+            pdf_page_range_size=settings.pdf_page_range_size,
+        )
+    return _parser_executor
+
+
+def reset_parser_executor() -> None:
+    """싱글톤 초기화 (테스트 / 설정 변경 시, 프로세스 풀 종료)"""
+    global _parser_executor
+    if _parser_executor is not None:
+        _parser_executor.shutdown()
+    _parser_executor = None
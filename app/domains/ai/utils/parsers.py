@@ -5,7 +5,9 @@ HTML, PDF, YouTube 자막 등 다양한 포맷의 텍스트를 추출합니다.
 
 import hashlib
 import re
-from typing import Union, cast
+import time
+from io import BytesIO
+from typing import Optional, Union, cast
 
 from bs4 import BeautifulSoup
 from pypdf import PdfReader
@@ -24,9 +26,14 @@ from app.domains.ai.exceptions import (
     TranscriptNotAvailableException,
     YoutubeVideoNotFoundException,
 )
+from app.domains.ai.utils.types import PDFPage, YoutubeTranscript
 
 logger = get_logger(__name__)
 
+YOUTUBE_TRANSCRIPT_LANGUAGES = ("ko", "en")  # 자막 선호 언어 (순서대로)
+
+PDF_NO_TEXT_MESSAGE = "PDF에서 텍스트를 추출할 수 없습니다. 이미지 기반 PDF이거나 보호된 문서일 수 있습니다."
+
 
 def extract_text_from_html(html_content: str) -> str:
     """HTML에서 텍스트 추출
@@ -65,63 +72,160 @@ def extract_text_from_html(html_content: str) -> str:
         raise HTMLParseException(detail_msg=f"HTML 파싱 실패: {str(e)}")
 
 
-def extract_text_from_pdf(pdf_content: bytes) -> str:
-    """PDF에서 텍스트 추출
+def count_pdf_pages(pdf_content: bytes) -> int:
+    """PDF 페이지 수 조회
 
     Args:
         pdf_content: PDF 바이너리 콘텐츠
 
     Returns:
-        str: 추출된 텍스트
+        int: 페이지 수
 
     Raises:
-        PDFParseException: PDF 파싱 실패 시
+        PDFParseException: PDF를 열 수 없거나 페이지가 없을 때
     """
     try:
-        from io import BytesIO
+        total_pages = len(PdfReader(BytesIO(pdf_content)).pages)
+    except Exception as e:
+        logger.error(f"PDF parsing failed: {e}")
+        raise PDFParseException(detail_msg=f"PDF 파싱 실패: {str(e)}")
 
-        pdf_file = BytesIO(pdf_content)
-        reader = PdfReader(pdf_file)
+    if total_pages == 0:
+        raise PDFParseException(detail_msg="PDF에 페이지가 없습니다")
+    return total_pages
 
-        if len(reader.pages) == 0:
-            raise PDFParseException(detail_msg="PDF에 페이지가 없습니다")
 
-        # 페이지별 텍스트 추출
-        text_parts = []
-        for page_num, page in enumerate(reader.pages):
-            try:
-                page_text = page.extract_text()
-                if page_text.strip():
-                    text_parts.append(page_text)
-            except Exception as e:
-                logger.warning(f"Page {page_num + 1} extraction failed: {e}")
-                continue
-
-        if not text_parts:
-            raise PDFParseException(
-                detail_msg="PDF에서 텍스트를 추출할 수 없습니다. "
-                "이미지 기반 PDF이거나 보호된 문서일 수 있습니다."
-            )
+def extract_pdf_page_range(
+    pdf_content: bytes, start: int = 0, end: Optional[int] = None
+) -> list[PDFPage]:
+    """PDF 페이지 구간 [start, end) 텍스트 추출
 
-        text = "\n\n".join(text_parts)
+    스레드에서 실행하는 작업 단위입니다. 페이지 단위 실패는 예외 대신
+    PDFPage.error에 기록하고 다음 페이지를 계속 추출합니다.
 
-        # 공백 정리
-        text = re.sub(r"\n\s*\n", "\n\n", text)
-        text = re.sub(r"[ \t]+", " ", text)
+    Args:
+        pdf_content: PDF 바이너리 콘텐츠
+        start: 시작 페이지 인덱스 (0부터)
+        end: 끝 페이지 인덱스 (미포함, None이면 마지막 페이지까지)
 
-        logger.info(
-            f"Extracted {len(text)} characters from PDF "
-            f"({len(reader.pages)} pages)"
-        )
-        return text.strip()
+    Returns:
+        list[PDFPage]: 페이지별 추출 결과 (페이지 순서)
 
-    except PDFParseException:
-        raise
+    Raises:
+        PDFParseException: PDF를 열 수 없을 때
+    """
+    return _extract_pages(_open_pdf(BytesIO(pdf_content)), start, end)
+
+
+# 워커 프로세스별 마지막으로 연 PDF 파일 (경로, PdfReader)
+_cached_reader: Optional[tuple[str, PdfReader]] = None
+
+
+def extract_pdf_file_page_range(
+    path: str, start: int = 0, end: Optional[int] = None
+) -> list[PDFPage]:
+    """PDF 파일의 페이지 구간 [start, end) 텍스트 추출 (프로세스 풀 작업)
+
+    호출 프로세스가 PDF를 임시 파일로 한 번만 쓰고 경로만 전달하므로,
+    구간마다 PDF 전체를 pickle하지 않습니다. 워커 프로세스는 마지막으로
+    연 PdfReader를 캐시해 같은 파일의 다음 구간에서 다시 파싱하지 않습니다
+    (워커는 작업을 하나씩 실행하므로 락 불필요).
+
+    Args:
+        path: PDF 임시 파일 경로 (추출 중 내용이 바뀌지 않아야 함)
+        start: 시작 페이지 인덱스 (0부터)
+        end: 끝 페이지 인덱스 (미포함, None이면 마지막 페이지까지)
+
+    Returns:
+        list[PDFPage]: 페이지별 추출 결과 (페이지 순서)
+
+    Raises:
+        PDFParseException: PDF를 열 수 없을 때
+    """
+    global _cached_reader
+    if _cached_reader is None or _cached_reader[0] != path:
+        # 이전 문서를 먼저 해제해 워커 메모리에 문서 하나만 유지
+        _cached_reader = None
+        _cached_reader = (path, _open_pdf(path))
+    return _extract_pages(_cached_reader[1], start, end)
+
+
+def _open_pdf(source: Union[str, BytesIO]) -> PdfReader:
+    try:
+        return PdfReader(source)
     except Exception as e:
         logger.error(f"PDF parsing failed: {e}")
         raise PDFParseException(detail_msg=f"PDF 파싱 실패: {str(e)}")
 
 
+def _extract_pages(
+    reader: PdfReader, start: int, end: Optional[int]
+) -> list[PDFPage]:
+    try:
+        total_pages = len(reader.pages)
+    except Exception as e:
+        logger.error(f"PDF parsing failed: {e}")
+        raise PDFParseException(detail_msg=f"PDF 파싱 실패: {str(e)}")
+
+    pages = []
+    if end is None or end > total_pages:
+        end = total_pages
+    for index in range(start, end):
+        started = time.perf_counter()
+        error = None
+        try:
+            page_text = reader.pages[index].extract_text() or ""
+        except Exception as e:
+            logger.warning(f"Page {index + 1} extraction failed: {e}")
+            page_text, error = "", str(e)
+        pages.append(
+            PDFPage(
+                number=index + 1,
+                text=page_text,
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+                error=error,
+            )
+        )
+    return pages
+
+
+def join_pdf_pages(pages: list[PDFPage]) -> str:
+    """페이지 텍스트 결합 및 공백 정리 (빈 페이지 제외)"""
+    text = "\n\n".join(page.text for page in pages if page.text.strip())
+    text = re.sub(r"\n\s*\n", "\n\n", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    return text.strip()
+
+
+def extract_text_from_pdf(pdf_content: bytes) -> str:
+    """PDF에서 텍스트 추출 (전체 페이지 순차 추출)
+
+    페이지 구간 병렬 추출 / 토큰 예산 조기 종료는
+    ParserExecutor.extract_pdf를 사용합니다.
+
+    Args:
+        pdf_content: PDF 바이너리 콘텐츠
+
+    Returns:
+        str: 추출된 텍스트
+
+    Raises:
+        PDFParseException: PDF 파싱 실패 시
+    """
+    pages = extract_pdf_page_range(pdf_content)
+    if not pages:
+        raise PDFParseException(detail_msg="PDF에 페이지가 없습니다")
+
+    text = join_pdf_pages(pages)
+    if not text:
+        raise PDFParseException(detail_msg=PDF_NO_TEXT_MESSAGE)
+
+    logger.info(
+        f"Extracted {len(text)} characters from PDF ({len(pages)} pages)"
+    )
+    return text
+
+
 def extract_youtube_video_id(url: str) -> str:
     """YouTube URL에서 비디오 ID 추출
 
@@ -152,52 +256,37 @@ def extract_youtube_video_id(url: str) -> str:
     raise InvalidYoutubeURLException(url=url)
 
 
-def get_youtube_transcript(
-    video_id: str, languages: list[str] | None = None
-) -> str:
-    """YouTube 자막 추출
+def fetch_youtube_transcript(
+    video_id: str, languages: Optional[list[str]] = None
+) -> YoutubeTranscript:
+    """YouTube 자막 조회 (자막 언어 포함)
+
+    자막 목록을 한 번 조회한 뒤 선호 언어 → 자동 생성 자막 → 첫 번째
+    자막 순으로 선택합니다. 네트워크 I/O이므로 이벤트 루프에서는
+    스레드로 실행해야 합니다 (ParserExecutor.run_in_thread).
 
     Args:
         video_id: YouTube 비디오 ID
         languages: 선호 언어 목록 (기본: ['ko', 'en'])
 
     Returns:
-        str: 자막 텍스트
+        YoutubeTranscript: 자막 텍스트와 언어 코드
 
     Raises:
         YoutubeVideoNotFoundException: 동영상을 찾을 수 없음
         TranscriptNotAvailableException: 자막을 사용할 수 없음
     """
     if languages is None:
-        languages = ["ko", "en"]
+        languages = list(YOUTUBE_TRANSCRIPT_LANGUAGES)
 
     try:
-        # 테스트/모킹 호환을 위해 직접 get_transcript도 우선 시도
-        try:
-            transcript_data = YouTubeTranscriptApi.get_transcript(
-                video_id, languages=languages
-            )
-            text = " ".join(item["text"] for item in transcript_data)
-            text = re.sub(r"\s+", " ", text)
-            logger.info(
-                f"Extracted {len(text)} characters from YouTube "
-                f"transcript (video_id={video_id}) via get_transcript"
-            )
-            return text.strip()
-        except Exception:
-            pass
-
-        # 자막 가져오기
         transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
 
-        # 선호 언어 순서대로 시도
-        transcript = None
-        for lang in languages:
-            try:
-                transcript = transcript_list.find_transcript([lang])
-                break
-            except NoTranscriptFound:
-                continue
+        # 선호 언어 순서대로 시도 (find_transcript가 목록 순서대로 탐색)
+        try:
+            transcript = transcript_list.find_transcript(languages)
+        except NoTranscriptFound:
+            transcript = None
 
         # 선호 언어가 없으면 사용 가능한 첫 번째 자막
         if transcript is None:
@@ -227,10 +316,15 @@ def get_youtube_transcript(
 
         logger.info(
             f"Extracted {len(text)} characters from YouTube "
-            f"transcript (video_id={video_id})"
+            f"transcript (video_id={video_id}, "
+            f"language={transcript.language_code})"
+        )
+        return YoutubeTranscript(
+            text=text.strip(), language=transcript.language_code
         )
-        return text.strip()
 
+    except TranscriptNotAvailableException:
+        raise
     except VideoUnavailable:
         logger.error(f"YouTube video not found: {video_id}")
         raise YoutubeVideoNotFoundException(video_id=video_id)
@@ -244,6 +338,25 @@ def get_youtube_transcript(
         )
 
 
+def get_youtube_transcript(
+    video_id: str, languages: list[str] | None = None
+) -> str:
+    """YouTube 자막 추출
+
+    Args:
+        video_id: YouTube 비디오 ID
+        languages: 선호 언어 목록 (기본: ['ko', 'en'])
+
+    Returns:
+        str: 자막 텍스트
+
+    Raises:
+        YoutubeVideoNotFoundException: 동영상을 찾을 수 없음
+        TranscriptNotAvailableException: 자막을 사용할 수 없음
+    """
+    return fetch_youtube_transcript(video_id, languages).text
+
+
 def calculate_content_hash(content: Union[str, bytes]) -> str:
     """콘텐츠 해시 계산 (캐시 키 생성용)
 
@@ -258,3 +371,21 @@ def calculate_content_hash(content: Union[str, bytes]) -> str:
 
     hash_obj = hashlib.sha256(content)
     return hash_obj.hexdigest()
+
+
+def calculate_source_fingerprint(content: Union[str, bytes]) -> str:
+    """원본 지문 계산 (본문 추출 전 캐시 비교용)
+
+    원본 HTML 전체를 해싱하므로 본문 추출보다 훨씬 저렴합니다.
+    암호학적 강도가 필요 없어 SHA-256보다 빠른 BLAKE2b(128비트)를 사용합니다.
+
+    Args:
+        content: 원본 텍스트 또는 바이너리 콘텐츠
+
+    Returns:
+        str: BLAKE2b 해시 (32자 16진수 문자열)
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
@@ -0,0 +1,81 @@
+"""파싱 유틸리티 타입 정의"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class PDFPage:
+    """PDF 페이지 추출 결과
+
+    Attributes:
+        number: 페이지 번호 (1부터)
+        text: 추출된 텍스트 (실패 시 빈 문자열)
+        elapsed_ms: 추출 소요 시간
+        error: 추출 실패 시 오류 메시지
+    """
+
+    number: int
+    text: str
+    elapsed_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class PDFExtractionResult:
+    """PDF 텍스트 추출 결과 (페이지별 통계 포함)
+
+    Attributes:
+        text: 정리된 전체 텍스트 (summary 모드는 토큰 예산까지)
+        total_pages: PDF 전체 페이지 수
+        pages: 추출한 페이지별 결과 (조기 종료 시 일부)
+        mode: "full" (전체 추출) 또는 "summary" (토큰 예산에서 중단)
+        truncated: 토큰 예산 도달로 일부 페이지를 건너뛰었는지 여부
+        elapsed_ms: 전체 추출 소요 시간
+
+    Example::
+
+        result = await get_parser_executor().extract_pdf(
+            pdf_content, token_budget=12_000
+        )
+        if result.failed_pages:
+            logger.warning("PDF pages failed", extra=result.stats())
+    """
+
+    text: str
+    total_pages: int
+    pages: list[PDFPage] = field(default_factory=list)
+    mode: str = "full"
+    truncated: bool = False
+    elapsed_ms: float = 0.0
+
+    @property
+    def failed_pages(self) -> list[PDFPage]:
+        return [page for page in self.pages if page.error is not None]
+
+    def stats(self) -> dict[str, Any]:
+        """로깅용 추출 통계 (느린 페이지 / 실패 페이지 식별)"""
+        slowest = max(self.pages, key=lambda p: p.elapsed_ms, default=None)
+        return {
+            "mode": self.mode,
+            "total_pages": self.total_pages,
+            "extracted_pages": len(self.pages),
+            "failed_pages": [page.number for page in self.failed_pages],
+            "truncated": self.truncated,
+            "elapsed_ms": self.elapsed_ms,
+            "slowest_page": slowest.number if slowest else None,
+            "slowest_page_ms": slowest.elapsed_ms if slowest else None,
+        }
+
+
+@dataclass
+class YoutubeTranscript:
+    """YouTube 자막 조회 결과
+
+    Attributes:
+        text: 공백 정리된 자막 텍스트
+        language: 자막 언어 코드 (캐시 키)
+    """
+
+    text: str
+    language: str
@@ -9,14 +9,17 @@ from typing import Optional
 
 from sqlalchemy import (
     ARRAY,
+    DDL,
     DateTime,
     Index,
     Integer,
     String,
     Text,
+    event,
     func,
     text,
 )
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -45,6 +48,7 @@ class EmbeddingStatus(str, Enum):
     PENDING = "pending"  # 임베딩 대기
     PROCESSING = "processing"  # 임베딩 생성 중
     COMPLETED = "completed"  # 임베딩 완료
+    PARTIAL = "partial"  # 일부 청크 실패 (성공 청크만 저장, 재시도 대상)
     FAILED = "failed"  # 임베딩 실패
 
 
@@ -93,6 +97,11 @@ class Content(Base):
         server_default="pending",
         comment="임베딩 생성 상태 (AI 도메인 독립 프로세스)",
     )
+    embedding_progress: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="임베딩 진행 상태 (청크 수, 실패 청크 인덱스, 오류)",
+    )
 
     # Source Information (웹페이지/YouTube만)
     source_url: Mapped[Optional[str]] = mapped_column(
@@ -159,6 +168,14 @@ class Content(Base):
         comment="추출 방법 (AI 모델명 등)",
     )
 
+    # Full-Text Search (트리거로 유지, 모듈 하단 DDL 참고)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        nullable=True,
+        deferred=True,
+        comment="가중치 적용 전문 검색 벡터 (트리거 자동 갱신)",
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -190,6 +207,19 @@ class Content(Base):
         Index("ix_contents_summary_status", "summary_status"),
         Index("ix_contents_embedding_status", "embedding_status"),
         Index("ix_contents_created_at", "created_at"),
+        # 목록 keyset 페이지네이션 (ORDER BY created_at DESC, id DESC)
+        Index(
+            "ix_contents_user_created_id",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_contents_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -199,3 +229,53 @@ class Content(Base):
             f"summary={self.summary_status}, "
             f"embedding={self.embedding_status})>"
         )
+
+
+# search_vector 갱신 트리거
+# array_to_string은 IMMUTABLE이 아니어서 generated column 대신 트리거 사용
+# 가중치: A(title, tags) > B(category, summary) > C(memo) > D(type, url)
+# 마이그레이션(add_search_vector_to_contents)과 동일하게 유지해야 합니다.
+CONTENTS_SEARCH_VECTOR_FUNCTION = DDL(
+    """
+    CREATE OR REPLACE FUNCTION contents_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A')
+            || setweight(to_tsvector('simple',
+                coalesce(array_to_string(NEW.tags, ' '), '')), 'A')
+            || setweight(to_tsvector('simple',
+                coalesce(NEW.category, '')), 'B')
+            || setweight(to_tsvector('simple',
+                coalesce(NEW.summary, '')), 'B')
+            || setweight(to_tsvector('simple', coalesce(NEW.memo, '')), 'C')
+            || setweight(to_tsvector('simple',
+                coalesce(NEW.content_type, '')), 'D')
+            || setweight(to_tsvector('simple',
+                coalesce(NEW.source_url, '')), 'D');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """
+)
+CONTENTS_SEARCH_VECTOR_TRIGGER = DDL(
+    """
+    CREATE TRIGGER contents_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF
+        title, tags, category, summary, memo, content_type, source_url
+    ON contents
+    FOR EACH ROW EXECUTE FUNCTION contents_search_vector_update()
+    """
+)
+
+# create_all(테스트 등)에서도 트리거가 설치되도록 등록
+event.listen(
+    Content.__table__,
+    "after_create",
+    CONTENTS_SEARCH_VECTOR_FUNCTION.execute_if(dialect="postgresql"),
+)
+event.listen(
+    Content.__table__,
+    "after_create",
+    CONTENTS_SEARCH_VECTOR_TRIGGER.execute_if(dialect="postgresql"),
+)
@@ -7,10 +7,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Sequence, cast
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import Select, and_, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.utils.datetime import now_utc
+from app.core.utils.pagination import TotalMode, count_total
 from app.domains.contents.models import Content, ContentType
 
 
@@ -100,32 +101,29 @@ class ContentRepository:
         result = await self.session.execute(query)
         return cast(Optional[Content], result.scalar_one_or_none())
 
-    async def get_list(
+    def _apply_filters(
         self,
+        query: Select,
         user_id: int,
-        skip: int = 0,
-        limit: int = 20,
         filters: Optional[ContentFilters] = None,
-    ) -> Sequence[Content]:
-        """콘텐츠 목록 조회
+    ) -> Select:
+        """목록/개수 조회 공통 조건 적용
 
         Args:
+            query: 조건을 적용할 SELECT
             user_id: 사용자 ID
-            skip: 건너뛸 레코드 수
-            limit: 조회할 최대 레코드 수
             filters: 필터 옵션
 
         Returns:
-            콘텐츠 목록
+            조건이 적용된 SELECT
         """
-        query = select(Content).where(
+        query = query.where(
             and_(
                 Content.user_id == user_id,
                 Content.deleted_at.is_(None),
             )
         )
 
-        # 필터 적용
         if filters:
             if filters.content_type:
                 query = query.where(
@@ -145,9 +143,41 @@ class ContentRepository:
             if filters.date_to:
                 query = query.where(Content.created_at <= filters.date_to)
 
-        # 정렬 및 페이지네이션
+        return query
+
+    async def get_list(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        filters: Optional[ContentFilters] = None,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> Sequence[Content]:
+        """콘텐츠 목록 조회 (created_at, id 내림차순)
+
+        Args:
+            user_id: 사용자 ID
+            skip: 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            filters: 필터 옵션
+            after: 커서 (마지막으로 본 created_at, id).
+                주어지면 OFFSET 없이 그 이후 레코드부터 조회 (keyset)
+
+        Returns:
+            콘텐츠 목록
+        """
+        query = self._apply_filters(select(Content), user_id, filters)
+
+        if after is not None:
+            query = query.where(
+                tuple_(Content.created_at, Content.id) < tuple_(*after)
+            )
+
+        # 정렬 및 페이지네이션 (id로 동일 created_at 순서 고정)
         query = (
-            query.order_by(Content.created_at.desc()).offset(skip).limit(limit)
+            query.order_by(Content.created_at.desc(), Content.id.desc())
+            .offset(skip)
+            .limit(limit)
         )
 
         result = await self.session.execute(query)
@@ -167,35 +197,38 @@ class ContentRepository:
         Returns:
             콘텐츠 수
         """
-        query = select(func.count(Content.id)).where(
-            and_(
-                Content.user_id == user_id,
-                Content.deleted_at.is_(None),
-            )
+        query = self._apply_filters(
+            select(func.count(Content.id)), user_id, filters
         )
 
-        # 필터 적용 (get_list와 동일)
-        if filters:
-            if filters.content_type:
-                query = query.where(
-                    Content.content_type == filters.content_type
-                )
-
-            if filters.category:
-                query = query.where(Content.category == filters.category)
+        result = await self.session.execute(query)
+        count = result.scalar_one()
+        return int(count)
 
-            if filters.tags:
-                query = query.where(Content.tags.overlap(filters.tags))
+    async def count_total(
+        self,
+        user_id: int,
+        filters: Optional[ContentFilters] = None,
+        mode: TotalMode = TotalMode.EXACT,
+    ) -> Optional[int]:
+        """전체 개수 계산 방식에 따른 콘텐츠 수 조회
 
-            if filters.date_from:
-                query = query.where(Content.created_at >= filters.date_from)
+        Args:
+            user_id: 사용자 ID
+            filters: 필터 옵션
+            mode: 계산 방식 (exact, capped, estimated, none)
 
-            if filters.date_to:
-                query = query.where(Content.created_at <= filters.date_to)
+        Returns:
+            콘텐츠 수 (count_total 참고, none이면 None)
+        """
+        if mode == TotalMode.EXACT:
+            return await self.count(user_id=user_id, filters=filters)
 
-        result = await self.session.execute(query)
-        count = result.scalar_one()
-        return int(count)
+        return await count_total(
+            self.session,
+            self._apply_filters(select(Content.id), user_id, filters),
+            mode=mode,
+        )
 
     async def create(self, content: Content) -> Content:
         """콘텐츠 생성
@@ -15,7 +15,7 @@ from app.core.schemas import (
     create_response,
 )
 from app.core.storage import S3Client, get_s3_client
-from app.core.utils.pagination import PageParams
+from app.core.utils.pagination import CursorParams, PageParams
 from app.domains.contents.schemas import (
     ContentDeleteRequest,
     ContentDeleteResponse,
@@ -168,21 +168,32 @@ async def delete_contents(
 async def list_contents(
     user_id: int,
     page_params: PageParams = Depends(),
+    cursor_params: CursorParams = Depends(),
     filters: ContentListRequest = Depends(),
     service: ContentService = Depends(get_content_service),
 ):
-    """콘텐츠 목록 조회"""
-    contents, total = await service.list_contents(
+    """콘텐츠 목록 조회
+
+    cursor를 주면 page 대신 커서 이후 목록을 조회합니다 (keyset).
+    """
+    result = await service.list_contents_page(
         user_id=user_id,
-        page=page_params.page,
         size=page_params.size,
+        page=page_params.page,
+        cursor=cursor_params.cursor,
         filters=filters,
+        total_mode=cursor_params.total_mode,
     )
 
     return create_list_response(
-        data=[ContentResponse.model_validate(content) for content in contents],
-        total=total,
+        data=[
+            ContentResponse.model_validate(content) for content in result.items
+        ],
+        total=result.total,
         page=page_params.page,
         size=page_params.size,
         message="콘텐츠 목록을 조회했습니다.",
+        next_cursor=result.next_cursor,
+        total_mode=cursor_params.total_mode,
+        cursor=cursor_params.cursor,
     )
@@ -4,7 +4,7 @@
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
@@ -125,6 +125,7 @@ class ContentResponse(BaseModel):
     content_type: ContentType
     summary_status: SummaryStatus
     embedding_status: EmbeddingStatus
+    embedding_progress: Optional[dict[str, Any]] = None
     source_url: Optional[str] = None
     file_hash: Optional[str] = None
     title: str
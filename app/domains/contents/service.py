@@ -3,15 +3,23 @@
 콘텐츠 동기화 및 관리를 위한 비즈니스 로직 계층입니다.
 """
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ForbiddenException
+from app.core.hooks import notify_content_changed
 from app.core.logging import get_logger
 from app.core.middlewares.context import get_request_id
 from app.core.storage import S3Client, get_s3_client
+from app.core.utils.pagination import (
+    CursorPage,
+    TotalMode,
+    decode_cursor,
+    encode_cursor,
+)
 from app.domains.contents.exceptions import ContentNotFoundException
 from app.domains.contents.models import (
     Content,
@@ -94,6 +102,8 @@ class ContentService:
             content = await self.repository.create(content)
             action = "created"
 
+        notify_content_changed(self.session, data.user_id)
+
         logger.info(
             "Webpage synced",
             extra={
@@ -159,6 +169,8 @@ class ContentService:
             content = await self.repository.create(content)
             action = "created"
 
+        notify_content_changed(self.session, data.user_id)
+
         logger.info(
             "YouTube synced",
             extra={
@@ -245,6 +257,8 @@ class ContentService:
             content = await self.repository.create(content)
             action = "created"
 
+        notify_content_changed(self.session, data.user_id)
+
         logger.info(
             "PDF synced",
             extra={
@@ -301,7 +315,47 @@ class ContentService:
         Returns:
             (콘텐츠 목록, 전체 콘텐츠 수) 튜플
         """
+        result = await self.list_contents_page(
+            user_id=user_id, size=size, page=page, filters=filters
+        )
+        return result.items, result.total or 0
+
+    async def list_contents_page(
+        self,
+        user_id: int,
+        size: int = 20,
+        page: int = 1,
+        cursor: Optional[str] = None,
+        filters: Optional[ContentListRequest] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> CursorPage[Content]:
+        """콘텐츠 목록 조회 (커서 페이지네이션 지원)
+
+        cursor가 주어지면 page를 무시하고 (created_at, id) keyset 조건으로
+        커서 이후 레코드를 조회하므로 페이지가 깊어져도 비용이 일정합니다.
+
+        Args:
+            user_id: 사용자 ID
+            size: 페이지 크기
+            page: 페이지 번호 (cursor가 없을 때만 사용)
+            cursor: 이전 응답의 next_cursor
+            filters: 필터 옵션
+            total_mode: 전체 개수 계산 방식
+
+        Returns:
+            CursorPage (콘텐츠 목록, 전체 개수, 다음 페이지 커서)
+
+        Raises:
+            BadRequestException: 커서 형식이 잘못된 경우
+        """
         skip = (page - 1) * size
+        after = None
+        if cursor:
+            values = decode_cursor(
+                cursor, keys={"created_at": datetime, "id": int}
+            )
+            after = (values["created_at"], values["id"])
+            skip = 0
 
         # ContentListRequest를 ContentFilters로 변환
         content_filters = None
@@ -314,19 +368,33 @@ class ContentService:
                 date_to=filters.date_to,
             )
 
-        contents = await self.repository.get_list(
-            user_id=user_id,
-            skip=skip,
-            limit=size,
-            filters=content_filters,
+        # 한 건 더 조회하여 다음 페이지 존재 여부 판단
+        contents = list(
+            await self.repository.get_list(
+                user_id=user_id,
+                skip=skip,
+                limit=size + 1,
+                filters=content_filters,
+                after=after,
+            )
         )
+        has_more = len(contents) > size
+        contents = contents[:size]
+
+        next_cursor = None
+        if has_more:
+            last = contents[-1]
+            next_cursor = encode_cursor(
+                {"created_at": last.created_at, "id": last.id}
+            )
 
-        total = await self.repository.count(
+        total = await self.repository.count_total(
             user_id=user_id,
             filters=content_filters,
+            mode=total_mode,
         )
 
-        return list(contents), total
+        return CursorPage(items=contents, total=total, next_cursor=next_cursor)
 
     async def delete_contents(
         self, content_ids: list[int], user_id: int
@@ -353,6 +421,9 @@ class ContentService:
                 content_ids, user_id
             )
 
+            if deleted_count:
+                notify_content_changed(self.session, user_id)
+
             # 실패한 항목 계산
             failed_count = len(content_ids) - deleted_count
             # 배치 작업에서는 어떤 항목이 실패했는지 알 수 없음
@@ -4,7 +4,6 @@ Topics Agent 오케스트레이션 관련 API 엔드포인트입니다.
 """
 
 import asyncio
-import json
 from typing import AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -12,6 +11,7 @@ from fastapi.responses import StreamingResponse
 
 from app.core.dependencies import verify_internal_api_key
 from app.core.schemas import APIResponse, create_response
+from app.core.utils.sse import format_sse
 from app.domains.topics.agents import (
     ResearcherAgent,
     SummarizerAgent,
@@ -137,7 +137,7 @@ async def _create_streaming_response(
             event = await queue.get()
             if event is None:
                 break
-            yield _format_sse(event)
+            yield format_sse(event)
 
     return StreamingResponse(
         event_generator(),
@@ -173,8 +173,3 @@ def _map_usage_summary(usage: UsageSummary | None) -> TopicsUsage | None:
         total_wtu=usage.total_wtu,
         agents=usage.agents,
     )
-
-
-def _format_sse(event: StreamEvent) -> bytes:
-    payload = json.dumps(event.data, ensure_ascii=False)
-    return f"event: {event.event}\ndata: {payload}\n\n".encode("utf-8")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import Any
@@ -7,7 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router as api_v1_router
 from app.core.config import settings
-from app.core.database import close_db
+from app.core.database import async_session_maker, close_db
 from app.core.exceptions import (
     BaseAPIException,
     base_exception_handler,
@@ -19,6 +20,10 @@ from app.core.logging import get_logger, setup_logging
 from app.core.middlewares import LoggingMiddleware
 from app.core.migration import run_migrations_on_startup
 from app.core.schemas import APIResponse
+from app.domains.ai.personalization.backfill import create_backfill_worker
+from app.domains.ai.personalization.popularity import get_popularity_store
+from app.domains.ai.personalization.usage_buffer import get_usage_buffer
+from app.domains.ai.utils.parser_executor import reset_parser_executor
 
 # 로깅 설정 초기화
 setup_logging()
@@ -45,9 +50,40 @@ async def lifespan(app: FastAPI):
             "⚠️  LangFuse observability disabled (continuing without tracing)"
         )
 
+    # 전역 태그/카테고리 인기도 스냅샷 주기적 갱신
+    background_tasks = [
+        asyncio.create_task(
+            get_popularity_store().run_forever(async_session_maker)
+        )
+    ]
+
+    # 태그/카테고리 마스터 NULL 임베딩 주기적 backfill (활성화 시)
+    if settings.personalization_backfill_enabled:
+        background_tasks.append(
+            asyncio.create_task(
+                create_backfill_worker(async_session_maker).run_forever()
+            )
+        )
+
+    # 개인화 사용 통계 write-behind 버퍼 주기적 flush (활성화 시)
+    usage_buffer = get_usage_buffer()
+    if usage_buffer is not None:
+        background_tasks.append(
+            asyncio.create_task(usage_buffer.run_forever())
+        )
+
     yield
     # Shutdown
     logger.info(f"👋 Shutting down {settings.app_name}...")
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+
+    # 남은 사용 통계 증가분 반영 (DB 연결 종료 전)
+    if usage_buffer is not None:
+        await usage_buffer.flush()
+    # 파서 워커 프로세스 종료
+    reset_parser_executor()
     await close_db()
 
 
@@ -0,0 +1,95 @@
+"""add_search_vector_to_contents
+
+Revision ID: 2b46ec00d874
+Revises: dff2bd2982d3
+Create Date: 2026-10-16 10:03:27.184406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2b46ec00d874"
+down_revision: Union[str, None] = "dff2bd2982d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 가중치: A(title, tags) > B(category, summary) > C(memo) > D(type, url)
+# app/domains/contents/models.py의 트리거 DDL과 동일하게 유지
+SEARCH_VECTOR_EXPR = """
+    setweight(to_tsvector('simple', coalesce({row}title, '')), 'A')
+    || setweight(to_tsvector('simple',
+        coalesce(array_to_string({row}tags, ' '), '')), 'A')
+    || setweight(to_tsvector('simple', coalesce({row}category, '')), 'B')
+    || setweight(to_tsvector('simple', coalesce({row}summary, '')), 'B')
+    || setweight(to_tsvector('simple', coalesce({row}memo, '')), 'C')
+    || setweight(to_tsvector('simple', coalesce({row}content_type, '')), 'D')
+    || setweight(to_tsvector('simple', coalesce({row}source_url, '')), 'D')
+"""
+
+
+def upgrade() -> None:
+    """업그레이드 마이그레이션"""
+    op.add_column(
+        "contents",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            nullable=True,
+            comment="가중치 적용 전문 검색 벡터 (트리거 자동 갱신)",
+        ),
+    )
+
+    # array_to_string은 IMMUTABLE이 아니어서 generated column 대신 트리거 사용
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION contents_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_EXPR.format(row="NEW.")};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contents_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF
+            title, tags, category, summary, memo, content_type, source_url
+        ON contents
+        FOR EACH ROW EXECUTE FUNCTION contents_search_vector_update()
+        """
+    )
+
+    # 기존 행 백필
+    op.execute(
+        f"UPDATE contents SET search_vector = {SEARCH_VECTOR_EXPR.format(row='')}"
+    )
+
+    op.create_index(
+        "ix_contents_search_vector",
+        "contents",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """다운그레이드 마이그레이션"""
+    op.drop_index(
+        "ix_contents_search_vector",
+        table_name="contents",
+        postgresql_using="gin",
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS contents_search_vector_trigger ON contents"
+    )
+    op.execute("DROP FUNCTION IF EXISTS contents_search_vector_update()")
+    op.drop_column("contents", "search_vector")
@@ -0,0 +1,42 @@
+"""add_embedding_progress_to_contents
+
+Revision ID: 3a9d5e7b1c42
+Revises: b8e4f2a7c915
+Create Date: 2026-10-16 23:05:12.384511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3a9d5e7b1c42"
+down_revision: Union[str, None] = "b8e4f2a7c915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """업그레이드 마이그레이션"""
+    # embedding_status는 VARCHAR이므로 partial 값 추가에 스키마 변경 불필요
+    op.add_column(
+        "contents",
+        sa.Column(
+            "embedding_progress",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="임베딩 진행 상태 (청크 수, 실패 청크 인덱스, 오류)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """다운그레이드 마이그레이션"""
+    op.execute(
+        "UPDATE contents SET embedding_status = 'pending' "
+        "WHERE embedding_status = 'partial'"
+    )
+    op.drop_column("contents", "embedding_progress")
@@ -0,0 +1,41 @@
+"""add_contents_keyset_index
+
+Revision ID: 4d1bc2f279ed
+Revises: 2b46ec00d874
+Create Date: 2026-10-16 11:12:40.518273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d1bc2f279ed"
+down_revision: Union[str, None] = "2b46ec00d874"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """업그레이드 마이그레이션"""
+    # 콘텐츠 목록 keyset 페이지네이션용
+    # WHERE user_id = ? AND (created_at, id) < (?, ?)
+    # ORDER BY created_at DESC, id DESC
+    op.create_index(
+        "ix_contents_user_created_id",
+        "contents",
+        ["user_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """다운그레이드 마이그레이션"""
+    op.drop_index(
+        "ix_contents_user_created_id",
+        table_name="contents",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
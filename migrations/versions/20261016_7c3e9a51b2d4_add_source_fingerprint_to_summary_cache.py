@@ -0,0 +1,37 @@
+"""add_source_fingerprint_to_summary_cache
+
+Revision ID: 7c3e9a51b2d4
+Revises: f1a1d9ac3f82
+Create Date: 2026-10-16 18:42:05.913274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e9a51b2d4"
+down_revision: Union[str, None] = "f1a1d9ac3f82"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """업그레이드 마이그레이션"""
+    # 기존 캐시는 NULL (첫 요청에서 파싱 후 본문이 같으면 채워짐)
+    op.add_column(
+        "summary_cache",
+        sa.Column(
+            "source_fingerprint",
+            sa.String(length=64),
+            nullable=True,
+            comment="원본 지문 (원본 HTML 해시 / YouTube 영상 ID, 파싱 생략용)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """다운그레이드 마이그레이션"""
+    op.drop_column("summary_cache", "source_fingerprint")
@@ -0,0 +1,64 @@
+"""create_youtube_transcript_cache
+
+Revision ID: b8e4f2a7c915
+Revises: 7c3e9a51b2d4
+Create Date: 2026-10-16 21:17:44.508163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e4f2a7c915"
+down_revision: Union[str, None] = "7c3e9a51b2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """업그레이드 마이그레이션"""
+    op.create_table(
+        "youtube_transcript_cache",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "video_id",
+            sa.String(length=20),
+            nullable=False,
+            comment="YouTube 영상 ID",
+        ),
+        sa.Column(
+            "language",
+            sa.String(length=20),
+            nullable=False,
+            comment="자막 언어 코드 (ko, en 등)",
+        ),
+        sa.Column(
+            "transcript", sa.Text(), nullable=False, comment="자막 텍스트"
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="생성일시",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="만료일시",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        # video_id 단독 조회도 이 제약의 인덱스 사용
+        sa.UniqueConstraint(
+            "video_id", "language", name="uq_youtube_transcript_video_language"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """다운그레이드 마이그레이션"""
+    op.drop_table("youtube_transcript_cache")
@@ -0,0 +1,39 @@
+"""add_halfvec_hnsw_index_to_embeddings
+
+Revision ID: dff2bd2982d3
+Revises: 054266193b8b
+Create Date: 2026-10-16 09:12:41.503217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "dff2bd2982d3"
+down_revision: Union[str, None] = "054266193b8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """업그레이드 마이그레이션"""
+    # vector(3072)는 HNSW/IVFFlat 인덱스 한도(2000 차원)를 넘으므로
+    # halfvec(3072) 표현식 인덱스로 ANN 검색 지원 (pgvector >= 0.7.0)
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS
+            ix_content_embedding_metadatas_embedding_hnsw
+        ON content_embedding_metadatas
+        USING hnsw ((embedding_vector::halfvec(3072)) halfvec_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        """
+    )
+
+
+def downgrade() -> None:
+    """다운그레이드 마이그레이션"""
+    op.execute(
+        "DROP INDEX IF EXISTS ix_content_embedding_metadatas_embedding_hnsw"
+    )
@@ -0,0 +1,59 @@
+"""shrink_tag_category_embeddings
+
+Revision ID: f1a1d9ac3f82
+Revises: 4d1bc2f279ed
+Create Date: 2026-10-16 15:20:11.402931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a1d9ac3f82"
+down_revision: Union[str, None] = "4d1bc2f279ed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("tags", "categories")
+
+
+def upgrade() -> None:
+    """업그레이드 마이그레이션"""
+    # 태그/카테고리 임베딩 1536 → 256 차원
+    # 기존 벡터는 NULL로 비우고 백그라운드 backfill(EmbeddingBackfillWorker)이
+    # dimensions=256으로 다시 임베딩 (잘라낸 벡터는 모델/정규화 가정에 의존)
+    for table in TABLES:
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ALTER COLUMN embedding_vector TYPE vector(256)
+            USING NULL
+            """
+        )
+        op.execute(
+            f"COMMENT ON COLUMN {table}.embedding_vector "
+            f"IS '{_label(table)} 임베딩 벡터 (256 차원)'"
+        )
+
+
+def downgrade() -> None:
+    """다운그레이드 마이그레이션"""
+    # 축소된 차원은 복원할 수 없으므로 NULL로 되돌리고 backfill로 재생성
+    for table in TABLES:
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ALTER COLUMN embedding_vector TYPE vector(1536)
+            USING NULL
+            """
+        )
+        op.execute(
+            f"COMMENT ON COLUMN {table}.embedding_vector "
+            f"IS '{_label(table)} 임베딩 벡터 (1536 차원)'"
+        )
+
+
+def _label(table: str) -> str:
+    return "태그" if table == "tags" else "카테고리"
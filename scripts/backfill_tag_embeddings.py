@@ -0,0 +1,45 @@
+"""태그/카테고리 마스터 임베딩 backfill
+
+embedding_vector가 NULL인 Tag/Category 행을 배치로 임베딩해 저장합니다.
+앱의 백그라운드 작업과 동시에 실행해도 FOR UPDATE SKIP LOCKED로 같은 행을
+중복 처리하지 않습니다.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from app.core.database import async_session_maker, close_db
+from app.domains.ai.personalization.backfill import create_backfill_worker
+
+
+async def run(batch_size: Optional[int], max_batches: Optional[int]) -> int:
+    """backfill 실행 후 DB 연결 종료"""
+    worker = create_backfill_worker(async_session_maker, batch_size)
+    try:
+        return await worker.run_until_done(max_batches=max_batches)
+    finally:
+        await close_db()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=None, help="배치당 행 수")
+    parser.add_argument(
+        "--max-batches", type=int, default=None, help="최대 배치 수"
+    )
+    args = parser.parse_args()
+
+    try:
+        filled = asyncio.run(run(args.batch_size, args.max_batches))
+    except Exception as e:
+        print(f"❌ backfill 실패: {e}")
+        return 1
+
+    print(f"✅ {filled}개 행 임베딩 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""PDF 텍스트 추출 벤치마크
+
+같은 PDF를 세 가지 방식으로 추출해 지연 시간을 비교합니다.
+
+1. 순차 추출: parsers.extract_text_from_pdf (단일 스레드, 기준)
+2. 구간 병렬 (구간마다 bytes 전달): 구간 작업마다 PDF 전체를 pickle하고
+   워커에서 다시 파싱
+3. 구간 병렬 (임시 파일 + 워커 PdfReader 캐시): ParserExecutor.extract_pdf
+
+--file을 주지 않으면 텍스트 페이지로 이루어진 PDF를 생성해 사용합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from app.domains.ai.exceptions import PDFParseException
+from app.domains.ai.utils import parsers
+from app.domains.ai.utils.parser_executor import ParserExecutor
+
+
+def make_pdf(pages: int, lines: int) -> bytes:
+    """페이지당 lines줄의 텍스트를 가진 PDF 생성"""
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    for number in range(1, pages + 1):
+        page = writer.add_blank_page(width=595, height=842)
+        body = " ".join(
+            f"BT /F1 9 Tf 20 {820 - i * 11} Td "
+            f"(page {number} line {i} lorem ipsum dolor sit amet) Tj ET"
+            for i in range(lines)
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(body.encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+async def bench_async(
+    fn: Callable[[], Awaitable[object]], iterations: int
+) -> tuple[float, float]:
+    """비동기 함수 실행 시간 (중앙값, 최대 / 밀리초)"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+async def run_benchmark(
+    pdf: bytes, workers: int, range_size: int, iterations: int
+) -> None:
+    executor = ParserExecutor(
+        max_workers=workers,
+        process_min_bytes=0,
+        timeout_seconds=300.0,
+        memory_limit_bytes=0,
+        pdf_page_range_size=range_size,
+    )
+    total_pages = parsers.count_pdf_pages(pdf)
+
+    async def serial() -> None:
+        await asyncio.to_thread(parsers.extract_text_from_pdf, pdf)
+
+    async def ranges_with_bytes() -> None:
+        await asyncio.gather(
+            *(
+                executor._run_in_pool(
+                    parsers.extract_pdf_page_range,
+                    pdf,
+                    PDFParseException,
+                    start,
+                    min(start + range_size, total_pages),
+                )
+                for start in range(0, total_pages, range_size)
+            )
+        )
+
+    async def ranges_with_file() -> None:
+        await executor.extract_pdf(pdf)
+
+    print("\n" + "=" * 60)
+    print(
+        f"[PDF 추출] {total_pages}페이지, {len(pdf) / 1024:.0f} KB, "
+        f"워커 {workers}개, 구간 {range_size}페이지, {iterations}회"
+    )
+    print("=" * 60)
+
+    try:
+        # 워커 프로세스 기동 시간은 측정에서 제외
+        await ranges_with_file()
+
+        baseline = None
+        for name, fn in [
+            ("순차 (extract_text_from_pdf)", serial),
+            ("구간 병렬 - 구간마다 bytes", ranges_with_bytes),
+            ("구간 병렬 - 임시 파일 + 캐시", ranges_with_file),
+        ]:
+            median, worst = await bench_async(fn, iterations)
+            baseline = baseline or median
+            print(
+                f"  {name:<30} {median:>8.1f} ms / {worst:>8.1f} ms  "
+                f"(x{baseline / median:.2f})"
+            )
+    finally:
+        executor.shutdown()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", type=Path, default=None, help="PDF 파일")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=60, help="페이지당 줄 수")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--range-size", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    pdf = (
+        args.file.read_bytes()
+        if args.file
+        else make_pdf(args.pages, args.lines)
+    )
+    asyncio.run(
+        run_benchmark(pdf, args.workers, args.range_size, args.iterations)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
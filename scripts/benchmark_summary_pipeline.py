@@ -0,0 +1,116 @@
+"""요약 LLM 파이프라인 벤치마크 (pipeline vs combined)
+
+같은 본문으로 두 가지 방식을 비교합니다.
+
+1. pipeline: 요약 → 태그 ∥ 카테고리 (LLM 3회 호출)
+2. combined: 요약/태그/카테고리를 JSON 객체 하나로 요청 (1회 호출,
+   스키마 검증 실패 시 pipeline으로 재시도)
+
+실제 LLM을 호출하므로 API 키(OPENAI_API_KEY 등)가 필요합니다.
+DB는 사용하지 않습니다 (캐시/태그 저장 단계 제외).
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+from pathlib import Path
+
+from app.domains.ai.summarization.service import SummarizationService
+from app.domains.ai.summarization.types import SummaryPipelineResult
+
+SAMPLE_TEXT = """\
+벡터 데이터베이스는 임베딩 벡터를 저장하고 유사도 기반으로 검색하는
+시스템입니다. PostgreSQL의 pgvector 확장은 vector 타입과 HNSW, IVFFlat
+인덱스를 제공해 기존 관계형 데이터와 함께 근사 최근접 이웃(ANN) 검색을
+수행할 수 있게 합니다. HNSW 인덱스는 계층형 그래프를 탐색하며 ef_search
+값으로 정확도와 속도를 조절합니다. 임베딩 차원이 클수록 저장 공간과 인덱스
+크기가 늘어나므로 halfvec(16비트) 타입으로 절반 크기에 인덱싱하는 방법도
+널리 쓰입니다. 하이브리드 검색은 벡터 유사도와 키워드(BM25 등) 점수를
+결합해 고유명사나 코드 식별자처럼 임베딩이 약한 질의를 보완합니다.
+"""
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """정렬된 표본의 백분위수 (최근접 순위)"""
+    return samples[max(0, int(len(samples) * q) - 1)]
+
+
+async def bench_mode(
+    service: SummarizationService, text: str, combined: bool, iterations: int
+) -> None:
+    """한 모드를 iterations회 실행하고 지연 시간 / WTU 출력"""
+    latencies: list[float] = []
+    wtus: list[int] = []
+    fallbacks = 0
+    partials = 0
+
+    for _ in range(iterations):
+        result: SummaryPipelineResult = await service._run_llm_pipeline(
+            text, combined=combined
+        )
+        latencies.append(result.timings_ms["total"])
+        wtus.append(result.calculate_total_wtu())
+        fallbacks += result.discarded is not None
+        partials += result.is_partial
+
+    latencies.sort()
+    name = "combined (1회)" if combined else "pipeline (3회)"
+    print(
+        f"  {name:<18} {statistics.median(latencies):>8.0f} ms / "
+        f"{percentile(latencies, 0.95):>8.0f} ms  "
+        f"WTU {statistics.mean(wtus):>7.1f}  "
+        f"재시도 {fallbacks}  부분 {partials}"
+    )
+
+
+async def run(text: str, iterations: int, modes: list[bool]) -> None:
+    """모드별 벤치마크 실행"""
+    # 파이프라인 단계는 DB를 사용하지 않음
+    service = SummarizationService(session=None)  # type: ignore[arg-type]
+
+    print("\n" + "=" * 60)
+    print(
+        f"[요약 파이프라인] 본문 {len(text)}자, {iterations}회 " "(지연 중앙값 / p95, 평균 WTU)"
+    )
+    print("=" * 60)
+
+    for combined in modes:
+        await bench_mode(service, text, combined, iterations)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument(
+        "--file", type=Path, default=None, help="본문 텍스트 파일 (기본: 샘플)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["both", "pipeline", "combined"],
+        default="both",
+        help="측정할 모드",
+    )
+    args = parser.parse_args()
+
+    text = SAMPLE_TEXT
+    if args.file is not None:
+        text = args.file.read_text(encoding="utf-8")
+
+    modes = {
+        "both": [False, True],
+        "pipeline": [False],
+        "combined": [True],
+    }[args.mode]
+
+    try:
+        asyncio.run(run(text, args.iterations, modes))
+    except Exception as e:
+        print(f"\n❌ 벤치마크 실패: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""pgvector 코덱 마이크로벤치마크
+
+3072 차원 쿼리 벡터를 전달하는 두 가지 방식을 비교합니다.
+
+1. 텍스트 리터럴: `'[0.1,0.2,...]'::vector`를 SQL 문자열에 직접 삽입
+   (쿼리마다 SQL이 달라져 prepared statement 캐시 미사용)
+2. 바이너리 바인드 파라미터: asyncpg 바이너리 코덱 + `$1`
+
+--db 옵션을 주면 실제 DB(DATABASE_URL)에서 왕복 시간도 측정합니다.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable
+
+from pgvector.utils import to_db, to_db_binary
+
+from app.core.vector import halfvec_to_db_binary
+
+DIM = 3072
+
+
+def make_vector() -> list[float]:
+    """임의의 임베딩 벡터 생성 (text-embedding-3-large 스케일)"""
+    return [random.uniform(-0.05, 0.05) for _ in range(DIM)]
+
+
+def bench(fn: Callable[[], object], iterations: int) -> float:
+    """동기 함수 평균 실행 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def bench_async(
+    fn: Callable[[], Awaitable[object]], iterations: int
+) -> tuple[float, float]:
+    """비동기 함수 실행 시간 (중앙값, p95 / 밀리초)"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def run_encode_benchmark(iterations: int) -> None:
+    """인코딩 시간 및 전송 크기 비교"""
+    print("\n" + "=" * 60)
+    print(f"[인코딩] {DIM}차원 벡터, {iterations}회 평균")
+    print("=" * 60)
+
+    vector = make_vector()
+
+    cases = [
+        (
+            "텍스트 리터럴 (기존)",
+            lambda: f"[{','.join(map(str, vector))}]",
+        ),
+        ("pgvector 텍스트 (to_db)", lambda: to_db(vector, DIM)),
+        ("vector 바이너리", lambda: to_db_binary(vector)),
+        ("halfvec 바이너리", lambda: halfvec_to_db_binary(vector)),
+    ]
+
+    baseline_size = None
+    for name, fn in cases:
+        payload = fn()
+        size = len(payload)
+        baseline_size = baseline_size or size
+        elapsed = bench(fn, iterations)
+        print(
+            f"  {name:<24} {elapsed:>9.1f} µs  "
+            f"{size / 1024:>7.1f} KB  ({size / baseline_size:>5.1%})"
+        )
+
+
+async def run_db_benchmark(iterations: int) -> None:
+    """실제 DB 왕복 시간 비교 (asyncpg 직접 연결)"""
+    import asyncpg
+
+    from app.core.config import settings
+    from app.core.vector import register_vector_codecs
+
+    dsn = settings.database_url.replace("postgresql+asyncpg", "postgresql")
+
+    print("\n" + "=" * 60)
+    print(f"[DB 왕복] {iterations}회 (중앙값 / p95)")
+    print("=" * 60)
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        await register_vector_codecs(conn)
+
+        async def text_literal():
+            literal = f"[{','.join(map(str, make_vector()))}]"
+            await conn.fetchval(
+                f"SELECT '{literal}'::vector <=> '{literal}'::vector"
+            )
+
+        async def binary_vector():
+            vector = make_vector()
+            await conn.fetchval(
+                "SELECT $1::vector <=> $2::vector", vector, vector
+            )
+
+        async def binary_halfvec():
+            vector = make_vector()
+            await conn.fetchval(
+                "SELECT $1::halfvec <=> $2::halfvec", vector, vector
+            )
+
+        for name, fn in [
+            ("텍스트 리터럴 (기존)", text_literal),
+            ("vector 바이너리", binary_vector),
+            ("halfvec 바이너리", binary_halfvec),
+        ]:
+            median, p95 = await bench_async(fn, iterations)
+            print(f"  {name:<24} {median:>7.2f} ms / {p95:>7.2f} ms")
+    finally:
+        await conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--db", action="store_true", help="DATABASE_URL로 왕복 시간 측정"
+    )
+    args = parser.parse_args()
+
+    run_encode_benchmark(args.iterations)
+
+    if args.db:
+        try:
+            asyncio.run(run_db_benchmark(args.iterations))
+        except Exception as e:
+            print(f"\n❌ DB 벤치마크 실패: {e}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,9 +20,19 @@ from testcontainers.minio import MinioContainer
 from testcontainers.postgres import PostgresContainer
 
 from app.core.config import Settings, settings
-from app.core.database import Base, get_db
+from app.core.database import Base, enable_vector_codecs, get_db
+from app.core.llm.embedding_cache import reset_embedding_cache
 from app.core.llm.types import LLMResult
 from app.core.utils.datetime import now_utc
+from app.domains.ai.models import TAG_EMBEDDING_DIM
+from app.domains.ai.personalization.popularity import reset_popularity_store
+from app.domains.ai.personalization.profile_cache import (
+    reset_user_profile_cache,
+)
+from app.domains.ai.personalization.tag_index import reset_tag_index
+from app.domains.ai.personalization.usage_buffer import reset_usage_buffer
+from app.domains.ai.search.snapshot import reset_search_snapshot_cache
+from app.domains.ai.utils.parser_executor import reset_parser_executor
 from app.main import app
 
 
@@ -108,6 +118,9 @@ async def setup_test_database(test_database_url: str):
 async def db_session(test_database_url: str, setup_test_database):
     """테스트 데이터베이스 세션"""
     engine = create_async_engine(test_database_url, echo=False)
+    # 앱 엔진과 동일하게 pgvector 바이너리 코덱 사용
+    # (setup_test_database에서 vector 확장이 이미 설치된 상태)
+    enable_vector_codecs(engine)
 
     # 각 테스트마다 깨끗한 스키마 유지
     async with engine.begin() as conn:
@@ -306,12 +319,15 @@ def mock_llm_completion():
 def mock_embedding():
     """임베딩 생성 Mock - 자동 적용"""
 
-    # 텍스트 임베딩(3072)와 태그/카테고리 임베딩(1536)을 구분
+    # 텍스트 임베딩(3072)와 태그/카테고리 임베딩(TAG_EMBEDDING_DIM)을 구분
     async def mock_embedding_3072(_text):
         return [0.1] * 3072
 
-    async def mock_embedding_1536(_text):
-        return [0.1] * 1536
+    async def mock_embeddings_3072(texts):
+        return [[0.1] * 3072 for _ in texts]
+
+    async def mock_tag_embeddings(texts, dimensions=None):
+        return [[0.1] * (dimensions or TAG_EMBEDDING_DIM) for _ in texts]
 
     # create_embedding이 사용되는 모든 경로를 Mock
     with patch(
@@ -323,26 +339,66 @@ def mock_embedding():
     ), patch(
         "app.domains.ai.embedding.service.create_embedding",
         side_effect=mock_embedding_3072,
+    ), patch(
+        "app.domains.ai.embedding.service.create_embeddings",
+        side_effect=mock_embeddings_3072,
     ), patch(
         "app.domains.ai.search.service.create_embedding",
         side_effect=mock_embedding_3072,
     ), patch(
-        "app.domains.ai.personalization.service.create_embedding",
-        side_effect=mock_embedding_1536,
-    ), patch(
-        "app.domains.ai.personalization.repository.create_embedding",
-        side_effect=mock_embedding_1536,
+        "app.domains.ai.personalization.service.create_embeddings",
+        side_effect=mock_tag_embeddings,
     ):
         yield mock_llm
 
 
+@pytest.fixture(autouse=True)
+def reset_search_snapshots():
+    """테스트 간 하이브리드 검색 랭킹 스냅샷 공유 방지 - 자동 적용"""
+    reset_search_snapshot_cache()
+    yield
+    reset_search_snapshot_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_embedding_cache_fixture():
+    """테스트 간 임베딩 캐시 공유 방지 - 자동 적용"""
+    reset_embedding_cache()
+    yield
+    reset_embedding_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_user_profile_cache_fixture():
+    """테스트 간 개인화 프로필/인기도/태그 인덱스, 사용 통계 버퍼 공유 방지 - 자동 적용"""
+    reset_user_profile_cache()
+    reset_popularity_store()
+    reset_tag_index()
+    reset_usage_buffer()
+    yield
+    reset_user_profile_cache()
+    reset_popularity_store()
+    reset_tag_index()
+    reset_usage_buffer()
+
+
+@pytest.fixture(autouse=True)
+def reset_parser_executor_fixture():
+    """테스트 간 파서 실행기(프로세스 풀) 공유 방지 - 자동 적용"""
+    reset_parser_executor()
+    yield
+    reset_parser_executor()
+
+
 @pytest.fixture
 def mock_youtube_transcript():
     """YouTube 자막 Mock"""
     with patch(
-        "youtube_transcript_api.YouTubeTranscriptApi.get_transcript"
+        "youtube_transcript_api.YouTubeTranscriptApi.list_transcripts"
     ) as mock:
-        mock.return_value = [
+        transcript = mock.return_value.find_transcript.return_value
+        transcript.language_code = "ko"
+        transcript.fetch.return_value = [
             {"text": "Mock transcript line 1", "start": 0.0, "duration": 2.0},
             {"text": "Mock transcript line 2", "start": 2.0, "duration": 2.0},
             {"text": "Mock transcript line 3", "start": 4.0, "duration": 2.0},
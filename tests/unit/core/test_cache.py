@@ -0,0 +1,73 @@
+"""인메모리 TTL/LRU 캐시 테스트"""
+
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_expiration():
+    """TTL 경과 시 미스 및 만료 통계"""
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(
+        max_entries=10, ttl_seconds=5, clock=clock
+    )
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    clock.now = 6
+    assert cache.get("a") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_entries():
+    """항목 수 초과 시 가장 오래 사용하지 않은 항목 축출"""
+    cache: TTLCache[str, int] = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_eviction_by_weight():
+    """가중치 합 상한 초과 시 축출, 상한보다 큰 항목은 저장 안 함"""
+    cache: TTLCache[str, bytes] = TTLCache(
+        max_entries=100, max_weight=10, weigher=len
+    )
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"1")
+
+    assert cache.get("a") is None
+    assert cache.weight == 6
+
+    cache.set("big", b"x" * 11)
+    assert cache.get("big") is None
+
+
+def test_delete_where_and_stats_dict():
+    """조건부 삭제 및 통계 딕셔너리"""
+    cache: TTLCache[tuple[int, str], int] = TTLCache(max_entries=10)
+    cache.set((1, "a"), 1)
+    cache.set((1, "b"), 2)
+    cache.set((2, "a"), 3)
+
+    assert cache.delete_where(lambda key: key[0] == 1) == 2
+    assert len(cache) == 1
+    assert cache.get((2, "a")) == 3
+    assert cache.stats.to_dict()["hit_ratio"] == 1.0
@@ -0,0 +1,168 @@
+"""임베딩 배치 패킹 및 일괄 생성 단위 테스트"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.core.llm.batching import pack_by_token_budget
+from app.core.llm.fallback import create_embeddings
+from app.core.llm.types import LLMProviderError
+
+
+@pytest.fixture(autouse=True)
+def fixed_token_counts():
+    """토큰 계산 고정 (tiktoken 인코딩 다운로드 없이 테스트)"""
+    with patch(
+        "app.core.llm.fallback.count_tokens",
+        side_effect=lambda texts: [1] * len(texts),
+    ):
+        yield
+
+
+class TestPackByTokenBudget:
+    """pack_by_token_budget 테스트"""
+
+    def test_packs_until_token_budget(self):
+        """토큰 예산을 넘기 전까지 한 배치로 묶음"""
+        batches = pack_by_token_budget(
+            [300, 300, 300], max_tokens=600, max_items=10
+        )
+
+        assert batches == [[0, 1], [2]]
+
+    def test_respects_item_limit(self):
+        """배치당 입력 개수 한도 적용"""
+        batches = pack_by_token_budget([1] * 5, max_tokens=100, max_items=2)
+
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_oversized_item_gets_own_batch(self):
+        """예산을 초과하는 단일 입력은 단독 배치"""
+        batches = pack_by_token_budget(
+            [10, 1000, 10], max_tokens=100, max_items=10
+        )
+
+        assert batches == [[0], [1], [2]]
+
+    def test_empty_input(self):
+        """빈 입력은 빈 배치 리스트"""
+        assert pack_by_token_budget([], max_tokens=100, max_items=10) == []
+
+
+@pytest.mark.asyncio
+async def test_create_embeddings_preserves_input_order():
+    """배치가 역순으로 완료되어도 입력 순서대로 반환"""
+    texts = [f"chunk {i}" for i in range(7)]
+
+    async def fake_batch(model: str, inputs: list[str]):
+        # 앞 배치일수록 늦게 끝나도록 지연
+        await asyncio.sleep(0.01 * (10 - len(inputs)))
+        return [[float(text.split()[1])] for text in inputs]
+
+    with patch(
+        "app.core.llm.fallback.aembedding_batch_raw", side_effect=fake_batch
+    ) as mock_batch, patch(
+        "app.core.llm.fallback.settings.embedding_batch_max_items", 3
+    ):
+        vectors = await create_embeddings(texts)
+
+    assert vectors == [[float(i)] for i in range(7)]
+    # 7개 입력 / 배치당 3개 = 3회 요청
+    assert mock_batch.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_create_embeddings_bounded_concurrency():
+    """동시 배치 요청 수가 설정값을 넘지 않음"""
+    in_flight = 0
+    peak = 0
+
+    async def fake_batch(model: str, inputs: list[str]):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[0.0] for _ in inputs]
+
+    with patch(
+        "app.core.llm.fallback.aembedding_batch_raw", side_effect=fake_batch
+    ), patch(
+        "app.core.llm.fallback.settings.embedding_batch_max_items", 1
+    ), patch(
+        "app.core.llm.fallback.settings.embedding_batch_concurrency", 2
+    ):
+        vectors = await create_embeddings(["a", "b", "c", "d", "e"])
+
+    assert len(vectors) == 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_create_embeddings_propagates_provider_error():
+    """배치 요청 실패 시 LLMProviderError 전파"""
+
+    async def failing_batch(model: str, inputs: list[str]):
+        raise LLMProviderError(provider=model, original_error="rate limit")
+
+    with patch(
+        "app.core.llm.fallback.aembedding_batch_raw",
+        side_effect=failing_batch,
+    ):
+        with pytest.raises(LLMProviderError):
+            await create_embeddings(["a", "b"])
+
+
+@pytest.mark.asyncio
+async def test_create_embeddings_rejects_short_batch_response():
+    """배치 응답의 벡터 수가 입력 수보다 적으면 LLMProviderError"""
+
+    async def short_batch(model: str, inputs: list[str]):
+        return [[0.0] for _ in inputs[1:]]
+
+    with patch(
+        "app.core.llm.fallback.aembedding_batch_raw", side_effect=short_batch
+    ):
+        with pytest.raises(LLMProviderError):
+            await create_embeddings(["a", "b", "c"])
+
+
+@pytest.mark.asyncio
+async def test_create_embeddings_empty_input():
+    """빈 입력은 프로바이더를 호출하지 않음"""
+    with patch("app.core.llm.fallback.aembedding_batch_raw") as mock_batch:
+        assert await create_embeddings([]) == []
+
+    mock_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_embeddings_requests_dimensions():
+    """dimensions 지정 시 배치 요청과 litellm 호출에 전달"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.core.llm.provider import aembedding_batch_raw
+
+    async def fake_batch(model: str, inputs: list[str], dimensions=None):
+        return [[0.0] * dimensions for _ in inputs]
+
+    with patch(
+        "app.core.llm.fallback.aembedding_batch_raw", side_effect=fake_batch
+    ) as mock_batch:
+        vectors = await create_embeddings(["a", "b"], dimensions=1536)
+
+    assert [len(v) for v in vectors] == [1536, 1536]
+    assert mock_batch.call_args.kwargs["dimensions"] == 1536
+
+    response = MagicMock(data=[{"index": 0, "embedding": [0.0] * 1536}])
+    with patch(
+        "app.core.llm.provider.aembedding", AsyncMock(return_value=response)
+    ) as mock_litellm:
+        await aembedding_batch_raw("text-embedding-3-large", ["a"], 1536)
+        await aembedding_batch_raw("text-embedding-3-large", ["a"])
+
+    first, second = mock_litellm.await_args_list
+    assert first.kwargs["dimensions"] == 1536
+    # 미지정 시 모델 기본 차원 (파라미터 자체를 보내지 않음)
+    assert "dimensions" not in second.kwargs
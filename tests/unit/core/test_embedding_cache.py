@@ -0,0 +1,191 @@
+"""임베딩 캐시 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.core.llm.embedding_cache import EmbeddingCache
+from app.core.llm.types import LLMProviderError
+
+
+def make_cache(**kwargs) -> EmbeddingCache:
+    options = {"max_entries": 10, "ttl_seconds": 60, "max_bytes": 1 << 20}
+    options.update(kwargs)
+    return EmbeddingCache(**options)
+
+
+class CountingLoader:
+    """호출 횟수를 세는 임베딩 loader"""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self, text: str) -> list[float]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [float(len(text)), 0.5, 0.25]
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_with_normalized_text():
+    """공백만 다른 텍스트는 같은 캐시 항목 사용"""
+    cache = make_cache()
+    loader = CountingLoader()
+
+    first = await cache.get_or_create("hello  world", loader)
+    second = await cache.get_or_create(" hello world ", loader)
+
+    assert first == second == [12.0, 0.5, 0.25]
+    assert loader.calls == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_model_is_part_of_key():
+    """모델이 다르면 별도 항목"""
+    cache = make_cache()
+    loader = CountingLoader()
+
+    await cache.get_or_create("tag", loader, model="model-a")
+    await cache.get_or_create("tag", loader, model="model-b")
+
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    """동시 동일 요청은 프로바이더 호출 1회 공유"""
+    cache = make_cache()
+    loader = CountingLoader(delay=0.01)
+
+    results = await asyncio.gather(
+        *(cache.get_or_create("popular", loader) for _ in range(5))
+    )
+
+    assert loader.calls == 1
+    assert all(r == results[0] for r in results)
+    assert cache.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_error_without_caching():
+    """실패는 대기 중인 요청에도 전달되고 캐시되지 않음"""
+    cache = make_cache()
+    loader = CountingLoader(delay=0.01, error=RuntimeError("provider down"))
+
+    results = await asyncio.gather(
+        *(cache.get_or_create("q", loader) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert loader.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_vectors_stored_as_float32():
+    """float32로 저장하고 미스/적중 모두 같은 반올림 값을 반환"""
+    cache = make_cache()
+
+    async def loader(text: str) -> list[float]:
+        return [0.1, 0.2, 0.3]
+
+    first = await cache.get_or_create("q", loader)
+    second = await cache.get_or_create("q", loader)
+
+    assert first == second
+    assert first == pytest.approx([0.1, 0.2, 0.3], abs=1e-7)
+    assert cache.stats()["bytes"] == 3 * 4
+
+
+@pytest.mark.asyncio
+async def test_memory_bound_evicts():
+    """벡터 총 바이트 상한 초과 시 LRU 축출"""
+    # float32 3개 = 12바이트, 두 개까지만 저장
+    cache = make_cache(max_bytes=24)
+    loader = CountingLoader()
+
+    for text in ("a", "bb", "ccc"):
+        await cache.get_or_create(text, loader)
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["bytes"] == 24
+    assert stats["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_many_batches_misses_only():
+    """일괄 조회 시 캐시 미스만 한 번의 배치 호출로 생성"""
+    cache = make_cache()
+    single = CountingLoader()
+    batches: list[list[str]] = []
+
+    async def batch_loader(texts: list[str]) -> list[list[float]]:
+        batches.append(texts)
+        return [[float(len(t)), 0.5, 0.25] for t in texts]
+
+    await cache.get_or_create("cached", single)
+
+    vectors = await cache.get_or_create_many(
+        ["new", "cached", "other", "new"], batch_loader
+    )
+
+    assert batches == [["new", "other"]]
+    assert vectors == [
+        [3.0, 0.5, 0.25],
+        [6.0, 0.5, 0.25],
+        [5.0, 0.5, 0.25],
+        [3.0, 0.5, 0.25],
+    ]
+    assert await cache.get_or_create("other", single) == [5.0, 0.5, 0.25]
+    assert single.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_many_joins_inflight_request():
+    """다른 요청에서 생성 중인 키는 그 결과를 공유"""
+    cache = make_cache()
+    single = CountingLoader(delay=0.01)
+    batches: list[list[str]] = []
+
+    async def batch_loader(texts: list[str]) -> list[list[float]]:
+        batches.append(texts)
+        return [[float(len(t)), 0.5, 0.25] for t in texts]
+
+    pending = asyncio.create_task(cache.get_or_create("shared", single))
+    await asyncio.sleep(0)
+    vectors = await cache.get_or_create_many(["shared", "b"], batch_loader)
+
+    assert vectors[0] == await pending
+    assert batches == [["b"]]
+    assert cache.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_many_fails_waiters_on_short_result():
+    """loader 결과 수가 부족하면 대기 중인 요청까지 실패 (무한 대기 방지)"""
+    cache = make_cache()
+
+    async def short_loader(texts: list[str]) -> list[list[float]]:
+        await asyncio.sleep(0.01)
+        return [[0.5, 0.25] for _ in texts[1:]]
+
+    first = asyncio.create_task(
+        cache.get_or_create_many(["a", "b"], short_loader)
+    )
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.get_or_create_many(["b"], short_loader))
+
+    results = await asyncio.wait_for(
+        asyncio.gather(first, second, return_exceptions=True), timeout=1
+    )
+
+    assert all(isinstance(r, LLMProviderError) for r in results)
+    assert cache.stats()["size"] == 0
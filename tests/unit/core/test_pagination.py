@@ -0,0 +1,93 @@
+"""커서 페이지네이션 유틸리티 테스트"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.exceptions import BadRequestException, ErrorCode
+from app.core.utils.pagination import (
+    TotalMode,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+    resolve_total,
+)
+
+
+class TestCursor:
+    """커서 인코딩/디코딩 테스트"""
+
+    def test_roundtrip_with_datetime(self):
+        """datetime을 포함한 정렬 키 왕복"""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+        cursor = encode_cursor({"created_at": created_at, "id": 10})
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, keys=("created_at", "id")) == {
+            "created_at": created_at,
+            "id": 10,
+        }
+
+    def test_float_score_roundtrip_is_exact(self):
+        """점수(float)는 keyset 비교를 위해 정확히 복원"""
+        score = 1 - 0.123456789012345
+        assert decode_cursor(encode_cursor({"score": score}))["score"] == score
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor!", "W10", "e30"])
+    def test_invalid_cursor(self, cursor):
+        """형식 오류, dict 아님, 키 누락은 400"""
+        with pytest.raises(BadRequestException):
+            decode_cursor(cursor, keys=("id",))
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {"created_at": "2026-01-02", "id": 10},
+            {"created_at": datetime(2026, 1, 2, tzinfo=timezone.utc)},
+            {"created_at": datetime(2026, 1, 2), "id": "10"},
+            {"created_at": datetime(2026, 1, 2), "id": True},
+            {"created_at": 1767312000, "id": 10},
+        ],
+    )
+    def test_invalid_cursor_value_types(self, values):
+        """키별 타입이 맞지 않는 커서는 400 (INVALID_CURSOR)"""
+        cursor = encode_cursor(values)
+
+        with pytest.raises(BadRequestException) as exc_info:
+            decode_cursor(cursor, keys={"created_at": datetime, "id": int})
+
+        assert exc_info.value.error_code == ErrorCode.INVALID_CURSOR
+
+    def test_next_cursor_only_for_full_page(self):
+        """페이지가 가득 찬 경우에만 다음 커서 생성"""
+        items = [{"id": 1}, {"id": 2}]
+
+        assert next_cursor(items, 3, lambda item: item) is None
+        cursor = next_cursor(items, 2, lambda item: item)
+        assert decode_cursor(cursor) == {"id": 2}
+
+
+class TestResolveTotal:
+    """전체 개수 표시 방식 테스트"""
+
+    def test_capped_over_limit(self):
+        """상한 초과 시 (cap, capped) → "1000+" """
+        assert resolve_total(1001, TotalMode.CAPPED, cap=1000) == (
+            1000,
+            TotalMode.CAPPED,
+        )
+
+    def test_capped_within_limit_is_exact(self):
+        """상한 이하이면 정확한 개수"""
+        assert resolve_total(42, TotalMode.CAPPED, cap=1000) == (
+            42,
+            TotalMode.EXACT,
+        )
+
+    def test_none_and_estimated(self):
+        """none은 개수 없음, estimated는 그대로"""
+        assert resolve_total(None, TotalMode.NONE) == (None, TotalMode.NONE)
+        assert resolve_total(500, TotalMode.ESTIMATED) == (
+            500,
+            TotalMode.ESTIMATED,
+        )
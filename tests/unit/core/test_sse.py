@@ -0,0 +1,21 @@
+"""SSE 유틸리티 테스트"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.utils.sse import format_sse
+
+
+@dataclass
+class _Event:
+    event: str
+    data: Any
+
+
+def test_format_sse_keeps_unicode():
+    """이벤트 이름과 JSON 데이터를 SSE 메시지로 인코딩 (한글 이스케이프 없음)"""
+    message = format_sse(_Event(event="summary", data={"summary": "요약"}))
+
+    assert message == (
+        'event: summary\ndata: {"summary": "요약"}\n\n'.encode("utf-8")
+    )
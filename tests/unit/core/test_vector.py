@@ -0,0 +1,69 @@
+"""halfvec 타입 및 ANN 인덱스 단위 테스트"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.schema import CreateIndex
+
+from app.core.vector import (
+    HalfVector,
+    Vector,
+    halfvec_from_db_binary,
+    halfvec_to_db_binary,
+)
+from app.domains.ai.models import ContentEmbeddingMetadata
+
+
+class TestHalfVector:
+    """HalfVector 타입 테스트"""
+
+    def test_col_spec(self):
+        """차원 지정 여부에 따른 타입 선언"""
+        assert HalfVector(3072).get_col_spec() == "HALFVEC(3072)"
+        assert HalfVector().get_col_spec() == "HALFVEC"
+
+    def test_bind_processor_formats_vector_literal(self):
+        """리스트를 pgvector 텍스트 포맷으로 변환"""
+        process = HalfVector(3).bind_processor(postgresql.dialect())
+        assert process([1.0, 2.0, 3.0]) == "[1.0,2.0,3.0]"
+
+    def test_result_processor_parses_vector(self):
+        """pgvector 텍스트 포맷을 배열로 변환"""
+        process = HalfVector(3).result_processor(postgresql.dialect(), None)
+        assert list(process("[1,2,3]")) == [1.0, 2.0, 3.0]
+
+
+def test_embedding_hnsw_index_ddl():
+    """청크 임베딩 HNSW 표현식 인덱스 DDL"""
+    index = next(
+        i
+        for i in ContentEmbeddingMetadata.__table__.indexes
+        if i.name == "ix_content_embedding_metadatas_embedding_hnsw"
+    )
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert "USING hnsw" in ddl
+    assert "CAST(embedding_vector AS HALFVEC(3072)) halfvec_cosine_ops" in ddl
+
+
+class TestBinaryCodec:
+    """asyncpg 바이너리 코덱 테스트"""
+
+    def test_halfvec_binary_roundtrip(self):
+        """halfvec 인코딩/디코딩 왕복"""
+        data = halfvec_to_db_binary([0.5, -1.0, 2.0])
+
+        # dim(2) + unused(2) + float16 * 3
+        assert len(data) == 4 + 2 * 3
+        assert list(halfvec_from_db_binary(data)) == [0.5, -1.0, 2.0]
+
+    def test_asyncpg_bind_passes_value_through(self):
+        """asyncpg에서는 텍스트 변환 없이 값 그대로 전달"""
+        value = [0.1, 0.2, 0.3]
+        assert Vector(3).bind_processor(asyncpg_dialect())(value) is value
+        assert HalfVector(3).bind_processor(asyncpg_dialect())(value) is value
+
+    def test_asyncpg_bind_checks_dimensions(self):
+        """바이너리 경로에서도 차원 검증"""
+        with pytest.raises(ValueError):
+            Vector(3).bind_processor(asyncpg_dialect())([0.1, 0.2])
@@ -0,0 +1,48 @@
+"""AI 도메인 단위 테스트 공용 픽스처"""
+
+from typing import Any, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domains.ai.summarization.service import SummarizationService
+
+
+def _async_stubs(target: MagicMock, stubs: Optional[dict[str, Any]]) -> None:
+    """비동기 메서드를 반환값이 고정된 AsyncMock으로 교체"""
+    for name, return_value in (stubs or {}).items():
+        setattr(target, name, AsyncMock(return_value=return_value))
+
+
+@pytest.fixture
+def summarization_service_factory():
+    """
+    DB 세션 / 임베딩 / 개인화 서비스를 Mock으로 둔 SummarizationService 팩토리.
+    repository, personalization에는 {메서드 이름: 반환값}으로 비동기 스텁 지정
+    """
+
+    def _factory(
+        *,
+        repository: Optional[dict[str, Any]] = None,
+        personalization: Optional[dict[str, Any]] = None,
+        embedding_service: Optional[MagicMock] = None,
+        parser_executor: Optional[MagicMock] = None,
+    ) -> SummarizationService:
+        session = MagicMock()
+        session.flush = AsyncMock()
+        if embedding_service is None:
+            embedding_service = MagicMock()
+            embedding_service.get_chunk_strategy = AsyncMock(return_value=None)
+        personalization_service = MagicMock()
+        _async_stubs(personalization_service, personalization)
+
+        service = SummarizationService(
+            session,
+            embedding_service=embedding_service,
+            personalization_service=personalization_service,
+            parser_executor=parser_executor,
+        )
+        _async_stubs(service.repository, repository)
+        return service
+
+    return _factory
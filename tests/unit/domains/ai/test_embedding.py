@@ -128,12 +128,12 @@ async def test_create_embeddings_for_content(db_session):
     db_session.add(strategy)
     await db_session.flush()
 
-    # 임베딩 Mock
+    # 임베딩 Mock (청크 배치 단위 호출)
     with patch(
-        "app.domains.ai.embedding.service.create_embedding",
+        "app.domains.ai.embedding.service.create_embeddings",
         new_callable=AsyncMock,
     ) as mock_embed:
-        mock_embed.return_value = [0.1] * 3072
+        mock_embed.side_effect = lambda texts: [[0.1] * 3072 for _ in texts]
 
         # 임베딩 생성
         text = "Short test text for embedding generation."
@@ -149,6 +149,8 @@ async def test_create_embeddings_for_content(db_session):
         assert embeddings[0].strategy_id == strategy.id
         assert embeddings[0].chunk_index == 0
         assert len(embeddings[0].embedding_vector) == 3072
+        assert content.embedding_status == "completed"
+        assert content.embedding_progress["embedded_chunks"] == 1
 
 
 @pytest.mark.asyncio
@@ -189,12 +191,12 @@ async def test_create_embeddings_removes_existing(db_session):
     db_session.add(existing_embedding)
     await db_session.flush()
 
-    # 임베딩 Mock
+    # 임베딩 Mock (청크 배치 단위 호출)
     with patch(
-        "app.domains.ai.embedding.service.create_embedding",
+        "app.domains.ai.embedding.service.create_embeddings",
         new_callable=AsyncMock,
     ) as mock_embed:
-        mock_embed.return_value = [0.1] * 3072
+        mock_embed.side_effect = lambda texts: [[0.1] * 3072 for _ in texts]
 
         # 새 임베딩 생성
         new_embeddings = await service.create_embeddings_for_content(
@@ -213,3 +215,136 @@ async def test_create_embeddings_removes_existing(db_session):
         # 새 임베딩만 존재
         assert len(all_embeddings) == len(new_embeddings)
         assert all_embeddings[0].chunk_content != "Old chunk"
+
+
+@pytest.mark.asyncio
+@pytest.mark.mock_ai
+async def test_create_embeddings_partial_failure(db_session):
+    """일부 청크 배치 실패 시 성공한 청크만 저장 테스트"""
+    from unittest.mock import patch
+
+    from app.core.config import settings
+    from app.core.utils.datetime import now_utc
+    from app.domains.contents.models import Content
+
+    service = EmbeddingService(db_session)
+
+    content = Content(
+        id=3,
+        user_id=1,
+        content_type="webpage",
+        source_url="https://example.com",
+        title="Test Content",
+        summary="Test Summary",
+        created_at=now_utc(),
+    )
+    db_session.add(content)
+    await db_session.flush()
+
+    strategy = ChunkStrategy(
+        id=2,
+        name="small_strategy",
+        content_type="webpage",
+        chunk_size=20,
+        chunk_overlap=0,
+        split_method="token",
+        is_active=True,
+    )
+    db_session.add(strategy)
+    await db_session.flush()
+
+    # 첫 번째 청크가 포함된 배치만 실패
+    async def flaky_embeddings(texts):
+        if texts[0].startswith("word0 "):
+            raise RuntimeError("provider error")
+        return [[0.1] * 3072 for _ in texts]
+
+    progress_updates = []
+
+    async def on_progress(progress):
+        progress_updates.append(progress.status)
+
+    long_text = " ".join([f"word{i}" for i in range(100)])
+
+    with patch.object(settings, "embedding_pipeline_batch_size", 1), patch(
+        "app.domains.ai.embedding.service.create_embeddings",
+        side_effect=flaky_embeddings,
+    ):
+        embeddings = await service.create_embeddings_for_content(
+            content_id=content.id,
+            text=long_text,
+            strategy_id=strategy.id,
+            on_progress=on_progress,
+        )
+
+    # 부분 실패는 콘텐츠 행에 기록되어 재시도 대상으로 남음
+    assert content.embedding_status == "partial"
+    progress = content.embedding_progress
+    assert progress["failed_indices"] == [0]
+    assert progress["failed_chunks"] == 1
+    assert len(embeddings) == progress["total_chunks"] - 1
+    assert [e.chunk_index for e in embeddings] == list(
+        range(1, progress["total_chunks"])
+    )
+    assert progress_updates[-1] == "partial"
+
+
+@pytest.mark.asyncio
+async def test_save_progress_commits_processing_and_failed_separately():
+    """processing / failed는 별도 트랜잭션으로 커밋, 완료 상태는 요청 세션"""
+    from contextlib import asynccontextmanager
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.domains.ai.embedding.types import EmbeddingProgress
+    from app.domains.contents.models import Content
+
+    progress_session = MagicMock()
+    progress_session.commit = AsyncMock()
+    updated = MagicMock()
+    updated.scalar_one_or_none.return_value = 1
+    progress_session.execute = AsyncMock(return_value=updated)
+
+    @asynccontextmanager
+    async def progress_session_factory():
+        yield progress_session
+
+    content = Content(id=1, user_id=1)
+    session = MagicMock()
+    session.get = AsyncMock(return_value=content)
+    session.flush = AsyncMock()
+    # 인코딩 다운로드 없이 생성 (청크 분할은 사용하지 않음)
+    with patch("app.domains.ai.embedding.service.tiktoken.get_encoding"):
+        service = EmbeddingService(
+            session, progress_session_factory=progress_session_factory
+        )
+
+    # processing: 별도 트랜잭션에서 바로 커밋 (SKIP LOCKED)
+    await service._save_progress(EmbeddingProgress(content_id=1))
+    statement = progress_session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    progress_session.commit.assert_awaited_once()
+    session.get.assert_not_awaited()
+
+    # failed: 호출자가 롤백해도 남도록 별도 트랜잭션
+    failed = EmbeddingProgress(
+        content_id=1, total_chunks=1, failed_chunks=1, chunking_done=True
+    )
+    await service._save_progress(failed)
+    assert progress_session.commit.await_count == 2
+    session.get.assert_not_awaited()
+
+    # 행이 아직 커밋 전(보이지 않거나 잠김)이면 요청 세션에 기록
+    updated.scalar_one_or_none.return_value = None
+    await service._save_progress(failed)
+    assert content.embedding_status == "failed"
+
+    # completed: 청크와 함께 보이도록 요청 세션에 기록
+    completed = EmbeddingProgress(
+        content_id=1, total_chunks=1, embedded_chunks=1, chunking_done=True
+    )
+    await service._save_progress(completed)
+    assert content.embedding_status == "completed"
+    assert progress_session.commit.await_count == 3
@@ -0,0 +1,190 @@
+"""파서 실행기(프로세스 풀 + 스레드 fallback) 단위 테스트"""
+
+import os
+import time
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from app.domains.ai.exceptions import HTMLParseException, PDFParseException
+from app.domains.ai.utils import parser_executor, parsers
+from app.domains.ai.utils.parser_executor import ParserExecutor
+
+HTML = (
+    "<html><body><nav>메뉴</nav><article><p>"
+    + "프로세스 풀에서 추출한 본문입니다. " * 20
+    + "</p></article></body></html>"
+)
+
+
+def _executor(**kwargs) -> ParserExecutor:
+    options = {
+        "max_workers": 1,
+        "process_min_bytes": 1024 * 1024,
+        "timeout_seconds": 30.0,
+        "memory_limit_bytes": 0,
+    }
+    options.update(kwargs)
+    return ParserExecutor(**options)
+
+
+def _make_pdf(texts: list[str]) -> bytes:
+    """페이지별 텍스트 한 줄짜리 PDF 생성"""
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    for text in texts:
+        page = writer.add_blank_page(width=200, height=200)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 10 100 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _slow_parser(content: str) -> str:
+    time.sleep(1.0)
+    return content
+
+
+@pytest.mark.asyncio
+async def test_small_input_parsed_in_thread_without_pool():
+    """임계값 미만 입력은 프로세스 풀을 만들지 않고 스레드에서 파싱"""
+    executor = _executor()
+
+    text = await executor.extract_html(HTML)
+
+    assert "프로세스 풀에서 추출한 본문입니다." in text
+    assert executor.stats()["thread"] == 1
+    assert executor.stats()["pool_started"] is False
+
+
+@pytest.mark.asyncio
+async def test_large_input_parsed_in_worker_process():
+    """임계값 이상 입력은 워커 프로세스에서 파싱 (메모리 한도 적용)"""
+    executor = _executor(
+        process_min_bytes=0, memory_limit_bytes=1024 * 1024 * 1024
+    )
+    try:
+        text = await executor.extract_html(HTML)
+    finally:
+        executor.shutdown()
+
+    assert "프로세스 풀에서 추출한 본문입니다." in text
+    assert executor.stats()["process"] == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_errors_raised_as_parser_exception():
+    """워커의 파싱 실패는 호출 프로세스에서 파서별 도메인 예외로 변환"""
+    executor = _executor(process_min_bytes=0)
+    try:
+        with pytest.raises(PDFParseException):
+            await executor.extract_pdf(b"not a pdf")
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_timeout_raises_parse_exception():
+    """제한 시간 초과 시 시간 초과 메시지로 파싱 예외 발생"""
+    executor = _executor(timeout_seconds=0.05)
+
+    with pytest.raises(HTMLParseException) as exc_info:
+        await executor._run(_slow_parser, HTML, HTMLParseException)
+
+    assert "제한 시간" in exc_info.value.detail_info["info"]
+    assert executor.stats()["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pdf_page_ranges_extracted_in_parallel_processes():
+    """PDF 페이지 구간을 워커 프로세스에서 병렬 추출, 페이지 순서 유지"""
+    pdf = _make_pdf([f"page {n} text" for n in range(1, 8)])
+    executor = _executor(
+        max_workers=2, process_min_bytes=0, pdf_page_range_size=2
+    )
+    paths: list[str] = []
+    original = parser_executor._write_temp_pdf
+
+    def write_temp_pdf(content: bytes) -> str:
+        paths.append(original(content))
+        return paths[-1]
+
+    with patch.object(parser_executor, "_write_temp_pdf", write_temp_pdf):
+        try:
+            result = await executor.extract_pdf(pdf)
+        finally:
+            executor.shutdown()
+
+    assert result.mode == "full"
+    assert result.total_pages == 7
+    assert [page.number for page in result.pages] == list(range(1, 8))
+    assert result.text.split("\n\n")[0] == "page 1 text"
+    assert result.text.endswith("page 7 text")
+    assert not result.truncated
+    # 구간 4개 (2+2+2+1페이지)
+    assert executor.stats()["process"] == 4
+    assert result.stats()["slowest_page"] is not None
+    # PDF는 임시 파일로 한 번만 쓰고 (구간에는 경로만 전달), 추출 후 삭제
+    assert len(paths) == 1
+    assert not os.path.exists(paths[0])
+
+
+def test_pdf_file_page_ranges_reuse_cached_reader(tmp_path):
+    """같은 파일의 다음 구간은 워커에 캐시된 PdfReader 재사용"""
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(_make_pdf([f"page {n} text" for n in range(1, 5)]))
+
+    with patch.object(parsers, "PdfReader", wraps=PdfReader) as reader:
+        first = parsers.extract_pdf_file_page_range(str(path), 0, 2)
+        second = parsers.extract_pdf_file_page_range(str(path), 2, 4)
+
+    assert reader.call_count == 1
+    assert [page.number for page in first + second] == [1, 2, 3, 4]
+    assert second[-1].text == "page 4 text"
+
+
+@pytest.mark.asyncio
+async def test_pdf_token_budget_stops_early():
+    """토큰 예산에 도달하면 남은 구간을 추출하지 않고 중단 (summary 모드)"""
+    pdf = _make_pdf([f"page {n} text" for n in range(1, 21)])
+    executor = _executor(pdf_page_range_size=2)
+
+    with patch(
+        "app.core.llm.batching.count_tokens",
+        side_effect=lambda texts: [len(text.split()) for text in texts],
+    ):
+        result = await executor.extract_pdf(pdf, token_budget=9)
+
+    # 페이지당 3토큰 → 3페이지에서 예산 도달
+    assert result.mode == "summary"
+    assert result.truncated
+    assert [page.number for page in result.pages] == [1, 2, 3]
+    assert "page 4 text" not in result.text
+    # 조기 종료로 구간 10개 중 일부만 실행
+    assert executor.stats()["thread"] < 10
+
+
+@pytest.mark.asyncio
+async def test_pdf_without_text_raises():
+    """텍스트가 없는 PDF (이미지 기반 등)는 PDFParseException"""
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    output = BytesIO()
+    writer.write(output)
+
+    with pytest.raises(PDFParseException):
+        await _executor().extract_pdf(output.getvalue())
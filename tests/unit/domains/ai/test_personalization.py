@@ -2,6 +2,7 @@
 
 import pytest
 
+from app.domains.ai.models import TAG_EMBEDDING_DIM
 from app.domains.ai.personalization.service import PersonalizationService
 
 
@@ -41,13 +42,13 @@ async def test_personalize_tags_with_history(db_session, mock_embedding):
     tag1 = Tag(
         id=1,
         tag_name="AI",
-        embedding_vector=[0.9] * 1536,
+        embedding_vector=[0.9] * TAG_EMBEDDING_DIM,
         created_at=now_utc(),
     )
     tag2 = Tag(
         id=2,
         tag_name="Python",
-        embedding_vector=[0.1] * 1536,
+        embedding_vector=[0.1] * TAG_EMBEDDING_DIM,
         created_at=now_utc(),
     )
 
@@ -105,9 +106,7 @@ async def test_personalize_category_cold_start(db_session):
 @pytest.mark.asyncio
 @pytest.mark.mock_ai
 async def test_update_tag_usage(db_session):
-    """태그 사용 통계 업데이트 테스트"""
-    from unittest.mock import patch
-
+    """태그 사용 통계 업데이트 테스트 (새 태그는 임베딩 없이 생성)"""
     from sqlalchemy import select
 
     from app.domains.ai.models import Tag, UserTagUsage
@@ -117,33 +116,26 @@ async def test_update_tag_usage(db_session):
     user_id = 2
     tags = ["Python", "Django", "FastAPI"]
 
-    # 임베딩 Mock
-    async def mock_create_embedding(_text):
-        return [0.1] * 1536  # 태그는 1536 차원
-
-    with patch(
-        "app.domains.ai.personalization.service.create_embedding",
-        side_effect=mock_create_embedding,
-    ):
-        # 태그 사용 통계 업데이트
-        await service.update_tag_usage(user_id=user_id, tags=tags)
+    # 태그 사용 통계 업데이트
+    await service.update_tag_usage(user_id=user_id, tags=tags)
 
-        # 태그 마스터 확인
-        query = select(Tag).where(Tag.tag_name.in_(tags))
-        result = await db_session.execute(query)
-        tag_models = result.scalars().all()
+    # 태그 마스터 확인
+    query = select(Tag).where(Tag.tag_name.in_(tags))
+    result = await db_session.execute(query)
+    tag_models = result.scalars().all()
 
-        # 모든 태그가 생성되어야 함
-        assert len(tag_models) == 3
+    # 모든 태그가 생성되어야 함 (임베딩은 backfill로 채움)
+    assert len(tag_models) == 3
+    assert all(tag.embedding_vector is None for tag in tag_models)
 
-        # 사용 통계 확인
-        query = select(UserTagUsage).where(UserTagUsage.user_id == user_id)
-        result = await db_session.execute(query)
-        usages = result.scalars().all()
+    # 사용 통계 확인
+    query = select(UserTagUsage).where(UserTagUsage.user_id == user_id)
+    result = await db_session.execute(query)
+    usages = result.scalars().all()
 
-        # 3개의 태그 사용 통계
-        assert len(usages) == 3
-        assert all(u.use_count == 1 for u in usages)
+    # 3개의 태그 사용 통계
+    assert len(usages) == 3
+    assert all(u.use_count == 1 for u in usages)
 
 
 @pytest.mark.asyncio
@@ -181,9 +173,7 @@ async def test_update_tag_usage_increment(db_session, mock_embedding):
 @pytest.mark.asyncio
 @pytest.mark.mock_ai
 async def test_update_category_usage(db_session):
-    """카테고리 사용 통계 업데이트 테스트"""
-    from unittest.mock import patch
-
+    """카테고리 사용 통계 업데이트 테스트 (새 카테고리는 임베딩 없이 생성)"""
     from sqlalchemy import select
 
     from app.domains.ai.models import Category, UserCategoryUsage
@@ -193,33 +183,26 @@ async def test_update_category_usage(db_session):
     user_id = 4
     category = "기술"
 
-    # 임베딩 Mock
-    async def mock_create_embedding(_text):
-        return [0.1] * 1536  # 카테고리는 1536 차원
+    # 카테고리 사용 통계 업데이트
+    await service.update_category_usage(user_id=user_id, category=category)
 
-    with patch(
-        "app.domains.ai.personalization.service.create_embedding",
-        side_effect=mock_create_embedding,
-    ):
-        # 카테고리 사용 통계 업데이트
-        await service.update_category_usage(user_id=user_id, category=category)
-
-        # 카테고리 마스터 확인
-        query = select(Category).where(Category.category_name == category)
-        result = await db_session.execute(query)
-        category_model = result.scalar_one()
+    # 카테고리 마스터 확인 (임베딩은 backfill로 채움)
+    query = select(Category).where(Category.category_name == category)
+    result = await db_session.execute(query)
+    category_model = result.scalar_one()
 
-        assert category_model.category_name == "기술"
+    assert category_model.category_name == "기술"
+    assert category_model.embedding_vector is None
 
-        # 사용 통계 확인
-        query = select(UserCategoryUsage).where(
-            UserCategoryUsage.user_id == user_id,
-            UserCategoryUsage.category_id == category_model.id,
-        )
-        result = await db_session.execute(query)
-        usage = result.scalar_one()
+    # 사용 통계 확인
+    query = select(UserCategoryUsage).where(
+        UserCategoryUsage.user_id == user_id,
+        UserCategoryUsage.category_id == category_model.id,
+    )
+    result = await db_session.execute(query)
+    usage = result.scalar_one()
 
-        assert usage.use_count == 1
+    assert usage.use_count == 1
 
 
 @pytest.mark.asyncio
@@ -239,7 +222,7 @@ async def test_personalization_scoring_algorithm(db_session):
     tag = Tag(
         id=10,
         tag_name="Python",
-        embedding_vector=[0.8] * 1536,
+        embedding_vector=[0.8] * TAG_EMBEDDING_DIM,
         created_at=now_utc(),
     )
     db_session.add(tag)
@@ -258,12 +241,12 @@ async def test_personalization_scoring_algorithm(db_session):
     candidate_tags = ["Django", "FastAPI", "JavaScript"]
 
     # 임베딩 Mock
-    async def mock_create_embedding(_text):
-        return [0.1] * 1536
+    async def mock_create_embeddings(texts, dimensions=None):
+        return [[0.1] * TAG_EMBEDDING_DIM for _ in texts]
 
     with patch(
-        "app.domains.ai.personalization.service.create_embedding",
-        side_effect=mock_create_embedding,
+        "app.domains.ai.personalization.service.create_embeddings",
+        side_effect=mock_create_embeddings,
     ):
         # 개인화 추천
         result = await service.personalize_tags(
@@ -278,8 +261,6 @@ async def test_personalization_scoring_algorithm(db_session):
 @pytest.mark.mock_ai
 async def test_get_or_create_tag(db_session):
     """태그 조회 또는 생성 테스트"""
-    from unittest.mock import patch
-
     from sqlalchemy import select
 
     from app.domains.ai.models import Tag
@@ -291,28 +272,24 @@ async def test_get_or_create_tag(db_session):
 
     tag_name = "NewTag"
 
-    # 임베딩 Mock
-    async def mock_create_embedding(_text):
-        return [0.1] * 1536
-
-    with patch(
-        "app.domains.ai.personalization.repository.create_embedding",
-        side_effect=mock_create_embedding,
-    ):
-        # 첫 번째 호출 - 생성
-        tag1 = await repository.get_or_create_tag(tag_name)
-        assert tag1.tag_name == tag_name
-        assert tag1.id is not None
+    # 첫 번째 호출 - 생성 (임베딩은 backfill 작업이 채움)
+    tag1 = await repository.get_or_create_tag(tag_name)
+    assert tag1.tag_name == tag_name
+    assert tag1.id is not None
+    assert tag1.embedding_vector is None
 
-        # 두 번째 호출 - 조회
-        tag2 = await repository.get_or_create_tag(tag_name)
-        assert tag2.id == tag1.id
+    # 두 번째 호출 - 조회 (주어진 임베딩으로 NULL 채움)
+    tag2 = await repository.get_or_create_tag(
+        tag_name, [0.1] * TAG_EMBEDDING_DIM
+    )
+    assert tag2.id == tag1.id
+    assert tag2.embedding_vector is not None
 
-        # DB에 한 개만 존재해야 함
-        query = select(Tag).where(Tag.tag_name == tag_name)
-        result = await db_session.execute(query)
-        all_tags = result.scalars().all()
-        assert len(all_tags) == 1
+    # DB에 한 개만 존재해야 함
+    query = select(Tag).where(Tag.tag_name == tag_name)
+    result = await db_session.execute(query)
+    all_tags = result.scalars().all()
+    assert len(all_tags) == 1
 
 
 @pytest.mark.asyncio
@@ -333,7 +310,7 @@ async def test_upsert_user_tag_usage(db_session):
     tag = Tag(
         id=20,
         tag_name="TestTag",
-        embedding_vector=[0.5] * 1536,
+        embedding_vector=[0.5] * TAG_EMBEDDING_DIM,
         created_at=now_utc(),
     )
     db_session.add(tag)
@@ -355,3 +332,1000 @@ async def test_upsert_user_tag_usage(db_session):
     result = await db_session.execute(query)
     usage = result.scalar_one()
     assert usage.use_count == 2  # 증가
+
+
+def test_scorer_matches_reference_scoring():
+    """행렬 기반 점수가 후보별 반복 계산과 동일"""
+    import math
+    from datetime import timedelta
+
+    import numpy as np
+
+    from app.core.utils.datetime import now_utc
+    from app.domains.ai.personalization.scoring import (
+        PersonalizationScorer,
+        build_popularity,
+        build_profile,
+    )
+
+    rng = np.random.default_rng(0)
+    now = now_utc()
+    stats = [
+        {
+            "tag_name": f"tag{i}",
+            "use_count": 10 - i,
+            "last_used_at": now - timedelta(days=i * 7),
+            "embedding_vector": (
+                None if i == 2 else rng.normal(size=8).tolist()
+            ),
+        }
+        for i in range(5)
+    ]
+    global_stats = [
+        {"tag_name": "tag1", "total_use_count": 40},
+        {"tag_name": "new", "total_use_count": 10},
+    ]
+    candidates = ["new", "TAG1", "tag2", "other"]
+    embeddings = rng.normal(size=(len(candidates), 8))
+
+    scored = PersonalizationScorer().score(
+        candidates,
+        build_profile(stats),
+        candidate_embeddings=embeddings,
+        popularity=build_popularity(global_stats),
+        now=now,
+    )
+
+    def reference(index: int, candidate: str) -> float:
+        vec = embeddings[index]
+        best = 0.0
+        for row in stats:
+            if row["embedding_vector"] is None:
+                continue
+            user_vec = np.array(row["embedding_vector"])
+            similarity = vec @ user_vec
+            similarity /= np.linalg.norm(vec) * np.linalg.norm(user_vec)
+            best = max(best, similarity * math.log(row["use_count"] + 1))
+        personalization = min(best / 0.25, 1.0)
+
+        match = next(
+            (r for r in stats if r["tag_name"] == candidate.lower()), None
+        )
+        recency = (
+            math.exp(-(now - match["last_used_at"]).days / 30.0)
+            if match
+            else 0.0
+        )
+        popularity = {"tag1": 1.0, "new": 0.25}.get(candidate.lower(), 0.0)
+        base = 1.0 - 0.9 * index / (len(candidates) - 1)
+        return base + 0.5 * personalization + 0.2 * recency + 0.1 * popularity
+
+    expected = sorted(
+        ((reference(i, c), c) for i, c in enumerate(candidates)),
+        key=lambda x: x[0],
+        reverse=True,
+    )
+    assert [item["tag"] for item in scored] == [c for _, c in expected]
+    for item, (score, _) in zip(scored, expected):
+        assert item["final_score"] == pytest.approx(score, rel=1e-5)
+
+
+@pytest.fixture
+def fresh_popularity():
+    """백그라운드 갱신이 끝난 전역 인기도 스냅샷"""
+    from app.domains.ai.personalization.popularity import get_popularity_store
+
+    store = get_popularity_store()
+    store.tags = {"python": 1.0}
+    store.refreshed_at = store.clock()
+    return store
+
+
+@pytest.mark.asyncio
+async def test_personalize_tags_loads_profile_once(fresh_popularity):
+    """후보 수와 관계없이 통계 조회 1회씩, 임베딩 배치 1회"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.utils.datetime import now_utc
+
+    service = PersonalizationService(MagicMock())
+    service.repository = MagicMock()
+    service.repository.get_user_tag_stats = AsyncMock(
+        return_value=[
+            {
+                "tag_name": "Python",
+                "use_count": 5,
+                "last_used_at": now_utc(),
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+            }
+        ]
+    )
+    service.repository.get_user_category_stats = AsyncMock(return_value=[])
+    embed = AsyncMock(
+        side_effect=lambda texts, dimensions=None: [[0.1] * TAG_EMBEDDING_DIM]
+        * len(texts)
+    )
+
+    candidates = [f"tag{i}" for i in range(10)] + ["python"]
+    with patch(
+        "app.domains.ai.personalization.service.create_embeddings", embed
+    ):
+        scored = await service.score_tags(candidates, user_id=1)
+        category = await service.personalize_category(["기술", "경제"], 1)
+
+    assert service.repository.get_user_tag_stats.await_count == 1
+    # 태그 배치 1회 (카테고리 이력 없음 → 임베딩 생략)
+    assert embed.await_count == 1
+    recency = {item["tag"]: item["recency_score"] for item in scored}
+    assert recency["python"] == pytest.approx(1.0)
+    assert recency["tag0"] == 0.0
+    popularity = {item["tag"]: item["popularity_score"] for item in scored}
+    assert popularity["python"] == 1.0
+    assert all(item["personalization_score"] > 0 for item in scored)
+    assert category == "기술"
+
+
+def _mock_repository(tag_stats: list[dict]):
+    from unittest.mock import AsyncMock, MagicMock
+
+    repository = MagicMock()
+    repository.get_user_tag_stats = AsyncMock(return_value=tag_stats)
+    repository.get_user_category_stats = AsyncMock(return_value=[])
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_warm_profile_skips_database(fresh_popularity):
+    """캐시된 사용자는 개인화 시 DB 조회 없음"""
+    from unittest.mock import MagicMock
+
+    from app.core.utils.datetime import now_utc
+
+    repository = _mock_repository(
+        [
+            {
+                "tag_name": "Python",
+                "use_count": 3,
+                "last_used_at": now_utc(),
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+            }
+        ]
+    )
+
+    for _ in range(3):
+        service = PersonalizationService(MagicMock())
+        service.repository = repository
+        await service.personalize_tags(["Python", "Go"], user_id=1)
+        await service.personalize_category(["기술"], user_id=1)
+
+    assert repository.get_user_tag_stats.await_count == 1
+    assert repository.get_user_category_stats.await_count == 1
+    assert fresh_popularity.refreshed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_update_tag_usage_writes_through_profile_cache(
+    fresh_popularity,
+):
+    """태그 사용 갱신 시 커밋 후 캐시된 프로필을 재조회 없이 갱신"""
+    from datetime import timedelta
+    from unittest.mock import AsyncMock
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.core.utils.datetime import now_utc
+
+    old = now_utc() - timedelta(days=60)
+    repository = _mock_repository(
+        [
+            {
+                "tag_name": "Python",
+                "use_count": 3,
+                "last_used_at": old,
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+            }
+        ]
+    )
+    session = AsyncSession()
+    service = PersonalizationService(session)
+    service.repository = repository
+
+    before = await service.score_tags(["Python"], user_id=1)
+
+    now = now_utc()
+    repository.bulk_get_or_create_tags = AsyncMock(
+        return_value={
+            "Python": {
+                "id": 1,
+                "tag_name": "Python",
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+                "created": False,
+            },
+            "Rust": {
+                "id": 2,
+                "tag_name": "Rust",
+                "embedding_vector": [0.2] * TAG_EMBEDDING_DIM,
+                "created": True,
+            },
+        }
+    )
+    repository.bulk_upsert_user_tag_usage = AsyncMock(
+        return_value=[
+            {"user_id": 1, "tag_id": 1, "use_count": 4, "last_used_at": now},
+            {"user_id": 1, "tag_id": 2, "use_count": 1, "last_used_at": now},
+        ]
+    )
+    # 롤백되면 캐시된 프로필에 반영하지 않음
+    await session.begin()
+    await service.update_tag_usage(user_id=1, tags=["Python", "Rust"])
+    assert list(service.profile_cache.get(1).tags.use_counts) == [3]
+    await session.rollback()
+    assert list(service.profile_cache.get(1).tags.use_counts) == [3]
+
+    await service.update_tag_usage(user_id=1, tags=["Python", "Rust"])
+    await session.commit()
+
+    repository.bulk_upsert_user_tag_usage.assert_awaited_with(
+        {(1, 1): 1, (1, 2): 1}
+    )
+
+    after = await service.score_tags(["Python", "Rust"], user_id=1)
+    profile = service.profile_cache.get(1).tags
+
+    assert repository.get_user_tag_stats.await_count == 1
+    assert profile.names == ["Python", "Rust"]
+    assert list(profile.use_counts) == [4, 1]
+    assert list(profile.embedding_rows) == [0, 1]
+    assert before[0]["recency_score"] < 0.2
+    assert after[0]["recency_score"] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_update_category_usage_updates_profile_after_commit(
+    fresh_popularity,
+):
+    """카테고리 사용 갱신은 커밋 후에만 캐시된 프로필에 반영"""
+    from unittest.mock import AsyncMock
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.core.utils.datetime import now_utc
+
+    repository = _mock_repository([])
+    session = AsyncSession()
+    service = PersonalizationService(session)
+    service.repository = repository
+    await service.score_categories(["기술"], user_id=1)
+
+    repository.bulk_get_or_create_categories = AsyncMock(
+        return_value={
+            "기술": {
+                "id": 3,
+                "category_name": "기술",
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+                "created": True,
+            }
+        }
+    )
+    repository.bulk_upsert_user_category_usage = AsyncMock(
+        return_value=[
+            {
+                "user_id": 1,
+                "category_id": 3,
+                "use_count": 1,
+                "last_used_at": now_utc(),
+            }
+        ]
+    )
+
+    await session.begin()
+    await service.update_category_usage(user_id=1, category="기술")
+    await session.rollback()
+    assert service.profile_cache.get(1).categories.names == []
+
+    await service.update_category_usage(user_id=1, category="기술")
+    assert service.profile_cache.get(1).categories.names == []
+    await session.commit()
+
+    profile = service.profile_cache.get(1).categories
+    assert profile.names == ["기술"]
+    assert list(profile.use_counts) == [1]
+
+
+def test_record_use_keeps_profile_limit():
+    """프로필 행 수 상한 초과 시 사용 횟수가 가장 적은 행 제거"""
+    from app.domains.ai.personalization.scoring import (
+        build_profile,
+        record_use,
+    )
+
+    profile = build_profile(
+        [
+            {
+                "tag_name": name,
+                "use_count": count,
+                "last_used_at": None,
+                "embedding_vector": vector,
+            }
+            for name, count, vector in [
+                ("a", 5, [1.0, 0.0]),
+                ("b", 2, [0.0, 1.0]),
+                ("c", 3, None),
+            ]
+        ]
+    )
+
+    # 가득 찬 상태에서 최소 횟수 이하의 새 항목은 무시
+    record_use(profile, "d", 1, None, [1.0, 1.0], limit=3)
+    assert profile.names == ["a", "b", "c"]
+
+    # 더 많이 사용된 항목은 최소 행(b)을 대체
+    record_use(profile, "e", 4, None, [3.0, 4.0], limit=3)
+    assert profile.names == ["a", "c", "e"]
+    assert list(profile.embedding_rows) == [0, 2]
+    assert profile.embeddings[1] == pytest.approx([0.6, 0.8])
+
+
+@pytest.mark.asyncio
+async def test_popularity_store_refreshes_once_when_stale():
+    """만료된 스냅샷은 동시 요청에서도 한 번만 다시 집계"""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.domains.ai.personalization.popularity import PopularityStore
+
+    now = [0.0]
+    store = PopularityStore(top_k=10, refresh_seconds=60, clock=lambda: now[0])
+    repository = MagicMock()
+    repository.get_global_tag_stats = AsyncMock(
+        return_value=[
+            {"tag_name": "Python", "total_use_count": 8},
+            {"tag_name": "Go", "total_use_count": 2},
+        ]
+    )
+    repository.get_global_category_stats = AsyncMock(
+        return_value=[{"category_name": "기술", "total_use_count": 3}]
+    )
+
+    with patch(
+        "app.domains.ai.personalization.popularity.PersonalizationRepository",
+        return_value=repository,
+    ):
+        await asyncio.gather(
+            *(store.ensure_fresh(MagicMock()) for _ in range(5))
+        )
+        assert repository.get_global_tag_stats.await_count == 1
+        assert repository.get_global_tag_stats.await_args.kwargs == {
+            "limit": 10
+        }
+
+        now[0] = 30.0
+        await store.ensure_fresh(MagicMock())
+        assert repository.get_global_tag_stats.await_count == 1
+
+        now[0] = 61.0
+        await store.ensure_fresh(MagicMock())
+        assert repository.get_global_tag_stats.await_count == 2
+
+    assert store.tag_score("python") == 1.0
+    assert store.tag_score("GO") == 0.25
+    assert store.tag_score("Rust") == 0.0
+    assert store.category_score("기술") == 1.0
+
+
+@pytest.mark.asyncio
+async def test_popularity_store_serves_stale_while_refresher_runs():
+    """백그라운드 갱신 중에는 만료된 스냅샷을 그대로 사용"""
+    import asyncio
+    from contextlib import asynccontextmanager
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.domains.ai.personalization.popularity import PopularityStore
+
+    now = [0.0]
+    store = PopularityStore(
+        top_k=10, refresh_seconds=3600, clock=lambda: now[0]
+    )
+    repository = MagicMock()
+    repository.get_global_tag_stats = AsyncMock(
+        return_value=[{"tag_name": "Python", "total_use_count": 8}]
+    )
+    repository.get_global_category_stats = AsyncMock(return_value=[])
+
+    @asynccontextmanager
+    async def session_factory():
+        yield MagicMock()
+
+    with patch(
+        "app.domains.ai.personalization.popularity.PersonalizationRepository",
+        return_value=repository,
+    ):
+        refresher = asyncio.create_task(store.run_forever(session_factory))
+        await asyncio.sleep(0)
+        try:
+            # 첫 스냅샷은 백그라운드 갱신으로 생성
+            await store.ensure_fresh(MagicMock())
+            assert repository.get_global_tag_stats.await_count == 1
+
+            # 만료되어도 요청 경로에서 다시 집계하지 않음
+            now[0] = 7200.0
+            await store.ensure_fresh(MagicMock())
+            assert repository.get_global_tag_stats.await_count == 1
+        finally:
+            refresher.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await refresher
+
+        # 백그라운드 갱신이 멈추면 요청 경로에서 다시 집계
+        await store.ensure_fresh(MagicMock())
+        assert repository.get_global_tag_stats.await_count == 2
+
+    assert store.tag_score("python") == 1.0
+
+
+@pytest.mark.asyncio
+async def test_bulk_tag_usage_statements():
+    """태그 수와 관계없이 INSERT ... RETURNING + SELECT + 다중 행 UPSERT"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.domains.ai.personalization.repository import (
+        PersonalizationRepository,
+    )
+
+    session = MagicMock()
+    inserted = MagicMock()
+    inserted.all.return_value = [(1, "AI", None)]
+    existing = MagicMock()
+    existing.all.return_value = [(2, "Python", [0.1] * TAG_EMBEDDING_DIM)]
+    upserted = MagicMock()
+    upserted.all.return_value = []
+    session.execute = AsyncMock(side_effect=[inserted, existing, upserted])
+
+    service = PersonalizationService(session)
+    service.repository = PersonalizationRepository(session)
+    await service.update_tag_usage(
+        user_id=7, tags=["AI", "Python", "AI"] + ["Python"] * 7
+    )
+
+    statements = [
+        str(c.args[0].compile(dialect=postgresql.dialect()))
+        for c in session.execute.await_args_list
+    ]
+    assert len(statements) == 3
+    assert "ON CONFLICT (tag_name) DO NOTHING RETURNING" in statements[0]
+    assert "WHERE tags.tag_name IN" in statements[1]
+    assert "ON CONFLICT (user_id, tag_id) DO UPDATE" in statements[2]
+    assert "user_tag_usage.use_count + excluded.use_count" in statements[2]
+
+    upsert = session.execute.await_args_list[2].args[0]
+    params = upsert.compile(dialect=postgresql.dialect()).params
+    assert (params["tag_id_m0"], params["use_count_m0"]) == (1, 2)
+    assert (params["tag_id_m1"], params["use_count_m1"]) == (2, 8)
+
+
+def _usage_buffer(session_factory=None):
+    from unittest.mock import MagicMock
+
+    from app.domains.ai.personalization.usage_buffer import UsageBuffer
+
+    return UsageBuffer(
+        session_factory=session_factory or MagicMock(),
+        max_pending=100,
+        flush_interval_seconds=60,
+    )
+
+
+@pytest.mark.asyncio
+async def test_usage_buffer_stages_until_commit():
+    """증가분은 커밋 시 버퍼에 합산, 롤백 시 폐기"""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    buffer = _usage_buffer()
+    session = AsyncSession()
+
+    buffer.stage(session, "tag", 1, 10, "Python")
+    buffer.stage(session, "tag", 1, 10, "Python", count=2)
+    assert len(buffer) == 0
+    await session.commit()
+
+    buffer.stage(session, "tag", 1, 11, "Go")
+    session.sync_session.dispatch.after_rollback(session.sync_session)
+    await session.commit()
+
+    pending = buffer.pending_for_user(1)
+    assert [(u.ref_id, u.count) for u in pending] == [(10, 3)]
+    assert buffer.pending_for_user(2) == []
+
+
+@pytest.mark.asyncio
+async def test_usage_buffer_flush_aggregates_per_kind():
+    """flush는 종류별 다중 행 UPSERT 1회, 실패 시 버퍼로 복구"""
+    from contextlib import asynccontextmanager
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.utils.datetime import now_utc
+    from app.domains.ai.personalization.types import PendingUsage
+
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    buffer = _usage_buffer(session_factory)
+    now = now_utc()
+    for user_id, kind, ref_id in [
+        (1, "tag", 10),
+        (2, "tag", 10),
+        (1, "tag", 10),
+        (1, "category", 5),
+    ]:
+        buffer.add(PendingUsage(kind, user_id, ref_id, "n", 1, now))
+
+    repository = MagicMock()
+    repository.bulk_upsert_user_tag_usage = AsyncMock(
+        side_effect=[RuntimeError("db down"), []]
+    )
+    repository.bulk_upsert_user_category_usage = AsyncMock(return_value=[])
+
+    with patch(
+        "app.domains.ai.personalization.usage_buffer."
+        "PersonalizationRepository",
+        return_value=repository,
+    ):
+        assert await buffer.flush() == 0
+        assert len(buffer) == 3
+
+        assert await buffer.flush() == 3
+
+    (
+        increments,
+        last_used,
+    ) = repository.bulk_upsert_user_tag_usage.await_args.args
+    assert increments == {(1, 10): 2, (2, 10): 1}
+    assert last_used == {(1, 10): now, (2, 10): now}
+    repository.bulk_upsert_user_category_usage.assert_awaited_once_with(
+        {(1, 5): 1}, {(1, 5): now}
+    )
+    assert len(buffer) == 0
+    assert buffer.stats()["flushed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_usage_buffer_clears_inflight_on_commit_and_drops_poison():
+    """커밋 직후 inflight 제외, 반복 실패한 증가분은 max_attempts 후 버림"""
+    from contextlib import asynccontextmanager
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.utils.datetime import now_utc
+    from app.domains.ai.personalization.types import PendingUsage
+
+    inflight_on_close: list[int] = []
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+        inflight_on_close.append(len(buffer.inflight))
+
+    buffer = _usage_buffer(session_factory)
+    buffer.max_attempts = 3
+    now = now_utc()
+    repository = MagicMock()
+    repository.bulk_upsert_user_category_usage = AsyncMock(return_value=[])
+
+    with patch(
+        "app.domains.ai.personalization.usage_buffer."
+        "PersonalizationRepository",
+        return_value=repository,
+    ):
+        repository.bulk_upsert_user_tag_usage = AsyncMock(return_value=[])
+        buffer.add(PendingUsage("tag", 1, 10, "Python", 1, now))
+        assert await buffer.flush() == 1
+        # 세션 종료 시점에는 이미 inflight에서 제외 (이중 합산 없음)
+        assert inflight_on_close == [0]
+        assert buffer.pending_for_user(1) == []
+
+        repository.bulk_upsert_user_tag_usage = AsyncMock(
+            side_effect=RuntimeError("foreign key violation")
+        )
+        buffer.add(PendingUsage("tag", 1, 99, "Deleted", 1, now))
+        for _ in range(3):
+            assert await buffer.flush() == 0
+
+    assert len(buffer) == 0
+    assert buffer.stats()["dropped"] == 1
+    assert repository.bulk_upsert_user_tag_usage.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_write_behind_profile_sees_pending_increments(fresh_popularity):
+    """write-behind 모드에서 즉시 UPSERT 없이 커밋 후 프로필에 증가분 반영"""
+    from unittest.mock import AsyncMock
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.core.utils.datetime import now_utc
+
+    buffer = _usage_buffer()
+    repository = _mock_repository(
+        [
+            {
+                "tag_name": "Python",
+                "use_count": 3,
+                "last_used_at": now_utc(),
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+            }
+        ]
+    )
+    repository.bulk_get_or_create_tags = AsyncMock(
+        return_value={
+            "Python": {
+                "id": 1,
+                "tag_name": "Python",
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+                "created": False,
+            }
+        }
+    )
+    repository.bulk_upsert_user_tag_usage = AsyncMock()
+
+    session = AsyncSession()
+    service = PersonalizationService(session, usage_buffer=buffer)
+    service.repository = repository
+
+    # 캐시된 프로필: 커밋 후 반영 (롤백된 사용은 반영하지 않음)
+    await service.score_tags(["Python"], user_id=1)
+    await service.update_tag_usage(1, ["Python"])
+    session.sync_session.dispatch.after_rollback(session.sync_session)
+    await service.update_tag_usage(1, ["Python", "Python"])
+    assert service.profile_cache.get(1).tags.use_counts[0] == 3
+    await session.commit()
+    assert service.profile_cache.get(1).tags.use_counts[0] == 5
+
+    # 캐시 만료 후 DB 재조회: 커밋된 반영 전 증가분을 더함
+    service.profile_cache.invalidate(1)
+    await service.score_tags(["Python"], user_id=1)
+    assert service.profile_cache.get(1).tags.use_counts[0] == 5
+
+    repository.bulk_upsert_user_tag_usage.assert_not_awaited()
+    assert [(u.ref_id, u.count) for u in buffer.pending_for_user(1)] == [
+        (1, 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_worker_locks_and_embeds_in_batches():
+    """NULL 임베딩 행을 SKIP LOCKED로 잠그고 태그 차원 배치로 일괄 저장"""
+    from contextlib import asynccontextmanager
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.domains.ai.personalization.backfill import EmbeddingBackfillWorker
+    from app.domains.ai.personalization.tag_index import get_tag_index
+
+    def rows(*values):
+        result = MagicMock()
+        result.all.return_value = list(values)
+        return result
+
+    # 실제 세션 (커밋 후 훅 실행), SQL 실행만 Mock
+    session = AsyncSession()
+    session.commit = AsyncMock(wraps=session.commit)
+    session.execute = AsyncMock(
+        side_effect=[
+            rows((1, "Python"), (2, "AI")),  # 태그 조회
+            MagicMock(),  # 태그 UPDATE
+            rows((3, "기술")),  # 카테고리 조회
+            MagicMock(),  # 카테고리 UPDATE
+            rows(),  # 다음 배치: 남은 태그 없음
+            rows(),  # 남은 카테고리 없음
+        ]
+    )
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    embed = AsyncMock(
+        side_effect=lambda texts, dimensions=None: [[0.1] * dimensions]
+        * len(texts)
+    )
+    worker = EmbeddingBackfillWorker(
+        session_factory, batch_size=10, interval_seconds=60
+    )
+    with patch(
+        "app.domains.ai.personalization.service.create_embeddings", embed
+    ):
+        filled = await worker.run_until_done()
+
+    assert filled == 3
+    assert worker.stats() == {"filled": 3, "skipped": 0}
+    assert session.commit.await_count == 2
+    # 종류별 배치 1회, 태그/카테고리 컬럼 차원으로 요청
+    assert [c.args[0] for c in embed.await_args_list] == [
+        ["Python", "AI"],
+        ["기술"],
+    ]
+    assert {c.kwargs["dimensions"] for c in embed.await_args_list} == {
+        TAG_EMBEDDING_DIM
+    }
+    # 임베딩된 태그는 커밋 후 태그 인덱스에 추가 (카테고리는 제외)
+    assert get_tag_index().names == ["Python", "AI"]
+
+    calls = session.execute.await_args_list
+    select_sql = str(calls[0].args[0].compile(dialect=postgresql.dialect()))
+    assert "embedding_vector IS NULL" in select_sql
+    assert "FOR UPDATE SKIP LOCKED" in select_sql
+    # executemany UPDATE 한 번에 배치 전체
+    assert [row["id"] for row in calls[1].args[1]] == [1, 2]
+    assert len(calls[1].args[1][0]["embedding_vector"]) == TAG_EMBEDDING_DIM
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_rows_that_keep_failing():
+    """항상 실패하는 행은 분리해 건너뛰고 나머지 행은 저장"""
+    from contextlib import asynccontextmanager
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.llm.types import LLMProviderError
+    from app.domains.ai.personalization.backfill import EmbeddingBackfillWorker
+
+    missing = [(1, "Python"), (2, "bad"), (3, "AI"), (4, "Go")]
+    excluded: list[set[int]] = []
+
+    async def get_missing_embeddings(
+        model, name_column, limit, exclude_ids=()
+    ):
+        if name_column.key != "tag_name":
+            return []
+        excluded.append(set(exclude_ids))
+        return [
+            row
+            for row in missing
+            if row[0] not in exclude_ids and row[0] not in saved
+        ][:limit]
+
+    saved: dict[int, list[float]] = {}
+
+    async def update_embeddings(model, vectors):
+        saved.update(vectors)
+
+    repository = MagicMock()
+    repository.get_missing_embeddings = AsyncMock(
+        side_effect=get_missing_embeddings
+    )
+    repository.update_embeddings = AsyncMock(side_effect=update_embeddings)
+
+    async def embed(texts, dimensions=None):
+        if "bad" in texts:
+            raise LLMProviderError(provider="test", original_error="bad")
+        return [[0.5] * dimensions for _ in texts]
+
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    worker = EmbeddingBackfillWorker(
+        session_factory, batch_size=4, interval_seconds=60
+    )
+    with patch(
+        "app.domains.ai.personalization.service.PersonalizationRepository",
+        return_value=repository,
+    ), patch(
+        "app.domains.ai.personalization.service.create_embeddings",
+        AsyncMock(side_effect=embed),
+    ):
+        filled = await worker.run_until_done()
+
+    assert filled == 3
+    assert sorted(saved) == [1, 3, 4]
+    assert worker.stats() == {"filled": 3, "skipped": 1}
+    # 실패한 행은 같은 실행의 다음 배치에서 제외
+    assert excluded == [set(), {2}]
+
+
+@pytest.mark.asyncio
+async def test_backfill_raises_when_whole_batch_fails():
+    """배치의 모든 행이 실패하면 프로바이더 장애로 보고 예외 (롤백)"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.llm.types import LLMProviderError
+
+    repository = MagicMock()
+    repository.get_missing_embeddings = AsyncMock(
+        return_value=[(1, "Python"), (2, "AI")]
+    )
+    repository.update_embeddings = AsyncMock()
+    service = PersonalizationService(MagicMock())
+    service.repository = repository
+
+    with patch(
+        "app.domains.ai.personalization.service.create_embeddings",
+        AsyncMock(
+            side_effect=LLMProviderError(
+                provider="test", original_error="down"
+            )
+        ),
+    ):
+        with pytest.raises(LLMProviderError):
+            await service.backfill_embeddings(batch_size=10)
+
+    repository.update_embeddings.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_backfill_outage_stops_bisecting():
+    """프로바이더 장애면 행 단위로 나누지 않고 몇 번의 호출 후 예외"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.llm.types import LLMProviderError
+
+    repository = MagicMock()
+    repository.get_missing_embeddings = AsyncMock(
+        return_value=[(i, f"tag-{i}") for i in range(100)]
+    )
+    repository.update_embeddings = AsyncMock()
+    service = PersonalizationService(MagicMock())
+    service.repository = repository
+    embed = AsyncMock(
+        side_effect=LLMProviderError(provider="test", original_error="down")
+    )
+
+    with patch(
+        "app.domains.ai.personalization.service.create_embeddings", embed
+    ):
+        with pytest.raises(LLMProviderError):
+            await service.backfill_embeddings(batch_size=100)
+
+    # 전체 배치, 두 절반, 단일 행 확인 (2N-1 = 199회가 아님)
+    assert embed.await_count == 4
+    repository.update_embeddings.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_backfill_adds_to_tag_index_only_after_commit():
+    """롤백되면 태그 인덱스에 추가하지 않음"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.domains.ai.personalization.tag_index import get_tag_index
+
+    repository = MagicMock()
+    repository.get_missing_embeddings = AsyncMock(
+        side_effect=lambda model, name_column, limit, exclude_ids=(): (
+            [(1, "Python")] if name_column.key == "tag_name" else []
+        )
+    )
+    repository.update_embeddings = AsyncMock()
+    session = AsyncSession()
+    service = PersonalizationService(session)
+    service.repository = repository
+
+    with patch(
+        "app.domains.ai.personalization.service.create_embeddings",
+        AsyncMock(return_value=[[0.1] * TAG_EMBEDDING_DIM]),
+    ):
+        await session.begin()
+        await service.backfill_embeddings(batch_size=10)
+        await session.rollback()
+        assert get_tag_index().names == []
+
+        await service.backfill_embeddings(batch_size=10)
+        await session.commit()
+
+    assert get_tag_index().names == ["Python"]
+
+
+def test_tag_index_top_k_and_incremental_growth():
+    """증분 추가 시 연속 행렬 유지, 최근접 검색은 유사도 내림차순"""
+    import numpy as np
+
+    from app.domains.ai.personalization.tag_index import TagVectorIndex
+
+    index = TagVectorIndex(dim=3, refresh_seconds=60)
+    index.add_many(["Python", "Django"], [[1, 0, 0], [0.9, 0.1, 0]])
+    buffer = index.matrix.base
+
+    # 용량 안에서는 재할당 없이 행 추가, 기존 이름은 행 교체
+    index.add_many(["Cooking", "Python"], [[0, 0, 1], [2, 0, 0]])
+    # 차원이 다른 벡터는 무시
+    assert index.add_many(["Old"], [[1.0] * 1536]) == 0
+
+    assert index.names == ["Python", "Django", "Cooking"]
+    assert index.matrix.base is buffer
+    assert index.matrix.flags["C_CONTIGUOUS"]
+    assert index.matrix.dtype == np.float32
+    np.testing.assert_allclose(index.vector("Python"), [1, 0, 0])
+
+    similar = index.top_k([1, 0.05, 0], k=2, exclude="Python")
+    assert [item["tag"] for item in similar] == ["Django", "Cooking"]
+    assert similar[0]["similarity"] > similar[1]["similarity"]
+    assert [item["tag"] for item in index.top_k([0, 0, 1], k=1)] == ["Cooking"]
+    assert index.top_k([1, 0], k=1) == []
+
+    # 용량 초과 시 2배 확장, 기존 행 보존
+    index.add_many(
+        [f"tag{i}" for i in range(100)], np.random.rand(100, 3).tolist()
+    )
+    assert len(index) == 103
+    np.testing.assert_allclose(index.vector("Django")[2], 0.0)
+    assert index.stats()["bytes"] == 103 * 3 * 4
+
+
+@pytest.mark.asyncio
+async def test_score_tags_reuses_tag_index_vectors(fresh_popularity):
+    """마스터에 있는 후보 태그는 인덱스 행 사용, 나머지만 임베딩"""
+    from unittest.mock import AsyncMock, patch
+
+    from app.core.utils.datetime import now_utc
+    from app.domains.ai.personalization.tag_index import get_tag_index
+
+    index = get_tag_index()
+    index.add_many(["Python", "FastAPI"], [[0.1] * TAG_EMBEDDING_DIM] * 2)
+    index.refreshed_at = index.clock()
+
+    service = PersonalizationService(AsyncMock())
+    service.repository = _mock_repository(
+        [
+            {
+                "tag_name": "Python",
+                "use_count": 5,
+                "last_used_at": now_utc(),
+                "embedding_vector": [0.1] * TAG_EMBEDDING_DIM,
+            }
+        ]
+    )
+    embed = AsyncMock(
+        side_effect=lambda texts, dimensions=None: [[0.1] * dimensions]
+        * len(texts)
+    )
+    with patch(
+        "app.domains.ai.personalization.service.create_embeddings", embed
+    ):
+        scored = await service.score_tags(["FastAPI", "Rust", "Python"], 1)
+        similar = await service.similar_tags("Python", k=5)
+
+    embed.assert_awaited_once()
+    assert embed.await_args.args[0] == ["Rust"]
+    assert all(item["personalization_score"] > 0 for item in scored)
+    assert [item["tag"] for item in similar] == ["FastAPI"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_get_or_create_inserts_names_in_sorted_order():
+    """마스터 INSERT는 이름 정렬 순서로 실행 (동시 요청 간 교착 방지)"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.domains.ai.personalization.repository import (
+        PersonalizationRepository,
+    )
+
+    session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = [
+        (i, name, None) for i, name in enumerate(["a", "b", "c"], start=1)
+    ]
+    session.execute = AsyncMock(return_value=result)
+    repository = PersonalizationRepository(session)
+
+    rows = await repository.bulk_get_or_create_tags(["c", "a", "b", "a"])
+
+    statement = session.execute.await_args_list[0].args[0]
+    params = statement.compile(dialect=postgresql.dialect()).params
+    inserted = [v for k, v in params.items() if k.startswith("tag_name")]
+    assert inserted == ["a", "b", "c"]
+    assert session.execute.await_count == 1
+    assert all(row["created"] for row in rows.values())
@@ -2,6 +2,7 @@
 
 import pytest
 
+from app.core.utils.pagination import TotalMode
 from app.domains.ai.search.repository import AISearchRepository
 from app.domains.ai.search.service import AISearchService
 from app.domains.ai.search.types import SearchFilters
@@ -101,6 +102,45 @@ async def test_keyword_search(db_session):
     assert "rank" in results[0]
 
 
+@pytest.mark.asyncio
+@pytest.mark.mock_ai
+async def test_keyword_search_weights_title_over_memo(db_session):
+    """키워드 검색 - title 매칭이 memo 매칭보다 높은 관련도"""
+    from app.core.utils.datetime import now_utc
+    from app.domains.contents.models import Content
+
+    repository = AISearchRepository(db_session)
+
+    title_match = Content(
+        id=8,
+        user_id=1,
+        content_type="webpage",
+        source_url="https://example.com/title",
+        title="Kubernetes Operators",
+        created_at=now_utc(),
+    )
+    memo_match = Content(
+        id=9,
+        user_id=1,
+        content_type="webpage",
+        source_url="https://example.com/memo",
+        title="Cluster notes",
+        memo="kubernetes",
+        created_at=now_utc(),
+    )
+    db_session.add_all([title_match, memo_match])
+    await db_session.commit()
+
+    # search_vector는 트리거가 INSERT 시 채움
+    results, total = await repository.keyword_search(
+        query="kubernetes", user_id=1
+    )
+
+    assert total == 2
+    assert [r["content_id"] for r in results] == [8, 9]
+    assert results[0]["rank"] > results[1]["rank"]
+
+
 @pytest.mark.asyncio
 @pytest.mark.mock_ai
 async def test_hybrid_search_score_combination(db_session, mock_embedding):
@@ -139,7 +179,7 @@ async def test_hybrid_search_score_combination(db_session, mock_embedding):
     # 하이브리드 검색 실행
     query = "machine learning"
     query_embedding = [0.2] * 3072
-    results, total = await repository.hybrid_search(
+    results, total, total_mode = await repository.hybrid_search(
         query=query,
         query_embedding=query_embedding,
         user_id=1,
@@ -152,6 +192,7 @@ async def test_hybrid_search_score_combination(db_session, mock_embedding):
 
     # 결과 검증
     assert total >= 1
+    assert total_mode == TotalMode.EXACT
     assert len(results) >= 1
 
     # 스코어 필드 확인
@@ -302,6 +343,50 @@ async def test_search_pagination(db_session, mock_embedding):
     assert ids_page1.isdisjoint(ids_page2)
 
 
+@pytest.mark.asyncio
+@pytest.mark.mock_ai
+async def test_search_cursor_pagination(db_session, mock_embedding):
+    """커서 페이지네이션 - 동점 점수도 content_id로 빠짐없이 순회"""
+    from app.core.utils.datetime import now_utc
+    from app.domains.ai.search.service import AISearchService
+    from app.domains.contents.models import Content
+
+    for i in range(5):
+        db_session.add(
+            Content(
+                id=200 + i,
+                user_id=1,
+                content_type="webpage",
+                source_url=f"https://example.com/rust{i}",
+                title="Rust ownership",
+                created_at=now_utc(),
+            )
+        )
+    await db_session.commit()
+
+    service = AISearchService(db_session)
+    seen_ids: list[int] = []
+    cursor = None
+    while True:
+        results, total, _ = await service.search(
+            query="rust",
+            user_id=1,
+            mode="keyword",
+            size=2,
+            cursor=cursor,
+            total_mode=TotalMode.CAPPED,
+        )
+        seen_ids.extend(r["content_id"] for r in results)
+        cursor = service.next_cursor(
+            results, mode="keyword", size=2, cursor=cursor
+        )
+        if cursor is None:
+            break
+
+    assert total == 5
+    assert seen_ids == [200, 201, 202, 203, 204]
+
+
 @pytest.mark.asyncio
 @pytest.mark.mock_ai
 async def test_search_service_integration(db_session, mock_embedding):
@@ -338,7 +423,7 @@ async def test_search_service_integration(db_session, mock_embedding):
     await db_session.commit()
 
     # 하이브리드 검색
-    results, total = await service.search(
+    results, total, _ = await service.search(
         query="test",
         user_id=1,
         mode="hybrid",
@@ -353,3 +438,462 @@ async def test_search_service_integration(db_session, mock_embedding):
     assert total >= 1
     assert len(results) >= 1
     assert results[0]["content_id"] == content.id
+
+
+@pytest.mark.asyncio
+@pytest.mark.mock_ai
+async def test_hybrid_search_rrf_fusion(db_session, mock_embedding):
+    """하이브리드 검색 - RRF 결합 테스트"""
+    from app.core.utils.datetime import now_utc
+    from app.domains.ai.models import ContentEmbeddingMetadata
+    from app.domains.contents.models import Content
+
+    repository = AISearchRepository(db_session)
+
+    content = Content(
+        id=7,
+        user_id=1,
+        content_type="webpage",
+        source_url="https://example.com/rrf",
+        title="Reciprocal Rank Fusion",
+        summary="Rank fusion for hybrid retrieval",
+        embedding_status="completed",
+        created_at=now_utc(),
+    )
+    db_session.add(content)
+    await db_session.flush()
+
+    db_session.add(
+        ContentEmbeddingMetadata(
+            content_id=content.id,
+            chunk_index=0,
+            chunk_content="rank fusion",
+            embedding_vector=[0.6] * 3072,
+            embedding_model="text-embedding-3-large",
+            created_at=now_utc(),
+        )
+    )
+    await db_session.commit()
+
+    results, total, _ = await repository.hybrid_search(
+        query="fusion",
+        query_embedding=[0.6] * 3072,
+        user_id=1,
+        threshold=0.0,
+        fusion="rrf",
+    )
+
+    # 두 레그 모두 1위 → 1/(k+1) * 2
+    assert total == 1
+    assert results[0]["content_id"] == content.id
+    assert abs(results[0]["final_score"] - 2 / 61) < 0.0001
+
+
+def test_fuse_results_weighted_and_rrf():
+    """레그 결과 병합 - content_id 중복 제거 및 점수 계산"""
+    base = {"title": "t", "summary": None, "content_type": "webpage"}
+    vector_results = [
+        {
+            **base,
+            "content_id": 1,
+            "source_url": None,
+            "vector_score": 0.9,
+            "vector_rank": 1,
+        },
+        {
+            **base,
+            "content_id": 2,
+            "source_url": None,
+            "vector_score": 0.6,
+            "vector_rank": 2,
+        },
+    ]
+    keyword_results = [
+        {
+            **base,
+            "content_id": 2,
+            "source_url": None,
+            "keyword_score": 1.0,
+            "keyword_rank": 1,
+        },
+        {
+            **base,
+            "content_id": 3,
+            "source_url": None,
+            "keyword_score": 0.5,
+            "keyword_rank": 2,
+        },
+    ]
+
+    weighted = AISearchRepository._fuse_results(
+        vector_results, keyword_results, alpha=0.7, fusion="weighted"
+    )
+    scores = {r["content_id"]: r["final_score"] for r in weighted}
+    assert len(weighted) == 3
+    assert abs(scores[1] - 0.63) < 1e-9
+    assert abs(scores[2] - (0.6 * 0.7 + 1.0 * 0.3)) < 1e-9
+    assert abs(scores[3] - 0.15) < 1e-9
+    assert [r["content_id"] for r in weighted] == [2, 1, 3]
+
+    rrf = AISearchRepository._fuse_results(
+        vector_results, keyword_results, alpha=0.7, fusion="rrf"
+    )
+    assert rrf[0]["content_id"] == 2
+    assert abs(rrf[0]["final_score"] - (1 / 62 + 1 / 61)) < 1e-9
+    assert "vector_rank" not in rrf[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.mock_ai
+async def test_vector_search_returns_each_content_once(db_session):
+    """벡터 검색 - 콘텐츠별 최고 유사 청크 하나만 반환"""
+    from app.core.utils.datetime import now_utc
+    from app.domains.ai.models import ContentEmbeddingMetadata
+    from app.domains.contents.models import Content
+
+    repository = AISearchRepository(db_session)
+
+    long_pdf = Content(
+        id=10,
+        user_id=1,
+        content_type="pdf",
+        file_hash="a" * 64,
+        title="Long PDF",
+        embedding_status="completed",
+        created_at=now_utc(),
+    )
+    article = Content(
+        id=11,
+        user_id=1,
+        content_type="webpage",
+        source_url="https://example.com/article",
+        title="Article",
+        embedding_status="completed",
+        created_at=now_utc(),
+    )
+    db_session.add_all([long_pdf, article])
+    await db_session.flush()
+
+    # PDF는 청크 5개, 첫 청크만 쿼리와 같은 방향
+    for i in range(5):
+        vector = [0.7] * 3072 if i == 0 else [0.7] * 1536 + [-0.7] * 1536
+        db_session.add(
+            ContentEmbeddingMetadata(
+                content_id=long_pdf.id,
+                chunk_index=i,
+                chunk_content=f"pdf chunk {i}",
+                embedding_vector=vector,
+                embedding_model="text-embedding-3-large",
+                created_at=now_utc(),
+            )
+        )
+    db_session.add(
+        ContentEmbeddingMetadata(
+            content_id=article.id,
+            chunk_index=0,
+            chunk_content="article chunk",
+            embedding_vector=[0.7] * 3000 + [0.0] * 72,
+            embedding_model="text-embedding-3-large",
+            created_at=now_utc(),
+        )
+    )
+    await db_session.commit()
+
+    results, total = await repository.vector_search(
+        query_embedding=[0.7] * 3072,
+        user_id=1,
+        size=2,
+        threshold=-1.0,
+        chunks_per_content=2,
+    )
+
+    assert total == 2
+    assert [r["content_id"] for r in results] == [10, 11]
+    assert results[0]["chunk_index"] == 0
+    assert len(results[0]["matched_chunks"]) == 2
+    assert len(results[1]["matched_chunks"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_snapshot_pages(mock_embedding):
+    """하이브리드 검색 스냅샷 - 이후 페이지는 슬라이스 + ID 조회"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.domains.ai.search.snapshot import get_search_snapshot_cache
+
+    ranked = [
+        {
+            "content_id": i,
+            "title": f"Doc {i}",
+            "summary": None,
+            "content_type": "webpage",
+            "source_url": None,
+            "final_score": 1.0 - i / 100,
+            "vector_score": 1.0 - i / 100,
+            "keyword_score": 0.0,
+        }
+        for i in range(1, 8)
+    ]
+    service = AISearchService(MagicMock())
+    service.repository.hybrid_search = AsyncMock(
+        return_value=(ranked, 7, TotalMode.EXACT)
+    )
+    service.repository.get_contents_by_ids = AsyncMock(
+        side_effect=lambda ids, user_id: [
+            {k: r[k] for k in ("content_id", "title")}
+            for r in ranked
+            if r["content_id"] in ids
+        ]
+    )
+
+    page1, total, _ = await service.search("doc", 1, mode="hybrid", size=3)
+    cursor = service.next_cursor(page1, mode="hybrid", size=3)
+    page2, _, _ = await service.search(
+        "  Doc ", 1, mode="hybrid", size=3, cursor=cursor
+    )
+    page3, _, _ = await service.search("doc", 1, mode="hybrid", page=3, size=3)
+
+    assert total == 7
+    assert [r["content_id"] for r in page1] == [1, 2, 3]
+    assert [r["content_id"] for r in page2] == [4, 5, 6]
+    assert page2[0]["final_score"] == ranked[3]["final_score"]
+    assert [r["content_id"] for r in page3] == [7]
+    service.repository.hybrid_search.assert_awaited_once()
+    assert mock_embedding.call_count <= 1
+
+    # 콘텐츠 변경 시 사용자 스냅샷 무효화 → 다시 계산
+    await get_search_snapshot_cache().invalidate_user(1)
+    await service.search("doc", 1, mode="hybrid", size=3)
+    assert service.repository.hybrid_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_snapshot_truncated(mock_embedding):
+    """잘린 스냅샷 - 실제 전체 개수 유지, 범위 밖 페이지는 직접 조회"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.config import settings
+
+    def row(i: int) -> dict:
+        return {
+            "content_id": i,
+            "title": f"Doc {i}",
+            "final_score": 1.0 - i / 100,
+            "vector_score": 1.0 - i / 100,
+            "keyword_score": 0.0,
+        }
+
+    snapshot_rows = [row(i) for i in range(1, 5)]
+    beyond_rows = [row(5), row(6)]
+    service = AISearchService(MagicMock())
+    service.repository.hybrid_search = AsyncMock(
+        side_effect=[
+            (snapshot_rows, 9, TotalMode.EXACT),
+            (beyond_rows, 9, TotalMode.EXACT),
+        ]
+    )
+    service.repository.get_contents_by_ids = AsyncMock(
+        side_effect=lambda ids, user_id: [
+            {"content_id": r["content_id"], "title": r["title"]}
+            for r in snapshot_rows
+            if r["content_id"] in ids
+        ]
+    )
+
+    with patch.object(settings, "search_snapshot_size", 4):
+        page1, total, _ = await service.search(
+            "truncated", 1, mode="hybrid", size=2
+        )
+        cursor = service.next_cursor(page1, mode="hybrid", size=2)
+        page2, _, _ = await service.search(
+            "truncated", 1, mode="hybrid", size=2, cursor=cursor
+        )
+        cursor = service.next_cursor(
+            page2, mode="hybrid", size=2, cursor=cursor
+        )
+        page3, total3, _ = await service.search(
+            "truncated", 1, mode="hybrid", size=2, cursor=cursor
+        )
+
+    assert total == 9
+    assert [r["content_id"] for r in page1] == [1, 2]
+    assert [r["content_id"] for r in page2] == [3, 4]
+    assert [r["content_id"] for r in page3] == [5, 6]
+    assert total3 == 9
+    live_call = service.repository.hybrid_search.await_args_list[1]
+    assert live_call.kwargs["after"] == (row(4)["final_score"], 4)
+    assert live_call.kwargs["seen"] == 4
+
+
+@pytest.mark.asyncio
+async def test_hybrid_total_marked_estimated_when_legs_capped(mock_embedding):
+    """레그 후보 수 이상으로 병합되면 전체 개수는 하한 → estimated"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.config import settings
+
+    repository = AISearchRepository(MagicMock())
+    with patch.object(settings, "hybrid_candidate_limit", 5), patch.object(
+        settings, "hybrid_search_strategy", "sql"
+    ):
+        repository._hybrid_search_sql = AsyncMock(return_value=([], 4))
+        _, total, total_mode = await repository.hybrid_search(
+            "doc", [0.1], user_id=1, size=2
+        )
+        assert (total, total_mode) == (4, TotalMode.EXACT)
+
+        repository._hybrid_search_sql = AsyncMock(return_value=([], 5))
+        _, total, total_mode = await repository.hybrid_search(
+            "doc", [0.1], user_id=1, size=2
+        )
+        assert (total, total_mode) == (5, TotalMode.ESTIMATED)
+
+    service = AISearchService(MagicMock())
+    service.repository.hybrid_search = AsyncMock(
+        return_value=([], 500, TotalMode.ESTIMATED)
+    )
+    with patch.object(settings, "search_snapshot_enabled", False):
+        _, total, total_mode = await service.search("doc", 1, mode="hybrid")
+        assert (total, total_mode) == (500, TotalMode.ESTIMATED)
+
+        _, _, total_mode = await service.search(
+            "doc", 1, mode="hybrid", total_mode=TotalMode.NONE
+        )
+        assert total_mode == TotalMode.NONE
+
+
+@pytest.mark.asyncio
+async def test_set_ef_search_enables_iterative_scan():
+    """HNSW 탐색 설정 시 같은 트랜잭션에서 반복 스캔도 함께 설정"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.config import settings
+
+    session = MagicMock()
+    session.execute = AsyncMock()
+    repository = AISearchRepository(session)
+
+    with patch.object(settings, "vector_index_mode", "halfvec"), patch.object(
+        settings, "vector_iterative_scan", "relaxed_order"
+    ), patch.object(settings, "vector_max_scan_tuples", 20_000):
+        await repository._set_ef_search(300)
+
+    session.execute.assert_awaited_once()
+    statement, params = session.execute.await_args.args
+    assert "hnsw.iterative_scan" in str(statement)
+    assert "hnsw.max_scan_tuples" in str(statement)
+    assert params == {
+        "ef_search": "300",
+        "iterative_scan": "relaxed_order",
+        "max_scan_tuples": "20000",
+    }
+
+    # off면 ef_search만 설정 (pgvector 0.8 미만 호환)
+    session.execute.reset_mock()
+    with patch.object(settings, "vector_index_mode", "halfvec"), patch.object(
+        settings, "vector_iterative_scan", "off"
+    ):
+        await repository._set_ef_search(50)
+
+    statement, params = session.execute.await_args.args
+    assert "hnsw.iterative_scan" not in str(statement)
+    assert params == {"ef_search": str(settings.vector_ef_search)}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_invalidated_after_commit():
+    """스냅샷 무효화는 커밋 후 실행, 롤백 시 취소"""
+    import asyncio
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.domains.ai.search.snapshot import get_search_snapshot_cache
+
+    cache = get_search_snapshot_cache()
+    ranked = [{"content_id": 1, "final_score": 0.9}]
+    session = AsyncSession()
+
+    await cache.set(1, "key", ranked, total=1)
+    await session.begin()
+    cache.invalidate_user_on_commit(session, 1)
+    await session.rollback()
+    await session.commit()
+    await asyncio.sleep(0)
+    assert await cache.get(1, "key") is not None
+
+    cache.invalidate_user_on_commit(session, 1)
+    assert await cache.get(1, "key") is not None
+    await session.commit()
+    await asyncio.sleep(0)
+    assert await cache.get(1, "key") is None
+
+
+def test_memory_snapshot_backend_rejected_with_multiple_workers():
+    """여러 워커에서 memory 백엔드는 설정 오류"""
+    from pydantic import ValidationError
+
+    from app.core.config import Settings
+
+    with pytest.raises(ValidationError):
+        Settings(search_snapshot_backend="memory", web_concurrency=2)
+
+    Settings(search_snapshot_backend="auto", web_concurrency=2)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cache_disabled_without_redis_package(mock_embedding):
+    """redis 패키지가 없으면 스냅샷 캐시를 끄고 직접 조회"""
+    import builtins
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from app.core.config import settings
+    from app.domains.ai.search.snapshot import (
+        get_search_snapshot_cache,
+        reset_search_snapshot_cache,
+    )
+
+    real_import = builtins.__import__
+
+    def no_redis(name, *args, **kwargs):
+        if name == "redis":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    reset_search_snapshot_cache()
+    with patch.object(settings, "search_snapshot_backend", "redis"), patch(
+        "builtins.__import__", side_effect=no_redis
+    ):
+        cache = get_search_snapshot_cache()
+
+    assert not cache.enabled
+    cache.invalidate_user_on_commit(MagicMock(), 1)
+    await cache.set(1, "key", [{"content_id": 1}], total=1)
+    assert await cache.get(1, "key") is None
+
+    service = AISearchService(MagicMock())
+    service.repository.hybrid_search = AsyncMock(
+        return_value=([], 0, TotalMode.EXACT)
+    )
+    await service.search("doc", 1, mode="hybrid", page=2, size=3)
+
+    # 스냅샷 크기가 아닌 요청 페이지로 직접 조회
+    kwargs = service.repository.hybrid_search.await_args.kwargs
+    assert (kwargs["page"], kwargs["size"]) == (2, 3)
+    reset_search_snapshot_cache()
+
+
+def test_content_change_hook_invalidates_snapshots():
+    """콘텐츠 변경 알림은 등록된 스냅샷 무효화 훅으로 전달"""
+    from unittest.mock import MagicMock, patch
+
+    from app.core.hooks import notify_content_changed
+
+    session = MagicMock()
+    with patch(
+        "app.domains.ai.search.snapshot.get_search_snapshot_cache"
+    ) as get_cache:
+        notify_content_changed(session, 7)
+
+    get_cache.return_value.invalidate_user_on_commit.assert_called_once_with(
+        session, 7
+    )
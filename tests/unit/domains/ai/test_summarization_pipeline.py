@@ -0,0 +1,468 @@
+"""요약 LLM 파이프라인 단위 테스트 (LLM 호출 Mock)"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.core.llm.types import LLMProviderError, LLMResult
+from app.domains.ai.exceptions import SummarizationFailedException
+from app.domains.ai.summarization.types import (
+    SummaryEvent,
+    SummaryPipelineResult,
+)
+from app.domains.ai.utils import parsers
+from app.domains.ai.utils.types import PDFExtractionResult, PDFPage
+
+
+@pytest.fixture(autouse=True)
+def word_token_counts():
+    """토큰 수를 단어 수로 대체 (tiktoken 인코딩 다운로드 없이 테스트)"""
+    with patch(
+        "app.domains.ai.summarization.service.count_tokens",
+        side_effect=lambda texts: [len(text.split()) for text in texts],
+    ):
+        yield
+
+
+def _split_words(text: str, strategy):
+    """EmbeddingService.iter_chunks 대용 (단어 = 토큰)"""
+    words = text.split()
+    for start in range(0, len(words), strategy.chunk_size):
+        end = start + strategy.chunk_size
+        yield " ".join(words[start:end]), start, min(end, len(words))
+
+
+def _result(content: str) -> LLMResult:
+    return LLMResult(
+        content=content, model="gpt-4o-mini", input_tokens=10, output_tokens=5
+    )
+
+
+def _step(kwargs: dict) -> str:
+    """max_tokens로 단계 구분 (요약 400, 태그 200, 카테고리 150)"""
+    max_tokens = kwargs["max_tokens"]
+    return {200: "tags", 150: "category"}.get(max_tokens, "summary")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_tags_and_category_concurrently(
+    summarization_service_factory,
+):
+    """요약 이후 태그/카테고리는 동시에 실행, 단계별 소요 시간 기록"""
+    in_flight = 0
+    peak = 0
+    order = []
+
+    async def fake_call(**kwargs):
+        nonlocal in_flight, peak
+        step = _step(kwargs)
+        order.append(step)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _result(
+            {"summary": " 요약 ", "tags": '["AI"]', "category": '["기술"]'}[step]
+        )
+
+    with patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        side_effect=fake_call,
+    ):
+        result = await summarization_service_factory()._run_llm_pipeline("본문")
+
+    assert order[0] == "summary"
+    assert peak == 2
+    assert result.tags.content == '["AI"]'
+    assert result.category.content == '["기술"]'
+    assert not result.is_partial
+    assert set(result.timings_ms) == {"summary", "tags", "category", "total"}
+    assert result.timings_ms["total"] >= result.timings_ms["summary"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_summary_and_tags_when_category_fails(
+    summarization_service_factory,
+):
+    """카테고리 실패 시 요약/태그 유지, 실패 단계는 None"""
+
+    async def fake_call(**kwargs):
+        step = _step(kwargs)
+        if step == "category":
+            raise LLMProviderError(provider="gpt", original_error="timeout")
+        return _result("요약" if step == "summary" else '["AI", "LLM"]')
+
+    service = summarization_service_factory()
+    with patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        side_effect=fake_call,
+    ):
+        result = await service._run_llm_pipeline("본문")
+
+    assert result.summary.content == "요약"
+    assert result.tags.content == '["AI", "LLM"]'
+    assert result.category is None
+    assert result.is_partial
+    assert "category" in result.errors
+    assert "category" in result.timings_ms
+    # 실패한 단계는 WTU에서 제외
+    assert result.calculate_total_wtu() > 0
+
+    # 부분 결과는 캐시하지 않음
+    await service._save_cache("key", {}, total_tokens=0, partial=True)
+    service.session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_raises_when_summary_fails(
+    summarization_service_factory,
+):
+    """요약 실패 시 후속 단계 없이 SummarizationFailedException"""
+
+    async def fake_call(**kwargs):
+        raise LLMProviderError(provider="gpt", original_error="rate limit")
+
+    with patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        side_effect=fake_call,
+    ) as mock_call:
+        with pytest.raises(SummarizationFailedException):
+            await summarization_service_factory()._run_llm_pipeline("본문")
+
+    assert mock_call.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_combined_mode_single_json_call(summarization_service_factory):
+    """combined 모드는 JSON 단일 호출, 스키마 검증 후 후보 추출"""
+    combined = (
+        '```json\n{"summary": " 요약 ", "tags": ["AI", " "], '
+        '"categories": ["기술"]}\n```'
+    )
+
+    with patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        return_value=_result(combined),
+    ) as mock_call:
+        result = await summarization_service_factory()._run_llm_pipeline(
+            "본문", combined=True
+        )
+
+    assert mock_call.call_count == 1
+    kwargs = mock_call.call_args.kwargs
+    assert kwargs["response_format"] == {"type": "json_object"}
+    assert kwargs["messages"][0].content.endswith("JSON:")
+    assert result.mode == "combined"
+    assert result.summary_text == "요약"
+    assert result.candidate_tags == ["AI"]
+    assert result.candidate_categories == ["기술"]
+    assert not result.is_partial
+    assert set(result.timings_ms) == {"combined", "total"}
+
+
+@pytest.mark.asyncio
+async def test_combined_mode_falls_back_when_output_invalid(
+    summarization_service_factory,
+):
+    """스키마에 맞지 않는 응답이면 3회 호출로 재시도, 버려진 호출도 WTU 포함"""
+
+    async def fake_call(**kwargs):
+        if "response_format" in kwargs:
+            return _result('{"summary": "", "tags": "AI"}')
+        return _result(
+            {"summary": "요약", "tags": '["AI"]', "category": '["기술"]'}[
+                _step(kwargs)
+            ]
+        )
+
+    with patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        side_effect=fake_call,
+    ) as mock_call:
+        result = await summarization_service_factory()._run_llm_pipeline(
+            "본문", combined=True
+        )
+
+    assert mock_call.call_count == 4
+    assert result.mode == "pipeline"
+    assert result.candidate_tags == ["AI"]
+    assert result.discarded is not None
+    assert "combined" in result.timings_ms
+
+    single = SummaryPipelineResult(
+        summary=result.summary,
+        summary_text="요약",
+        candidate_tags=[],
+        candidate_categories=[],
+    )
+    assert result.calculate_total_wtu() == 4 * single.calculate_total_wtu()
+
+
+@pytest.mark.asyncio
+async def test_response_format_dropped_for_unsupported_models():
+    """JSON 모드 미지원 모델에는 response_format을 전달하지 않음"""
+    from unittest.mock import AsyncMock
+
+    from app.core.llm.provider import acompletion_raw
+    from app.core.llm.types import LLMMessage
+
+    response = MagicMock()
+    response.choices[0].message.content = "{}"
+    response.choices[0].finish_reason = "stop"
+    response.model = "model"
+    response.usage.prompt_tokens = 1
+    response.usage.completion_tokens = 1
+    messages = [LLMMessage(role="user", content="hi")]
+
+    with patch(
+        "app.core.llm.provider.acompletion", AsyncMock(return_value=response)
+    ) as mock_completion, patch(
+        "app.core.llm.provider._supports_param",
+        side_effect=lambda model, param: model == "json-model",
+    ):
+        for model in ("json-model", "plain-model"):
+            await acompletion_raw(
+                model, messages, response_format={"type": "json_object"}
+            )
+
+    supported, unsupported = mock_completion.await_args_list
+    assert supported.kwargs["response_format"] == {"type": "json_object"}
+    assert "response_format" not in unsupported.kwargs
+
+
+@pytest.mark.asyncio
+async def test_long_text_map_reduce_with_bounded_fan_out(
+    summarization_service_factory,
+):
+    """임계값 초과 본문은 구간 요약(동시 실행 제한) 후 병합해 최종 요약"""
+    in_flight = 0
+    peak = 0
+    prompts_seen = []
+
+    async def fake_call(**kwargs):
+        nonlocal in_flight, peak
+        content = kwargs["messages"][0].content
+        prompts_seen.append(content)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "구간 중" in content:
+            return _result("구간 요약 " * 30)
+        if "구간별 요약" in content:
+            return _result("병합 요약")
+        return _result(
+            {"tags": '["AI"]', "category": '["기술"]'}.get(
+                _step(kwargs), "최종 요약"
+            )
+        )
+
+    embedding_service = MagicMock()
+    embedding_service.iter_chunks.side_effect = _split_words
+    service = summarization_service_factory(
+        embedding_service=embedding_service
+    )
+    text = "word " * 1000
+
+    with patch.object(
+        settings, "summary_map_reduce_threshold_tokens", 150
+    ), patch.object(settings, "summary_map_section_tokens", 100), patch.object(
+        settings, "summary_map_concurrency", 3
+    ), patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        side_effect=fake_call,
+    ):
+        result = await service._run_llm_pipeline(text, combined=False)
+
+    map_calls = [p for p in prompts_seen if "구간 중" in p]
+    reduce_calls = [p for p in prompts_seen if "구간별 요약" in p]
+    assert len(map_calls) == 10
+    assert "10/10번째" in map_calls[-1]
+    assert peak == 3
+    # 구간 요약 10개(각 약 60토큰)는 임계값 150 단위로 묶여 한 번 더 병합
+    assert 1 < len(reduce_calls) < 10
+    assert "병합 요약" in prompts_seen[-3]
+    assert result.summary_text == "최종 요약"
+    assert len(result.sections) == len(map_calls) + len(reduce_calls)
+    assert {"map", "reduce_1", "summary"} <= set(result.timings_ms)
+    assert (
+        result.calculate_total_wtu()
+        > SummaryPipelineResult(
+            summary=result.summary,
+            summary_text="",
+            candidate_tags=[],
+            candidate_categories=[],
+            tags=result.tags,
+            category=result.category,
+        ).calculate_total_wtu()
+    )
+
+
+@pytest.mark.asyncio
+async def test_short_text_skips_map_reduce(summarization_service_factory):
+    """임계값 이하 본문은 구간 요약 없이 그대로 요약"""
+    with patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        return_value=_result('["AI"]'),
+    ) as mock_call:
+        result = await summarization_service_factory()._run_llm_pipeline(
+            "본문", combined=False
+        )
+
+    assert mock_call.call_count == 3
+    assert result.sections == []
+    assert "map" not in result.timings_ms
+
+
+@pytest.mark.asyncio
+async def test_pdf_token_budget_applies_to_summary_text_only(
+    summarization_service_factory,
+):
+    """PDF 토큰 예산은 요약용 텍스트에만 적용, 캐시/임베딩 텍스트는 전체"""
+    pages = [
+        PDFPage(number=i, text=f"페이지 {i} 본문", elapsed_ms=1.0)
+        for i in range(1, 5)
+    ]
+    executor = MagicMock()
+    executor.extract_pdf = AsyncMock(
+        return_value=PDFExtractionResult(
+            text=parsers.join_pdf_pages(pages), total_pages=4, pages=pages
+        )
+    )
+    service = summarization_service_factory(parser_executor=executor)
+
+    with patch.object(settings, "pdf_summary_token_budget", 6):
+        (
+            extracted_text,
+            summary_text,
+            _,
+        ) = await service._prepare_pdf_text_and_strategy(b"%PDF")
+
+    # 전체 페이지를 추출 (조기 종료 없음)
+    executor.extract_pdf.assert_awaited_once_with(b"%PDF")
+    assert "페이지 4" in extracted_text
+    # 페이지당 3단어 → 두 페이지에서 예산 도달
+    assert "페이지 2" in summary_text
+    assert "페이지 3" not in summary_text
+
+
+@pytest.mark.asyncio
+async def test_streaming_pipeline_emits_summary_deltas(
+    summarization_service_factory,
+):
+    """event_callback이 있으면 요약을 스트리밍하고 완성된 요약 이벤트 전송"""
+    events: list[SummaryEvent] = []
+
+    async def collect(event: SummaryEvent) -> None:
+        events.append(event)
+
+    async def fake_stream(**kwargs):
+        for chunk in ["핵심 ", "요약 ", "문장"]:
+            yield chunk
+
+    with patch(
+        "app.domains.ai.summarization.service.stream_with_fallback",
+        side_effect=fake_stream,
+    ), patch(
+        "app.domains.ai.summarization.service.call_with_fallback",
+        return_value=_result('["AI"]'),
+    ) as mock_call:
+        result = await summarization_service_factory()._run_llm_pipeline(
+            "본문", combined=False, event_callback=collect
+        )
+
+    # 요약은 스트리밍, 태그/카테고리만 일반 호출
+    assert mock_call.call_count == 2
+    assert [e.data["text"] for e in events[:3]] == ["핵심 ", "요약 ", "문장"]
+    assert events[3] == SummaryEvent(
+        event="summary", data={"summary": "핵심 요약 문장"}
+    )
+    assert result.summary_text == "핵심 요약 문장"
+    # 스트림은 사용량을 주지 않으므로 토큰 수 추정 (테스트는 단어 수)
+    assert result.summary.output_tokens == 3
+    assert result.summary.input_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_relays_events_as_sse():
+    """서비스 이벤트를 SSE로 중계, 예외는 error 이벤트로 전송"""
+    from app.domains.ai.router import _create_summary_streaming_response
+
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__.return_value = MagicMock()
+
+    async def run(service, event_callback):
+        await event_callback(
+            SummaryEvent(event="summary_delta", data={"text": "요약"})
+        )
+        raise SummarizationFailedException(detail_msg="LLM 요약 생성 실패")
+
+    with patch(
+        "app.domains.ai.router.async_session_maker", session_maker
+    ), patch("app.domains.ai.router.SummarizationService"):
+        response = _create_summary_streaming_response(run)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert response.media_type == "text/event-stream"
+    first, second = body.decode("utf-8").strip().split("\n\n")
+    assert first == 'event: summary_delta\ndata: {"text": "요약"}'
+    assert second.startswith("event: error\ndata: ")
+
+
+def _streaming_session_maker(commit_error: Exception | None = None):
+    session = MagicMock()
+    session.commit = AsyncMock(side_effect=commit_error)
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__.return_value = session
+    return session_maker
+
+
+async def _stream_events(run, session_maker) -> list[str]:
+    from app.domains.ai.router import _create_summary_streaming_response
+
+    service = MagicMock(done_payload={"success": True})
+    with patch(
+        "app.domains.ai.router.async_session_maker", session_maker
+    ), patch(
+        "app.domains.ai.router.SummarizationService", return_value=service
+    ):
+        response = _create_summary_streaming_response(run)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+    return [
+        block.split("\n", 1)[0].removeprefix("event: ")
+        for block in body.decode("utf-8").strip().split("\n\n")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_sends_done_after_commit():
+    """done 이벤트는 커밋 성공 후 마지막으로 전송"""
+
+    async def run(service, event_callback):
+        await event_callback(
+            SummaryEvent(event="summary", data={"summary": "요약"})
+        )
+
+    session_maker = _streaming_session_maker()
+    events = await _stream_events(run, session_maker)
+
+    assert events == ["summary", "done"]
+    session_maker.return_value.__aenter__.return_value.commit.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_skips_done_when_commit_fails():
+    """커밋 실패 시 done 없이 error 이벤트로 종료"""
+
+    async def run(service, event_callback):
+        await event_callback(
+            SummaryEvent(event="summary", data={"summary": "요약"})
+        )
+
+    events = await _stream_events(
+        run, _streaming_session_maker(RuntimeError("commit failed"))
+    )
+
+    assert events == ["summary", "error"]
@@ -0,0 +1,117 @@
+"""요약 캐시 원본 지문(source_fingerprint) 단위 테스트 (DB / LLM Mock)"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domains.ai.models import SummaryCache
+from app.domains.ai.utils import parsers
+
+HTML = "<html><body><article>본문</article></body></html>"
+YOUTUBE_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+PERSONALIZATION = {"personalize_tags": ["AI"], "personalize_category": "기술"}
+
+
+def _cached(content_hash: str, source_fingerprint: str) -> SummaryCache:
+    return SummaryCache(
+        cache_key="key",
+        cache_type="webpage",
+        content_hash=content_hash,
+        source_fingerprint=source_fingerprint,
+        extracted_text="본문",
+        summary="캐시된 요약",
+        candidate_tags=["AI"],
+        candidate_categories=["기술"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_webpage_fingerprint_match_skips_parsing(
+    summarization_service_factory,
+):
+    """원본 HTML 지문이 같으면 HTML 파싱 없이 캐시 반환"""
+    cached = _cached("stale", parsers.calculate_source_fingerprint(HTML))
+    service = summarization_service_factory(
+        repository={"get_summary_cache": cached},
+        personalization=PERSONALIZATION,
+    )
+
+    with patch.object(
+        parsers, "extract_text_from_html", side_effect=AssertionError
+    ):
+        result = await service.summarize_webpage(
+            url="https://example.com", html_content=HTML, user_id=1
+        )
+
+    assert result["cached"] is True
+    assert result["summary"] == "캐시된 요약"
+    service.embedding_service.get_chunk_strategy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_webpage_same_text_refreshes_fingerprint(
+    summarization_service_factory,
+):
+    """원본은 달라도 추출 본문이 같으면 지문만 갱신하고 캐시 반환"""
+    cached = _cached(parsers.calculate_content_hash("본문"), "old")
+    service = summarization_service_factory(
+        repository={"get_summary_cache": cached},
+        personalization=PERSONALIZATION,
+    )
+
+    with patch.object(
+        parsers, "extract_text_from_html", return_value="본문"
+    ), patch(
+        "app.domains.ai.summarization.service.call_with_fallback"
+    ) as mock_call:
+        result = await service.summarize_webpage(
+            url="https://example.com", html_content=HTML, user_id=1
+        )
+
+    assert result["cached"] is True
+    assert cached.source_fingerprint == parsers.calculate_source_fingerprint(
+        HTML
+    )
+    service.session.flush.assert_awaited_once()
+    mock_call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_youtube_video_id_match_skips_transcript_fetch(
+    summarization_service_factory,
+):
+    """영상 ID 지문이 같으면 자막 조회 없이 캐시 반환"""
+    cached = _cached("stale", "youtube:dQw4w9WgXcQ")
+    service = summarization_service_factory(
+        repository={"get_summary_cache": cached},
+        personalization=PERSONALIZATION,
+    )
+
+    with patch.object(
+        parsers, "fetch_youtube_transcript", side_effect=AssertionError
+    ):
+        result = await service.summarize_youtube(url=YOUTUBE_URL, user_id=1)
+
+    assert result["cached"] is True
+
+
+@pytest.mark.asyncio
+async def test_refresh_ignores_fingerprint(summarization_service_factory):
+    """refresh=True면 지문이 같아도 캐시를 조회하지 않음"""
+    cached = _cached("stale", parsers.calculate_source_fingerprint(HTML))
+    service = summarization_service_factory(
+        repository={"get_summary_cache": cached},
+        personalization=PERSONALIZATION,
+    )
+    service._run_llm_pipeline = AsyncMock(side_effect=RuntimeError("llm"))
+
+    with patch.object(parsers, "extract_text_from_html", return_value="본문"):
+        with pytest.raises(RuntimeError):
+            await service.summarize_webpage(
+                url="https://example.com",
+                html_content=HTML,
+                user_id=1,
+                refresh=True,
+            )
+
+    service.repository.get_summary_cache.assert_not_called()
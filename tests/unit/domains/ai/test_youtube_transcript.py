@@ -0,0 +1,121 @@
+"""YouTube 자막 조회 / 자막 캐시 단위 테스트 (DB / 자막 API Mock)"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.domains.ai.exceptions import TranscriptNotAvailableException
+from app.domains.ai.models import YoutubeTranscriptCache
+from app.domains.ai.repository import AIRepository
+from app.domains.ai.utils import parsers
+from app.domains.ai.utils.types import YoutubeTranscript
+
+
+def _transcript_stubs(cached=None) -> dict:
+    """자막 캐시 조회/저장 저장소 스텁"""
+    return {"get_youtube_transcript": cached, "save_youtube_transcript": None}
+
+
+def _cached(language: str, transcript: str) -> YoutubeTranscriptCache:
+    return YoutubeTranscriptCache(
+        video_id="dQw4w9WgXcQ", language=language, transcript=transcript
+    )
+
+
+@pytest.mark.asyncio
+async def test_transcript_cache_hit_skips_network(
+    summarization_service_factory,
+):
+    """자막 캐시가 있으면 자막 API를 호출하지 않음"""
+    service = summarization_service_factory(
+        repository=_transcript_stubs(_cached("ko", "캐시된 자막"))
+    )
+
+    with patch.object(
+        parsers, "fetch_youtube_transcript", side_effect=AssertionError
+    ):
+        transcript = await service._get_youtube_transcript("dQw4w9WgXcQ")
+
+    assert transcript == "캐시된 자막"
+    service.repository.save_youtube_transcript.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transcript_cache_miss_fetches_and_saves_by_language(
+    summarization_service_factory,
+):
+    """캐시 미스 시 스레드에서 자막 조회 후 (영상 ID, 언어)로 저장"""
+    service = summarization_service_factory(repository=_transcript_stubs())
+
+    with patch.object(
+        parsers,
+        "fetch_youtube_transcript",
+        return_value=YoutubeTranscript(text="자막", language="en"),
+    ) as mock_fetch:
+        transcript = await service._get_youtube_transcript("dQw4w9WgXcQ")
+
+    assert transcript == "자막"
+    mock_fetch.assert_called_once_with("dQw4w9WgXcQ", ["ko", "en"])
+    service.repository.save_youtube_transcript.assert_awaited_once_with(
+        "dQw4w9WgXcQ",
+        "en",
+        "자막",
+        ttl_days=settings.youtube_transcript_cache_ttl_days,
+    )
+
+
+@pytest.mark.asyncio
+async def test_transcript_fetch_timeout_raises(summarization_service_factory):
+    """자막 조회가 제한 시간을 넘으면 TranscriptNotAvailableException"""
+    service = summarization_service_factory(repository=_transcript_stubs())
+
+    def slow_fetch(video_id, languages):
+        time.sleep(0.5)
+
+    with patch.object(
+        parsers, "fetch_youtube_transcript", side_effect=slow_fetch
+    ), patch.object(settings, "youtube_transcript_timeout_seconds", 0.05):
+        with pytest.raises(TranscriptNotAvailableException):
+            await service._get_youtube_transcript("dQw4w9WgXcQ")
+
+    service.repository.save_youtube_transcript.assert_not_called()
+
+
+def test_fetch_uses_single_transcript_list_lookup():
+    """자막 목록을 한 번만 조회하고 선택된 자막 언어를 함께 반환"""
+    with patch.object(parsers, "YouTubeTranscriptApi") as mock_api:
+        transcript = mock_api.list_transcripts.return_value.find_transcript(
+            ["ko", "en"]
+        )
+        transcript.language_code = "en"
+        transcript.fetch.return_value = [
+            {"text": "hello  "},
+            {"text": "world"},
+        ]
+
+        result = parsers.fetch_youtube_transcript("dQw4w9WgXcQ")
+
+    assert result == YoutubeTranscript(text="hello world", language="en")
+    mock_api.list_transcripts.assert_called_once_with("dQw4w9WgXcQ")
+    mock_api.get_transcript.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_repository_prefers_requested_language_order():
+    """여러 언어 자막이 캐시되어 있으면 선호 언어 순서대로 선택"""
+    session = MagicMock()
+    rows = [_cached("ja", "日本語"), _cached("en", "English")]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    session.execute = AsyncMock(return_value=result)
+    repository = AIRepository(session)
+
+    preferred = await repository.get_youtube_transcript(
+        "dQw4w9WgXcQ", ["ko", "en"]
+    )
+    fallback = await repository.get_youtube_transcript("dQw4w9WgXcQ", ["ko"])
+
+    assert preferred is not None and preferred.language == "en"
+    assert fallback is not None and fallback.language == "ja"
@@ -0,0 +1,50 @@
+"""Content Repository 단위 테스트 (테스트 DB)"""
+
+import pytest
+from sqlalchemy import text
+
+from app.core.utils.datetime import now_utc
+from app.core.utils.pagination import TotalMode
+from app.domains.contents.models import Content, ContentType
+from app.domains.contents.repository import ContentFilters, ContentRepository
+
+
+def _content(user_id: int, index: int, category: str) -> Content:
+    return Content(
+        user_id=user_id,
+        content_type=ContentType.WEBPAGE,
+        source_url=f"https://example.com/{user_id}/{index}",
+        title=f"콘텐츠 {index}",
+        category=category,
+        created_at=now_utc(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_count_total_estimated_with_bound_filters(db_session):
+    """estimated 모드는 바인드 파라미터가 있는 필터로 EXPLAIN을 실행"""
+    db_session.add_all(
+        [_content(1, index, "기술") for index in range(5)]
+        + [_content(1, 5, "경제"), _content(2, 0, "기술")]
+    )
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE contents"))
+
+    repository = ContentRepository(db_session)
+    filters = ContentFilters(
+        content_type=ContentType.WEBPAGE,
+        category="기술",
+        date_from=now_utc().replace(year=2000),
+    )
+
+    estimated = await repository.count_total(
+        user_id=1, filters=filters, mode=TotalMode.ESTIMATED
+    )
+    exact = await repository.count_total(
+        user_id=1, filters=filters, mode=TotalMode.EXACT
+    )
+
+    assert exact == 5
+    # 플래너 추정치이므로 정확한 값 대신 범위만 확인
+    assert isinstance(estimated, int)
+    assert 1 <= estimated <= 7
@@ -1,11 +1,13 @@
 """Content Service 단위 테스트"""
 
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.exceptions import ForbiddenException
+from app.core.utils.pagination import TotalMode, decode_cursor, encode_cursor
 from app.domains.contents.exceptions import ContentNotFoundException
 from app.domains.contents.models import (
     Content,
@@ -351,6 +353,45 @@ class TestContentServiceList:
         content_service.repository.get_list.assert_called_once()
         content_service.repository.count.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_list_contents_page_with_cursor(self, content_service):
+        """커서 페이지네이션: keyset 조건 전달 및 다음 커서 생성"""
+        # Given
+        created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        mock_contents = [
+            Content(
+                id=content_id,
+                user_id=100,
+                content_type=ContentType.WEBPAGE,
+                title=f"Content {content_id}",
+                created_at=created_at,
+            )
+            for content_id in (9, 8, 7)
+        ]
+        content_service.repository.get_list = AsyncMock(
+            return_value=mock_contents
+        )
+        content_service.repository.count = AsyncMock()
+        cursor = encode_cursor({"created_at": created_at, "id": 10})
+
+        # When
+        result = await content_service.list_contents_page(
+            user_id=100, size=2, cursor=cursor, total_mode=TotalMode.NONE
+        )
+
+        # Then: size + 1건 조회로 다음 페이지 판단, 개수 쿼리 생략
+        call = content_service.repository.get_list.call_args
+        assert call.kwargs["after"] == (created_at, 10)
+        assert call.kwargs["skip"] == 0
+        assert call.kwargs["limit"] == 3
+        assert [c.id for c in result.items] == [9, 8]
+        assert result.total is None
+        assert decode_cursor(result.next_cursor) == {
+            "created_at": created_at,
+            "id": 8,
+        }
+        content_service.repository.count.assert_not_called()
+
 
 class TestContentServiceDelete:
     """콘텐츠 삭제 테스트"""
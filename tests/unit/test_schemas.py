@@ -6,7 +6,9 @@ from app.core.schemas import (
     ErrorResponse,
     ListAPIResponse,
     PageMeta,
+    create_list_response,
 )
+from app.core.utils.pagination import TotalMode
 
 
 class TestAPIResponse:
@@ -130,6 +132,34 @@ class TestListAPIResponse:
         assert response.meta.has_next is False
         assert response.meta.has_prev is False
 
+    def test_cursor_page_meta(self):
+        """커서 페이지: has_next는 next_cursor 기준"""
+        response = create_list_response(
+            data=[{"id": 1}],
+            total=5000,
+            page=1,
+            size=1,
+            next_cursor="abc",
+            total_mode=TotalMode.CAPPED,
+            cursor="prev",
+        )
+
+        assert response.meta.next_cursor == "abc"
+        assert response.meta.has_next is True
+        assert response.meta.has_prev is True
+        assert response.meta.total == 1000
+        assert response.meta.total_mode == TotalMode.CAPPED
+
+    def test_total_mode_none(self):
+        """total_mode=none이면 전체 개수/페이지 수 없음"""
+        response = create_list_response(
+            data=[], total=None, page=1, size=20, total_mode=TotalMode.NONE
+        )
+
+        assert response.meta.total is None
+        assert response.meta.total_pages is None
+        assert response.meta.has_next is False
+
 
 class TestErrorResponse:
     """ErrorResponse 테스트"""